@@ -8,10 +8,27 @@ Atlassian API - 统一的 Atlassian 产品 API 客户端
 
 __version__ = "0.1.0"
 
-from atlassian.jira import JiraClient
-from atlassian.confluence import ConfluenceClient
-from atlassian.common.auth import AtlassianOAuth1Flow, OAuth1Config, OAuth1Token
-from atlassian.common.exceptions import AtlassianOAuthError
+from typing import TYPE_CHECKING
+
+from atlassian.common.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from atlassian.jira import JiraClient
+    from atlassian.confluence import ConfluenceClient
+    from atlassian.common.auth import AtlassianOAuth1Flow, OAuth1Config, OAuth1Token
+    from atlassian.common.exceptions import AtlassianOAuthError
+
+# 客户端、资源与模型在首次访问时才导入，见 atlassian.common.lazy
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "atlassian.jira": ("JiraClient",),
+        "atlassian.confluence": ("ConfluenceClient",),
+        "atlassian.common.auth": ("AtlassianOAuth1Flow", "OAuth1Config", "OAuth1Token"),
+        "atlassian.common.exceptions": ("AtlassianOAuthError",),
+    },
+    submodules=("jira", "confluence", "tempo"),
+)
 
 __all__ = [
     "JiraClient",
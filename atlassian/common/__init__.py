@@ -7,19 +7,125 @@ Atlassian Common - 共享基础模块
 - 异常类
 """
 
-from atlassian.common.exceptions import (
-    AtlassianError,
-    AtlassianAuthError,
-    AtlassianCaptchaError,
-    AtlassianSessionExpiredError,
-    AtlassianOAuthError,
-    AtlassianAPIError,
-    AtlassianNotFoundError,
-    AtlassianPermissionError,
+from typing import TYPE_CHECKING
+
+from atlassian.common.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from atlassian.common.exceptions import (
+        AtlassianError,
+        AtlassianAuthError,
+        AtlassianCaptchaError,
+        AtlassianSessionExpiredError,
+        AtlassianOAuthError,
+        AtlassianAPIError,
+        AtlassianNotFoundError,
+        AtlassianPermissionError,
+        AtlassianRateLimitError,
+        AtlassianRetryExhaustedError,
+        AtlassianCircuitOpenError,
+        AtlassianDeadlineExceededError,
+        AtlassianCassetteError,
+    )
+    from atlassian.common.client import BaseHttpClient, LoginStats, SessionInfo
+    from atlassian.common.transport import PoolStats, TransportConfig
+    from atlassian.common.retry import RetryPolicy
+    from atlassian.common.ratelimit import RateLimit, RateLimiter
+    from atlassian.common.cache import DiskCache, MemoryCache, ResponseCache
+    from atlassian.common.shared import SharedConnection
+    from atlassian.common.streaming import JsonArrayStreamParser
+    from atlassian.common.codec import JsonCodec, available_codecs, get_codec
+    from atlassian.common.instrumentation import Instrumentation, LoginEvent, RequestEvent
+    from atlassian.common.tracing import OpenTelemetryTracer, RecordingTracer, Tracer
+    from atlassian.common.cassette import Cassette, RecordingTransport, ReplayTransport
+    from atlassian.common.sync import EventLoopThread, SyncClient
+    from atlassian.common.session_store import (
+        FileSessionStore,
+        MemorySessionStore,
+        SessionStore,
+        SqliteSessionStore,
+    )
+    from atlassian.common.circuit import BreakerPolicy, CircuitBreaker, CircuitEvent
+    from atlassian.common.budget import Deadline, current_deadline, deadline
+    from atlassian.common.hedging import HedgePolicy, Hedger
+    from atlassian.common.compression import (
+        CompressionConfig,
+        CompressionStats,
+        available_encodings,
+    )
+    from atlassian.common.routing import NodeRouter, RoutingPolicy
+    from atlassian.common.concurrency import AdaptiveLimiter, ConcurrencyPolicy, ConcurrencyStats
+    from atlassian.common.scheduler import (
+        RequestScheduler,
+        SchedulerPolicy,
+        PriorityStats,
+        request_priority,
+        current_priority,
+    )
+    from atlassian.common.base import BaseResource
+    from atlassian.common.auth import AtlassianOAuth1Flow, OAuth1Config, OAuth1Token
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "atlassian.common.exceptions": (
+            "AtlassianError",
+            "AtlassianAuthError",
+            "AtlassianCaptchaError",
+            "AtlassianSessionExpiredError",
+            "AtlassianOAuthError",
+            "AtlassianAPIError",
+            "AtlassianNotFoundError",
+            "AtlassianPermissionError",
+            "AtlassianRateLimitError",
+            "AtlassianRetryExhaustedError",
+            "AtlassianCircuitOpenError",
+            "AtlassianDeadlineExceededError",
+            "AtlassianCassetteError",
+        ),
+        "atlassian.common.client": ("BaseHttpClient", "LoginStats", "SessionInfo"),
+        "atlassian.common.transport": ("PoolStats", "TransportConfig"),
+        "atlassian.common.retry": ("RetryPolicy",),
+        "atlassian.common.ratelimit": ("RateLimit", "RateLimiter"),
+        "atlassian.common.cache": ("DiskCache", "MemoryCache", "ResponseCache"),
+        "atlassian.common.shared": ("SharedConnection",),
+        "atlassian.common.streaming": ("JsonArrayStreamParser",),
+        "atlassian.common.codec": ("JsonCodec", "available_codecs", "get_codec"),
+        "atlassian.common.instrumentation": ("Instrumentation", "LoginEvent", "RequestEvent"),
+        "atlassian.common.tracing": ("OpenTelemetryTracer", "RecordingTracer", "Tracer"),
+        "atlassian.common.cassette": ("Cassette", "RecordingTransport", "ReplayTransport"),
+        "atlassian.common.sync": ("EventLoopThread", "SyncClient"),
+        "atlassian.common.session_store": (
+            "FileSessionStore",
+            "MemorySessionStore",
+            "SessionStore",
+            "SqliteSessionStore",
+        ),
+        "atlassian.common.circuit": ("BreakerPolicy", "CircuitBreaker", "CircuitEvent"),
+        "atlassian.common.budget": ("Deadline", "current_deadline", "deadline"),
+        "atlassian.common.hedging": ("HedgePolicy", "Hedger"),
+        "atlassian.common.compression": (
+            "CompressionConfig",
+            "CompressionStats",
+            "available_encodings",
+        ),
+        "atlassian.common.routing": ("NodeRouter", "RoutingPolicy"),
+        "atlassian.common.concurrency": (
+            "AdaptiveLimiter",
+            "ConcurrencyPolicy",
+            "ConcurrencyStats",
+        ),
+        "atlassian.common.scheduler": (
+            "RequestScheduler",
+            "SchedulerPolicy",
+            "PriorityStats",
+            "request_priority",
+            "current_priority",
+        ),
+        "atlassian.common.base": ("BaseResource",),
+        "atlassian.common.auth": ("AtlassianOAuth1Flow", "OAuth1Config", "OAuth1Token"),
+    },
 )
-from atlassian.common.client import BaseHttpClient, SessionInfo
-from atlassian.common.base import BaseResource
-from atlassian.common.auth import AtlassianOAuth1Flow, OAuth1Config, OAuth1Token
 
 __all__ = [
     # Exceptions
@@ -31,12 +137,67 @@ __all__ = [
     "AtlassianAPIError",
     "AtlassianNotFoundError",
     "AtlassianPermissionError",
+    "AtlassianRateLimitError",
+    "AtlassianRetryExhaustedError",
+    "AtlassianCircuitOpenError",
+    "AtlassianDeadlineExceededError",
+    "AtlassianCassetteError",
     # Client
     "BaseHttpClient",
     "SessionInfo",
+    "LoginStats",
+    "TransportConfig",
+    "PoolStats",
+    "RetryPolicy",
+    "RateLimit",
+    "RateLimiter",
+    "ResponseCache",
+    "MemoryCache",
+    "DiskCache",
+    "SharedConnection",
+    "JsonArrayStreamParser",
+    "JsonCodec",
+    "get_codec",
+    "available_codecs",
+    "Instrumentation",
+    "RequestEvent",
+    "LoginEvent",
+    "Tracer",
+    "OpenTelemetryTracer",
+    "RecordingTracer",
+    "Cassette",
+    "RecordingTransport",
+    "ReplayTransport",
+    "SyncClient",
+    "EventLoopThread",
     "AtlassianOAuth1Flow",
     "OAuth1Config",
     "OAuth1Token",
+    "SessionStore",
+    "MemorySessionStore",
+    "FileSessionStore",
+    "SqliteSessionStore",
+    "BreakerPolicy",
+    "CircuitBreaker",
+    "CircuitEvent",
+    "Deadline",
+    "current_deadline",
+    "deadline",
+    "HedgePolicy",
+    "Hedger",
+    "CompressionConfig",
+    "CompressionStats",
+    "available_encodings",
+    "NodeRouter",
+    "RoutingPolicy",
+    "AdaptiveLimiter",
+    "ConcurrencyPolicy",
+    "ConcurrencyStats",
+    "RequestScheduler",
+    "SchedulerPolicy",
+    "PriorityStats",
+    "request_priority",
+    "current_priority",
     # Resource
     "BaseResource",
 ]
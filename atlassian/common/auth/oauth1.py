@@ -8,15 +8,16 @@ import secrets
 import time
 from collections.abc import Callable, Generator, Mapping
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from urllib.parse import parse_qsl, quote, urlencode
 
 import httpx
-from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import padding, rsa
 
 from atlassian.common.exceptions import AtlassianOAuthError
 
+if TYPE_CHECKING:
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
 _FORM_CONTENT_TYPE = "application/x-www-form-urlencoded"
 _OAUTH_SIGNATURE_METHOD = "RSA-SHA1"
 _OAUTH_VERSION = "1.0"
@@ -117,6 +118,11 @@ def _buffered_request_body(request: httpx.Request) -> bytes | None:
 
 
 def _load_rsa_private_key(private_key: str) -> rsa.RSAPrivateKey:
+    # cryptography is only imported once OAuth is actually configured, which
+    # keeps it off the import path of session and basic auth users.
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
     try:
         loaded_key = serialization.load_pem_private_key(
             private_key.encode("utf-8"),
@@ -143,8 +149,13 @@ class _AtlassianOAuth1Auth(httpx.Auth):
         nonce_factory: Callable[[], str] | None = None,
         timestamp_factory: Callable[[], str] | None = None,
     ) -> None:
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.asymmetric import padding
+
         self._consumer_key = consumer_key
         self._private_key = _load_rsa_private_key(private_key)
+        self._padding = padding.PKCS1v15()
+        self._hash = hashes.SHA1()
         self._token = token
         self._extra_oauth_parameters = dict(oauth_parameters or {})
         self._nonce_factory = nonce_factory or (lambda: secrets.token_urlsafe(24))
@@ -183,8 +194,8 @@ class _AtlassianOAuth1Auth(httpx.Auth):
         base_string = _signature_base_string(request, oauth_parameters, body)
         signature = self._private_key.sign(
             base_string.encode("ascii"),
-            padding.PKCS1v15(),
-            hashes.SHA1(),
+            self._padding,
+            self._hash,
         )
         oauth_parameters.append(
             ("oauth_signature", base64.b64encode(signature).decode("ascii"))
@@ -6,6 +6,8 @@ Base Resource - 资源基类
 
 from typing import TYPE_CHECKING
 
+from atlassian.common.tracing import trace_public_methods
+
 if TYPE_CHECKING:
     from atlassian.common.client import BaseHttpClient
 
@@ -14,9 +16,15 @@ class BaseResource:
     """
     API 资源基类
 
-    所有资源类继承此类，通过 client 访问 HTTP 方法
+    所有资源类继承此类，通过 client 访问 HTTP 方法。
+    子类的公开协程方法会自动包装: 客户端配置了 tracer 时为每次调用创建
+    "{类名}.{方法名}" span（如 IssueResource.get）。
     """
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        trace_public_methods(cls)
+
     def __init__(self, client: "BaseHttpClient"):
         """
         初始化资源
@@ -0,0 +1,99 @@
+"""
+Deadline - 操作级超时预算
+
+客户端的 timeout 只约束单次 HTTP 请求。翻 40 页搜索结果、批量获取 Issue 这类高层操作
+没有整体期限: 每页都可能接近 timeout，重试与重新登录还会继续叠加等待。
+
+deadline() 在当前上下文（contextvars）中设置一个截止时间，上下文内的每个请求——
+包括分页循环、批量辅助方法中并发的子任务、重试退避与重新登录——都只能使用剩余预算:
+- 单次 HTTP 尝试的超时取 min(timeout, 剩余时间)
+- 剩余时间不足 min_budget 时不再发出请求
+- 退避等待超过剩余时间时不再等待
+以上情况都会立即抛出 AtlassianDeadlineExceededError。嵌套的 deadline 只能缩短、不能延长外层期限。
+
+用法:
+    with deadline(2.0):
+        results = await jira.search.search("project = DEMO")
+
+    # Web 处理函数保留 50ms 用于渲染响应
+    with deadline(0.5, min_budget=0.05):
+        ...
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Coroutine, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Deadline:
+    """截止时间（time.monotonic() 时钟）"""
+
+    expires_at: float
+    timeout: float  # 创建时的总预算（秒）
+    min_budget: float = 0.0  # 剩余时间低于该值时不再发起新请求
+
+    def remaining(self) -> float:
+        """剩余秒数（可能为负）"""
+        return self.expires_at - time.monotonic()
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= self.min_budget
+
+
+_current: ContextVar[Optional[Deadline]] = ContextVar("atlassian_deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """当前上下文的截止时间，未设置时为 None"""
+    return _current.get()
+
+
+@contextmanager
+def deadline(timeout: float, min_budget: float = 0.0) -> Iterator[Deadline]:
+    """
+    在上下文内为所有请求设置整体截止时间
+
+    Args:
+        timeout: 总预算（秒）
+        min_budget: 剩余时间低于该值时不再发起新请求，直接抛出超时异常
+
+    Yields:
+        Deadline: 生效的截止时间（外层期限更早时为外层期限）
+    """
+    if timeout <= 0:
+        raise ValueError("timeout must be > 0")
+    if min_budget < 0:
+        raise ValueError("min_budget must be >= 0")
+    current = Deadline(time.monotonic() + timeout, timeout, min_budget)
+    parent = _current.get()
+    if parent is not None and parent.expires_at <= current.expires_at:
+        current = Deadline(parent.expires_at, parent.timeout, max(parent.min_budget, min_budget))
+    token = _current.set(current)
+    try:
+        yield current
+    finally:
+        _current.reset(token)
+
+
+def bind_deadline(coro: Coroutine[Any, Any, T]) -> Coroutine[Any, Any, T]:
+    """
+    将当前截止时间绑定到协程上
+
+    用于把协程交给其他线程的事件循环执行（如 SyncClient），
+    此时调用方线程中的 contextvars 不会自动传递。
+    """
+    current = _current.get()
+    if current is None:
+        return coro
+
+    async def _run() -> T:
+        _current.set(current)
+        return await coro
+
+    return _run()
@@ -0,0 +1,365 @@
+"""
+Response Cache - HTTP 响应缓存
+
+为 BaseHttpClient.get_json 提供可插拔的响应缓存:
+- 内存 LRU (MemoryCache) 与磁盘 (DiskCache) 两种后端，均按容量淘汰
+- 按路径前缀配置 TTL
+- 过期后使用 ETag / Last-Modified 条件请求 (If-None-Match / If-Modified-Since) 重新验证，
+  服务端返回 304 时复用缓存内容
+- 命中/未命中/重新验证统计
+- DiskCache 的文件读写在线程池中执行（asyncio.to_thread），不阻塞事件循环
+
+用法:
+    cache = ResponseCache(
+        MemoryCache(max_entries=1000),
+        ttls={"/rest/api/2/field": 3600, "/rest/api/2/project": 600},
+    )
+    async with JiraClient(response_cache=cache) as jira:
+        fields = await jira.field.get_all()             # 未命中，写入缓存
+        fields = await jira.field.get_all()             # 命中
+        await jira.get_json("/rest/api/2/field", cache=False)  # 单次绕过缓存
+    print(cache.stats.snapshot())
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Mapping, Optional, TypeVar, Union
+
+import httpx
+
+T = TypeVar("T")
+
+
+@dataclass
+class CacheEntry:
+    """缓存条目"""
+
+    body: bytes
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    expires_at: float = 0.0  # time.time() 时间戳
+
+    @property
+    def size(self) -> int:
+        return len(self.body)
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    @property
+    def has_validators(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self) -> dict[str, str]:
+        """构建条件请求头"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass
+class CacheStats:
+    """缓存统计"""
+
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0  # 条件请求返回 304 后复用
+    stores: int = 0
+    evictions: int = 0
+    bypassed: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.revalidated + self.misses
+        return (self.hits + self.revalidated) / total if total else 0.0
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "bypassed": self.bypassed,
+            "hit_ratio": self.hit_ratio,
+        }
+
+
+class CacheBackend(ABC):
+    """缓存后端基类"""
+
+    stats: Optional[CacheStats] = None
+    # 后端操作是否涉及阻塞 I/O（为 True 时 ResponseCache 的异步方法在线程池中执行）
+    blocking_io = False
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """读取条目，不存在时返回 None"""
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """写入条目（必要时淘汰旧条目）"""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """删除条目"""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """清空缓存"""
+
+    def _evicted(self, count: int = 1) -> None:
+        if self.stats is not None:
+            self.stats.evictions += count
+
+
+class MemoryCache(CacheBackend):
+    """内存 LRU 缓存，按条目数与总字节数淘汰"""
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.size
+            self._entries[key] = entry
+            self._bytes += entry.size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+                self._evicted()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry.size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskCache(CacheBackend):
+    """
+    磁盘缓存
+
+    每个条目一个文件: 首行为 JSON 元数据，其后为响应体。
+    写入时累计总大小，超过 max_bytes 时才扫描目录（同时计入其他进程写入的文件），
+    按最近访问时间淘汰到 max_bytes 的 EVICT_TO 比例以下，避免每次写入都扫描。
+    """
+
+    blocking_io = True
+    # 淘汰后保留的大小占 max_bytes 的比例
+    EVICT_TO = 0.9
+
+    def __init__(self, directory: Union[str, Path], max_bytes: int = 512 * 1024 * 1024):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total = sum(size for _, size, _ in self._scan())
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.sha256(key.encode()).hexdigest()}.cache"
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                meta = json.loads(f.readline())
+                body = f.read()
+            os.utime(path)  # 刷新访问时间用于 LRU
+        except (OSError, ValueError):
+            return None
+        return CacheEntry(body=body, **meta)
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        if entry.size > self.max_bytes:
+            return
+        meta = {
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+            "expires_at": entry.expires_at,
+        }
+        path = self._path(key)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        data = json.dumps(meta).encode() + b"\n" + entry.body
+        with open(tmp, "wb") as f:
+            f.write(data)
+        replaced = self._size(path)
+        os.replace(tmp, path)
+        with self._lock:
+            self._total += len(data) - replaced
+            if self._total > self.max_bytes:
+                self._evict()
+
+    @staticmethod
+    def _size(path: Path) -> int:
+        try:
+            return path.stat().st_size
+        except OSError:
+            return 0
+
+    def _scan(self) -> list[tuple[float, int, Path]]:
+        files = []
+        for path in self.directory.glob("*.cache"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        return files
+
+    def _evict(self) -> None:
+        """按最近访问时间淘汰到 max_bytes * EVICT_TO 以下（需持有锁）"""
+        files = self._scan()
+        total = sum(size for _, size, _ in files)
+        target = self.max_bytes * self.EVICT_TO
+        for _, size, path in sorted(files):
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            self._evicted()
+        self._total = total
+
+    def delete(self, key: str) -> None:
+        path = self._path(key)
+        size = self._size(path)
+        path.unlink(missing_ok=True)
+        with self._lock:
+            self._total = max(0, self._total - size)
+
+    def clear(self) -> None:
+        with self._lock:
+            for path in self.directory.glob("*.cache"):
+                path.unlink(missing_ok=True)
+            self._total = 0
+
+
+class ResponseCache:
+    """
+    响应缓存策略层
+
+    - TTL 按路径前缀（最长前缀）匹配，未匹配时使用 default_ttl
+    - 未配置 TTL 且响应不带 ETag/Last-Modified 的路径不缓存
+    - 带验证器的条目过期后发起条件请求重新验证
+    - 响应带 Cache-Control: no-store 时不缓存
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        ttls: Optional[Mapping[str, float]] = None,
+        default_ttl: Optional[float] = None,
+    ):
+        """
+        Args:
+            backend: 缓存后端，默认 MemoryCache()
+            ttls: 路径前缀 -> TTL（秒），0 表示每次都重新验证
+            default_ttl: 未匹配前缀时的 TTL，None 表示仅缓存带验证器的响应（每次重新验证）
+        """
+        self.backend = backend or MemoryCache()
+        self.ttls = dict(ttls or {})
+        self.default_ttl = default_ttl
+        self.stats = CacheStats()
+        self.backend.stats = self.stats
+        self._prefixes = sorted(self.ttls, key=len, reverse=True)
+
+    def ttl_for(self, path: str) -> Optional[float]:
+        """路径对应的 TTL"""
+        for prefix in self._prefixes:
+            if path.startswith(prefix):
+                return self.ttls[prefix]
+        return self.default_ttl
+
+    @staticmethod
+    def make_key(parts: tuple) -> str:
+        return repr(parts)
+
+    async def alookup(self, key: str) -> Optional[CacheEntry]:
+        """lookup 的异步版本"""
+        return await self._run(self.lookup, key)
+
+    async def astore(self, key: str, path: str, response: httpx.Response) -> None:
+        """store 的异步版本"""
+        await self._run(self.store, key, path, response)
+
+    async def arefresh(self, key: str, path: str, entry: CacheEntry) -> None:
+        """refresh 的异步版本"""
+        await self._run(self.refresh, key, path, entry)
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        if not self.backend.blocking_io:
+            return func(*args)
+        return await asyncio.to_thread(func, *args)
+
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        """查找条目；过期且无法重新验证的条目会被删除"""
+        entry = self.backend.get(key)
+        if entry is None or entry.fresh or entry.has_validators:
+            return entry
+        self.backend.delete(key)
+        return None
+
+    def store(self, key: str, path: str, response: httpx.Response) -> None:
+        """按策略写入成功响应"""
+        if response.status_code != 200:
+            return
+        if "no-store" in response.headers.get("Cache-Control", "").lower():
+            return
+        ttl = self.ttl_for(path)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if ttl is None and not (etag or last_modified):
+            return
+        self.backend.set(
+            key,
+            CacheEntry(
+                body=response.content,
+                etag=etag,
+                last_modified=last_modified,
+                expires_at=time.time() + (ttl or 0.0),
+            ),
+        )
+        self.stats.stores += 1
+
+    def refresh(self, key: str, path: str, entry: CacheEntry) -> None:
+        """304 后延长条目有效期"""
+        entry.expires_at = time.time() + (self.ttl_for(path) or 0.0)
+        self.backend.set(key, entry)
+
+    def clear(self) -> None:
+        self.backend.clear()
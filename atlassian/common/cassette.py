@@ -0,0 +1,329 @@
+"""
+Cassette - 请求录制与回放 transport
+
+在没有真实 Atlassian 实例的情况下做性能基准与回归测试:
+- RecordingTransport 包装真实 transport，把请求/响应对写入磁盘 cassette
+- ReplayTransport 从 cassette 回放响应，可模拟延迟与带宽
+
+cassette 格式为 JSON Lines（路径以 .gz 结尾时 gzip 压缩），每行一次交互。
+响应体按线上原始字节保存（保留 Content-Encoding），文本体直接存储，二进制体使用 base64。
+默认脱敏 Authorization / Cookie / Set-Cookie 请求头与响应头，以及登录请求体中的密码
+（登录响应体中的会话 ID 会保留，回放登录流程时需要它；录制结束时客户端注销会话后即失效）。
+
+用法:
+    # 录制
+    recorder = RecordingTransport("tests/cassettes/search.jsonl.gz")
+    async with JiraClient(transport=recorder) as jira:
+        await jira.search.search("project = DEMO")
+    # 客户端关闭时写入 cassette（也可以调用 recorder.save()）
+
+    # 回放（每个请求额外 20ms 延迟、1 MB/s 带宽）
+    replay = ReplayTransport("tests/cassettes/search.jsonl.gz", latency=0.02, bandwidth=1_000_000)
+    async with JiraClient(transport=replay) as jira:
+        await jira.search.search("project = DEMO")
+"""
+
+import asyncio
+import base64
+import gzip
+import hashlib
+import json
+import time
+from collections import defaultdict, deque
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Iterable, Optional, Union
+
+import httpx
+
+from atlassian.common.exceptions import AtlassianCassetteError
+
+REDACTED = "<redacted>"
+DEFAULT_REDACT_HEADERS = ("authorization", "cookie", "set-cookie")
+DEFAULT_REDACT_BODY_KEYS = ("password",)
+DEFAULT_MATCH_ON = ("method", "path", "query", "body")
+
+PathLike = Union[str, Path]
+
+
+@dataclass
+class Interaction:
+    """一次请求/响应交互"""
+
+    method: str
+    url: str
+    status: int
+    headers: list[tuple[str, str]] = field(default_factory=list)
+    body: str = ""
+    encoding: str = "utf8"  # "utf8" 或 "base64"
+    request_headers: list[tuple[str, str]] = field(default_factory=list)
+    request_body_sha1: Optional[str] = None
+    request_body: Optional[str] = None  # 仅在可解码为文本时保存（已脱敏），便于排查
+    elapsed: float = 0.0  # 录制时从发送请求到读完响应体的耗时（秒）
+
+    @property
+    def content(self) -> bytes:
+        if self.encoding == "base64":
+            return base64.b64decode(self.body)
+        return self.body.encode("utf-8")
+
+    def match_key(self, match_on: Iterable[str]) -> tuple:
+        url = httpx.URL(self.url)
+        return _match_key(self.method, url, self.request_body_sha1, match_on)
+
+    def to_response(self, stream: Optional[httpx.AsyncByteStream] = None) -> httpx.Response:
+        return httpx.Response(
+            self.status,
+            headers=self.headers,
+            stream=stream or httpx.ByteStream(self.content),
+        )
+
+
+def _body_sha1(body: bytes) -> Optional[str]:
+    return hashlib.sha1(body).hexdigest() if body else None
+
+
+def _match_key(method: str, url: httpx.URL, body_sha1: Optional[str], match_on: Iterable[str]) -> tuple:
+    parts = []
+    for name in match_on:
+        if name == "method":
+            parts.append(method.upper())
+        elif name == "path":
+            parts.append(url.path)
+        elif name == "query":
+            parts.append(tuple(sorted(url.params.multi_items())))
+        elif name == "body":
+            parts.append(body_sha1)
+        elif name == "host":
+            parts.append(url.host)
+        else:
+            raise ValueError(f"Unknown match_on field: {name!r}")
+    return tuple(parts)
+
+
+def _encode_body(content: bytes) -> tuple[str, str]:
+    try:
+        return content.decode("utf-8"), "utf8"
+    except UnicodeDecodeError:
+        return base64.b64encode(content).decode("ascii"), "base64"
+
+
+def _redact_headers(headers: Iterable[tuple[str, str]], redact: Iterable[str]) -> list[tuple[str, str]]:
+    redact = {name.lower() for name in redact}
+    return [(k, REDACTED if k.lower() in redact else v) for k, v in headers]
+
+
+def _redact_body(body: bytes, keys: Iterable[str]) -> Optional[str]:
+    try:
+        text = body.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+    keys = set(keys)
+    if not keys or not text:
+        return text or None
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return text
+    if isinstance(data, dict) and keys & data.keys():
+        data = {k: REDACTED if k in keys else v for k, v in data.items()}
+        return json.dumps(data, ensure_ascii=False)
+    return text
+
+
+class Cassette:
+    """交互列表及其读写"""
+
+    def __init__(self, interactions: Optional[list[Interaction]] = None):
+        self.interactions: list[Interaction] = list(interactions or [])
+
+    def __len__(self) -> int:
+        return len(self.interactions)
+
+    def append(self, interaction: Interaction) -> None:
+        self.interactions.append(interaction)
+
+    @classmethod
+    def load(cls, path: PathLike) -> "Cassette":
+        path = Path(path)
+        opener = gzip.open if path.suffix == ".gz" else open
+        interactions = []
+        with opener(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    data = json.loads(line)
+                    data["headers"] = [tuple(h) for h in data.get("headers", [])]
+                    data["request_headers"] = [tuple(h) for h in data.get("request_headers", [])]
+                    interactions.append(Interaction(**data))
+        return cls(interactions)
+
+    def save(self, path: PathLike) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        opener = gzip.open if path.suffix == ".gz" else open
+        tmp = path.with_name(path.name + ".tmp")
+        with opener(tmp, "wt", encoding="utf-8") as f:
+            for interaction in self.interactions:
+                data = {k: v for k, v in asdict(interaction).items() if v not in (None, [], "")}
+                data.setdefault("body", "")
+                f.write(json.dumps(data, ensure_ascii=False, separators=(",", ":")) + "\n")
+        tmp.replace(path)
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """包装真实 transport，记录每次交互"""
+
+    def __init__(
+        self,
+        path: Optional[PathLike] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        redact_headers: Iterable[str] = DEFAULT_REDACT_HEADERS,
+        redact_body_keys: Iterable[str] = DEFAULT_REDACT_BODY_KEYS,
+        before_record: Optional[Callable[[Interaction], Optional[Interaction]]] = None,
+    ):
+        """
+        Args:
+            path: cassette 文件路径，关闭 transport 时写入；None 表示只保存在内存（cassette 属性）
+            transport: 真实 transport，默认 httpx.AsyncHTTPTransport()
+            redact_headers: 需要脱敏的请求头与响应头
+            redact_body_keys: 需要脱敏的 JSON 请求体顶层键
+            before_record: 写入前的回调，可修改交互或返回 None 跳过
+        """
+        self.path = Path(path) if path is not None else None
+        self.cassette = Cassette()
+        self._transport = transport or httpx.AsyncHTTPTransport()
+        self._redact_headers = tuple(redact_headers)
+        self._redact_body_keys = tuple(redact_body_keys)
+        self._before_record = before_record
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        request_body = await request.aread()
+        response = await self._transport.handle_async_request(request)
+        try:
+            # 直接读取底层流: 保留 Content-Encoding 压缩前的线上字节
+            raw = b"".join([chunk async for chunk in response.stream])
+        finally:
+            await response.aclose()
+        elapsed = time.perf_counter() - started
+
+        body, encoding = _encode_body(raw)
+        interaction = Interaction(
+            method=request.method,
+            url=str(request.url),
+            status=response.status_code,
+            headers=_redact_headers(response.headers.multi_items(), self._redact_headers),
+            body=body,
+            encoding=encoding,
+            request_headers=_redact_headers(request.headers.multi_items(), self._redact_headers),
+            request_body_sha1=_body_sha1(request_body),
+            request_body=_redact_body(request_body, self._redact_body_keys),
+            elapsed=elapsed,
+        )
+        if self._before_record is not None:
+            interaction = self._before_record(interaction)
+        if interaction is not None:
+            self.cassette.append(interaction)
+
+        return httpx.Response(
+            response.status_code,
+            headers=response.headers,
+            stream=httpx.ByteStream(raw),
+            extensions=response.extensions,
+        )
+
+    def save(self, path: Optional[PathLike] = None) -> None:
+        """写入 cassette 文件"""
+        target = path or self.path
+        if target is None:
+            raise ValueError("No cassette path configured")
+        self.cassette.save(target)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+        if self.path is not None:
+            self.save()
+
+
+class _PacedStream(httpx.AsyncByteStream):
+    """按带宽分块输出响应体"""
+
+    def __init__(self, content: bytes, bandwidth: float, chunk_size: int):
+        self._content = content
+        self._bandwidth = bandwidth
+        self._chunk_size = chunk_size
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for i in range(0, len(self._content), self._chunk_size):
+            chunk = self._content[i:i + self._chunk_size]
+            await asyncio.sleep(len(chunk) / self._bandwidth)
+            yield chunk
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """
+    从 cassette 回放响应
+
+    匹配相同请求的多条交互按录制顺序依次回放，用完后重复最后一条。
+    没有匹配的交互时抛出 AtlassianCassetteError。
+    """
+
+    def __init__(
+        self,
+        cassette: Union[PathLike, Cassette],
+        match_on: Iterable[str] = DEFAULT_MATCH_ON,
+        latency: Optional[float] = None,
+        use_recorded_timing: bool = False,
+        bandwidth: Optional[float] = None,
+        chunk_size: int = 16 * 1024,
+    ):
+        """
+        Args:
+            cassette: cassette 文件路径或 Cassette 对象
+            match_on: 匹配字段，可选 "method"、"path"、"query"、"body"、"host"
+            latency: 每个请求额外的固定延迟（秒），模拟服务端与网络耗时
+            use_recorded_timing: 按录制时的耗时延迟（与 latency 叠加）
+            bandwidth: 下行带宽（字节/秒），响应体按 chunk_size 分块限速输出
+            chunk_size: 限速时的分块大小
+        """
+        if not isinstance(cassette, Cassette):
+            cassette = Cassette.load(cassette)
+        self.cassette = cassette
+        self.match_on = tuple(match_on)
+        self.latency = latency
+        self.use_recorded_timing = use_recorded_timing
+        self.bandwidth = bandwidth
+        self.chunk_size = chunk_size
+        self.played = 0
+        self._queues: dict[tuple, deque[Interaction]] = defaultdict(deque)
+        self._last: dict[tuple, Interaction] = {}
+        for interaction in cassette.interactions:
+            self._queues[interaction.match_key(self.match_on)].append(interaction)
+
+    def _next(self, request: httpx.Request, body: bytes) -> Interaction:
+        key = _match_key(request.method, request.url, _body_sha1(body), self.match_on)
+        queue = self._queues.get(key)
+        if queue:
+            interaction = self._last[key] = queue.popleft()
+            return interaction
+        if key in self._last:
+            return self._last[key]
+        raise AtlassianCassetteError(
+            f"No recorded interaction for {request.method} {request.url} (match_on={self.match_on})"
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        interaction = self._next(request, body)
+        self.played += 1
+
+        delay = self.latency or 0.0
+        if self.use_recorded_timing:
+            delay += interaction.elapsed
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        stream = None
+        if self.bandwidth:
+            stream = _PacedStream(interaction.content, self.bandwidth, self.chunk_size)
+        return interaction.to_response(stream)
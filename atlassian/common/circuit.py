@@ -0,0 +1,270 @@
+"""
+Circuit Breaker - 按产品与接口族熔断
+
+后端某个接口族持续失败或变慢时（如 Tempo 工作日志搜索超时、Jira 搜索返回 503），
+继续发送请求只会加重后端负担并占满客户端的并发与重试预算。
+熔断器统计最近 window_size 次调用的失败率与慢调用率，超过阈值后打开:
+- 打开 (open): 该接口族的请求不再发出，立即抛出 AtlassianCircuitOpenError
+- 半开 (half_open): open_duration 之后放行少量探测请求，全部成功则关闭，任一失败则重新打开
+- 关闭 (closed): 正常放行并统计
+
+键为 (产品, 主机, 接口族)。接口族默认取路径的前四段（如 /rest/api/2/search、
+/rest/tempo-timesheets/4/worklogs），也可以通过 endpoints 按路径前缀单独配置阈值。
+同一个 CircuitBreaker 实例可以在多个客户端之间共享。
+
+用法:
+    breaker = CircuitBreaker(
+        default=BreakerPolicy(failure_ratio=0.5, slow_call_duration=10.0),
+        endpoints={TEMPO_WORKLOG_SEARCH_PATH: BreakerPolicy(open_duration=60.0)},
+    )
+    jira = JiraClient(circuit_breaker=breaker)
+    tempo = TempoClient(circuit_breaker=breaker)
+    ...
+    print(breaker.snapshot())
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Literal, Mapping, Optional
+
+from atlassian.common.exceptions import AtlassianCircuitOpenError
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+@dataclass(frozen=True)
+class BreakerPolicy:
+    """熔断阈值"""
+
+    failure_ratio: float = 0.5  # 窗口内失败比例达到该值时打开
+    slow_call_ratio: float = 1.0  # 窗口内慢调用比例达到该值时打开
+    slow_call_duration: Optional[float] = None  # 慢调用耗时阈值（秒），None 表示不统计
+    window_size: int = 20  # 统计最近多少次调用
+    min_calls: int = 10  # 窗口内调用数不足时不评估
+    open_duration: float = 30.0  # 打开后多久进入半开（秒）
+    half_open_calls: int = 1  # 半开时放行的探测请求数，全部成功后关闭
+    failure_statuses: frozenset[int] = frozenset({500, 502, 503, 504})
+
+    def __post_init__(self) -> None:
+        if not 0 < self.failure_ratio <= 1:
+            raise ValueError("failure_ratio must be in (0, 1]")
+        if not 0 < self.slow_call_ratio <= 1:
+            raise ValueError("slow_call_ratio must be in (0, 1]")
+        if self.slow_call_duration is not None and self.slow_call_duration <= 0:
+            raise ValueError("slow_call_duration must be > 0")
+        if self.window_size < 1:
+            raise ValueError("window_size must be >= 1")
+        if not 1 <= self.min_calls <= self.window_size:
+            raise ValueError("min_calls must be between 1 and window_size")
+        if self.open_duration < 0:
+            raise ValueError("open_duration must be >= 0")
+        if self.half_open_calls < 1:
+            raise ValueError("half_open_calls must be >= 1")
+
+
+@dataclass
+class CircuitEvent:
+    """熔断器状态变化"""
+
+    key: str
+    previous: CircuitState
+    state: CircuitState
+    failure_ratio: float = 0.0
+    slow_call_ratio: float = 0.0
+
+
+class EndpointCircuit:
+    """单个 (产品, 主机, 接口族) 的熔断状态"""
+
+    def __init__(self, key: str, policy: BreakerPolicy):
+        self.key = key
+        self.policy = policy
+        self.state: CircuitState = "closed"
+        # 最近 window_size 次调用: (是否失败, 是否慢调用)
+        self._window: deque[tuple[bool, bool]] = deque(maxlen=policy.window_size)
+        self._failures = 0
+        self._slow = 0
+        self._opened_at = 0.0
+        self._probes = 0  # 半开时已放行的探测数
+        self._probe_successes = 0
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.failures = 0
+        self.slow_calls = 0
+        self.rejected = 0
+        self.opened = 0
+
+    def before_call(self) -> tuple[bool, Optional[CircuitEvent]]:
+        """
+        请求发出前调用
+
+        Returns:
+            (是否为半开探测, 状态变化)
+
+        Raises:
+            AtlassianCircuitOpenError: 熔断器打开，或半开时探测名额已用完
+        """
+        with self._lock:
+            event = None
+            if self.state == "open":
+                remaining = self._opened_at + self.policy.open_duration - time.monotonic()
+                if remaining > 0:
+                    self.rejected += 1
+                    raise AtlassianCircuitOpenError(self.key, retry_after=remaining)
+                event = self._transition("half_open")
+            if self.state == "half_open":
+                if self._probes >= self.policy.half_open_calls:
+                    self.rejected += 1
+                    raise AtlassianCircuitOpenError(self.key, retry_after=0.0)
+                self._probes += 1
+                return True, event
+            return False, event
+
+    def record(self, probe: bool, failed: bool, elapsed: float) -> Optional[CircuitEvent]:
+        """记录一次调用结果，返回状态变化"""
+        policy = self.policy
+        slow = policy.slow_call_duration is not None and elapsed >= policy.slow_call_duration
+        with self._lock:
+            self.calls += 1
+            self.failures += failed
+            self.slow_calls += slow
+            if probe:
+                if self.state != "half_open":
+                    return None
+                if failed or slow:
+                    return self._transition("open")
+                self._probe_successes += 1
+                if self._probe_successes >= policy.half_open_calls:
+                    return self._transition("closed")
+                return None
+            if self.state != "closed":
+                return None
+            if len(self._window) == self._window.maxlen:
+                old_failed, old_slow = self._window[0]
+                self._failures -= old_failed
+                self._slow -= old_slow
+            self._window.append((failed, slow))
+            self._failures += failed
+            self._slow += slow
+            if len(self._window) < policy.min_calls:
+                return None
+            if (
+                self._failures / len(self._window) >= policy.failure_ratio
+                or self._slow / len(self._window) >= policy.slow_call_ratio
+            ):
+                return self._transition("open")
+            return None
+
+    def release(self, probe: bool) -> None:
+        """请求未完成（如被取消）时归还半开探测名额"""
+        if probe:
+            with self._lock:
+                if self.state == "half_open":
+                    self._probes -= 1
+
+    def _transition(self, state: CircuitState) -> CircuitEvent:
+        window = len(self._window) or 1
+        event = CircuitEvent(
+            key=self.key,
+            previous=self.state,
+            state=state,
+            failure_ratio=self._failures / window,
+            slow_call_ratio=self._slow / window,
+        )
+        self.state = state
+        self._probes = 0
+        self._probe_successes = 0
+        if state == "open":
+            self._opened_at = time.monotonic()
+            self.opened += 1
+        elif state == "closed":
+            self._window.clear()
+            self._failures = self._slow = 0
+        return event
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            window = len(self._window)
+            return {
+                "state": self.state,
+                "calls": self.calls,
+                "failures": self.failures,
+                "slow_calls": self.slow_calls,
+                "rejected": self.rejected,
+                "opened": self.opened,
+                "window_calls": window,
+                "failure_ratio": self._failures / window if window else 0.0,
+                "slow_call_ratio": self._slow / window if window else 0.0,
+                "retry_after": (
+                    max(0.0, self._opened_at + self.policy.open_duration - time.monotonic())
+                    if self.state == "open"
+                    else 0.0
+                ),
+            }
+
+
+def endpoint_family(path: str) -> str:
+    """
+    默认接口族: /rest/<api>/<版本>/<资源>，其他路径取第一段
+
+    /rest/api/2/issue/DEMO-1 -> /rest/api/2/issue
+    /rest/tempo-timesheets/4/worklogs/search -> /rest/tempo-timesheets/4/worklogs
+    /secure/attachment/10000/a.txt -> /secure
+    """
+    parts = path.split("?", 1)[0].split("/", 5)  # ["", "rest", api, version, resource, ...]
+    if len(parts) > 1 and parts[1] == "rest":
+        return "/".join(parts[:5])
+    return "/".join(parts[:2])
+
+
+class CircuitBreaker:
+    """
+    按 (产品, 主机, 接口族) 分组的熔断器集合
+
+    命中 endpoints 中路径前缀的请求以该前缀为接口族并使用对应阈值，
+    其余请求按 endpoint_family 归组并使用 default。
+    """
+
+    def __init__(
+        self,
+        default: Optional[BreakerPolicy] = None,
+        endpoints: Optional[Mapping[str, BreakerPolicy]] = None,
+    ):
+        """
+        Args:
+            default: 默认熔断阈值
+            endpoints: 路径前缀 -> 熔断阈值（最长前缀匹配）
+        """
+        self.default = default or BreakerPolicy()
+        self.endpoints = dict(endpoints or {})
+        self._prefixes = sorted(self.endpoints, key=len, reverse=True)
+        self._circuits: dict[tuple[str, str, str], EndpointCircuit] = {}
+        self._lock = threading.Lock()
+
+    def circuit(self, product: str, host: str, path: str) -> EndpointCircuit:
+        """返回请求所属接口族的熔断状态"""
+        for prefix in self._prefixes:
+            if path.startswith(prefix):
+                family, policy = prefix, self.endpoints[prefix]
+                break
+        else:
+            family, policy = endpoint_family(path), self.default
+        key = (product, host.lower(), family)
+        circuit = self._circuits.get(key)
+        if circuit is None:
+            with self._lock:
+                circuit = self._circuits.get(key)
+                if circuit is None:
+                    circuit = self._circuits[key] = EndpointCircuit(" ".join(key), policy)
+        return circuit
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """各接口族的熔断状态与统计，键为 "产品 主机 接口族" """
+        return {circuit.key: circuit.snapshot() for circuit in list(self._circuits.values())}
+
+    def reset(self) -> None:
+        """清空全部熔断状态"""
+        with self._lock:
+            self._circuits.clear()
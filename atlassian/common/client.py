@@ -9,13 +9,31 @@ Base HTTP Client - 基础 HTTP 客户端
 """
 
 import os
+import asyncio
+import contextvars
 import logging
 import base64
-from typing import Any, Literal, Optional
-from dataclasses import dataclass
+import dataclasses
+import time
+from types import MappingProxyType
+from contextlib import AbstractContextManager, nullcontext
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Coroutine,
+    Iterable,
+    Literal,
+    Mapping,
+    Optional,
+    TypeVar,
+    Union,
+)
+from dataclasses import dataclass, field
 import httpx
 
 from atlassian.common.auth import OAuth1Config
+from atlassian.common.transport import PoolStats, TransportConfig, _PoolTracingTransport
 from atlassian.common.exceptions import (
     AtlassianAuthError,
     AtlassianCaptchaError,
@@ -23,6 +41,45 @@ from atlassian.common.exceptions import (
     AtlassianAPIError,
     AtlassianNotFoundError,
     AtlassianPermissionError,
+    AtlassianRateLimitError,
+    AtlassianRetryExhaustedError,
+    AtlassianDeadlineExceededError,
+    AtlassianCircuitOpenError,
+)
+from atlassian.common.retry import RetryPolicy, parse_retry_after
+from atlassian.common.ratelimit import RateLimiter
+from atlassian.common.cache import ResponseCache
+from atlassian.common.shared import SharedConnection
+from atlassian.common.session_store import SessionStore
+from atlassian.common.circuit import CircuitBreaker, CircuitEvent, EndpointCircuit
+from atlassian.common.budget import Deadline, current_deadline
+from atlassian.common.hedging import HEDGE_METHODS, Hedger
+from atlassian.common.compression import REJECTED_STATUSES, CompressionStats, is_rejected
+from atlassian.common.routing import CONNECT_ERRORS, Node, NodeRouter
+from atlassian.common.concurrency import AdaptiveLimiter
+from atlassian.common.scheduler import (
+    PRIORITY_EXTENSION,
+    RequestScheduler,
+    _ScheduledTransport,
+    current_priority,
+)
+from atlassian.common.streaming import JsonArrayStreamParser
+from atlassian.common.codec import JsonCodec, get_codec
+from atlassian.common.instrumentation import (
+    Instrumentation,
+    LoginEvent,
+    endpoint_template,
+    request_body_size,
+    response_body_size,
+)
+from atlassian.common.tracing import (
+    SPAN_JSON_DECODE,
+    SPAN_LOGIN,
+    SPAN_RETRY_BACKOFF,
+    Span,
+    Tracer,
+    _TracedAuth,
+    page_attributes,
 )
 
 logger = logging.getLogger(__name__)
@@ -30,6 +87,18 @@ logger = logging.getLogger(__name__)
 # 认证模式类型
 AuthMode = Literal["session", "basic", "oauth1"]
 
+T = TypeVar("T")
+
+# 未配置 concurrency_limiter 时批量方法（gather / get_many）的默认并发数
+DEFAULT_BULK_CONCURRENCY = 8
+
+
+def _request_path(path: str) -> str:
+    """提取请求路径（兼容附件下载等传入完整 URL 的调用）"""
+    if path.startswith(("http://", "https://")):
+        return httpx.URL(path).path
+    return path
+
 
 @dataclass
 class SessionInfo:
@@ -40,6 +109,36 @@ class SessionInfo:
     failed_login_count: int = 0
     last_failed_login_time: Optional[str] = None
     previous_login_time: Optional[str] = None
+    node_url: Optional[str] = None  # 配置了 node_router 时会话所属的节点（会话只在该节点有效）
+
+
+@dataclass
+class LoginStats:
+    """登录统计"""
+    logins: int = 0  # 实际执行的登录次数
+    relogins: int = 0  # 因会话过期 (401) 触发的重新登录次数
+    avoided_logins: int = 0  # 并发请求等待其他协程完成登录而省去的登录次数
+    stored_sessions: int = 0  # 从 session_store 复用其他进程会话而省去的登录次数
+
+
+@dataclass
+class _AuthState:
+    """认证会话状态，通过 SharedConnection 可在多个客户端之间共享"""
+    session_info: Optional[SessionInfo] = None
+    logged_in: bool = False
+    # 单飞登录: 同一时刻只有一个协程执行登录，其余协程等待并复用结果
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    generation: int = 0
+    error: Optional[AtlassianAuthError] = None
+    stats: LoginStats = field(default_factory=LoginStats)
+    refs: int = 0  # 处于 async with 中的客户端数量
+
+
+@dataclass
+class CoalesceStats:
+    """GET 请求合并统计"""
+    calls: int = 0  # 参与合并判断的 get_json 调用次数
+    coalesced: int = 0  # 复用进行中请求、未单独发出的调用次数
 
 
 @dataclass
@@ -90,6 +189,22 @@ class BaseHttpClient:
         auth_mode: AuthMode = "session",
         oauth1: Optional[OAuth1Config] = None,
         trust_env: bool = True,
+        transport_config: Optional[TransportConfig] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalesce_requests: bool = False,
+        response_cache: Optional[ResponseCache] = None,
+        shared: Optional[SharedConnection] = None,
+        json_codec: Union[str, JsonCodec, None] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        tracer: Optional[Tracer] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        session_store: Optional[SessionStore] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedger: Optional[Hedger] = None,
+        node_router: Optional[NodeRouter] = None,
+        concurrency_limiter: Optional[AdaptiveLimiter] = None,
+        scheduler: Optional[RequestScheduler] = None,
     ):
         """
         初始化 HTTP 客户端
@@ -105,6 +220,29 @@ class BaseHttpClient:
             auth_mode: 认证模式，"session"、"basic" 或 "oauth1"
             oauth1: OAuth 1.0a RSA-SHA1 认证配置
             trust_env: 是否读取系统代理等 HTTPX 环境变量
+            transport_config: 连接池 / HTTP2 / 自定义 transport 配置
+            retry_policy: 429/5xx/连接异常的重试策略，默认不重试
+            rate_limiter: 客户端令牌桶限流器，可在多个客户端间共享
+            coalesce_requests: 是否合并并发的相同 GET 请求 (get_json)
+            response_cache: get_json 响应缓存（支持 ETag/Last-Modified 重新验证）
+            shared: 与其他客户端共享连接池与登录会话
+            json_codec: JSON 编解码器（"orjson" / "msgspec" / "json" 或 JsonCodec 实例），
+                默认自动选择已安装的最快后端
+            instrumentation: 请求/登录事件钩子与按接口模板聚合的指标，可在多个客户端间共享
+            tracer: 分布式追踪（如 OpenTelemetryTracer），为资源方法、HTTP 尝试、登录等创建 span
+            transport: 自定义 httpx transport（如 RecordingTransport / ReplayTransport），
+                等价于 transport_config=TransportConfig(transport=...)
+            session_store: 跨进程共享会话 Cookie 的存储（FileSessionStore / SqliteSessionStore），
+                复用已有会话、单飞刷新，退出时不注销 (仅 session 模式)
+            circuit_breaker: 按产品与接口族熔断，后端持续失败或变慢时快速失败，可在多个客户端间共享
+            hedger: 对冲 GET 请求: 超过自适应延迟阈值仍未返回时再发一个（可发往备用节点），
+                采用先到的响应；对冲预算可在多个客户端间共享
+            node_router: Data Center 多节点路由（按负载/延迟选择节点、摘除故障节点、自动切换），
+                Session 模式下会话绑定到登录的节点；可在多个客户端间共享
+            concurrency_limiter: AIMD 自适应并发限制，按错误与延迟自动调整同时进行的请求数，
+                批量方法（gather / get_many）受其约束；可在多个客户端间共享
+            scheduler: 按优先级类别（request_priority / priority=）加权公平分配连接池，
+                为延迟敏感的请求保留名额，避免被批量任务饿死；可在共享连接池的客户端间共享
         """
         # 环境变量优先级: 参数 > 带前缀环境变量 > 通用环境变量
         self.base_url = (
@@ -130,6 +268,30 @@ class BaseHttpClient:
         self.auth_mode = auth_mode
         self._oauth1_config = oauth1
         self.trust_env = trust_env
+        self.shared = shared
+        if shared is not None and transport is not None:
+            raise ValueError("transport cannot be combined with shared; configure it on SharedConnection")
+        self.transport_config = (
+            shared.transport_config if shared else transport_config or TransportConfig()
+        )
+        if transport is not None:
+            self.transport_config = dataclasses.replace(self.transport_config, transport=transport)
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.coalesce_requests = coalesce_requests
+        self.response_cache = response_cache
+        self.json_codec = get_codec(json_codec)
+        self.instrumentation = instrumentation
+        self.tracer = tracer
+        self.session_store = session_store if auth_mode == "session" else None
+        self.circuit_breaker = circuit_breaker
+        self.hedger = hedger
+        self.node_router = node_router
+        self.concurrency_limiter = concurrency_limiter
+        self.scheduler = scheduler
+        if scheduler is not None:
+            scheduler.bind_capacity(self.transport_config.max_connections)
+        self._product = (env_prefix or "atlassian").lower()
 
         # 验证必要参数
         if not self.base_url:
@@ -145,12 +307,39 @@ class BaseHttpClient:
             )
         if self.auth_mode == "oauth1" and self._oauth1_config is None:
             raise ValueError("oauth1 configuration is required for auth_mode='oauth1'")
-
-        # 会话状态
-        self._session_info: Optional[SessionInfo] = None
+        if hedger is not None and node_router is not None and hedger.policy.alternate_urls:
+            # 对冲请求由 node_router 选择节点
+            raise ValueError("hedger alternate_urls cannot be combined with node_router")
+        if self.session_store is not None and node_router is not None:
+            # 存储中的会话不记录所属节点，无法保证会话亲和
+            raise ValueError("session_store cannot be combined with node_router")
+
+        self._host = httpx.URL(self.base_url).host
+
+        # 会话状态（共享时 base_url 与认证身份相同的客户端共用同一份）
+        if shared is not None:
+            self._auth_state: _AuthState = shared.session_state(
+                (self.base_url, self._auth_identity()), _AuthState
+            )
+            self._pool_stats = shared.pool_stats
+            self._compression_stats = shared.compression_stats
+        else:
+            self._auth_state = _AuthState()
+            self._pool_stats = PoolStats()
+            self._compression_stats = CompressionStats()
+        compression = self.transport_config.compression
+        # 服务端拒绝压缩请求体后置为 False
+        self._compress_requests = compression is not None and compression.compress_requests
         self._basic_auth_info: Optional[BasicAuthInfo] = None
         self._client: Optional[httpx.AsyncClient] = None
-        self._logged_in: bool = False
+        # (构建时的 SessionInfo, JSON 请求头, multipart 请求头)，会话对象变化时重建
+        self._auth_headers_cache: Optional[
+            tuple[Optional[SessionInfo], Mapping[str, str], Mapping[str, str]]
+        ] = None
+
+        # 进行中的 GET 请求 (合并键 -> Task)
+        self._inflight: dict[tuple, asyncio.Task] = {}
+        self._coalesce_stats = CoalesceStats()
 
         # Basic Auth 模式下，预先生成认证头
         if self.auth_mode == "basic":
@@ -164,6 +353,22 @@ class BaseHttpClient:
         elif self.auth_mode == "oauth1":
             self._logged_in = True  # OAuth access token 不需要登录步骤
 
+    @property
+    def _session_info(self) -> Optional[SessionInfo]:
+        return self._auth_state.session_info
+
+    @_session_info.setter
+    def _session_info(self, value: Optional[SessionInfo]) -> None:
+        self._auth_state.session_info = value
+
+    @property
+    def _logged_in(self) -> bool:
+        return self._auth_state.logged_in
+
+    @_logged_in.setter
+    def _logged_in(self, value: bool) -> None:
+        self._auth_state.logged_in = value
+
     @property
     def is_logged_in(self) -> bool:
         """是否已登录"""
@@ -176,25 +381,53 @@ class BaseHttpClient:
         """获取当前会话信息"""
         return self._session_info
 
+    @property
+    def login_stats(self) -> LoginStats:
+        """登录统计（登录、重新登录、单飞省去的登录次数）"""
+        return self._auth_state.stats
+
+    @property
+    def coalesce_stats(self) -> CoalesceStats:
+        """GET 请求合并统计"""
+        return self._coalesce_stats
+
+    @property
+    def pool_stats(self) -> PoolStats:
+        """连接池统计（连接复用、连接池等待）"""
+        return self._pool_stats
+
+    @property
+    def compression_stats(self) -> CompressionStats:
+        """压缩统计（配置了 TransportConfig.compression 时记录）"""
+        return self._compression_stats
+
     async def __aenter__(self) -> "BaseHttpClient":
         """异步上下文管理器入口"""
-        self._client = httpx.AsyncClient(
-            base_url=self.base_url,
-            timeout=self.timeout,
-            follow_redirects=True,
-            auth=self._get_httpx_auth(),
-            trust_env=self.trust_env,
-        )
-        # Basic Auth 模式不需要登录
+        self._get_client()
+        self._auth_state.refs += 1
+        if self.transport_config.prewarm_connections and not (
+            self.shared and self.shared.prewarmed
+        ):
+            if self.shared:
+                self.shared.prewarmed = True
+            await self.prewarm()
+        # Basic Auth 模式不需要登录；共享会话已登录时直接复用
         if self.auth_mode == "session" and self.auto_login:
-            await self.login()
+            await self._ensure_logged_in()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         """异步上下文管理器出口"""
         try:
-            # Basic Auth 模式不需要注销
-            if self.auth_mode == "session" and self._logged_in:
+            self._auth_state.refs = max(0, self._auth_state.refs - 1)
+            # Basic Auth 模式不需要注销；共享会话由最后一个客户端注销；
+            # 会话保存在 session_store 中时留给其他进程继续使用
+            if (
+                self.auth_mode == "session"
+                and self._logged_in
+                and self._auth_state.refs == 0
+                and self.session_store is None
+            ):
                 await self.logout()
         finally:
             if self._client:
@@ -204,33 +437,113 @@ class BaseHttpClient:
     def _get_client(self) -> httpx.AsyncClient:
         """获取 HTTP 客户端实例"""
         if self._client is None:
-            self._client = httpx.AsyncClient(
-                base_url=self.base_url,
-                timeout=self.timeout,
-                follow_redirects=True,
-                auth=self._get_httpx_auth(),
-                trust_env=self.trust_env,
-            )
+            self._client = self._create_client()
         return self._client
 
+    def _create_client(self) -> httpx.AsyncClient:
+        """按 transport_config 构建 HTTP 客户端（共享时使用共享连接池）"""
+        config = self.transport_config
+        if self.shared is not None:
+            transport = self.shared.acquire_transport()
+            mounts = self.shared.proxy_mounts()
+        else:
+            transport = _PoolTracingTransport(
+                config.create_transport(trust_env=self.trust_env),
+                self._pool_stats,
+            )
+            mounts = {
+                pattern: None if proxy is None else _PoolTracingTransport(proxy, self._pool_stats)
+                for pattern, proxy in config.create_proxy_mounts(trust_env=self.trust_env).items()
+            }
+        if self.scheduler is not None:
+            transport = _ScheduledTransport(transport, self.scheduler)
+            mounts = {
+                pattern: None if proxy is None else _ScheduledTransport(proxy, self.scheduler)
+                for pattern, proxy in mounts.items()
+            }
+        # 传入 transport 时 httpx 不再读取代理环境变量，代理通过 mounts 配置
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            follow_redirects=True,
+            auth=self._get_httpx_auth(),
+            trust_env=self.trust_env,
+            limits=config.limits,
+            http2=config.http2,
+            transport=transport,
+            mounts=mounts,
+        )
+
+    async def prewarm(self, connections: Optional[int] = None) -> int:
+        """
+        预热连接池: 并发请求 prewarm_path 以提前建立 TCP/TLS 连接
+
+        Args:
+            connections: 预热连接数，默认使用 transport_config.prewarm_connections
+
+        Returns:
+            int: 成功建立的连接数
+        """
+        count = self.transport_config.prewarm_connections if connections is None else connections
+        if count <= 0:
+            return 0
+
+        client = self._get_client()
+        path = self.transport_config.prewarm_path
+
+        async def _open() -> bool:
+            try:
+                response = await client.get(path, headers={"Accept": "application/json"})
+                await response.aclose()
+                return True
+            except httpx.HTTPError as e:
+                logger.debug(f"Connection prewarm failed: {e}")
+                return False
+
+        results = await asyncio.gather(*(_open() for _ in range(count)))
+        warmed = sum(results)
+        logger.info(f"Prewarmed {warmed}/{count} connections to {self.base_url}")
+        return warmed
+
     def _get_httpx_auth(self) -> Any:
         """获取需要参与完整请求签名的 HTTPX 认证对象。"""
 
         if self.auth_mode == "oauth1" and self._oauth1_config:
-            return self._oauth1_config.create_httpx_auth()
+            auth = self._oauth1_config.create_httpx_auth()
+            return _TracedAuth(auth, self.tracer) if self.tracer is not None else auth
         return None
 
-    def _get_auth_headers(self) -> dict:
-        """获取认证请求头"""
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
+    def _get_auth_headers(self, multipart: bool = False) -> Mapping[str, str]:
+        """
+        获取认证请求头
+
+        返回预先构建的只读映射，只在会话变化（登录、重新登录、注销）时重建，
+        请求热路径上不再为每个请求分配新的 dict 和格式化 Cookie 字符串。
+
+        Args:
+            multipart: 为 True 时返回文件上传用的版本: 不含 Content-Type
+                (由 httpx 生成 multipart 边界)，并带有 X-Atlassian-Token: no-check
+        """
+        session = self._session_info
+        cached = self._auth_headers_cache
+        if cached is None or cached[0] is not session:
+            cached = self._auth_headers_cache = (session, *self._build_auth_headers(session))
+        return cached[2] if multipart else cached[1]
+
+    def _build_auth_headers(
+        self, session: Optional[SessionInfo]
+    ) -> tuple[Mapping[str, str], Mapping[str, str]]:
+        """构建 (JSON 请求头, multipart 请求头)"""
+        auth: dict[str, str] = {}
         if self.auth_mode == "basic" and self._basic_auth_info:
-            headers["Authorization"] = self._basic_auth_info.auth_header
-        elif self._session_info:
-            headers["Cookie"] = f"{self._session_info.session_name}={self._session_info.session_value}"
-        return headers
+            auth["Authorization"] = self._basic_auth_info.auth_header
+        elif session:
+            auth["Cookie"] = f"{session.session_name}={session.session_value}"
+        if self.transport_config.compression is not None:
+            auth["Accept-Encoding"] = self.transport_config.compression.accept_encoding
+        json_headers = {"Content-Type": "application/json", "Accept": "application/json", **auth}
+        multipart_headers = {"Accept": "application/json", "X-Atlassian-Token": "no-check", **auth}
+        return MappingProxyType(json_headers), MappingProxyType(multipart_headers)
 
     async def login(self) -> SessionInfo | BasicAuthInfo | OAuth1Config:
         """
@@ -271,14 +584,18 @@ class BaseHttpClient:
 
         logger.info(f"Attempting login to {self.base_url} as {self._username}")
 
-        response = await client.post(
-            self.AUTH_SESSION_PATH,
-            json=payload,
-            headers={
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-            },
-        )
+        node = None
+        if self.node_router is None:
+            response = await client.post(
+                self.AUTH_SESSION_PATH,
+                json=payload,
+                headers={
+                    "Content-Type": "application/json",
+                    "Accept": "application/json",
+                },
+            )
+        else:
+            node, response = await self._login_on_node(client, payload)
 
         # 检查 CAPTCHA
         login_reason = response.headers.get("X-Seraph-LoginReason", "")
@@ -311,8 +628,11 @@ class BaseHttpClient:
             failed_login_count=login_info.get("failedLoginCount", 0),
             last_failed_login_time=login_info.get("lastFailedLoginTime"),
             previous_login_time=login_info.get("previousLoginTime"),
+            node_url=node.url if node is not None else None,
         )
         self._logged_in = True
+        self._auth_state.generation += 1
+        self._auth_state.stats.logins += 1
 
         logger.info(f"Login successful. Login count: {self._session_info.login_count}")
         return self._session_info
@@ -331,7 +651,7 @@ class BaseHttpClient:
 
         client = self._get_client()
         response = await client.get(
-            self.AUTH_SESSION_PATH,
+            self._session_url(self.AUTH_SESSION_PATH),
             headers=self._get_auth_headers(),
         )
 
@@ -340,7 +660,7 @@ class BaseHttpClient:
             raise AtlassianSessionExpiredError("Session expired")
 
         response.raise_for_status()
-        return response.json()
+        return self._loads(response.content)
 
     async def logout(self) -> bool:
         """
@@ -348,6 +668,8 @@ class BaseHttpClient:
 
         DELETE /rest/auth/1/session
 
+        配置了 session_store 时同时从存储中删除该会话（若未被其他进程刷新）。
+
         Returns:
             bool: 是否成功注销
         """
@@ -359,7 +681,7 @@ class BaseHttpClient:
 
         try:
             response = await client.delete(
-                self.AUTH_SESSION_PATH,
+                self._session_url(self.AUTH_SESSION_PATH),
                 headers=self._get_auth_headers(),
             )
             response.raise_for_status()
@@ -369,19 +691,163 @@ class BaseHttpClient:
             logger.warning(f"Logout failed: {e}")
             return False
         finally:
+            if self.session_store is not None:
+                await self.session_store.adelete(
+                    self._session_key, self._session_info.session_value
+                )
             self._session_info = None
             self._logged_in = False
 
+    async def _login_on_node(
+        self, client: httpx.AsyncClient, payload: dict
+    ) -> tuple[Node, httpx.Response]:
+        """在负载最低的健康节点上登录，节点不可达时依次尝试其他节点"""
+        router = self.node_router
+        tried: list[Node] = []
+        while True:
+            node = router.choose(exclude=tried)
+            router.start(node)
+            started = time.perf_counter()
+            try:
+                response = await client.post(
+                    f"{node.url}{self.AUTH_SESSION_PATH}",
+                    json=payload,
+                    headers={"Content-Type": "application/json", "Accept": "application/json"},
+                )
+            except CONNECT_ERRORS as e:
+                router.finish(node, time.perf_counter() - started, failed=True, unreachable=True)
+                tried.append(node)
+                if len(tried) >= len(router.nodes):
+                    raise
+                logger.warning(f"Login on node {node.url} failed with {e!r}, trying another node")
+                continue
+            except BaseException:
+                router.finish(node)
+                raise
+            router.finish(
+                node,
+                time.perf_counter() - started,
+                failed=response.status_code in router.policy.failure_statuses,
+            )
+            logger.info(f"Session bound to node {node.url}")
+            return node, response
+
+    def _session_url(self, path: str) -> str:
+        """会话绑定了节点时返回该节点上的地址"""
+        session = self._session_info
+        if session is not None and session.node_url:
+            return f"{session.node_url}{path}"
+        return path
+
+    async def _route(self, budget: Optional[Deadline], method: str, path: str, attempts: int) -> Node:
+        """
+        为一次尝试选择节点
+
+        Session 模式: 使用会话绑定的节点；该节点已被摘除（或尚未绑定）时在其他节点重新登录。
+        """
+        router = self.node_router
+        if self.auth_mode != "session":
+            return router.choose()
+        node = router.get(self._session_info.node_url if self._session_info else None)
+        if node is not None and router.is_healthy(node):
+            return node
+        logger.warning(
+            f"Node {node.url if node else None} is unavailable, moving session to another node"
+        )
+        relogin = self._login_once(self._auth_state.generation, relogin=True)
+        await (
+            relogin
+            if budget is None
+            else self._within_deadline(budget, relogin, method, path, attempts)
+        )
+        return router.get(self._session_info.node_url) or router.choose()
+
     async def _ensure_logged_in(self) -> None:
         """确保已登录，必要时自动登录"""
         # Basic Auth 和 OAuth access token 不需要登录步骤
         if self.auth_mode in ("basic", "oauth1"):
             return
 
-        if not self._logged_in and self.auto_login:
-            await self.login()
-        elif not self._logged_in:
+        if self._logged_in:
+            return
+        if not self.auto_login:
             raise AtlassianAuthError("Not logged in and auto_login is disabled")
+        await self._login_once(self._auth_state.generation)
+
+    async def _login_once(self, generation: int, relogin: bool = False) -> None:
+        """
+        单飞登录
+
+        并发协程中只有第一个执行登录；其余协程在锁上等待，
+        发现登录代数 (generation) 已变化时直接复用新会话（或同一个登录错误）。
+
+        Args:
+            generation: 调用方发起请求时观察到的登录代数
+            relogin: 是否为会话过期后的重新登录
+        """
+        state = self._auth_state
+        async with state.lock:
+            if state.generation != generation:
+                state.stats.avoided_logins += 1
+                if state.error is not None:
+                    raise AtlassianAuthError(
+                        f"Concurrent login failed: {state.error}"
+                    ) from state.error
+                return
+
+            if relogin:
+                logger.warning("Session expired, attempting re-login...")
+                state.stats.relogins += 1
+            expired = self._session_info
+            self._logged_in = False
+            self._session_info = None
+            instrumentation = self.instrumentation
+            event = LoginEvent(self.base_url, relogin) if instrumentation is not None else None
+            started = time.perf_counter()
+            try:
+                with self._span(SPAN_LOGIN, {"atlassian.relogin": relogin}):
+                    if self.session_store is None:
+                        await self.login()
+                    else:
+                        await self._login_with_store(expired)
+                state.error = None
+            except AtlassianAuthError as e:
+                state.error = e
+                state.generation += 1
+                if event is not None:
+                    event.error = e
+                raise
+            finally:
+                if event is not None:
+                    event.elapsed = time.perf_counter() - started
+                    instrumentation.login_finished(event)
+
+    @property
+    def _session_key(self) -> str:
+        return SessionStore.make_key(self.base_url, self._auth_identity())
+
+    async def _login_with_store(self, expired: Optional[SessionInfo]) -> None:
+        """
+        通过 session_store 获取会话（跨进程单飞）
+
+        在跨进程锁内: 存储中有会话且不是刚刚过期的那个时直接采用（由其他进程登录或刷新），
+        否则登录并写回存储。
+        """
+        store = self.session_store
+        key = self._session_key
+        async with store.lock(key):
+            stored = await store.aload(key)
+            if stored is not None and (
+                expired is None or stored.session_value != expired.session_value
+            ):
+                self._session_info = stored.to_session_info()
+                self._logged_in = True
+                self._auth_state.generation += 1
+                self._auth_state.stats.stored_sessions += 1
+                logger.info(f"Reusing stored session for {self.base_url} as {self._username}")
+                return
+            await self.login()
+            await store.asave(key, self._session_info)
 
     def _handle_error_response(self, response: httpx.Response) -> None:
         """处理错误响应"""
@@ -395,6 +861,12 @@ class BaseHttpClient:
                 f"Permission denied: {response.url}",
                 status_code=403,
             )
+        elif response.status_code == 429:
+            raise AtlassianRateLimitError(
+                f"Rate limited: {response.url}",
+                status_code=429,
+                retry_after=parse_retry_after(response.headers.get("Retry-After")),
+            )
         elif response.status_code >= 400:
             error_msg = f"API error: {response.status_code}"
             try:
@@ -407,6 +879,39 @@ class BaseHttpClient:
                 pass
             raise AtlassianAPIError(error_msg, status_code=response.status_code)
 
+    def _resolve_retry_policy(self, retry: Any) -> Optional[RetryPolicy]:
+        """解析单次调用的 retry 参数: None 使用客户端策略，False 禁用，True 使用默认策略"""
+        if retry is None:
+            return self.retry_policy
+        if retry is False:
+            return None
+        if retry is True:
+            return self.retry_policy or RetryPolicy()
+        return retry
+
+    def _retry_exhausted_error(
+        self,
+        method: str,
+        path: str,
+        attempts: int,
+        response: Optional[httpx.Response] = None,
+        exc: Optional[Exception] = None,
+    ) -> AtlassianAPIError:
+        """构建重试耗尽异常"""
+        if response is not None and response.status_code == 429:
+            return AtlassianRateLimitError(
+                f"Rate limited: {method} {path} after {attempts} attempts",
+                status_code=429,
+                attempts=attempts,
+                retry_after=parse_retry_after(response.headers.get("Retry-After")),
+            )
+        reason = f"HTTP {response.status_code}" if response is not None else repr(exc)
+        return AtlassianRetryExhaustedError(
+            f"Retries exhausted: {method} {path} after {attempts} attempts ({reason})",
+            status_code=response.status_code if response is not None else None,
+            attempts=attempts,
+        )
+
     async def _request(
         self,
         method: str,
@@ -414,57 +919,633 @@ class BaseHttpClient:
         **kwargs,
     ) -> httpx.Response:
         """
-        发送 HTTP 请求，自动处理会话认证
+        发送 HTTP 请求，自动处理会话认证与重试
 
         Args:
             method: HTTP 方法
             path: API 路径
-            **kwargs: 传递给 httpx 的其他参数
+            **kwargs: 传递给 httpx 的其他参数，另支持:
+                retry: RetryPolicy 覆盖客户端策略，False 禁用重试
+                idempotent: 标记请求是否可安全重放（如 POST 搜索）
+                hedge: 为 False 时不对冲该请求（配置了 hedger 时）
+                priority: 优先级类别，覆盖 request_priority 上下文（配置了 scheduler 时）
+                stream: 为 True 时不预读响应体，调用方负责 aclose
 
         Returns:
             httpx.Response: 响应对象
+
+        Raises:
+            AtlassianRateLimitError: 429 重试耗尽
+            AtlassianRetryExhaustedError: 5xx / 连接异常重试耗尽
+            AtlassianCircuitOpenError: 接口族熔断器处于打开状态
+            AtlassianDeadlineExceededError: 超出当前上下文的 deadline（见 atlassian.common.budget）
         """
-        await self._ensure_logged_in()
+        budget = current_deadline()
+        policy = self._resolve_retry_policy(kwargs.pop("retry", None))
+        idempotent = kwargs.pop("idempotent", None)
+        stream = kwargs.pop("stream", False)
+        hedge = kwargs.pop("hedge", True) and self.hedger is not None and method in HEDGE_METHODS
+        priority = kwargs.pop("priority", None)
+        if priority is not None and self.scheduler is not None:
+            kwargs["extensions"] = {**(kwargs.get("extensions") or {}), PRIORITY_EXTENSION: priority}
+        extra_headers = kwargs.pop("headers", None)
+        multipart = kwargs.get("files") is not None
+        if kwargs.get("json") is not None:
+            # 预先编码一次，重试/重新登录时直接重放字节
+            kwargs["content"] = self.json_codec.dumps(kwargs.pop("json"))
+        compression = self.transport_config.compression
+        raw_content = None
+        if self._compress_requests and compression.should_compress(kwargs.get("content")):
+            # 压缩一次，重试时直接重放；服务端拒绝时回退到 raw_content
+            raw_content = kwargs["content"]
+            kwargs["content"] = compression.compress(raw_content)
+            extra_headers = {**(extra_headers or {}), "Content-Encoding": "gzip"}
+            self._compression_stats.record_request(len(raw_content), len(kwargs["content"]))
+
+        explicit_timeout = "timeout" in kwargs
+
+        if budget is None:
+            await self._ensure_logged_in()
+        else:
+            await self._within_deadline(budget, self._ensure_logged_in(), method, path, 0)
 
         client = self._get_client()
+        attempts = 0
+        retries = 0
+        slept = 0.0
+        relogged = False
+        failovers = 0
+
+        while True:
+            node = None
+            target = path
+            if self.node_router is not None:
+                node = await self._route(budget, method, path, attempts)
+                if not path.startswith(("http://", "https://")):
+                    target = f"{node.url}{path}"
+
+            # 合并请求头（重新登录后需使用新的会话 Cookie）
+            generation = self._auth_state.generation
+            auth_headers = self._get_auth_headers(multipart)
+            headers = {**auth_headers, **extra_headers} if extra_headers else auth_headers
+
+            if budget is not None:
+                if budget.expired:
+                    raise self._deadline_error(budget, method, path, attempts)
+                if not explicit_timeout:
+                    kwargs["timeout"] = min(self.timeout, budget.remaining())
+
+            circuit = probe = None
+            if self.circuit_breaker is not None:
+                circuit = self.circuit_breaker.circuit(self._product, self._host, _request_path(path))
+                probe, event = circuit.before_call()
+                if event is not None:
+                    self._circuit_changed(event)
+
+            attempts += 1
+            routed: Optional[Node] = None
+            slot: Optional[int] = None
+            try:
+                if self.rate_limiter is not None:
+                    acquire = self.rate_limiter.acquire(self._host, _request_path(path))
+                    await (
+                        acquire
+                        if budget is None
+                        else self._within_deadline(budget, acquire, method, path, attempts)
+                    )
+                if self.concurrency_limiter is not None:
+                    acquire = self.concurrency_limiter.acquire()
+                    slot = await (
+                        acquire
+                        if budget is None
+                        else self._within_deadline(budget, acquire, method, path, attempts)
+                    )
+                if node is not None:
+                    self.node_router.start(node)
+                    routed = node
+                started = time.perf_counter()
+                send = (
+                    self._hedged_send(
+                        client, method, target, headers, attempts, stream, kwargs, node, circuit
+                    )
+                    if hedge
+                    else self._send_attempt(client, method, target, headers, attempts, stream, kwargs)
+                )
+                response = await (
+                    send
+                    if budget is None
+                    else self._within_deadline(budget, send, method, path, attempts)
+                )
+            except httpx.TransportError as e:
+                if budget is not None and budget.expired:
+                    # 超时由 deadline 截短所致，不计入熔断与节点健康统计
+                    if circuit is not None:
+                        circuit.release(probe)
+                    if routed is not None:
+                        self.node_router.finish(routed)
+                    if slot is not None:
+                        self.concurrency_limiter.release(slot)
+                    raise self._deadline_error(budget, method, path, attempts) from e
+                if circuit is not None:
+                    self._record_circuit(circuit, probe, True, started)
+                if slot is not None:
+                    self._release_slot(slot, path, started, failed=True)
+                if routed is not None:
+                    unreachable = isinstance(e, CONNECT_ERRORS)
+                    self.node_router.finish(
+                        routed, time.perf_counter() - started, failed=True, unreachable=unreachable
+                    )
+                    if unreachable and failovers < len(self.node_router.nodes) - 1:
+                        # 请求未发出，换一个节点重发，不占用重试次数
+                        failovers += 1
+                        logger.warning(
+                            f"{method} {path} failed on node {routed.url} with {e!r}, failing over"
+                        )
+                        continue
+                if policy is None or not policy.is_retryable_exception(method, e, idempotent):
+                    raise
+                retries += 1
+                delay = policy.get_delay(retries)
+                if retries > policy.max_retries or slept + delay > policy.max_retry_time:
+                    raise self._retry_exhausted_error(method, path, attempts, exc=e) from e
+                if budget is not None and delay >= budget.remaining() - budget.min_budget:
+                    raise self._deadline_error(budget, method, path, attempts) from e
+                logger.warning(
+                    f"{method} {path} failed with {e!r}, retry {retries}/{policy.max_retries} "
+                    f"in {delay:.2f}s"
+                )
+                slept += delay
+                await self._backoff(delay, retries, repr(e))
+                continue
+            except BaseException:
+                # 取消等未完成的尝试不计入熔断与节点健康统计
+                if circuit is not None:
+                    circuit.release(probe)
+                if routed is not None:
+                    self.node_router.finish(routed)
+                if slot is not None:
+                    self.concurrency_limiter.release(slot)
+                raise
+
+            if slot is not None:
+                self._release_slot(
+                    slot,
+                    path,
+                    started,
+                    response.status_code in self.concurrency_limiter.policy.failure_statuses,
+                )
 
-        # 合并请求头
-        headers = self._get_auth_headers()
-        if "headers" in kwargs:
-            headers.update(kwargs.pop("headers"))
+            if routed is not None:
+                self.node_router.finish(
+                    routed,
+                    time.perf_counter() - started,
+                    failed=response.status_code in self.node_router.policy.failure_statuses,
+                )
 
-        response = await client.request(
-            method,
-            path,
-            headers=headers,
-            **kwargs,
+            if circuit is not None:
+                self._record_circuit(
+                    circuit,
+                    probe,
+                    response.status_code in circuit.policy.failure_statuses,
+                    started,
+                )
+
+            if raw_content is not None and response.status_code in REJECTED_STATUSES:
+                await response.aread()
+                if is_rejected(response):
+                    # 服务端不接受压缩请求体: 之后不再压缩，可安全重放的请求以原始请求体重发一次
+                    self._compress_requests = False
+                    self._compression_stats.record_rejected(len(raw_content), len(kwargs["content"]))
+                    if (policy or RetryPolicy()).is_idempotent(method, idempotent):
+                        logger.warning(
+                            f"{method} {path} returned {response.status_code} for a gzip body, "
+                            "disabling request compression and retrying uncompressed"
+                        )
+                        await response.aclose()
+                        kwargs["content"], raw_content = raw_content, None
+                        extra_headers = {
+                            k: v for k, v in extra_headers.items() if k != "Content-Encoding"
+                        }
+                        continue
+                    logger.warning(
+                        f"{method} {path} returned {response.status_code} for a gzip body, "
+                        "disabling request compression (not retried: request is not idempotent)"
+                    )
+            if compression is not None and not stream:
+                self._compression_stats.record_response(response)
+
+            # 检查会话过期，尝试重新登录
+            if (
+                response.status_code == 401
+                and self.auth_mode == "session"
+                and self.auto_relogin
+                and not relogged
+            ):
+                await response.aclose()
+                relogged = True
+                relogin = self._login_once(generation, relogin=True)
+                await (
+                    relogin
+                    if budget is None
+                    else self._within_deadline(budget, relogin, method, path, attempts)
+                )
+                continue
+
+            if policy is None or not policy.is_retryable_response(method, response, idempotent):
+                return response
+
+            retries += 1
+            delay = policy.get_delay(retries, response)
+            if retries > policy.max_retries or slept + delay > policy.max_retry_time:
+                await response.aclose()
+                raise self._retry_exhausted_error(method, path, attempts, response=response)
+            if budget is not None and delay >= budget.remaining() - budget.min_budget:
+                await response.aclose()
+                raise self._deadline_error(budget, method, path, attempts, response)
+            logger.warning(
+                f"{method} {path} returned {response.status_code}, "
+                f"retry {retries}/{policy.max_retries} in {delay:.2f}s"
+            )
+            await response.aclose()
+            slept += delay
+            await self._backoff(delay, retries, f"HTTP {response.status_code}")
+
+    async def _send_attempt(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        path: str,
+        headers: Mapping[str, str],
+        attempt: int,
+        stream: bool,
+        kwargs: dict,
+    ) -> httpx.Response:
+        """发送一次 HTTP 尝试，配置了 tracer 时包裹在 HTTP span 中"""
+        if self.tracer is None:
+            return await self._send(client, method, path, headers, attempt, stream, kwargs)
+
+        template = self._endpoint_template(_request_path(path))
+        attributes = {
+            "http.request.method": method,
+            "atlassian.endpoint": template,
+            "atlassian.attempt": attempt,
+            **page_attributes(kwargs.get("params")),
+        }
+        with self.tracer.start_span(f"HTTP {method} {template}", attributes) as span:
+            response = await self._send(client, method, path, headers, attempt, stream, kwargs)
+            span.set_attribute("http.response.status_code", response.status_code)
+            span.set_attribute("http.request.body.size", request_body_size(response))
+            span.set_attribute("http.response.body.size", response_body_size(response, stream))
+            return response
+
+    async def _hedged_send(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        path: str,
+        headers: Mapping[str, str],
+        attempt: int,
+        stream: bool,
+        kwargs: dict,
+        node: Optional[Node] = None,
+        circuit: Optional[EndpointCircuit] = None,
+    ) -> httpx.Response:
+        """
+        对冲发送: 超过阈值未返回时再发一个相同请求，采用先到的响应
+
+        配置了 node_router 时对冲请求发往另一个健康节点（Session 模式下会话只在所属节点有效，
+        仍发往原节点）；否则按 HedgePolicy.alternate_urls 选择。
+        对冲请求同样占用限流令牌与并发名额并计入熔断器，没有立即可用的名额时不对冲。
+        两个请求都因连接异常失败时抛出原请求的异常。
+        """
+        hedger = self.hedger
+        template = self._endpoint_template(_request_path(path))
+        delay = hedger.delay_for(template)
+        started = time.perf_counter()
+        primary = asyncio.ensure_future(
+            self._send_attempt(client, method, path, headers, attempt, stream, kwargs)
         )
+        hedge: Optional[asyncio.Future] = None
+        winner: Optional[asyncio.Future] = None
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            admission = None if done else self._admit_hedge(path, circuit)
+            if admission is not None and not hedger.try_acquire():
+                self._release_hedge(path, *admission)
+                admission = None
+            if admission is None:
+                winner = primary
+                response = await primary
+                hedger.observe(template, time.perf_counter() - started)
+                return response
+
+            hedge_node = self._hedge_node(node, path)
+            if hedge_node is not None:
+                target = f"{hedge_node.url}{path[len(node.url):]}"
+                send = self._send_on_node(
+                    hedge_node, client, method, target, headers, attempt, stream, kwargs
+                )
+            else:
+                target = hedger.hedge_target(path)
+                send = self._send_attempt(client, method, target, headers, attempt, stream, kwargs)
+            logger.debug(f"Hedging {method} {path} to {target} after {delay:.3f}s")
+            hedge_started = time.perf_counter()
+            hedge = asyncio.ensure_future(self._send_hedge(send, path, *admission))
+            pending = {primary, hedge}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # 同时完成时优先采用原请求
+                for task in sorted(done, key=lambda t: t is hedge):
+                    if task.exception() is not None:
+                        continue
+                    response = task.result()
+                    if task is hedge:
+                        if not hedger.is_usable(response.status_code):
+                            hedger.stats.rejected += 1
+                            continue
+                        hedger.stats.hedge_wins += 1
+                        hedger.observe(template, time.perf_counter() - hedge_started)
+                    else:
+                        hedger.observe(template, time.perf_counter() - started)
+                    winner = task
+                    return response
+            # 两个请求都没有可用响应时，原请求必然以异常结束
+            raise primary.exception()
+        finally:
+            for task in (primary, hedge):
+                if task is None or task is winner:
+                    continue
+                if not task.done():
+                    task.cancel()
+                    # 等待取消完成，确保连接归还连接池
+                    await asyncio.gather(task, return_exceptions=True)
+                elif not task.cancelled() and task.exception() is None:
+                    await task.result().aclose()
+
+    def _admit_hedge(
+        self, path: str, circuit: Optional[EndpointCircuit]
+    ) -> Optional[tuple[Optional[int], Optional[EndpointCircuit]]]:
+        """
+        不等待地为对冲请求占用并发名额、限流令牌与熔断器调用
 
-        # 检查会话过期，尝试重新登录
-        if (
-            response.status_code == 401
-            and self.auth_mode == "session"
-            and self.auto_relogin
+        Returns:
+            (并发名额, 熔断器)；任一项不能立即获得时返回 None，已占用的部分全部归还
+        """
+        if circuit is not None and circuit.state != "closed":
+            self.hedger.stats.throttled += 1
+            return None
+        slot = None
+        if self.concurrency_limiter is not None:
+            slot = self.concurrency_limiter.try_acquire()
+            if slot is None:
+                self.hedger.stats.throttled += 1
+                return None
+        if self.rate_limiter is not None and not self.rate_limiter.try_acquire(
+            self._host, _request_path(path)
         ):
-            logger.warning("Session expired, attempting re-login...")
-            self._logged_in = False
-            self._session_info = None
-            await self.login()
+            if slot is not None:
+                self.concurrency_limiter.release(slot)
+            self.hedger.stats.throttled += 1
+            return None
+        if circuit is not None:
+            try:
+                circuit.before_call()
+            except AtlassianCircuitOpenError:
+                self._release_hedge(path, slot, None)
+                self.hedger.stats.throttled += 1
+                return None
+        return slot, circuit
+
+    def _release_hedge(
+        self, path: str, slot: Optional[int], circuit: Optional[EndpointCircuit]
+    ) -> None:
+        """归还 _admit_hedge 占用但最终没有发出的对冲请求的名额"""
+        if slot is not None:
+            self.concurrency_limiter.release(slot)
+        if self.rate_limiter is not None:
+            self.rate_limiter.refund(self._host, _request_path(path))
+        if circuit is not None:
+            circuit.release(False)
+
+    async def _send_hedge(
+        self,
+        send: Coroutine[Any, Any, httpx.Response],
+        path: str,
+        slot: Optional[int],
+        circuit: Optional[EndpointCircuit],
+    ) -> httpx.Response:
+        """发送对冲请求，与原请求一样把结果反馈给并发限制器与熔断器"""
+        started = time.perf_counter()
+        try:
+            response = await send
+        except httpx.TransportError:
+            if circuit is not None:
+                self._record_circuit(circuit, False, True, started)
+            if slot is not None:
+                self._release_slot(slot, path, started, failed=True)
+            raise
+        except BaseException:
+            # 落败被取消的对冲请求不计入统计
+            if circuit is not None:
+                circuit.release(False)
+            if slot is not None:
+                self.concurrency_limiter.release(slot)
+            raise
+        if slot is not None:
+            self._release_slot(
+                slot,
+                path,
+                started,
+                response.status_code in self.concurrency_limiter.policy.failure_statuses,
+            )
+        if circuit is not None:
+            self._record_circuit(
+                circuit, False, response.status_code in circuit.policy.failure_statuses, started
+            )
+        return response
 
-            # 重新发送请求
-            headers = self._get_auth_headers()
-            if "headers" in kwargs:
-                headers.update(kwargs.get("headers", {}))
+    def _hedge_node(self, node: Optional[Node], path: str) -> Optional[Node]:
+        """对冲请求的目标节点: 原节点以外的健康节点，没有时为 None（发往原地址）"""
+        router = self.node_router
+        if router is None or node is None or self.auth_mode == "session":
+            return None
+        if not path.startswith(node.url):
+            # 调用方传入的完整 URL（如附件下载）不经过节点路由
+            return None
+        candidate = router.choose(exclude=(node,))
+        if candidate is node or not router.is_healthy(candidate):
+            return None
+        return candidate
 
-            response = await client.request(
-                method,
-                path,
-                headers=headers,
-                **kwargs,
+    async def _send_on_node(
+        self,
+        node: Node,
+        client: httpx.AsyncClient,
+        method: str,
+        path: str,
+        headers: Mapping[str, str],
+        attempt: int,
+        stream: bool,
+        kwargs: dict,
+    ) -> httpx.Response:
+        """发往指定节点的尝试（对冲请求），计入节点负载与健康统计"""
+        router = self.node_router
+        router.start(node)
+        started = time.perf_counter()
+        try:
+            response = await self._send_attempt(client, method, path, headers, attempt, stream, kwargs)
+        except httpx.TransportError as e:
+            router.finish(
+                node,
+                time.perf_counter() - started,
+                failed=True,
+                unreachable=isinstance(e, CONNECT_ERRORS),
             )
+            raise
+        except BaseException:
+            router.finish(node)
+            raise
+        router.finish(
+            node,
+            time.perf_counter() - started,
+            failed=response.status_code in router.policy.failure_statuses,
+        )
+        return response
 
+    async def _send(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        path: str,
+        headers: Mapping[str, str],
+        attempt: int,
+        stream: bool,
+        kwargs: dict,
+    ) -> httpx.Response:
+        """发送一次 HTTP 尝试，配置了 instrumentation 时记录事件与指标"""
+        instrumentation = self.instrumentation
+        event = (
+            instrumentation.request_started(method, _request_path(path), attempt)
+            if instrumentation is not None
+            else None
+        )
+        try:
+            if stream:
+                request = client.build_request(method, path, headers=headers, **kwargs)
+                response = await client.send(request, stream=True)
+            else:
+                response = await client.request(
+                    method,
+                    path,
+                    headers=headers,
+                    **kwargs,
+                )
+        except BaseException as e:
+            # 包括取消（对冲落败、deadline 到期），保证每个 request_start 都有对应的 request_end
+            if event is not None:
+                instrumentation.request_finished(event, error=e)
+            raise
+        if event is not None:
+            instrumentation.request_finished(event, response, streamed=stream)
         return response
 
+    async def _within_deadline(
+        self,
+        budget: Deadline,
+        awaitable: Coroutine[Any, Any, T],
+        method: str,
+        path: str,
+        attempts: int,
+    ) -> T:
+        """在剩余预算内等待（登录、限流、HTTP 尝试），超时转换为 AtlassianDeadlineExceededError"""
+        remaining = budget.remaining()
+        if remaining <= budget.min_budget:
+            awaitable.close()
+            raise self._deadline_error(budget, method, path, attempts)
+        try:
+            async with asyncio.timeout(remaining):
+                return await awaitable
+        except TimeoutError as e:
+            raise self._deadline_error(budget, method, path, attempts) from e
+
+    def _deadline_error(
+        self,
+        budget: Deadline,
+        method: str,
+        path: str,
+        attempts: int,
+        response: Optional[httpx.Response] = None,
+    ) -> AtlassianDeadlineExceededError:
+        return AtlassianDeadlineExceededError(
+            f"{method} {path} exceeded deadline of {budget.timeout:.3f}s after {attempts} attempt(s)",
+            status_code=response.status_code if response is not None else None,
+            attempts=attempts,
+            timeout=budget.timeout,
+        )
+
+    def _record_circuit(
+        self,
+        circuit: EndpointCircuit,
+        probe: bool,
+        failed: bool,
+        started: float,
+    ) -> None:
+        event = circuit.record(probe, failed, time.perf_counter() - started)
+        if event is not None:
+            self._circuit_changed(event)
+
+    def _release_slot(self, slot: int, path: str, started: float, failed: bool) -> None:
+        """归还并发名额，把耗时与结果反馈给自适应并发限制器"""
+        self.concurrency_limiter.release(
+            slot,
+            time.perf_counter() - started,
+            failed=failed,
+            key=self._endpoint_template(_request_path(path)),
+        )
+
+    def _circuit_changed(self, event: CircuitEvent) -> None:
+        """熔断器状态变化: 记录日志并上报 instrumentation"""
+        log = logger.warning if event.state == "open" else logger.info
+        log(
+            f"Circuit {event.key} {event.previous} -> {event.state} "
+            f"(failure ratio {event.failure_ratio:.0%}, slow ratio {event.slow_call_ratio:.0%})"
+        )
+        if self.instrumentation is not None:
+            self.instrumentation.circuit_changed(event)
+
+    async def _backoff(self, delay: float, retry: int, reason: str) -> None:
+        """重试前等待"""
+        with self._span(
+            SPAN_RETRY_BACKOFF,
+            {"atlassian.retry": retry, "atlassian.retry.delay": delay, "atlassian.retry.reason": reason},
+        ):
+            await asyncio.sleep(delay)
+
+    def _span(
+        self,
+        name: str,
+        attributes: Optional[dict[str, Any]] = None,
+    ) -> AbstractContextManager[Span]:
+        """创建追踪 span；未配置 tracer 时为空上下文"""
+        if self.tracer is None:
+            return nullcontext(Span())
+        return self.tracer.start_span(name, attributes)
+
+    def _endpoint_template(self, path: str) -> str:
+        if self.instrumentation is not None:
+            return self.instrumentation.template_for(path)
+        return endpoint_template(path)
+
+    def _loads(self, content: bytes) -> Any:
+        """解码 JSON 响应体"""
+        if self.tracer is None:
+            return self.json_codec.loads(content)
+        with self.tracer.start_span(
+            SPAN_JSON_DECODE,
+            {"atlassian.json.codec": self.json_codec.name, "atlassian.json.size": len(content)},
+        ):
+            return self.json_codec.loads(content)
+
     async def get(self, path: str, **kwargs) -> httpx.Response:
         """发送 GET 请求"""
         return await self._request("GET", path, **kwargs)
@@ -482,10 +1563,165 @@ class BaseHttpClient:
         return await self._request("DELETE", path, **kwargs)
 
     async def get_json(self, path: str, **kwargs) -> Any:
-        """发送 GET 请求并返回 JSON"""
+        """
+        发送 GET 请求并返回 JSON
+
+        开启 coalesce_requests（或传入 coalesce=True）时，并发的相同请求
+        (路径、参数、请求头、认证身份与优先级均相同) 共享一次网络请求及其解析结果，
+        共享请求不继承调用方的 deadline，每个调用方按自己的 deadline 等待。
+        合并的调用方拿到的是同一个对象，不应原地修改。
+
+        配置 response_cache 时先查缓存，传入 cache=False 可单次绕过。
+        """
+        coalesce = kwargs.pop("coalesce", self.coalesce_requests)
+        use_cache = kwargs.pop("cache", True)
+        key = self._request_key(path, kwargs) if coalesce else None
+        if key is None:
+            return await self._fetch_json(path, use_cache, **kwargs)
+
+        self._coalesce_stats.calls += 1
+        # 只合并优先级相同的请求；共享请求在干净的上下文中运行，显式传入优先级
+        priority = kwargs.get("priority") or current_priority()
+        if priority is not None:
+            kwargs["priority"] = priority
+        key = (*key, use_cache, priority)
+        task = self._inflight.get(key)
+        if task is None:
+            # 不继承第一个调用方的 deadline 等上下文，各调用方在下面按自己的 deadline 等待
+            task = asyncio.get_running_loop().create_task(
+                self._fetch_json(path, use_cache, **kwargs), context=contextvars.Context()
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._release_inflight(key, t))
+        else:
+            self._coalesce_stats.coalesced += 1
+
+        async def _wait() -> Any:
+            # shield: 单个调用方取消或超时不影响其他等待同一请求的调用方
+            return await asyncio.shield(task)
+
+        budget = current_deadline()
+        if budget is None:
+            return await _wait()
+        return await self._within_deadline(budget, _wait(), "GET", path, 0)
+
+    async def stream_json_items(
+        self,
+        path: str,
+        item_key: Optional[str] = None,
+        method: str = "GET",
+        metadata: Optional[dict] = None,
+        **kwargs,
+    ) -> AsyncIterator[Any]:
+        """
+        流式解析响应中的数组元素
+
+        响应体按块从 socket 读取，每个数组元素完整到达即产出，
+        内存峰值只与单个元素大小相关，而不是整页响应。
+        在 deadline 上下文中，每读取一块都会检查剩余预算（包括调用方处理元素所用的时间）。
+
+        Args:
+            path: API 路径
+            item_key: 顶层对象中目标数组的键（如 "issues"、"results"），None 表示响应本身是数组
+            method: HTTP 方法（Tempo 工时搜索为 POST）
+            metadata: 传入字典时填充顶层对象的其他字段（如 total、startAt）
+            **kwargs: 传递给 _request 的其他参数
+
+        Yields:
+            数组中的每个元素
+        """
+        budget = current_deadline()
+        response = await self._request(method, path, stream=True, **kwargs)
+        try:
+            if response.is_error:
+                await response.aread()
+                response.raise_for_status()
+            parser = JsonArrayStreamParser(item_key, loads=self.json_codec.loads)
+            decoded = 0
+            async for chunk in response.aiter_bytes():
+                decoded += len(chunk)
+                for item in parser.feed(chunk):
+                    yield item
+                if parser.done:
+                    break
+                if budget is not None and budget.remaining() <= 0:
+                    raise self._deadline_error(budget, method, path, 1, response)
+            parser.close()
+            if metadata is not None:
+                metadata.update(parser.metadata)
+            if self.transport_config.compression is not None:
+                self._compression_stats.record_response(response, decoded)
+        finally:
+            await response.aclose()
+
+    async def _fetch_json(self, path: str, use_cache: bool = True, **kwargs) -> Any:
+        cache = self.response_cache
+        if cache is None:
+            response = await self.get(path, **kwargs)
+            response.raise_for_status()
+            return self._loads(response.content)
+
+        parts = self._request_key(path, kwargs) if use_cache else None
+        if parts is None:
+            cache.stats.bypassed += 1
+            response = await self.get(path, **kwargs)
+            response.raise_for_status()
+            return self._loads(response.content)
+
+        cache_key = cache.make_key(parts)
+        entry = await cache.alookup(cache_key)
+        if entry is not None and entry.fresh:
+            cache.stats.hits += 1
+            return self._loads(entry.body)
+
+        if entry is not None:
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), **entry.conditional_headers()}
         response = await self.get(path, **kwargs)
+        if response.status_code == 304:
+            if entry is not None:
+                cache.stats.revalidated += 1
+                await cache.arefresh(cache_key, path, entry)
+                return self._loads(entry.body)
+            # 没有对应的缓存条目（如调用方自带条件请求头），按未命中去掉条件请求头重新获取
+            await response.aclose()
+            kwargs["headers"] = {
+                k: v
+                for k, v in kwargs["headers"].items()
+                if k.lower() not in ("if-none-match", "if-modified-since")
+            }
+            response = await self.get(path, **kwargs)
+
+        cache.stats.misses += 1
         response.raise_for_status()
-        return response.json()
+        await cache.astore(cache_key, path, response)
+        return self._loads(response.content)
+
+    def _auth_identity(self) -> str:
+        """认证身份标识，用于区分不同身份的请求"""
+        if self.auth_mode == "oauth1" and self._oauth1_config:
+            return f"oauth1:{self._oauth1_config.consumer_key}:{self._oauth1_config.access_token}"
+        return f"{self.auth_mode}:{self._username}"
+
+    def _request_key(self, path: str, kwargs: dict) -> Optional[tuple]:
+        """构建请求合并/缓存键；带有 params/headers/priority 以外参数的请求不参与"""
+        if not set(kwargs) <= {"params", "headers", "priority"}:
+            return None
+        params = httpx.QueryParams(kwargs.get("params"))
+        headers = kwargs.get("headers") or {}
+        # base_url 区分不同实例: 共享的 ResponseCache / 持久化的 DiskCache 中同一路径不会串用
+        return (
+            self.base_url,
+            self._auth_identity(),
+            path,
+            tuple(sorted(params.multi_items())),
+            tuple(sorted((k.lower(), v) for k, v in headers.items())),
+        )
+
+    def _release_inflight(self, key: tuple, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # 标记异常已读取，避免所有调用方取消时产生告警
 
     async def post_json(self, path: str, data: Any = None, **kwargs) -> Any:
         """发送 POST 请求并返回 JSON"""
@@ -493,7 +1729,25 @@ class BaseHttpClient:
         response.raise_for_status()
         if response.status_code == 204:
             return None
-        return response.json()
+        return self._loads(response.content)
+
+    async def post_multipart(self, path: str, files: Any, data: Any = None, **kwargs) -> Any:
+        """
+        上传文件（multipart/form-data）并返回 JSON
+
+        附件、头像等上传接口使用；请求经过 _request，享有自动重新登录、限流与追踪。
+        文件对象在重新登录后的重放中会被 httpx 重新定位到开头。
+
+        Args:
+            path: API 路径
+            files: httpx files 参数，如 {"file": (filename, fileobj_or_bytes)}
+            data: 随文件提交的表单字段
+        """
+        response = await self.post(path, files=files, data=data or None, **kwargs)
+        response.raise_for_status()
+        if response.status_code == 204:
+            return None
+        return self._loads(response.content)
 
     async def put_json(self, path: str, data: Any = None, **kwargs) -> Any:
         """发送 PUT 请求并返回 JSON"""
@@ -501,7 +1755,7 @@ class BaseHttpClient:
         response.raise_for_status()
         if response.status_code == 204:
             return None
-        return response.json()
+        return self._loads(response.content)
 
     async def delete_json(self, path: str, **kwargs) -> Any:
         """发送 DELETE 请求并返回 JSON（如有）"""
@@ -510,10 +1764,41 @@ class BaseHttpClient:
         if response.status_code == 204:
             return None
         try:
-            return response.json()
+            return self._loads(response.content)
         except Exception:
             return None
 
+    async def gather(
+        self,
+        calls: Iterable[Awaitable[T]],
+        concurrency: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> list[T]:
+        """
+        批量并发执行协程并按提交顺序返回结果
+
+        配置了 concurrency_limiter 时并发数由其按错误与延迟自适应调整，
+        否则最多同时执行 DEFAULT_BULK_CONCURRENCY 个。
+
+        Args:
+            calls: 尚未开始的协程（如 jira.issue.get("DEMO-1")）
+            concurrency: 固定并发上限，与 concurrency_limiter 同时生效
+            return_exceptions: 为 True 时异常作为结果返回，否则抛出第一个异常
+        """
+        if concurrency is None and self.concurrency_limiter is None:
+            concurrency = DEFAULT_BULK_CONCURRENCY
+        if not concurrency:
+            return await asyncio.gather(*calls, return_exceptions=return_exceptions)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one(call: Awaitable[T]) -> T:
+            async with semaphore:
+                return await call
+
+        return await asyncio.gather(
+            *(_one(call) for call in calls), return_exceptions=return_exceptions
+        )
+
     async def close(self) -> None:
         """关闭客户端（不注销会话）"""
         if self._client:
@@ -0,0 +1,139 @@
+"""
+JSON Codec - 可插拔 JSON 编解码
+
+翻页拉取搜索结果时，JSON 解码占用了相当比例的 CPU。
+BaseHttpClient 的响应解码（get_json / post_json 等）与请求体编码（json= 参数）统一经过 JsonCodec，
+安装了 orjson 或 msgspec 时自动使用，否则回退到标准库 json。
+
+用法:
+    JiraClient()                          # 自动选择: orjson > msgspec > json
+    JiraClient(json_codec="json")         # 强制使用标准库
+    JiraClient(json_codec=MyCodec())      # 自定义实现
+
+可选依赖:
+    pip install custom-atlassian-api[fast-json]
+"""
+
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Optional, Union
+
+
+class JsonCodec(ABC):
+    """JSON 编解码器基类（子类必须实现 loads 与 dumps，否则无法实例化）"""
+
+    name = "base"
+
+    @abstractmethod
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """解码 JSON"""
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """编码为 UTF-8 JSON 字节（紧凑格式，不转义非 ASCII 字符）"""
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.name}>"
+
+
+class StdlibJsonCodec(JsonCodec):
+    """标准库 json（与 httpx 默认行为一致）"""
+
+    name = "json"
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        if isinstance(data, memoryview):
+            data = bytes(data)
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+        ).encode("utf-8")
+
+
+class OrjsonCodec(JsonCodec):
+    """orjson"""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+        self._option = orjson.OPT_NON_STR_KEYS
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj, option=self._option)
+
+
+class MsgspecCodec(JsonCodec):
+    """msgspec.json"""
+
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        return self._decoder.decode(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+
+_BACKENDS: dict[str, Callable[[], JsonCodec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "json": StdlibJsonCodec,
+}
+
+_default_codec: Optional[JsonCodec] = None
+
+
+def available_codecs() -> list[str]:
+    """当前环境可用的后端名称，按优先级排列"""
+    names = []
+    for name, factory in _BACKENDS.items():
+        try:
+            factory()
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def get_codec(codec: Union[str, JsonCodec, None] = None) -> JsonCodec:
+    """
+    解析 JSON 编解码器
+
+    Args:
+        codec: JsonCodec 实例；后端名称 "orjson" / "msgspec" / "json"；
+            None 或 "auto" 表示按 orjson > msgspec > json 自动选择
+
+    Raises:
+        ValueError: 未知的后端名称
+        ImportError: 指定的后端未安装
+    """
+    global _default_codec
+
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec is None or codec == "auto":
+        if _default_codec is None:
+            for factory in _BACKENDS.values():
+                try:
+                    _default_codec = factory()
+                    break
+                except ImportError:
+                    continue
+        return _default_codec
+    if codec not in _BACKENDS:
+        raise ValueError(f"Unknown json codec: {codec!r} (expected one of {list(_BACKENDS)})")
+    return _BACKENDS[codec]()
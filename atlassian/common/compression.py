@@ -0,0 +1,138 @@
+"""
+Compression - 请求 / 响应体压缩
+
+响应: 显式声明 Accept-Encoding，按已安装的解码器依次为 zstd (zstandard)、br (brotli / brotlicffi)、
+gzip、deflate，由 httpx 透明解压。
+请求: 可选地对超过 min_size 的 JSON 请求体做 gzip 压缩（bulk_create、Tempo 工时搜索、
+Confluence storage 格式页面更新等大请求体）。Jira / Confluence 默认不解压请求体，
+需要在反向代理或 Tomcat 上启用后再打开 compress_requests。服务端拒绝压缩请求体
+（415，或响应体提到 Content-Encoding 的 400）时客户端不再压缩；可安全重放的请求
+（GET / PUT / DELETE 或 idempotent=True）以未压缩的请求体重发一次，其他 POST 不重发，直接返回错误。
+普通的 400（如 bulk_create 的字段校验错误）不视为拒绝压缩。
+
+CompressionStats 统计线上字节与解压后字节，用于衡量跨区域部署的带宽收益。
+
+用法:
+    config = TransportConfig(compression=CompressionConfig(compress_requests=True, min_size=8192))
+    async with JiraClient(transport_config=config) as jira:
+        await jira.issue.bulk_create(issues)
+        print(jira.compression_stats.snapshot())
+"""
+
+import gzip
+import importlib.util
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import httpx
+
+# 压缩请求被拒绝时服务端可能返回的状态码
+REJECTED_STATUSES = frozenset({400, 415})
+
+
+def is_rejected(response: httpx.Response) -> bool:
+    """服务端是否拒绝了压缩的请求体（响应体需已读取）"""
+    if response.status_code == 415:
+        return True
+    return response.status_code == 400 and b"content-encoding" in response.content.lower()
+
+
+def available_encodings() -> tuple[str, ...]:
+    """已安装解码器支持的响应编码（按偏好排序）"""
+    encodings = []
+    if importlib.util.find_spec("zstandard") is not None:
+        encodings.append("zstd")
+    if any(importlib.util.find_spec(name) is not None for name in ("brotli", "brotlicffi")):
+        encodings.append("br")
+    encodings.extend(("gzip", "deflate"))
+    return tuple(encodings)
+
+
+@dataclass(frozen=True)
+class CompressionConfig:
+    """压缩配置"""
+
+    accept_encodings: Optional[tuple[str, ...]] = None  # None 表示 available_encodings()
+    compress_requests: bool = False  # 是否 gzip 压缩大请求体
+    min_size: int = 16 * 1024  # 请求体达到该字节数才压缩
+    level: int = 6  # gzip 压缩级别
+
+    def __post_init__(self) -> None:
+        if self.min_size < 0:
+            raise ValueError("min_size must be >= 0")
+        if not 1 <= self.level <= 9:
+            raise ValueError("level must be between 1 and 9")
+
+    @property
+    def accept_encoding(self) -> str:
+        """Accept-Encoding 请求头"""
+        return ", ".join(self.accept_encodings or available_encodings())
+
+    def should_compress(self, content: Any) -> bool:
+        return self.compress_requests and isinstance(content, bytes) and len(content) >= self.min_size
+
+    def compress(self, content: bytes) -> bytes:
+        return gzip.compress(content, compresslevel=self.level, mtime=0)
+
+
+@dataclass
+class CompressionStats:
+    """
+    压缩统计
+
+    - requests_compressed / request_bytes_raw / request_bytes_sent: 压缩的请求数与压缩前后字节数
+    - requests_rejected: 服务端拒绝压缩请求体的次数
+    - responses_compressed / response_bytes_received / response_bytes_decoded: 压缩响应的线上与解压后字节数
+    """
+
+    requests_compressed: int = 0
+    request_bytes_raw: int = 0
+    request_bytes_sent: int = 0
+    requests_rejected: int = 0
+    responses_compressed: int = 0
+    response_bytes_received: int = 0
+    response_bytes_decoded: int = 0
+
+    def record_request(self, raw: int, sent: int) -> None:
+        self.requests_compressed += 1
+        self.request_bytes_raw += raw
+        self.request_bytes_sent += sent
+
+    def record_response(self, response: httpx.Response, decoded: Optional[int] = None) -> None:
+        """记录已读取完毕的响应（decoded 为流式读取时累计的解压后字节数）"""
+        if "Content-Encoding" not in response.headers:
+            return
+        # 线上字节数；mock 等预置响应体时回退到 Content-Length
+        received = response.num_bytes_downloaded or int(response.headers.get("Content-Length") or 0)
+        if not received:
+            return
+        self.responses_compressed += 1
+        self.response_bytes_received += received
+        self.response_bytes_decoded += len(response.content) if decoded is None else decoded
+
+    def record_rejected(self, raw: int, sent: int) -> None:
+        """服务端拒绝了压缩请求体，撤销 record_request 的统计"""
+        self.requests_rejected += 1
+        self.requests_compressed -= 1
+        self.request_bytes_raw -= raw
+        self.request_bytes_sent -= sent
+
+    @property
+    def bytes_saved(self) -> int:
+        """压缩节省的总字节数（上行 + 下行）"""
+        return (
+            self.request_bytes_raw - self.request_bytes_sent
+            + self.response_bytes_decoded - self.response_bytes_received
+        )
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "requests_compressed": self.requests_compressed,
+            "request_bytes_raw": self.request_bytes_raw,
+            "request_bytes_sent": self.request_bytes_sent,
+            "requests_rejected": self.requests_rejected,
+            "responses_compressed": self.responses_compressed,
+            "response_bytes_received": self.response_bytes_received,
+            "response_bytes_decoded": self.response_bytes_decoded,
+            "bytes_saved": self.bytes_saved,
+        }
@@ -0,0 +1,235 @@
+"""
+Adaptive Concurrency - 自适应并发限制 (AIMD)
+
+批量读取（如并发调用 IssueResource.get / ContentResource.get）的固定并发数很难选:
+太小浪费吞吐，太大压垮服务端。AdaptiveLimiter 按 AIMD 自动调整并发上限:
+- 加性增: 延迟平稳且并发被充分使用时，每轮（约 limit 个成功请求）上限 + increase
+- 乘性减: 出现 429 / 5xx / 连接异常，或延迟超过该接口基线的 latency_tolerance 倍时，
+  上限乘以 decrease_ratio；同一轮拥塞（降低前已发出的请求）只降低一次
+- 基线延迟按接口模板慢速跟踪（EWMA），服务端整体变慢后基线随之上移，不会一直卡在最小值
+
+客户端配置了 concurrency_limiter 后，每次 HTTP 尝试都先占用一个并发名额，
+超出上限的请求排队等待；client.gather 与 get_many 等批量方法因此自动受其约束。
+同一个 AdaptiveLimiter 实例可以在多个客户端之间共享，共同遵守一个并发上限。
+
+用法:
+    limiter = AdaptiveLimiter(ConcurrencyPolicy(initial_limit=4, max_limit=64))
+    async with JiraClient(concurrency_limiter=limiter) as jira:
+        issues = await jira.issue.get_many(keys)
+        print(limiter.limit, limiter.snapshot())
+"""
+
+import asyncio
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ConcurrencyPolicy:
+    """AIMD 调整参数"""
+
+    initial_limit: int = 8
+    min_limit: int = 1
+    max_limit: int = 64
+    increase: float = 1.0  # 每轮增加的并发数
+    decrease_ratio: float = 0.7  # 拥塞时上限乘以该系数
+    latency_tolerance: float = 2.0  # 延迟超过基线多少倍视为拥塞
+    latency_floor: float = 0.05  # 低于该延迟（秒）不视为拥塞，避免小延迟抖动
+    baseline_alpha: float = 0.05  # 基线延迟 EWMA 平滑系数
+    failure_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+
+    def __post_init__(self) -> None:
+        if self.min_limit < 1:
+            raise ValueError("min_limit must be >= 1")
+        if not self.min_limit <= self.initial_limit <= self.max_limit:
+            raise ValueError("initial_limit must be between min_limit and max_limit")
+        if self.increase <= 0:
+            raise ValueError("increase must be > 0")
+        if not 0 < self.decrease_ratio < 1:
+            raise ValueError("decrease_ratio must be in (0, 1)")
+        if self.latency_tolerance <= 1:
+            raise ValueError("latency_tolerance must be > 1")
+        if not 0 < self.baseline_alpha <= 1:
+            raise ValueError("baseline_alpha must be in (0, 1]")
+
+
+@dataclass
+class ConcurrencyStats:
+    """
+    并发限制统计
+
+    - queued: 因达到上限而排队等待的请求数
+    - peak_inflight: 最大同时进行的请求数
+    - error_backoffs / latency_backoffs: 因错误 / 延迟升高降低上限的次数
+    """
+
+    queued: int = 0
+    peak_inflight: int = 0
+    error_backoffs: int = 0
+    latency_backoffs: int = 0
+
+
+class AdaptiveLimiter:
+    """AIMD 自适应并发限制器"""
+
+    def __init__(self, policy: Optional[ConcurrencyPolicy] = None):
+        self.policy = policy or ConcurrencyPolicy()
+        self.stats = ConcurrencyStats()
+        self._limit = float(self.policy.initial_limit)
+        self._inflight = 0
+        # 每次降低上限后递增；名额记录获取时的轮次，旧轮次的拥塞信号不再重复降低
+        self._epoch = 0
+        self._baselines: dict[str, float] = {}
+        self._waiters: deque[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        """当前并发上限"""
+        return int(self._limit)
+
+    @property
+    def inflight(self) -> int:
+        """进行中的请求数"""
+        return self._inflight
+
+    async def acquire(self) -> int:
+        """
+        占用一个并发名额，达到上限时排队等待
+
+        Returns:
+            int: 名额所属的轮次，传给 release
+        """
+        loop = asyncio.get_running_loop()
+        queued = False
+        while True:
+            with self._lock:
+                if self._inflight < int(self._limit):
+                    self._inflight += 1
+                    self.stats.peak_inflight = max(self.stats.peak_inflight, self._inflight)
+                    return self._epoch
+                waiter = loop.create_future()
+                self._waiters.append((loop, waiter))
+                if not queued:
+                    queued = True
+                    self.stats.queued += 1
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with self._lock:
+                    try:
+                        self._waiters.remove((loop, waiter))
+                    except ValueError:
+                        # 已被唤醒但来不及占用名额，把唤醒让给下一个等待者
+                        # （唤醒尚未送达时由 _resolve 转交）
+                        if not waiter.cancelled():
+                            self._wake(1)
+                raise
+
+    def try_acquire(self) -> Optional[int]:
+        """
+        不等待地占用一个并发名额（如对冲请求）
+
+        Returns:
+            Optional[int]: 名额所属的轮次；已达上限或有请求在排队时返回 None
+        """
+        with self._lock:
+            if self._waiters or self._inflight >= int(self._limit):
+                return None
+            self._inflight += 1
+            self.stats.peak_inflight = max(self.stats.peak_inflight, self._inflight)
+            return self._epoch
+
+    def release(
+        self,
+        slot: int,
+        elapsed: Optional[float] = None,
+        failed: bool = False,
+        key: str = "",
+    ) -> None:
+        """
+        归还名额并根据结果调整上限
+
+        Args:
+            slot: acquire 返回的轮次
+            elapsed: 响应耗时（秒），None 表示请求未完成（如被取消），不参与调整
+            failed: 是否为拥塞信号（429 / 5xx / 连接异常等）
+            key: 接口模板，按接口分别跟踪基线延迟
+        """
+        with self._lock:
+            self._inflight -= 1
+            if elapsed is not None:
+                self._adjust(slot, elapsed, failed, key)
+            self._wake(int(self._limit) - self._inflight)
+
+    def _adjust(self, slot: int, elapsed: float, failed: bool, key: str) -> None:
+        policy = self.policy
+        spiked = False
+        if not failed:
+            baseline = self._baselines.get(key)
+            spiked = (
+                baseline is not None
+                and elapsed > policy.latency_floor
+                and elapsed > baseline * policy.latency_tolerance
+            )
+            self._baselines[key] = (
+                elapsed if baseline is None else baseline + policy.baseline_alpha * (elapsed - baseline)
+            )
+
+        if failed or spiked:
+            if slot != self._epoch:
+                return
+            self._epoch += 1
+            previous = self._limit
+            self._limit = max(float(policy.min_limit), self._limit * policy.decrease_ratio)
+            if failed:
+                self.stats.error_backoffs += 1
+            else:
+                self.stats.latency_backoffs += 1
+            logger.debug(
+                f"Concurrency limit {int(previous)} -> {int(self._limit)} "
+                f"({'error' if failed else f'latency {elapsed:.3f}s'} on {key or 'request'})"
+            )
+        elif self._inflight + 1 >= self._limit / 2:
+            # 只在并发被充分使用时增长，避免调用方并发不足时上限无限膨胀
+            self._limit = min(float(policy.max_limit), self._limit + policy.increase / self._limit)
+
+    def _wake(self, count: int) -> None:
+        """唤醒最多 count 个等待者重新尝试占用名额（需持有锁）"""
+        while count > 0 and self._waiters:
+            loop, waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            try:
+                loop.call_soon_threadsafe(self._resolve, waiter)
+            except RuntimeError:
+                # 等待者所在的事件循环已关闭
+                continue
+            count -= 1
+
+    def _resolve(self, waiter: asyncio.Future) -> None:
+        if waiter.done():
+            # 等待者在唤醒送达前被取消
+            with self._lock:
+                self._wake(1)
+            return
+        waiter.set_result(None)
+
+    def snapshot(self) -> dict[str, Any]:
+        """当前上限、进行中 / 排队请求数与调整统计"""
+        with self._lock:
+            return {
+                "limit": int(self._limit),
+                "inflight": self._inflight,
+                "waiting": len(self._waiters),
+                "queued": self.stats.queued,
+                "peak_inflight": self.stats.peak_inflight,
+                "error_backoffs": self.stats.error_backoffs,
+                "latency_backoffs": self.stats.latency_backoffs,
+                "baselines": dict(self._baselines),
+            }
@@ -33,10 +33,17 @@ class AtlassianOAuthError(AtlassianAuthError):
 class AtlassianAPIError(AtlassianError):
     """API 调用异常"""
 
-    def __init__(self, message: str, status_code: int | None = None, response: dict | None = None):
+    def __init__(
+        self,
+        message: str,
+        status_code: int | None = None,
+        response: dict | None = None,
+        attempts: int = 1,
+    ):
         super().__init__(message)
         self.status_code = status_code
         self.response = response
+        self.attempts = attempts
 
 
 class AtlassianNotFoundError(AtlassianAPIError):
@@ -47,3 +54,56 @@ class AtlassianNotFoundError(AtlassianAPIError):
 class AtlassianPermissionError(AtlassianAPIError):
     """权限不足异常 (403)"""
     pass
+
+
+class AtlassianRateLimitError(AtlassianAPIError):
+    """服务端限流异常 (429)，重试耗尽后抛出"""
+
+    def __init__(
+        self,
+        message: str,
+        status_code: int | None = 429,
+        response: dict | None = None,
+        attempts: int = 1,
+        retry_after: float | None = None,
+    ):
+        super().__init__(message, status_code=status_code, response=response, attempts=attempts)
+        self.retry_after = retry_after
+
+
+class AtlassianRetryExhaustedError(AtlassianAPIError):
+    """可重试的错误 (5xx / 连接异常) 在重试次数或时间预算耗尽后仍未成功"""
+    pass
+
+
+class AtlassianCircuitOpenError(AtlassianAPIError):
+    """接口族熔断器处于打开状态，请求未发出即失败"""
+
+    def __init__(self, endpoint: str, retry_after: float | None = None):
+        super().__init__(
+            f"Circuit open for {endpoint}"
+            + (f", retry in {retry_after:.1f}s" if retry_after else ""),
+            attempts=0,
+        )
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+
+class AtlassianDeadlineExceededError(AtlassianAPIError):
+    """操作的整体截止时间 (deadline) 已到，或剩余预算不足以完成下一次请求 / 退避等待"""
+
+    def __init__(
+        self,
+        message: str,
+        status_code: int | None = None,
+        response: dict | None = None,
+        attempts: int = 0,
+        timeout: float | None = None,
+    ):
+        super().__init__(message, status_code=status_code, response=response, attempts=attempts)
+        self.timeout = timeout
+
+
+class AtlassianCassetteError(AtlassianError):
+    """录制/回放异常（如回放时 cassette 中没有匹配的请求）"""
+    pass
@@ -0,0 +1,176 @@
+"""
+Request Hedging - 对冲 GET 请求以削减长尾延迟
+
+Data Center 集群中个别节点变慢时，issue.get / search 的 p99 会远高于中位数。
+对冲: 幂等 GET 在自适应阈值（该接口模板近期延迟的 percentile 分位）内仍未返回时，
+再发出一个相同的请求（可选发往备用节点），采用先到的响应并取消另一个。
+
+- 阈值按接口模板分别统计，样本不足 min_samples 时使用 initial_delay，并限制在 [min_delay, max_delay]
+- 全局预算: 每个请求积累 budget_ratio 个令牌（最多 budget_burst 个），每次对冲消耗 1 个，
+  因此额外负载不超过约 budget_ratio；后端整体变慢时不会把流量翻倍
+- 对冲请求与原请求一样经过客户端的 rate_limiter / concurrency_limiter / circuit_breaker，
+  但不排队: 没有立即可用的令牌或并发名额、或熔断器未处于关闭状态时不对冲
+- 备用节点的响应为 5xx / 401 / 429 时不采用（例如会话只在原节点有效），继续等待原请求
+- 客户端配置了 node_router 时，对冲请求发往另一个健康节点（Session 模式下仍发往会话所属节点）
+
+同一个 Hedger 实例可以在多个客户端之间共享，此时预算也是共享的。
+
+用法:
+    hedger = Hedger(HedgePolicy(percentile=0.95, budget_ratio=0.05,
+                                alternate_urls=("https://jira-node2.internal",)))
+    jira = JiraClient(hedger=hedger)
+    ...
+    print(hedger.snapshot())
+"""
+
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from itertools import cycle
+from typing import Any, Iterator, Optional
+
+HEDGE_METHODS = frozenset({"GET", "HEAD"})
+
+# 备用节点返回这些状态码时不采用该响应
+_UNUSABLE_STATUSES = frozenset({401, 429})
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    """对冲参数"""
+
+    percentile: float = 0.95  # 以该分位的近期延迟作为对冲阈值
+    min_samples: int = 20  # 样本数达到该值前使用 initial_delay
+    window: int = 200  # 每个接口模板保留的延迟样本数
+    initial_delay: float = 1.0  # 样本不足时的阈值（秒）
+    min_delay: float = 0.01
+    max_delay: float = 10.0
+    budget_ratio: float = 0.1  # 对冲请求占全部请求的比例上限
+    budget_burst: int = 10  # 预算最多累积的对冲次数
+    # 对冲请求轮流发往的备用节点，为空时发往原地址；配置了 node_router 时由其选择节点，不能同时使用
+    alternate_urls: tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        if not 0 < self.percentile < 1:
+            raise ValueError("percentile must be in (0, 1)")
+        if self.min_samples < 1 or self.window < self.min_samples:
+            raise ValueError("window must be >= min_samples >= 1")
+        if not 0 < self.min_delay <= self.max_delay:
+            raise ValueError("min_delay must be > 0 and <= max_delay")
+        if not 0 < self.budget_ratio <= 1:
+            raise ValueError("budget_ratio must be in (0, 1]")
+        if self.budget_burst < 1:
+            raise ValueError("budget_burst must be >= 1")
+        object.__setattr__(
+            self, "alternate_urls", tuple(url.rstrip("/") for url in self.alternate_urls)
+        )
+
+
+@dataclass
+class HedgeStats:
+    """对冲统计"""
+
+    requests: int = 0  # 可对冲的请求数
+    hedged: int = 0  # 发出对冲的请求数
+    hedge_wins: int = 0  # 对冲请求先返回的次数
+    budget_denied: int = 0  # 超过阈值但预算不足未对冲的次数
+    throttled: int = 0  # 超过阈值但限流、并发名额或熔断器不允许而未对冲的次数
+    rejected: int = 0  # 备用节点响应不可用而被丢弃的次数
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "budget_denied": self.budget_denied,
+            "throttled": self.throttled,
+            "rejected": self.rejected,
+            "hedge_ratio": self.hedged / self.requests if self.requests else 0.0,
+        }
+
+
+@dataclass
+class _LatencyWindow:
+    samples: deque = field(default_factory=deque)
+    threshold: Optional[float] = None
+    pending: int = 0  # 上次计算阈值后新增的样本数
+
+
+class Hedger:
+    """对冲阈值、全局预算与统计"""
+
+    # 每新增多少个样本重新计算一次分位数
+    RECOMPUTE_EVERY = 16
+
+    def __init__(self, policy: Optional[HedgePolicy] = None):
+        self.policy = policy or HedgePolicy()
+        self.stats = HedgeStats()
+        self._windows: dict[str, _LatencyWindow] = {}
+        self._tokens = float(self.policy.budget_burst)
+        self._alternates: Optional[Iterator[str]] = (
+            cycle(self.policy.alternate_urls) if self.policy.alternate_urls else None
+        )
+        self._lock = threading.Lock()
+
+    def delay_for(self, template: str) -> float:
+        """返回该接口模板的对冲阈值（秒），并为本次请求积累预算"""
+        policy = self.policy
+        with self._lock:
+            self.stats.requests += 1
+            self._tokens = min(float(policy.budget_burst), self._tokens + policy.budget_ratio)
+            window = self._windows.get(template)
+            threshold = window.threshold if window is not None else None
+        if threshold is None:
+            threshold = policy.initial_delay
+        return min(max(threshold, policy.min_delay), policy.max_delay)
+
+    def try_acquire(self) -> bool:
+        """消耗一次对冲预算"""
+        with self._lock:
+            if self._tokens >= 1:
+                self._tokens -= 1
+                self.stats.hedged += 1
+                return True
+            self.stats.budget_denied += 1
+            return False
+
+    def observe(self, template: str, elapsed: float) -> None:
+        """记录一次响应延迟"""
+        policy = self.policy
+        with self._lock:
+            window = self._windows.get(template)
+            if window is None:
+                window = self._windows[template] = _LatencyWindow(deque(maxlen=policy.window))
+            window.samples.append(elapsed)
+            window.pending += 1
+            if len(window.samples) >= policy.min_samples and (
+                window.threshold is None or window.pending >= self.RECOMPUTE_EVERY
+            ):
+                ordered = sorted(window.samples)
+                window.threshold = ordered[min(len(ordered) - 1, int(policy.percentile * len(ordered)))]
+                window.pending = 0
+
+    def hedge_target(self, path: str) -> str:
+        """对冲请求的地址: 轮流选择备用节点，未配置时为原路径"""
+        if self._alternates is None or path.startswith(("http://", "https://")):
+            return path
+        with self._lock:
+            return f"{next(self._alternates)}{path}"
+
+    @staticmethod
+    def is_usable(status_code: int) -> bool:
+        """备用节点的响应是否可以采用"""
+        return status_code < 500 and status_code not in _UNUSABLE_STATUSES
+
+    def snapshot(self) -> dict[str, Any]:
+        """统计与各接口模板当前的对冲阈值"""
+        with self._lock:
+            return {
+                **self.stats.snapshot(),
+                "budget": self._tokens,
+                "thresholds": {
+                    template: window.threshold
+                    for template, window in sorted(self._windows.items())
+                    if window.threshold is not None
+                },
+            }
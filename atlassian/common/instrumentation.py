@@ -0,0 +1,428 @@
+"""
+Instrumentation - 请求生命周期钩子与指标
+
+为 BaseHttpClient 提供可观测性:
+- 事件钩子: 请求开始 / 结束（每次 HTTP 尝试一次）、登录 / 重新登录
+- 按接口模板聚合的延迟直方图: /rest/api/2/issue/DEMO-1 与 /rest/api/2/issue/demo-2
+  归入同一个模板 /rest/api/2/issue/{key}；/project/ 后的项目 Key 统一为大写
+- 上行 / 下行字节数、状态码分布、重试次数
+- 熔断器状态变化（配置了 circuit_breaker 时）
+- snapshot() 导出为普通字典，便于写入日志或推送到监控系统
+
+未配置 instrumentation 时客户端只多一次 None 判断，没有额外开销。
+同一个 Instrumentation 实例可以在多个客户端之间共享。
+
+用法:
+    instrumentation = Instrumentation()
+    instrumentation.add_hook("request_end", lambda e: print(e.template, e.status_code, e.elapsed))
+    async with JiraClient(instrumentation=instrumentation) as jira:
+        await jira.issue.get("DEMO-1")
+    print(instrumentation.snapshot())
+"""
+
+import asyncio
+import functools
+import logging
+import re
+import threading
+import time
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional
+
+import httpx
+
+if TYPE_CHECKING:
+    from atlassian.common.circuit import CircuitEvent
+
+logger = logging.getLogger(__name__)
+
+# 直方图桶上界（秒），最后一个桶为 +inf
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Jira 接受任意大小写的 Key，按大小写不敏感匹配，避免同一接口拆成多个模板
+_ISSUE_KEY = re.compile(r"^[A-Z][A-Z0-9_]*-\d+$", re.IGNORECASE)
+_PROJECT_KEY = re.compile(r"^[A-Z][A-Z0-9_]+$", re.IGNORECASE)
+# /rest/api/2/project/ 下不是项目 Key 的子路径
+_PROJECT_SUBRESOURCES = frozenset({"type"})
+_NUMERIC = re.compile(r"^-?\d+$")
+_OPAQUE_ID = re.compile(r"^(?:[0-9a-fA-F]{8}-[0-9a-fA-F-]{27}|[0-9a-fA-F]{24,}|\d+:[0-9a-fA-F-]{24,})$")
+_PLACEHOLDER = re.compile(r"\{[^/{}]+\}")
+
+OTHER_TEMPLATE = "{other}"
+
+EVENTS = ("request_start", "request_end", "login", "circuit")
+
+# 熔断器进入各状态的计数字段
+_CIRCUIT_COUNTERS = {"open": "opened", "half_open": "half_opened", "closed": "closed"}
+
+
+@dataclass
+class RequestEvent:
+    """一次 HTTP 尝试（重试与重新登录后的重放各算一次）"""
+
+    method: str
+    path: str
+    template: str
+    attempt: int  # 从 1 开始，大于 1 表示重试或重新登录后的重放
+    started: float  # time.perf_counter()
+    status_code: Optional[int] = None
+    elapsed: float = 0.0  # 秒
+    bytes_out: int = 0
+    bytes_in: int = 0
+    error: Optional[BaseException] = None  # 被取消的尝试为 asyncio.CancelledError
+    project: Optional[str] = None  # 路径中的项目 Key（大写），见 project_key
+
+
+@dataclass
+class LoginEvent:
+    """一次登录（Session 模式）"""
+
+    base_url: str
+    relogin: bool
+    elapsed: float = 0.0
+    error: Optional[BaseException] = None
+
+
+class LatencyHistogram:
+    """固定桶延迟直方图"""
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.bounds = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def percentile(self, q: float) -> float:
+        """按桶上界估算分位数（落在 +inf 桶时返回观测到的最大值）"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return min(self.bounds[index], self.max) if index < len(self.bounds) else self.max
+        return self.max
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "avg": self.total / self.count if self.count else 0.0,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "buckets": {
+                **{str(bound): count for bound, count in zip(self.bounds, self.counts)},
+                "+inf": self.counts[-1],
+            },
+        }
+
+
+@dataclass
+class EndpointMetrics:
+    """单个 "METHOD 模板" 的指标"""
+
+    latency: LatencyHistogram
+    requests: int = 0
+    retries: int = 0
+    errors: int = 0  # 连接 / 超时等未拿到响应的尝试
+    cancelled: int = 0  # 被取消的尝试（对冲落败、deadline 到期等）
+    bytes_out: int = 0
+    bytes_in: int = 0
+    status: dict[int, int] = field(default_factory=dict)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "errors": self.errors,
+            "cancelled": self.cancelled,
+            "bytes_out": self.bytes_out,
+            "bytes_in": self.bytes_in,
+            "status": {str(code): count for code, count in sorted(self.status.items())},
+            "latency": self.latency.snapshot(),
+        }
+
+
+def _normalize_segment(segment: str) -> str:
+    if _NUMERIC.match(segment):
+        return "{id}"
+    if _ISSUE_KEY.match(segment):
+        return "{key}"
+    if _OPAQUE_ID.match(segment):
+        return "{id}"
+    return segment
+
+
+def _is_project_key(segments: list[str], index: int) -> bool:
+    return (
+        index > 0
+        and segments[index - 1] == "project"
+        and segments[index].lower() not in _PROJECT_SUBRESOURCES
+        and bool(_PROJECT_KEY.match(segments[index]))
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def endpoint_template(path: str) -> str:
+    """
+    按内置规则将请求路径归一化为接口模板
+
+    数字 ID、Issue Key 与 UUID 等不透明 ID 替换为 {id} / {key}，
+    /project/ 后的项目 Key 统一为大写，/rest/xxx/2 中的版本号保持原样。
+    """
+    segments = path.split("?", 1)[0].split("/")
+    return "/".join(
+        segment
+        if index >= 2 and segments[index - 2] == "rest"
+        else segment.upper()
+        if _is_project_key(segments, index)
+        else _normalize_segment(segment)
+        for index, segment in enumerate(segments)
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def project_key(path: str) -> Optional[str]:
+    """路径中的项目 Key（来自 Issue Key 或 /project/{key}），统一为大写；没有时返回 None"""
+    segments = path.split("?", 1)[0].split("/")
+    for index, segment in enumerate(segments):
+        if _ISSUE_KEY.match(segment):
+            return segment.rsplit("-", 1)[0].upper()
+        if _is_project_key(segments, index):
+            return segment.upper()
+    return None
+
+
+def request_body_size(response: httpx.Response) -> int:
+    """请求体字节数"""
+    return int(response.request.headers.get("Content-Length") or 0)
+
+
+def response_body_size(response: httpx.Response, streamed: bool = False) -> int:
+    """响应体字节数"""
+    if streamed:
+        # 流式响应体尚未读取，按声明的长度统计
+        return int(response.headers.get("Content-Length") or 0)
+    # 优先统计线上（压缩后）字节数；mock 等预置响应体时回退到响应体长度
+    return response.num_bytes_downloaded or len(response.content)
+
+
+def _compile_template(template: str) -> re.Pattern:
+    pattern = ""
+    last = 0
+    for m in _PLACEHOLDER.finditer(template):
+        pattern += re.escape(template[last:m.start()]) + "[^/]+"
+        last = m.end()
+    return re.compile(f"^{pattern}{re.escape(template[last:])}$")
+
+
+class Instrumentation:
+    """
+    请求生命周期钩子与指标收集
+
+    钩子为普通同步函数，在事件循环中同步调用，应尽量轻量；
+    钩子抛出的异常会被记录日志并忽略，不影响请求本身。
+    """
+
+    def __init__(
+        self,
+        templates: Optional[Iterable[str]] = None,
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+        collect_metrics: bool = True,
+        max_templates: int = 500,
+    ):
+        """
+        Args:
+            templates: 自定义接口模板（如 "/rest/api/2/project/{projectKey}"），优先于内置规则;
+                内置规则只识别数字 ID、Issue Key 与 UUID 等不透明 ID（/rest/xxx/2 中的版本号除外）
+            buckets: 延迟直方图桶上界（秒）
+            collect_metrics: 为 False 时只调用钩子，不聚合指标
+            max_templates: 模板数量上限，超出后归入 "{other}"，防止指标无限增长
+        """
+        self.buckets = tuple(buckets)
+        self.collect_metrics = collect_metrics
+        self.max_templates = max_templates
+        self._templates = [(t, _compile_template(t)) for t in (templates or ())]
+        self._template_cache: dict[str, str] = {}
+        self._hooks: dict[str, list[Callable[[Any], None]]] = {name: [] for name in EVENTS}
+        self._lock = threading.Lock()
+        self._started = time.time()
+        self._endpoints: dict[str, EndpointMetrics] = {}
+        self.logins = 0
+        self.relogins = 0
+        self.login_failures = 0
+        self.login_latency = LatencyHistogram(self.buckets)
+        self._circuits: dict[str, dict[str, Any]] = {}
+
+    # ========== Hooks ==========
+
+    def add_hook(self, event: str, callback: Callable[[Any], None]) -> Callable[[], None]:
+        """
+        注册钩子
+
+        Args:
+            event: "request_start" / "request_end"（参数为 RequestEvent）、"login"（参数为 LoginEvent）
+                或 "circuit"（参数为 CircuitEvent）
+            callback: 回调函数
+
+        Returns:
+            取消注册的函数
+        """
+        if event not in self._hooks:
+            raise ValueError(f"Unknown instrumentation event: {event!r} (expected one of {EVENTS})")
+        self._hooks[event].append(callback)
+        return lambda: self._hooks[event].remove(callback)
+
+    def _emit(self, event: str, payload: Any) -> None:
+        for callback in self._hooks[event]:
+            try:
+                callback(payload)
+            except Exception:
+                logger.exception(f"Instrumentation hook {event} failed")
+
+    # ========== Templates ==========
+
+    def template_for(self, path: str) -> str:
+        """将请求路径归一化为接口模板（不含查询参数）"""
+        path = path.split("?", 1)[0]
+        template = self._template_cache.get(path)
+        if template is not None:
+            return template
+        for candidate, pattern in self._templates:
+            if pattern.match(path):
+                template = candidate
+                break
+        else:
+            template = endpoint_template(path)
+        if len(self._template_cache) < self.max_templates * 4:
+            self._template_cache[path] = template
+        return template
+
+    # ========== Recording ==========
+
+    def request_started(self, method: str, path: str, attempt: int) -> RequestEvent:
+        event = RequestEvent(
+            method=method,
+            path=path,
+            template=self.template_for(path),
+            attempt=attempt,
+            started=time.perf_counter(),
+            project=project_key(path),
+        )
+        if self._hooks["request_start"]:
+            self._emit("request_start", event)
+        return event
+
+    def request_finished(
+        self,
+        event: RequestEvent,
+        response: Optional[httpx.Response] = None,
+        error: Optional[BaseException] = None,
+        streamed: bool = False,
+    ) -> None:
+        event.elapsed = time.perf_counter() - event.started
+        event.error = error
+        if response is not None:
+            event.status_code = response.status_code
+            event.bytes_out = request_body_size(response)
+            event.bytes_in = response_body_size(response, streamed)
+        if self.collect_metrics:
+            self._record(event)
+        if self._hooks["request_end"]:
+            self._emit("request_end", event)
+
+    def _record(self, event: RequestEvent) -> None:
+        key = f"{event.method} {event.template}"
+        with self._lock:
+            metrics = self._endpoints.get(key)
+            if metrics is None:
+                if len(self._endpoints) >= self.max_templates:
+                    key = f"{event.method} {OTHER_TEMPLATE}"
+                    metrics = self._endpoints.get(key)
+                if metrics is None:
+                    metrics = self._endpoints[key] = EndpointMetrics(LatencyHistogram(self.buckets))
+            metrics.requests += 1
+            if event.attempt > 1:
+                metrics.retries += 1
+            if isinstance(event.error, asyncio.CancelledError):
+                metrics.cancelled += 1
+            elif event.status_code is None:
+                metrics.errors += 1
+            else:
+                metrics.status[event.status_code] = metrics.status.get(event.status_code, 0) + 1
+            metrics.bytes_out += event.bytes_out
+            metrics.bytes_in += event.bytes_in
+            metrics.latency.observe(event.elapsed)
+
+    def login_finished(self, event: LoginEvent) -> None:
+        if self.collect_metrics:
+            with self._lock:
+                self.logins += 1
+                if event.relogin:
+                    self.relogins += 1
+                if event.error is not None:
+                    self.login_failures += 1
+                self.login_latency.observe(event.elapsed)
+        if self._hooks["login"]:
+            self._emit("login", event)
+
+    def circuit_changed(self, event: "CircuitEvent") -> None:
+        if self.collect_metrics:
+            with self._lock:
+                circuit = self._circuits.setdefault(
+                    event.key, {"state": "closed", "opened": 0, "half_opened": 0, "closed": 0}
+                )
+                circuit["state"] = event.state
+                circuit[_CIRCUIT_COUNTERS[event.state]] += 1
+        if self._hooks["circuit"]:
+            self._emit("circuit", event)
+
+    # ========== Export ==========
+
+    def snapshot(self) -> dict[str, Any]:
+        """导出全部指标"""
+        with self._lock:
+            endpoints = {key: m.snapshot() for key, m in sorted(self._endpoints.items())}
+            status: dict[str, int] = {}
+            for m in self._endpoints.values():
+                for code, count in m.status.items():
+                    status[str(code)] = status.get(str(code), 0) + count
+            return {
+                "since": self._started,
+                "requests": sum(m.requests for m in self._endpoints.values()),
+                "retries": sum(m.retries for m in self._endpoints.values()),
+                "errors": sum(m.errors for m in self._endpoints.values()),
+                "cancelled": sum(m.cancelled for m in self._endpoints.values()),
+                "bytes_out": sum(m.bytes_out for m in self._endpoints.values()),
+                "bytes_in": sum(m.bytes_in for m in self._endpoints.values()),
+                "status": dict(sorted(status.items())),
+                "logins": self.logins,
+                "relogins": self.relogins,
+                "login_failures": self.login_failures,
+                "login_latency": self.login_latency.snapshot(),
+                "endpoints": endpoints,
+                "circuits": {key: dict(c) for key, c in sorted(self._circuits.items())},
+            }
+
+    def reset(self) -> None:
+        """清空指标（保留钩子）"""
+        with self._lock:
+            self._endpoints.clear()
+            self.logins = self.relogins = self.login_failures = 0
+            self.login_latency = LatencyHistogram(self.buckets)
+            self._circuits.clear()
+            self._started = time.time()
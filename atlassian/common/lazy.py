@@ -0,0 +1,60 @@
+"""
+Lazy exports - 包级别的延迟导入
+
+包的 __init__ 只登记 "子模块 -> 导出名称"，首次访问某个名称时才导入对应子模块 (PEP 562)。
+`import atlassian` 因此不再连带导入所有资源类并构建所有 Pydantic 模型，
+只调用 jira.issue.get 的命令行工具或 serverless 冷启动只为实际用到的模块付出导入成本。
+
+用法 (包的 __init__.py):
+    from typing import TYPE_CHECKING
+
+    from atlassian.common.lazy import lazy_exports
+
+    if TYPE_CHECKING:
+        from atlassian.jira.models.user import User   # 供类型检查与 IDE 跳转
+
+    __getattr__, __dir__ = lazy_exports(__name__, {
+        "atlassian.jira.models.user": ("User",),
+    }, submodules=("models",))
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Iterable, Mapping
+
+
+def lazy_exports(
+    package: str,
+    exports: Mapping[str, tuple[str, ...]],
+    submodules: Iterable[str] = (),
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    创建模块级 __getattr__ / __dir__
+
+    Args:
+        package: 包名（传入 __name__）
+        exports: {子模块完整路径: (导出名称, ...)}
+        submodules: 作为包属性按需导入的子模块名（如 "models"，即 atlassian.jira.models）
+
+    Returns:
+        (__getattr__, __dir__)
+    """
+    origins = {name: module for module, names in exports.items() for name in names}
+    children = set(submodules)
+
+    def __getattr__(name: str) -> Any:
+        if name in children:
+            # 导入子模块时 importlib 会将其设置为包的属性
+            return importlib.import_module(f"{package}.{name}")
+        module = origins.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module), name)
+        # 写回包的命名空间，之后的访问不再经过 __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(origins) | children)
+
+    return __getattr__, __dir__
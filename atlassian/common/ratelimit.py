@@ -0,0 +1,236 @@
+"""
+Rate Limit - 客户端令牌桶限流
+
+在请求发出前按主机与接口族（路径前缀）限流，避免批量任务触发服务端限流。
+同一个 RateLimiter 实例可以在多个 JiraClient / ConfluenceClient / TempoClient 之间共享，
+例如它们位于同一个反向代理之后时。
+
+用法:
+    limiter = RateLimiter(
+        default=RateLimit(rate=50, burst=100),          # 每个主机的总预算
+        endpoints={
+            SEARCH_PATH: RateLimit(rate=5, burst=10),
+            TEMPO_WORKLOG_SEARCH_PATH: RateLimit(rate=2, burst=4),
+        },
+    )
+    jira = JiraClient(rate_limiter=limiter)
+    tempo = TempoClient(rate_limiter=limiter)
+    ...
+    print(limiter.stats())
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional
+
+SEARCH_PATH = "/rest/api/2/search"
+TEMPO_WORKLOG_SEARCH_PATH = "/rest/tempo-timesheets/4/worklogs/search"
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """令牌桶参数: 每秒补充 rate 个令牌，最多累积 burst 个"""
+
+    rate: float
+    burst: int = 1
+
+    def __post_init__(self) -> None:
+        if self.rate <= 0:
+            raise ValueError("rate must be > 0")
+        if self.burst < 1:
+            raise ValueError("burst must be >= 1")
+
+
+@dataclass
+class BucketStats:
+    """单个令牌桶的等待统计"""
+
+    acquired: int = 0
+    waited: int = 0
+    wait_total: float = 0.0
+    wait_max: float = 0.0
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "acquired": self.acquired,
+            "waited": self.waited,
+            "wait_total": self.wait_total,
+            "wait_avg": self.wait_total / self.waited if self.waited else 0.0,
+            "wait_max": self.wait_max,
+        }
+
+
+class TokenBucket:
+    """
+    异步令牌桶
+
+    令牌不足时预留（余额可为负）并返回需要等待的时间，
+    因此并发调用者按到达顺序排队，不会互相抢占。
+    等待期间被取消时归还预留的令牌，不占用后续调用者的预算。
+    """
+
+    def __init__(self, limit: RateLimit):
+        self.limit = limit
+        self.stats = BucketStats()
+        self._tokens = float(limit.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            float(self.limit.burst),
+            self._tokens + (now - self._updated) * self.limit.rate,
+        )
+        self._updated = now
+
+    def _reserve(self, tokens: float) -> float:
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.limit.rate
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """令牌足够时立即获取并返回 True，否则不预留、返回 False"""
+        with self._lock:
+            self._refill()
+            if self._tokens < tokens:
+                return False
+            self._tokens -= tokens
+        self.stats.acquired += 1
+        return True
+
+    def _refund(self, tokens: float) -> None:
+        with self._lock:
+            self._tokens += tokens
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """获取令牌，返回实际等待的秒数"""
+        delay = self._reserve(tokens)
+        stats = self.stats
+        stats.acquired += 1
+        if delay > 0:
+            stats.waited += 1
+            stats.wait_total += delay
+            stats.wait_max = max(stats.wait_max, delay)
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self._refund(tokens)
+                raise
+        return delay
+
+
+class RateLimiter:
+    """
+    按主机 + 接口族限流的令牌桶集合
+
+    每个主机有一个总预算桶（default 或 hosts 中的配置），
+    命中 endpoints 中路径前缀的请求还需额外获取该接口族的令牌（每个主机独立）。
+    """
+
+    def __init__(
+        self,
+        default: Optional[RateLimit] = None,
+        hosts: Optional[Mapping[str, RateLimit]] = None,
+        endpoints: Optional[Mapping[str, RateLimit]] = None,
+    ):
+        """
+        Args:
+            default: 未在 hosts 中配置的主机使用的总预算，None 表示不限
+            hosts: 主机名 -> 总预算
+            endpoints: 路径前缀 -> 接口族预算（最长前缀匹配）
+        """
+        self.default = default
+        self.hosts = {host.lower(): limit for host, limit in (hosts or {}).items()}
+        self.endpoints = dict(endpoints or {})
+        self._prefixes = sorted(self.endpoints, key=len, reverse=True)
+        self._buckets: dict[tuple[str, str], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, host: str, family: str, limit: RateLimit) -> TokenBucket:
+        key = (host, family)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.setdefault(key, TokenBucket(limit))
+        return bucket
+
+    def match_family(self, path: str) -> Optional[str]:
+        """返回路径命中的接口族前缀"""
+        for prefix in self._prefixes:
+            if path.startswith(prefix):
+                return prefix
+        return None
+
+    async def acquire(self, host: str, path: str) -> float:
+        """
+        为一次请求获取令牌
+
+        Args:
+            host: 目标主机名
+            path: 请求路径（不含 base_url）
+
+        Returns:
+            float: 累计等待秒数
+        """
+        host = host.lower()
+        waited = 0.0
+        host_limit = self.hosts.get(host, self.default)
+        host_bucket = None
+        if host_limit is not None:
+            host_bucket = self._bucket(host, "*", host_limit)
+            waited += await host_bucket.acquire()
+        family = self.match_family(path)
+        if family is not None:
+            try:
+                waited += await self._bucket(host, family, self.endpoints[family]).acquire()
+            except asyncio.CancelledError:
+                # 请求不会发出，主机总预算的令牌也一并归还
+                if host_bucket is not None:
+                    host_bucket._refund(1.0)
+                raise
+        return waited
+
+    def try_acquire(self, host: str, path: str) -> bool:
+        """
+        不等待地为一次请求获取令牌（如对冲请求）
+
+        Returns:
+            bool: 所有相关令牌桶都有可用令牌时获取并返回 True，否则不占用任何令牌
+        """
+        host = host.lower()
+        host_limit = self.hosts.get(host, self.default)
+        host_bucket = None
+        if host_limit is not None:
+            host_bucket = self._bucket(host, "*", host_limit)
+            if not host_bucket.try_acquire():
+                return False
+        family = self.match_family(path)
+        if family is not None:
+            if not self._bucket(host, family, self.endpoints[family]).try_acquire():
+                if host_bucket is not None:
+                    host_bucket._refund(1.0)
+                return False
+        return True
+
+    def refund(self, host: str, path: str) -> None:
+        """归还 try_acquire 获取但未使用的令牌"""
+        host = host.lower()
+        host_limit = self.hosts.get(host, self.default)
+        if host_limit is not None:
+            self._bucket(host, "*", host_limit)._refund(1.0)
+        family = self.match_family(path)
+        if family is not None:
+            self._bucket(host, family, self.endpoints[family])._refund(1.0)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """各令牌桶的等待统计，键为 "host path-prefix"（"*" 表示主机总预算）"""
+        return {
+            f"{host} {family}": bucket.stats.snapshot()
+            for (host, family), bucket in list(self._buckets.items())
+        }
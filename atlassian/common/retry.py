@@ -0,0 +1,133 @@
+"""
+Retry - 请求重试策略
+
+BaseHttpClient._request 在配置 retry_policy 后按本策略重试:
+- 429 (限流): 任意方法都可重试，服务端明确表示未处理该请求
+- 502/503/504: 仅重试幂等请求 (GET/HEAD/OPTIONS/PUT/DELETE)，
+  POST 需显式开启 retry_non_idempotent 或在调用时传入 idempotent=True
+- 连接建立失败 (ConnectError/ConnectTimeout/PoolTimeout): 请求尚未发出，任意方法都可重试
+- 读超时/协议错误: 仅重试幂等请求
+
+等待时间优先使用 Retry-After 响应头，否则使用带 full jitter 的指数退避；
+单次调用的累计等待时间受 max_retry_time 限制。
+OAuth 1.0a 请求每次重试都会经过 httpx auth_flow 重新签名（新的 nonce/timestamp）。
+"""
+
+import random
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import httpx
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# 请求尚未发送到服务端的传输异常，任意方法重试都是安全的
+_UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+# 请求可能已被服务端处理的传输异常，仅幂等请求可重试
+_SENT_ERRORS = (
+    httpx.ReadTimeout,
+    httpx.WriteTimeout,
+    httpx.ReadError,
+    httpx.WriteError,
+    httpx.RemoteProtocolError,
+)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """解析 Retry-After 响应头（秒数或 HTTP 日期），返回等待秒数"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    重试策略
+
+    可通过子类覆盖 is_retryable_response / is_retryable_exception / get_delay 定制行为。
+
+    用法:
+        policy = RetryPolicy(max_retries=5, backoff_base=1.0)
+        async with JiraClient(retry_policy=policy) as jira:
+            ...
+
+        # 单次调用覆盖: retry=False 禁用，idempotent=True 允许重试 POST
+        await jira.post_json("/rest/api/2/search", data=payload, idempotent=True)
+    """
+
+    max_retries: int = 3
+    retry_statuses: frozenset[int] = field(default_factory=lambda: frozenset({429, 502, 503, 504}))
+    idempotent_methods: frozenset[str] = IDEMPOTENT_METHODS
+    retry_non_idempotent: bool = False
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    respect_retry_after: bool = True
+    retry_after_max: float = 120.0
+    max_retry_time: float = 60.0
+
+    def __post_init__(self) -> None:
+        if self.max_retries < 0:
+            raise ValueError("max_retries must be >= 0")
+        if self.backoff_base < 0 or self.backoff_max < 0:
+            raise ValueError("backoff_base and backoff_max must be >= 0")
+        if self.max_retry_time < 0:
+            raise ValueError("max_retry_time must be >= 0")
+
+    def is_idempotent(self, method: str, idempotent: Optional[bool] = None) -> bool:
+        """请求是否可安全重放"""
+        if idempotent is not None:
+            return idempotent
+        return self.retry_non_idempotent or method.upper() in self.idempotent_methods
+
+    def is_retryable_response(
+        self,
+        method: str,
+        response: httpx.Response,
+        idempotent: Optional[bool] = None,
+    ) -> bool:
+        """响应是否应当重试"""
+        if response.status_code not in self.retry_statuses:
+            return False
+        if response.status_code == 429:
+            return True
+        return self.is_idempotent(method, idempotent)
+
+    def is_retryable_exception(
+        self,
+        method: str,
+        exc: Exception,
+        idempotent: Optional[bool] = None,
+    ) -> bool:
+        """传输异常是否应当重试"""
+        if isinstance(exc, _UNSENT_ERRORS):
+            return True
+        if isinstance(exc, _SENT_ERRORS):
+            return self.is_idempotent(method, idempotent)
+        return False
+
+    def get_delay(self, retry: int, response: Optional[httpx.Response] = None) -> float:
+        """
+        计算第 retry 次重试前的等待时间（秒）
+
+        Args:
+            retry: 重试序号，从 1 开始
+            response: 触发重试的响应（传输异常时为 None）
+        """
+        if self.respect_retry_after and response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.retry_after_max)
+        cap = min(self.backoff_max, self.backoff_base * (2 ** (retry - 1)))
+        return random.uniform(0, cap)
@@ -0,0 +1,187 @@
+"""
+Node Routing - Data Center 多节点路由
+
+Data Center 部署中通常可以绕过负载均衡直接访问各个节点。NodeRouter 管理一组节点地址，
+为每个请求选择节点并被动跟踪节点健康状况:
+- least_outstanding: 选择进行中请求最少的节点（相同时轮流）
+- latency: 选择 延迟 EWMA × (进行中请求 + 1) 最小的节点，慢节点自然分得更少流量
+- 连接失败的节点立即摘除，连续 failure_threshold 次 5xx / 超时后摘除，cooldown 秒后重新参与选择
+- 连接失败时自动换到其他节点重发（请求未发出，对任何方法都安全）
+
+Session 模式下会话 Cookie 只在登录的节点有效: 登录时选择节点并把会话绑定到该节点，
+之后的请求都发往该节点（会话亲和）；该节点被摘除时在其他节点重新登录。
+多个工作进程 / 客户端各自绑定到负载最低的节点，从而分摊批量导出的负载。
+Basic / OAuth 1.0a 模式下每个请求独立选择节点。
+
+同一个 NodeRouter 实例可以在多个客户端之间共享，节点负载与健康状态也随之共享。
+
+用法:
+    router = NodeRouter(
+        ["https://jira-node1.internal:8080", "https://jira-node2.internal:8080"],
+        RoutingPolicy(strategy="latency"),
+    )
+    async with JiraClient(base_url="https://jira.example.com", node_router=router) as jira:
+        ...
+    print(router.snapshot())
+"""
+
+import itertools
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Collection, Literal, Optional, Sequence
+
+import httpx
+
+RoutingStrategy = Literal["least_outstanding", "latency"]
+
+# 说明节点不可达的异常（请求尚未发出）
+CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+
+
+@dataclass(frozen=True)
+class RoutingPolicy:
+    """节点选择与健康判断参数"""
+
+    strategy: RoutingStrategy = "least_outstanding"
+    failure_threshold: int = 3  # 连续失败多少次后摘除节点
+    cooldown: float = 30.0  # 摘除后多久重新参与选择（秒）
+    latency_alpha: float = 0.3  # 延迟 EWMA 平滑系数
+    failure_statuses: frozenset[int] = frozenset({502, 503, 504})
+
+    def __post_init__(self) -> None:
+        if self.strategy not in ("least_outstanding", "latency"):
+            raise ValueError(f"Unsupported routing strategy: {self.strategy}")
+        if self.failure_threshold < 1:
+            raise ValueError("failure_threshold must be >= 1")
+        if self.cooldown < 0:
+            raise ValueError("cooldown must be >= 0")
+        if not 0 < self.latency_alpha <= 1:
+            raise ValueError("latency_alpha must be in (0, 1]")
+
+
+class Node:
+    """单个节点的负载与健康状态"""
+
+    def __init__(self, url: str):
+        self.url = url.rstrip("/")
+        self.host = httpx.URL(self.url).host
+        self.outstanding = 0
+        self.latency: Optional[float] = None  # EWMA（秒）
+        self.consecutive_failures = 0
+        self.down_until = 0.0  # time.monotonic()
+        self.requests = 0
+        self.failures = 0
+        self.ejections = 0
+        self._last_chosen = 0  # 轮流打破平局
+
+    def healthy(self, now: float) -> bool:
+        return now >= self.down_until
+
+    def snapshot(self, now: float) -> dict[str, Any]:
+        return {
+            "healthy": self.healthy(now),
+            "outstanding": self.outstanding,
+            "latency": self.latency,
+            "requests": self.requests,
+            "failures": self.failures,
+            "ejections": self.ejections,
+            "down_for": max(0.0, self.down_until - now),
+        }
+
+
+class NodeRouter:
+    """节点选择、负载与被动健康跟踪"""
+
+    def __init__(self, urls: Sequence[str], policy: Optional[RoutingPolicy] = None):
+        """
+        Args:
+            urls: 节点地址（如 https://jira-node1.internal:8080），上下文路径与 base_url 一致
+            policy: 选择策略与健康判断参数
+        """
+        if not urls:
+            raise ValueError("NodeRouter requires at least one node URL")
+        self.policy = policy or RoutingPolicy()
+        self.nodes = [Node(url) for url in urls]
+        self._by_url = {node.url: node for node in self.nodes}
+        if len(self._by_url) != len(self.nodes):
+            raise ValueError("Duplicate node URLs")
+        self._sequence = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def get(self, url: Optional[str]) -> Optional[Node]:
+        """按地址查找节点"""
+        return self._by_url.get(url.rstrip("/")) if url else None
+
+    def is_healthy(self, node: Node) -> bool:
+        return node.healthy(time.monotonic())
+
+    def choose(self, exclude: Collection[Node] = ()) -> Node:
+        """
+        选择节点
+
+        优先在健康且未排除的节点中选择；都不可用时选择最早恢复的节点，
+        避免全部摘除后请求无处可发。
+        """
+        now = time.monotonic()
+        with self._lock:
+            candidates = [n for n in self.nodes if n.healthy(now) and n not in exclude]
+            if not candidates:
+                candidates = [n for n in self.nodes if n not in exclude] or self.nodes
+                node = min(candidates, key=lambda n: n.down_until)
+            elif self.policy.strategy == "latency":
+                node = min(
+                    candidates,
+                    key=lambda n: ((n.latency or 0.0) * (n.outstanding + 1), n._last_chosen),
+                )
+            else:
+                node = min(candidates, key=lambda n: (n.outstanding, n._last_chosen))
+            node._last_chosen = next(self._sequence)
+            return node
+
+    def start(self, node: Node) -> None:
+        """请求发往节点前调用"""
+        with self._lock:
+            node.outstanding += 1
+            node.requests += 1
+
+    def finish(
+        self,
+        node: Node,
+        elapsed: Optional[float] = None,
+        failed: bool = False,
+        unreachable: bool = False,
+    ) -> None:
+        """
+        请求结束后调用
+
+        Args:
+            elapsed: 响应耗时（秒），None 表示请求未完成（如被取消），不计入延迟与健康判断
+            failed: 是否为失败（5xx / 超时等）
+            unreachable: 节点不可达（连接失败），立即摘除
+        """
+        policy = self.policy
+        with self._lock:
+            node.outstanding -= 1
+            if elapsed is None:
+                return
+            if not failed:
+                node.consecutive_failures = 0
+                node.latency = (
+                    elapsed
+                    if node.latency is None
+                    else node.latency + policy.latency_alpha * (elapsed - node.latency)
+                )
+                return
+            node.failures += 1
+            node.consecutive_failures += 1
+            if unreachable or node.consecutive_failures >= policy.failure_threshold:
+                node.down_until = time.monotonic() + policy.cooldown
+                node.consecutive_failures = 0
+                node.ejections += 1
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """各节点的负载、延迟与健康状态"""
+        now = time.monotonic()
+        with self._lock:
+            return {node.url: node.snapshot(now) for node in self.nodes}
@@ -0,0 +1,347 @@
+"""
+Request Scheduler - 请求优先级与加权公平排队
+
+同一个客户端同时服务 Web 界面和后台同步任务时，夜间导出翻页 search 的几百个请求
+会占满连接池，界面发出的 issue.get 只能排在后面。RequestScheduler 在连接池之前调度请求:
+- 每个请求属于一个优先级类别（默认 interactive / default / batch）
+- 并发请求数不超过 max_concurrency（默认取 transport_config.max_connections），
+  超出的请求按类别排队
+- 有空闲名额时按加权公平排队（WFQ）选择下一个请求: 各类别按 weights 比例分享连接，
+  低权重类别不会饿死
+- reserved 为类别保留的名额，其他类别即使有积压也不能占用，
+  保证延迟敏感的请求总能立即拿到连接
+- 名额一直占用到响应体读取完毕或关闭（包括流式响应）
+- 排队时间受 httpx 的 pool 超时约束，超时抛出 httpx.PoolTimeout
+
+优先级通过上下文设置（contextvars，并发子任务会继承），或在单个请求上传入 priority=。
+
+用法:
+    scheduler = RequestScheduler(SchedulerPolicy(reserved={"interactive": 4}))
+    jira = JiraClient(scheduler=scheduler)
+
+    # 后台任务
+    with request_priority("batch"):
+        async for issue in jira.search.stream_raw("project = DEMO"):
+            ...
+
+    # Web 处理函数
+    with request_priority("interactive"):
+        issue = await jira.issue.get("DEMO-1")
+
+    print(scheduler.snapshot())
+"""
+
+import asyncio
+import itertools
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Coroutine, Iterator, Mapping, Optional, TypeVar
+
+import httpx
+
+T = TypeVar("T")
+
+# 请求上的优先级（BaseHttpClient 按 priority= 参数设置）
+PRIORITY_EXTENSION = "atlassian.priority"
+
+# 未配置 max_concurrency 且连接池不限连接数时的并发上限
+DEFAULT_MAX_CONCURRENCY = 100
+
+
+@dataclass(frozen=True)
+class SchedulerPolicy:
+    """优先级类别、权重与保留名额"""
+
+    weights: Mapping[str, float] = field(
+        default_factory=lambda: {"interactive": 8.0, "default": 4.0, "batch": 1.0}
+    )
+    reserved: Mapping[str, int] = field(default_factory=lambda: {"interactive": 2})
+    default_priority: str = "default"  # 未指定优先级的请求所属类别
+    max_concurrency: Optional[int] = None  # None 表示取客户端连接池的 max_connections
+
+    def __post_init__(self) -> None:
+        if not self.weights:
+            raise ValueError("weights must define at least one priority class")
+        if any(weight <= 0 for weight in self.weights.values()):
+            raise ValueError("weights must be > 0")
+        if self.default_priority not in self.weights:
+            raise ValueError(f"default_priority {self.default_priority!r} is not in weights")
+        unknown = set(self.reserved) - set(self.weights)
+        if unknown:
+            raise ValueError(f"reserved refers to unknown priority classes: {sorted(unknown)}")
+        if any(count < 0 for count in self.reserved.values()):
+            raise ValueError("reserved must be >= 0")
+        if self.max_concurrency is not None:
+            self.check_capacity(self.max_concurrency)
+
+    def check_capacity(self, max_concurrency: int) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        if sum(self.reserved.values()) >= max_concurrency:
+            raise ValueError("reserved slots must leave at least one shared slot")
+
+
+_current: ContextVar[Optional[str]] = ContextVar("atlassian_priority", default=None)
+
+
+def current_priority() -> Optional[str]:
+    """当前上下文的优先级类别，未设置时为 None"""
+    return _current.get()
+
+
+@contextmanager
+def request_priority(priority: str) -> Iterator[str]:
+    """
+    在上下文内为所有请求设置优先级类别
+
+    Args:
+        priority: 优先级类别（SchedulerPolicy.weights 中的名称）
+    """
+    token = _current.set(priority)
+    try:
+        yield priority
+    finally:
+        _current.reset(token)
+
+
+def bind_priority(coro: Coroutine[Any, Any, T]) -> Coroutine[Any, Any, T]:
+    """
+    将当前优先级绑定到协程上
+
+    用于把协程交给其他线程的事件循环执行（如 SyncClient）。
+    """
+    current = _current.get()
+    if current is None:
+        return coro
+
+    async def _run() -> T:
+        _current.set(current)
+        return await coro
+
+    return _run()
+
+
+@dataclass
+class PriorityStats:
+    """单个优先级类别的统计"""
+
+    requests: int = 0
+    queued: int = 0  # 需要排队的请求数
+    timeouts: int = 0  # 排队超时的请求数
+    wait_total: float = 0.0
+    wait_max: float = 0.0
+
+    def record_wait(self, waited: float) -> None:
+        self.queued += 1
+        self.wait_total += waited
+        self.wait_max = max(self.wait_max, waited)
+
+
+class _Waiter:
+    __slots__ = ("tag", "seq", "loop", "future", "enqueued")
+
+    def __init__(self, tag: float, seq: int, loop: asyncio.AbstractEventLoop):
+        self.tag = tag
+        self.seq = seq
+        self.loop = loop
+        self.future = loop.create_future()
+        self.enqueued = time.perf_counter()
+
+
+class RequestScheduler:
+    """按优先级加权公平调度请求，可在共享连接池的多个客户端之间共享"""
+
+    def __init__(self, policy: Optional[SchedulerPolicy] = None):
+        self.policy = policy or SchedulerPolicy()
+        self.max_concurrency = self.policy.max_concurrency
+        self.stats = {name: PriorityStats() for name in self.policy.weights}
+        self._inflight = {name: 0 for name in self.policy.weights}
+        self._total = 0
+        self._queues: dict[str, deque[_Waiter]] = {name: deque() for name in self.policy.weights}
+        # 虚拟时间与各类别最后分配的完成标签（WFQ）
+        self._vtime = 0.0
+        self._last_tag = {name: 0.0 for name in self.policy.weights}
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+    def bind_capacity(self, max_connections: Optional[int]) -> None:
+        """未配置 max_concurrency 时采用客户端连接池的连接数（BaseHttpClient 初始化时调用）"""
+        if self.max_concurrency is None:
+            capacity = max_connections or DEFAULT_MAX_CONCURRENCY
+            self.policy.check_capacity(capacity)
+            self.max_concurrency = capacity
+
+    def resolve(self, priority: Optional[str]) -> str:
+        """解析请求的优先级类别"""
+        priority = priority or current_priority() or self.policy.default_priority
+        if priority not in self.policy.weights:
+            raise ValueError(f"Unknown priority class: {priority!r}")
+        return priority
+
+    async def acquire(self, priority: str, timeout: Optional[float] = None) -> None:
+        """
+        占用一个名额，没有可用名额时按加权公平顺序排队
+
+        Args:
+            priority: 优先级类别（已解析）
+            timeout: 最长排队时间（秒），超时抛出 httpx.PoolTimeout
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self.stats[priority].requests += 1
+            # 每次调度后仍在排队的请求都无法占用名额，因此本类别无积压且可占用时直接分配
+            if not self._queues[priority] and self._admissible(priority):
+                self._grant(priority)
+                return
+            weight = self.policy.weights[priority]
+            tag = max(self._vtime, self._last_tag[priority]) + 1.0 / weight
+            self._last_tag[priority] = tag
+            waiter = _Waiter(tag, next(self._sequence), loop)
+            self._queues[priority].append(waiter)
+            self._dispatch()
+        try:
+            if timeout is None:
+                await waiter.future
+            else:
+                await asyncio.wait_for(asyncio.shield(waiter.future), timeout)
+        except (asyncio.CancelledError, asyncio.TimeoutError) as e:
+            with self._lock:
+                try:
+                    self._queues[priority].remove(waiter)
+                except ValueError:
+                    # 已分配名额: 结果已送达时在此归还，尚未送达时取消后由 _resolve 归还
+                    if waiter.future.done() and not waiter.future.cancelled():
+                        self._release(priority)
+                if isinstance(e, asyncio.TimeoutError):
+                    self.stats[priority].timeouts += 1
+            waiter.future.cancel()
+            if isinstance(e, asyncio.TimeoutError):
+                raise httpx.PoolTimeout(
+                    f"Timed out waiting {timeout:.2f}s for a {priority!r} request slot"
+                ) from None
+            raise
+        self.stats[priority].record_wait(time.perf_counter() - waiter.enqueued)
+
+    def release(self, priority: str) -> None:
+        """归还名额并调度排队的请求"""
+        with self._lock:
+            self._release(priority)
+
+    def _release(self, priority: str) -> None:
+        self._inflight[priority] -= 1
+        self._total -= 1
+        self._dispatch()
+
+    def _admissible(self, priority: str) -> bool:
+        """priority 类别能否占用一个名额（不能挤占其他类别尚未使用的保留名额）"""
+        held_back = sum(
+            max(0, count - self._inflight[name])
+            for name, count in self.policy.reserved.items()
+            if name != priority
+        )
+        return self._total < (self.max_concurrency or DEFAULT_MAX_CONCURRENCY) - held_back
+
+    def _grant(self, priority: str) -> None:
+        self._inflight[priority] += 1
+        self._total += 1
+
+    def _dispatch(self) -> None:
+        """按完成标签从小到大把空闲名额分配给可以占用的排队请求（需持有锁）"""
+        while True:
+            best: Optional[_Waiter] = None
+            best_priority = ""
+            for name, queue in self._queues.items():
+                if not queue or not self._admissible(name):
+                    continue
+                head = queue[0]
+                if best is None or (head.tag, head.seq) < (best.tag, best.seq):
+                    best, best_priority = head, name
+            if best is None:
+                return
+            self._queues[best_priority].popleft()
+            self._vtime = best.tag
+            self._grant(best_priority)
+            try:
+                best.loop.call_soon_threadsafe(self._resolve, best, best_priority)
+            except RuntimeError:
+                # 等待者所在的事件循环已关闭
+                self._inflight[best_priority] -= 1
+                self._total -= 1
+
+    def _resolve(self, waiter: _Waiter, priority: str) -> None:
+        if waiter.future.done():
+            # 等待者在名额送达前被取消
+            self.release(priority)
+            return
+        waiter.future.set_result(None)
+
+    def snapshot(self) -> dict[str, Any]:
+        """各优先级类别的进行中 / 排队请求数与排队时间"""
+        with self._lock:
+            classes = {}
+            for name, weight in self.policy.weights.items():
+                stats = self.stats[name]
+                classes[name] = {
+                    "weight": weight,
+                    "reserved": self.policy.reserved.get(name, 0),
+                    "inflight": self._inflight[name],
+                    "waiting": len(self._queues[name]),
+                    "requests": stats.requests,
+                    "queued": stats.queued,
+                    "timeouts": stats.timeouts,
+                    "mean_wait": stats.wait_total / stats.queued if stats.queued else 0.0,
+                    "max_wait": stats.wait_max,
+                }
+            return {"max_concurrency": self.max_concurrency, "classes": classes}
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """响应体读取完毕或关闭时归还调度名额"""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release: Optional[Callable[[], None]] = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._release is not None:
+                release, self._release = self._release, None
+                release()
+
+
+class _ScheduledTransport(httpx.AsyncBaseTransport):
+    """包装 transport，请求在发往连接池前经过 RequestScheduler"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, scheduler: RequestScheduler):
+        self._transport = transport
+        self._scheduler = scheduler
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        scheduler = self._scheduler
+        priority = scheduler.resolve(request.extensions.get(PRIORITY_EXTENSION))
+        timeout = request.extensions.get("timeout", {}).get("pool")
+        await scheduler.acquire(priority, timeout)
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            scheduler.release(priority)
+            raise
+        if response.is_closed:
+            # 响应体已在内存中（如 MockTransport 预置的响应），不再占用连接
+            scheduler.release(priority)
+        else:
+            response.stream = _ReleasingStream(response.stream, lambda: scheduler.release(priority))
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
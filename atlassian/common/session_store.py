@@ -0,0 +1,369 @@
+"""
+Session Store - 跨进程共享的会话 Cookie 存储
+
+Session 模式下，每个工作进程、每个 `async with JiraClient()` 都会 POST /rest/auth/1/session 登录，
+退出时再 DELETE 注销。数十个工作进程同时启动会冲击认证接口，并可能触发 CAPTCHA 锁定。
+
+配置 session_store 后:
+- 登录前先查存储，已有会话直接复用（不发起请求）；会话是否有效由第一个实际请求顺带验证
+- 会话过期（401）时，在跨进程锁内刷新: 若存储中的会话已被其他进程刷新则直接采用，
+  否则由本进程登录并写回，所有进程合计只登录一次
+- 退出 `async with` 时不再注销，会话留给其他进程与下次启动使用；显式调用 logout() 会同时从存储中删除
+
+后端:
+- MemorySessionStore: 进程内（测试或单进程多客户端）
+- FileSessionStore: 每个会话一个 JSON 文件，锁为锁文件上的 flock（持有进程退出时由操作系统释放）
+- SqliteSessionStore: SQLite 单文件，锁为带租约的行
+
+用法:
+    store = FileSessionStore("~/.cache/atlassian-sessions")
+    async with JiraClient(auth_mode="session", session_store=store) as jira:
+        ...
+
+文件与 SQLite 读写在线程池中执行（asyncio.to_thread），不阻塞事件循环。
+
+注意: 存储中保存的是有效的会话 Cookie，应与密码同等对待，文件权限默认为 0600。
+"""
+
+import asyncio
+import dataclasses
+import hashlib
+import json
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Optional, TypeVar, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+if TYPE_CHECKING:
+    from atlassian.common.client import SessionInfo
+
+T = TypeVar("T")
+
+
+@dataclasses.dataclass
+class StoredSession:
+    """存储中的会话"""
+
+    session_name: str
+    session_value: str
+    saved_at: float  # time.time() 时间戳
+
+    def to_session_info(self) -> "SessionInfo":
+        from atlassian.common.client import SessionInfo
+
+        return SessionInfo(session_name=self.session_name, session_value=self.session_value)
+
+
+class SessionStore:
+    """
+    会话存储基类
+
+    子类实现 _read / _write / _remove（数据）与 _try_lock / _unlock（跨进程锁）。
+    异步代码使用 aload / asave / adelete，阻塞 I/O 在线程池中执行。
+    """
+
+    # 后端操作是否涉及阻塞 I/O（为 True 时异步方法在线程池中执行）
+    blocking_io = True
+
+    def __init__(
+        self,
+        max_age: Optional[float] = None,
+        lock_timeout: float = 30.0,
+        poll_interval: float = 0.05,
+        wait_timeout: Optional[float] = 60.0,
+    ):
+        """
+        Args:
+            max_age: 会话最长复用时间（秒），超过后视为不存在并重新登录；None 表示不限制
+            lock_timeout: 锁租约（秒），持有者崩溃后其他进程最多等待这么久（FileSessionStore 不使用）
+            poll_interval: 等待锁时的轮询间隔（秒）
+            wait_timeout: 等待锁的最长时间（秒），超时抛出 TimeoutError；None 表示一直等待
+        """
+        self.max_age = max_age
+        self.lock_timeout = lock_timeout
+        self.poll_interval = poll_interval
+        self.wait_timeout = wait_timeout
+        # 被取消的加锁尝试在线程结束后释放锁的任务（保留引用，避免被回收）
+        self._abandoned: set[asyncio.Future] = set()
+
+    @staticmethod
+    def make_key(base_url: str, identity: str) -> str:
+        """会话键: 实例地址 + 认证身份"""
+        return f"{base_url}|{identity}"
+
+    def load(self, key: str) -> Optional[StoredSession]:
+        """读取会话；不存在或超过 max_age 时返回 None"""
+        stored = self._read(key)
+        if stored is None:
+            return None
+        if self.max_age is not None and time.time() - stored.saved_at > self.max_age:
+            return None
+        return stored
+
+    def save(self, key: str, session: "SessionInfo") -> None:
+        """写入会话"""
+        self._write(key, StoredSession(session.session_name, session.session_value, time.time()))
+
+    def delete(self, key: str, session_value: Optional[str] = None) -> None:
+        """
+        删除会话
+
+        Args:
+            session_value: 只在存储中的会话仍是该值时删除，避免误删其他进程刚刷新的会话
+        """
+        if session_value is not None:
+            stored = self._read(key)
+            if stored is None or stored.session_value != session_value:
+                return
+        self._remove(key)
+
+    async def aload(self, key: str) -> Optional[StoredSession]:
+        """load 的异步版本"""
+        return await self._run(self.load, key)
+
+    async def asave(self, key: str, session: "SessionInfo") -> None:
+        """save 的异步版本"""
+        await self._run(self.save, key, session)
+
+    async def adelete(self, key: str, session_value: Optional[str] = None) -> None:
+        """delete 的异步版本"""
+        await self._run(self.delete, key, session_value)
+
+    @asynccontextmanager
+    async def lock(self, key: str) -> AsyncIterator[None]:
+        """
+        跨进程互斥锁（持有者崩溃后由租约到期或操作系统释放）
+
+        等待超过 wait_timeout 时抛出 TimeoutError。
+        """
+        owner = secrets.token_hex(8)
+        loop = asyncio.get_running_loop()
+        deadline = None if self.wait_timeout is None else loop.time() + self.wait_timeout
+        while not await self._acquire(key, owner):
+            if deadline is not None and loop.time() >= deadline:
+                raise TimeoutError(
+                    f"Timed out after {self.wait_timeout:.1f}s waiting for session lock"
+                )
+            await asyncio.sleep(self.poll_interval)
+        try:
+            yield
+        finally:
+            await asyncio.shield(self._run(self._unlock, key, owner))
+
+    async def _acquire(self, key: str, owner: str) -> bool:
+        """
+        尝试加锁一次
+
+        调用方被取消时线程中的加锁仍会完成，此时在其结束后释放得到的锁，避免锁泄漏。
+        """
+        attempt = asyncio.ensure_future(self._run(self._try_lock, key, owner))
+        try:
+            return await asyncio.shield(attempt)
+        except asyncio.CancelledError:
+            attempt.add_done_callback(lambda done: self._release_abandoned(done, key, owner))
+            raise
+
+    def _release_abandoned(self, attempt: asyncio.Future, key: str, owner: str) -> None:
+        if attempt.cancelled() or attempt.exception() is not None or not attempt.result():
+            return
+        task = asyncio.ensure_future(self._run(self._unlock, key, owner))
+        self._abandoned.add(task)
+        task.add_done_callback(self._abandoned.discard)
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        if not self.blocking_io:
+            return func(*args)
+        return await asyncio.to_thread(func, *args)
+
+    # ========== 后端实现 ==========
+
+    def _read(self, key: str) -> Optional[StoredSession]:
+        raise NotImplementedError
+
+    def _write(self, key: str, stored: StoredSession) -> None:
+        raise NotImplementedError
+
+    def _remove(self, key: str) -> None:
+        raise NotImplementedError
+
+    def _try_lock(self, key: str, owner: str) -> bool:
+        raise NotImplementedError
+
+    def _unlock(self, key: str, owner: str) -> None:
+        raise NotImplementedError
+
+
+class MemorySessionStore(SessionStore):
+    """进程内会话存储"""
+
+    blocking_io = False
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._sessions: dict[str, StoredSession] = {}
+        self._locks: dict[str, tuple[str, float]] = {}
+
+    def _read(self, key: str) -> Optional[StoredSession]:
+        return self._sessions.get(key)
+
+    def _write(self, key: str, stored: StoredSession) -> None:
+        self._sessions[key] = stored
+
+    def _remove(self, key: str) -> None:
+        self._sessions.pop(key, None)
+
+    def _try_lock(self, key: str, owner: str) -> bool:
+        held = self._locks.get(key)
+        if held is not None and held[1] > time.monotonic():
+            return False
+        self._locks[key] = (owner, time.monotonic() + self.lock_timeout)
+        return True
+
+    def _unlock(self, key: str, owner: str) -> None:
+        if self._locks.get(key, ("",))[0] == owner:
+            del self._locks[key]
+
+
+class FileSessionStore(SessionStore):
+    """
+    文件会话存储
+
+    每个会话一个 JSON 文件（原子替换写入）。锁为锁文件上的非阻塞排他 flock，
+    持有期间保持文件打开；持有进程退出（包括崩溃）时由操作系统释放，不使用 lock_timeout。
+    锁文件释放后保留，不删除，避免删除与其他进程加锁之间的竞争。
+    """
+
+    def __init__(self, directory: Union[str, Path], **kwargs):
+        super().__init__(**kwargs)
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True, mode=0o700)
+        # (key, owner) -> 持有锁的文件描述符
+        self._held: dict[tuple[str, str], int] = {}
+        self._held_lock = threading.Lock()
+
+    def _path(self, key: str, suffix: str) -> Path:
+        return self.directory / f"{hashlib.sha256(key.encode()).hexdigest()}{suffix}"
+
+    def _read(self, key: str) -> Optional[StoredSession]:
+        try:
+            data = json.loads(self._path(key, ".session").read_text(encoding="utf-8"))
+            return StoredSession(**data)
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _write(self, key: str, stored: StoredSession) -> None:
+        path = self._path(key, ".session")
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(dataclasses.asdict(stored), f)
+        os.replace(tmp, path)
+
+    def _remove(self, key: str) -> None:
+        self._path(key, ".session").unlink(missing_ok=True)
+
+    def _try_lock(self, key: str, owner: str) -> bool:
+        fd = os.open(self._path(key, ".lock"), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        except OSError:
+            os.close(fd)
+            return False
+        with self._held_lock:
+            self._held[(key, owner)] = fd
+        return True
+
+    def _unlock(self, key: str, owner: str) -> None:
+        with self._held_lock:
+            fd = self._held.pop((key, owner), None)
+        if fd is None:
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)
+
+
+class SqliteSessionStore(SessionStore):
+    """
+    SQLite 会话存储
+
+    会话与锁分别保存在 sessions / session_locks 两张表中，锁为带到期时间的行，
+    通过单条 INSERT ... ON CONFLICT 原子地抢占。
+    """
+
+    def __init__(self, path: Union[str, Path], **kwargs):
+        super().__init__(**kwargs)
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sessions ("
+                "key TEXT PRIMARY KEY, session_name TEXT NOT NULL, "
+                "session_value TEXT NOT NULL, saved_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS session_locks ("
+                "key TEXT PRIMARY KEY, owner TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+        os.chmod(self.path, 0o600)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+
+    def _execute(self, sql: str, params: tuple) -> sqlite3.Cursor:
+        conn = self._connect()
+        try:
+            return conn.execute(sql, params)
+        finally:
+            conn.close()
+
+    def _read(self, key: str) -> Optional[StoredSession]:
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT session_name, session_value, saved_at FROM sessions WHERE key = ?", (key,)
+            ).fetchone()
+        finally:
+            conn.close()
+        return StoredSession(*row) if row else None
+
+    def _write(self, key: str, stored: StoredSession) -> None:
+        self._execute(
+            "INSERT OR REPLACE INTO sessions (key, session_name, session_value, saved_at) "
+            "VALUES (?, ?, ?, ?)",
+            (key, stored.session_name, stored.session_value, stored.saved_at),
+        )
+
+    def _remove(self, key: str) -> None:
+        self._execute("DELETE FROM sessions WHERE key = ?", (key,))
+
+    def _try_lock(self, key: str, owner: str) -> bool:
+        now = time.time()
+        cursor = self._execute(
+            "INSERT INTO session_locks (key, owner, expires_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at "
+            "WHERE session_locks.expires_at < ?",
+            (key, owner, now + self.lock_timeout, now),
+        )
+        return cursor.rowcount == 1
+
+    def _unlock(self, key: str, owner: str) -> None:
+        self._execute("DELETE FROM session_locks WHERE key = ? AND owner = ?", (key, owner))
@@ -0,0 +1,137 @@
+"""
+Shared Connection - 多客户端共享连接池与认证会话
+
+TempoClient 与 JiraClient 使用相同的 URL 和认证信息，Confluence 也可能与 Jira 部署在同一主机。
+默认情况下每个客户端各自创建 httpx 连接池，Session 模式下还会各自登录一次。
+
+SharedConnection 让多个客户端:
+- 共用同一个底层 transport（同一个连接池，TCP/TLS 握手只做一次）
+- base_url 与认证身份相同时共用同一个登录会话（只登录一次，重新登录对所有客户端生效）
+
+连接池与会话均按引用计数管理: 最后一个使用者退出时才注销会话、关闭连接池。
+
+用法:
+    shared = SharedConnection(TransportConfig(max_connections=50))
+    async with JiraClient(auth_mode="session", shared=shared) as jira, \\
+               TempoClient(auth_mode="session", shared=shared) as tempo:
+        issue = await jira.issue.get("DEMO-1")
+        worklogs = await tempo.worklog.search(from_date="2024-01-01", to_date="2024-01-31")
+"""
+
+from typing import Any, Callable, Optional
+
+import httpx
+
+from atlassian.common.compression import CompressionStats
+from atlassian.common.transport import PoolStats, TransportConfig, _PoolTracingTransport
+
+
+class _SharedTransportHandle(httpx.AsyncBaseTransport):
+    """共享 transport 的引用句柄，aclose 只释放一次引用"""
+
+    def __init__(self, owner: "SharedConnection"):
+        self._owner = owner
+        self._closed = False
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._owner._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        if not self._closed:
+            self._closed = True
+            await self._owner._release_transport()
+
+
+class _SharedMountHandle(httpx.AsyncBaseTransport):
+    """共享代理 transport 的句柄，随共享连接池一起关闭"""
+
+    def __init__(self, owner: "SharedConnection", pattern: str):
+        self._owner = owner
+        self._pattern = pattern
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._owner._mounts[self._pattern].handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
+class SharedConnection:
+    """多个客户端共享的连接池与认证会话"""
+
+    def __init__(
+        self,
+        transport_config: Optional[TransportConfig] = None,
+        trust_env: bool = True,
+    ):
+        """
+        Args:
+            transport_config: 共享连接池配置（覆盖各客户端自己的 transport_config）
+            trust_env: 是否读取系统代理等 HTTPX 环境变量
+        """
+        self.transport_config = transport_config or TransportConfig()
+        self.trust_env = trust_env
+        self.pool_stats = PoolStats()
+        self.compression_stats = CompressionStats()
+        self._transport: Optional[_PoolTracingTransport] = None
+        self._mounts: dict[str, Optional[_PoolTracingTransport]] = {}
+        self._transport_refs = 0
+        self._sessions: dict[tuple[str, str], Any] = {}
+        self._held: Optional[_SharedTransportHandle] = None
+        self.prewarmed = False
+
+    @property
+    def active_clients(self) -> int:
+        """当前持有连接池引用的数量"""
+        return self._transport_refs
+
+    def acquire_transport(self) -> httpx.AsyncBaseTransport:
+        """获取共享 transport 的引用句柄，关闭句柄即释放引用"""
+        if self._transport is None:
+            self._transport = _PoolTracingTransport(
+                self.transport_config.create_transport(trust_env=self.trust_env),
+                self.pool_stats,
+            )
+            proxies = self.transport_config.create_proxy_mounts(trust_env=self.trust_env)
+            self._mounts = {
+                pattern: None if proxy is None else _PoolTracingTransport(proxy, self.pool_stats)
+                for pattern, proxy in proxies.items()
+            }
+            self.prewarmed = False
+        self._transport_refs += 1
+        return _SharedTransportHandle(self)
+
+    def proxy_mounts(self) -> dict[str, Optional[httpx.AsyncBaseTransport]]:
+        """共享的代理 transport（按环境变量构建，见 TransportConfig.create_proxy_mounts）"""
+        return {
+            pattern: None if transport is None else _SharedMountHandle(self, pattern)
+            for pattern, transport in self._mounts.items()
+        }
+
+    async def _release_transport(self) -> None:
+        self._transport_refs -= 1
+        if self._transport_refs == 0 and self._transport is not None:
+            transport, self._transport = self._transport, None
+            mounts, self._mounts = self._mounts, {}
+            await transport.aclose()
+            for mount in mounts.values():
+                if mount is not None:
+                    await mount.aclose()
+
+    def session_state(self, key: tuple[str, str], factory: Callable[[], Any]) -> Any:
+        """获取 (base_url, 认证身份) 对应的共享会话状态"""
+        state = self._sessions.get(key)
+        if state is None:
+            state = self._sessions[key] = factory()
+        return state
+
+    async def __aenter__(self) -> "SharedConnection":
+        """持有一个引用，使连接池在多个客户端上下文之间保持存活"""
+        if self._held is None:
+            self._held = self.acquire_transport()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self._held is not None:
+            held, self._held = self._held, None
+            await held.aclose()
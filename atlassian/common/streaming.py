@@ -0,0 +1,214 @@
+"""
+Streaming JSON - 增量 JSON 解析
+
+response.json() 需要先缓冲并解析整个响应体。对于 maxResults=1000 且 expand=changelog 的搜索、
+一个季度的 Tempo 工时搜索等数 MB 的响应，这会让内存峰值与整页大小成正比。
+
+JsonArrayStreamParser 按块接收响应字节，只定位目标数组（顶层数组，或顶层对象中指定键的数组），
+数组元素完整到达后即可产出，因此内存峰值只与单块及单个元素大小相关。
+顶层对象中的其他字段（如 total、startAt）解析后放入 metadata。
+
+元素内部的字符串与标量由一个正则整体跳过，只在括号处停下；
+同一块中完整到达的多个元素合并为一次 loads 调用解码，而不是逐个解码。
+"""
+
+import json
+import re
+from typing import Any, Callable, Optional
+
+_STRUCTURAL = re.compile(rb'[\[\]{}",:]')
+_STRING_SPECIAL = re.compile(rb'["\\]')
+# 元素内部: 跳过括号以外的字符与完整的字符串（未闭合的字符串留给逐字符扫描处理）
+_SKIP_NESTED = re.compile(rb'(?:[^"\[\]{}]+|"[^"\\]*(?:\\.[^"\\]*)*")*')
+
+_SEEK, _ITEMS, _DONE = 0, 1, 2
+
+
+class JsonArrayStreamParser:
+    """
+    增量解析 JSON 中的目标数组
+
+    用法:
+        parser = JsonArrayStreamParser("issues")
+        async for chunk in response.aiter_bytes():
+            for issue in parser.feed(chunk):
+                ...
+        parser.close()
+        total = parser.metadata["total"]
+    """
+
+    def __init__(
+        self,
+        item_key: Optional[str] = None,
+        loads: Callable[[bytes], Any] = json.loads,
+    ):
+        """
+        Args:
+            item_key: 顶层对象中目标数组的键；None 表示响应本身就是数组
+            loads: 单个元素的 JSON 解码函数（如 JsonCodec.loads）
+        """
+        self.item_key = item_key
+        self._loads = loads
+        self.metadata: dict[str, Any] = {}
+        self.items_seen = 0
+
+        self._buf = bytearray()
+        self._pos = 0
+        self._depth = 0
+        self._mode = _SEEK
+        self._in_string = False
+        self._string_start: Optional[int] = None
+        self._last_string: Optional[tuple[int, int]] = None
+        self._key: Optional[str] = None
+        self._value_start: Optional[int] = None
+        self._target_pending = False
+        self._array_depth = 0
+        self._elem_start: Optional[int] = None
+        self._batch_start: Optional[int] = None  # 本块中已完整到达、尚未解码的元素范围
+        self._batch_end = 0
+        self._batch_size = 0
+
+    @property
+    def done(self) -> bool:
+        return self._mode == _DONE
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """输入一块字节，返回本块中完整到达的数组元素"""
+        if self._mode == _DONE or not chunk:
+            return []
+        self._buf += chunk
+        items: list[Any] = []
+        self._scan(items)
+        self._flush(items)
+        self._compact()
+        return items
+
+    def close(self) -> None:
+        """输入结束；目标数组未完整解析时抛出 ValueError"""
+        if self._mode != _DONE:
+            raise ValueError("Incomplete JSON stream: target array was not fully received")
+
+    def _scan(self, items: list[Any]) -> None:
+        buf = self._buf
+        while self._mode != _DONE:
+            if self._in_string:
+                m = _STRING_SPECIAL.search(buf, self._pos)
+                if m is None:
+                    self._pos = len(buf)
+                    return
+                if m.group() == b"\\":
+                    if m.end() >= len(buf):
+                        self._pos = m.start()  # 转义字符被拆分到下一块
+                        return
+                    self._pos = m.end() + 1
+                    continue
+                self._in_string = False
+                self._pos = m.end()
+                if self._mode == _SEEK and self._depth == 1:
+                    self._last_string = (self._string_start, m.end())
+                self._string_start = None
+                continue
+
+            if self._mode == _ITEMS and self._depth > self._array_depth:
+                self._pos = _SKIP_NESTED.match(buf, self._pos).end()
+            m = _STRUCTURAL.search(buf, self._pos)
+            if m is None:
+                self._pos = len(buf)
+                return
+            char = buf[m.start()]
+            start, self._pos = m.start(), m.end()
+
+            if self._target_pending and char != ord("["):
+                self._target_pending = False  # 目标键的值不是数组，按普通字段记录
+
+            if char == ord('"'):
+                self._in_string = True
+                self._string_start = start
+            elif char in b"[{":
+                self._depth += 1
+                if self._mode == _SEEK and char == ord("["):
+                    if self.item_key is None and self._depth == 1:
+                        self._enter_items()
+                    elif self._target_pending and self._depth == 2:
+                        self._target_pending = False
+                        self._value_start = None
+                        self._key = None
+                        self._enter_items()
+            elif char in b"]}":
+                if self._mode == _ITEMS and self._depth == self._array_depth:
+                    if self._batch_start is not None or buf[self._elem_start:start].strip():
+                        self._emit(start)  # 空数组没有元素
+                    self._flush(items)
+                    self._elem_start = None
+                    self._mode = _DONE if self.item_key is None else _SEEK
+                elif self._mode == _SEEK and self._depth == 1:
+                    self._finish_value(start)
+                    self._mode = _DONE
+                self._depth -= 1
+            elif char == ord(","):
+                if self._mode == _ITEMS and self._depth == self._array_depth:
+                    self._emit(start)
+                    self._elem_start = self._pos
+                elif self._mode == _SEEK and self._depth == 1:
+                    self._finish_value(start)
+            elif char == ord(":"):
+                if self._mode == _SEEK and self._depth == 1 and self._last_string:
+                    key_start, key_end = self._last_string
+                    self._key = json.loads(bytes(buf[key_start:key_end]))
+                    self._last_string = None
+                    self._value_start = self._pos
+                    self._target_pending = self._key == self.item_key
+
+    def _enter_items(self) -> None:
+        self._mode = _ITEMS
+        self._array_depth = self._depth
+        self._elem_start = self._pos
+
+    def _emit(self, end: int) -> None:
+        if self._batch_start is None:
+            self._batch_start = self._elem_start
+        self._batch_end = end
+        self._batch_size += 1
+
+    def _flush(self, items: list[Any]) -> None:
+        """将已完整到达的元素（连同其间的逗号）包成一个数组，一次解码"""
+        if self._batch_start is None:
+            return
+        batch = self._loads(b"[" + self._buf[self._batch_start:self._batch_end] + b"]")
+        items.extend(batch)
+        self.items_seen += self._batch_size
+        self._batch_start = None
+        self._batch_size = 0
+
+    def _finish_value(self, end: int) -> None:
+        if self._key is not None and self._value_start is not None:
+            raw = bytes(self._buf[self._value_start:end]).strip()
+            if raw:
+                self.metadata[self._key] = self._loads(raw)
+        self._key = None
+        self._value_start = None
+        self._last_string = None
+
+    def _compact(self) -> None:
+        """丢弃已处理且不再需要的字节"""
+        keep = self._pos
+        for index in (
+            self._elem_start,
+            self._value_start,
+            self._string_start,
+            self._last_string[0] if self._last_string else None,
+        ):
+            if index is not None and index < keep:
+                keep = index
+        if keep == 0:
+            return
+        del self._buf[:keep]
+        self._pos -= keep
+        if self._elem_start is not None:
+            self._elem_start -= keep
+        if self._value_start is not None:
+            self._value_start -= keep
+        if self._string_start is not None:
+            self._string_start -= keep
+        if self._last_string is not None:
+            self._last_string = (self._last_string[0] - keep, self._last_string[1] - keep)
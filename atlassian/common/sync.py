@@ -0,0 +1,274 @@
+"""
+Sync Facade - 同步调用门面
+
+Celery worker、Django 视图、脚本等同步代码如果在每次调用时使用 asyncio.run，
+会反复重建连接池、在 Session 模式下反复登录。
+
+SyncClient 在后台线程中运行一个长期存在的事件循环，异步客户端始终在该循环中打开，
+连接池与登录会话保持预热；任意线程的同步调用都会被提交到该循环执行。
+
+用法:
+    with SyncClient(JiraClient()) as jira:
+        issue = jira.issue.get("DEMO-1")             # 与异步 API 相同，只是不需要 await
+        me = jira.get_json("/rest/api/2/myself")
+
+        # 异步生成器方法变为普通迭代器，元素在后台循环中逐个拉取
+        for issue in jira.search.stream_raw("project = DEMO"):
+            ...
+
+        # 批量并发执行，按顺序返回结果
+        issues = jira.batch(
+            (lambda c, k=key: c.issue.get(k)) for key in ["DEMO-1", "DEMO-2"]
+        )
+"""
+
+import asyncio
+import inspect
+import threading
+from concurrent.futures import Future
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Generic,
+    Iterable,
+    Iterator,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+from atlassian.common.base import BaseResource
+from atlassian.common.budget import bind_deadline
+from atlassian.common.client import BaseHttpClient
+from atlassian.common.scheduler import bind_priority
+
+T = TypeVar("T")
+ClientT = TypeVar("ClientT", bound=BaseHttpClient)
+
+BatchCall = Union[Callable[[Any], Awaitable[Any]], Coroutine[Any, Any, Any]]
+
+
+class EventLoopThread:
+    """
+    运行事件循环的后台守护线程
+
+    可以在多个 SyncClient 之间共享（例如配合 SharedConnection 使用）。
+    """
+
+    def __init__(self, name: str = "atlassian-event-loop"):
+        self._name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """事件循环（必要时启动线程）"""
+        self.start()
+        return self._loop
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """启动后台线程"""
+        with self._lock:
+            if self.is_running:
+                return
+            loop = asyncio.new_event_loop()
+            started = threading.Event()
+
+            def _run() -> None:
+                asyncio.set_event_loop(loop)
+                loop.call_soon(started.set)
+                loop.run_forever()
+
+            self._loop = loop
+            self._thread = threading.Thread(target=_run, name=self._name, daemon=True)
+            self._thread.start()
+            started.wait()
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> "Future[T]":
+        """提交协程，返回 concurrent.futures.Future（调用方上下文中的 deadline 与优先级随协程一起传递）"""
+        if self._thread is threading.current_thread():
+            coro.close()
+            raise RuntimeError("SyncClient cannot be called from its own event loop thread")
+        return asyncio.run_coroutine_threadsafe(bind_priority(bind_deadline(coro)), self.loop)
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+        """在后台循环中执行协程并阻塞等待结果"""
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    def stop(self) -> None:
+        """停止事件循环并等待线程退出"""
+        with self._lock:
+            if not self.is_running:
+                return
+            loop, thread = self._loop, self._thread
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+            self._loop = None
+            self._thread = None
+
+
+class _SyncProxy:
+    """将资源对象上的协程方法包装为同步方法，异步生成器方法包装为同步迭代器"""
+
+    def __init__(self, target: Any, runner: "SyncClient"):
+        self._target = target
+        self._runner = runner
+
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(self._target, name)
+        if inspect.iscoroutinefunction(value):
+            runner = self._runner
+
+            def _call(*args, **kwargs):
+                return runner.call(value, *args, **kwargs)
+
+            _call.__name__ = name
+            _call.__doc__ = value.__doc__
+            return _call
+        # 追踪包装后的流式方法是返回异步生成器的普通函数，按被包装的原函数判断
+        if inspect.isasyncgenfunction(inspect.unwrap(value)):
+            runner = self._runner
+
+            def _iterate(*args, **kwargs):
+                return runner.iterate(value, *args, **kwargs)
+
+            _iterate.__name__ = name
+            _iterate.__doc__ = value.__doc__
+            return _iterate
+        if isinstance(value, BaseResource):
+            return _SyncProxy(value, self._runner)
+        return value
+
+    def __dir__(self) -> list[str]:
+        return dir(self._target)
+
+
+class SyncClient(_SyncProxy, Generic[ClientT]):
+    """
+    异步客户端的同步门面
+
+    线程安全: 多个线程可以同时调用，调用在后台事件循环中并发执行。
+    """
+
+    def __init__(
+        self,
+        client: ClientT,
+        loop_thread: Optional[EventLoopThread] = None,
+        call_timeout: Optional[float] = None,
+    ):
+        """
+        Args:
+            client: JiraClient / ConfluenceClient / TempoClient 实例
+            loop_thread: 共享的事件循环线程，默认为本门面创建一个
+            call_timeout: 单次同步调用的最长等待时间（秒），None 表示不限
+        """
+        super().__init__(client, self)
+        self.client = client
+        self.call_timeout = call_timeout
+        self._owns_loop = loop_thread is None
+        self._loop_thread = loop_thread or EventLoopThread()
+        self._opened = False
+        self._open_lock = threading.Lock()
+
+    def open(self) -> "SyncClient[ClientT]":
+        """在后台循环中打开异步客户端（登录、预热连接池）"""
+        with self._open_lock:
+            if not self._opened:
+                self._loop_thread.run(self.client.__aenter__())
+                self._opened = True
+        return self
+
+    def close(self) -> None:
+        """关闭异步客户端（注销会话、关闭连接池）并停止自有的事件循环线程"""
+        with self._open_lock:
+            if self._opened:
+                self._opened = False
+                self._loop_thread.run(self.client.__aexit__(None, None, None))
+            if self._owns_loop:
+                self._loop_thread.stop()
+
+    def __enter__(self) -> "SyncClient[ClientT]":
+        return self.open()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def call(self, func: Callable[..., Awaitable[T]], *args, **kwargs) -> T:
+        """同步执行一个异步函数"""
+        if not self._opened:
+            self.open()
+        return self._loop_thread.run(func(*args, **kwargs), self.call_timeout)
+
+    def iterate(self, func: Callable[..., AsyncIterator[T]], *args, **kwargs) -> Iterator[T]:
+        """
+        同步迭代一个异步生成器
+
+        每个元素都在后台循环中拉取（call_timeout 作用于单个元素），
+        提前结束迭代时在后台循环中关闭异步生成器，释放连接等资源。
+        """
+        if not self._opened:
+            self.open()
+        agen = func(*args, **kwargs)
+
+        async def _next() -> T:
+            return await agen.__anext__()
+
+        async def _close() -> None:
+            await agen.aclose()
+
+        try:
+            while True:
+                try:
+                    yield self._loop_thread.run(_next(), self.call_timeout)
+                except StopAsyncIteration:
+                    return
+        finally:
+            if self._loop_thread.is_running:
+                self._loop_thread.run(_close(), self.call_timeout)
+
+    def batch(
+        self,
+        calls: Iterable[BatchCall],
+        concurrency: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """
+        批量并发执行并按提交顺序返回结果
+
+        Args:
+            calls: 以异步客户端为参数的可调用对象（如 lambda c: c.issue.get("DEMO-1")），
+                或尚未开始的协程对象
+            concurrency: 最大并发数，None 时与 client.gather 相同（配置了 concurrency_limiter
+                时由其自适应限制，否则最多 DEFAULT_BULK_CONCURRENCY 个）
+            return_exceptions: 为 True 时异常作为结果返回，否则抛出第一个异常
+        """
+        if not self._opened:
+            self.open()
+        items = list(calls)
+        client = self.client
+
+        async def _one(item: BatchCall) -> Any:
+            return await (item if inspect.iscoroutine(item) else item(client))
+
+        return self._loop_thread.run(
+            client.gather(
+                (_one(item) for item in items),
+                concurrency=concurrency,
+                return_exceptions=return_exceptions,
+            ),
+            self.call_timeout,
+        )
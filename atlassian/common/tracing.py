@@ -0,0 +1,276 @@
+"""
+Tracing - 分布式追踪集成
+
+为 JiraClient / ConfluenceClient / TempoClient 的调用创建 span，使其在端到端追踪中不再是黑盒:
+
+    IssueResource.get                       资源方法（所有 BaseResource 子类的公开协程 / 异步生成器方法）
+    ├── atlassian.login                     Session 登录 / 重新登录
+    ├── HTTP GET /rest/api/2/issue/{key}    每次 HTTP 尝试（含重试与重新登录后的重放）
+    │   └── atlassian.oauth1.sign           OAuth 1.0a 签名
+    ├── atlassian.retry.backoff             重试退避等待
+    └── atlassian.json.decode               响应 JSON 解码
+
+资源方法 span 与 HTTP span 之差即为客户端侧的解析与模型校验耗时。
+流式方法（stream_raw 等）的 span 在首次迭代时开始，迭代结束或关闭时结束，期间的翻页请求都是它的子 span；
+atlassian.stream.items 记录已产出的条数，提前关闭时 atlassian.stream.closed 为 True。
+
+HTTP span 属性: http.request.method、atlassian.endpoint（接口模板）、atlassian.attempt、
+http.response.status_code、http.request.body.size、http.response.body.size，
+以及分页请求的 atlassian.page.start / atlassian.page.size / atlassian.page.index。
+
+用法:
+    # OpenTelemetry（pip install opentelemetry-api）
+    jira = JiraClient(tracer=OpenTelemetryTracer())
+
+    # 无依赖的内存追踪，便于调试与测试
+    tracer = RecordingTracer()
+    jira = JiraClient(tracer=tracer)
+    ...
+    for span in tracer.spans:
+        print(span.name, span.duration, span.attributes)
+
+未配置 tracer 时资源方法只多一次属性判断，没有额外开销。
+"""
+
+import contextvars
+import functools
+import inspect
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Generator, Iterator, Mapping, Optional
+
+import httpx
+
+SPAN_LOGIN = "atlassian.login"
+SPAN_OAUTH1_SIGN = "atlassian.oauth1.sign"
+SPAN_RETRY_BACKOFF = "atlassian.retry.backoff"
+SPAN_JSON_DECODE = "atlassian.json.decode"
+
+# 分页参数: (起始位置参数, 每页数量参数)
+_PAGE_PARAMS = (("startAt", "maxResults"), ("start", "limit"), ("offset", "limit"))
+
+
+class Span:
+    """span 接口（与 OpenTelemetry Span 的常用方法一致）"""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def add_event(self, name: str, attributes: Optional[Mapping[str, Any]] = None) -> None:
+        pass
+
+    def record_exception(self, exception: BaseException) -> None:
+        pass
+
+
+class Tracer:
+    """追踪器基类（不记录任何内容）"""
+
+    @contextmanager
+    def start_span(
+        self,
+        name: str,
+        attributes: Optional[Mapping[str, Any]] = None,
+    ) -> Iterator[Span]:
+        """创建当前上下文的子 span，退出时结束；异常会被记录并继续抛出"""
+        yield Span()
+
+
+class OpenTelemetryTracer(Tracer):
+    """OpenTelemetry 适配器，span 会挂到调用方的当前 span 下"""
+
+    def __init__(self, tracer: Any = None, name: str = "atlassian"):
+        """
+        Args:
+            tracer: opentelemetry.trace.Tracer，默认从全局 TracerProvider 获取
+            name: instrumentation scope 名称
+        """
+        from opentelemetry import trace
+
+        self._tracer = tracer or trace.get_tracer(name)
+
+    @contextmanager
+    def start_span(
+        self,
+        name: str,
+        attributes: Optional[Mapping[str, Any]] = None,
+    ) -> Iterator[Span]:
+        with self._tracer.start_as_current_span(name, attributes=attributes) as span:
+            yield span
+
+
+@dataclass
+class RecordedSpan(Span):
+    """RecordingTracer 记录的 span"""
+
+    name: str
+    parent: Optional["RecordedSpan"] = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    events: list[tuple[str, dict[str, Any]]] = field(default_factory=list)
+    error: Optional[BaseException] = None
+    start: float = field(default_factory=time.perf_counter)
+    end: Optional[float] = None
+
+    @property
+    def duration(self) -> float:
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def add_event(self, name: str, attributes: Optional[Mapping[str, Any]] = None) -> None:
+        self.events.append((name, dict(attributes or {})))
+
+    def record_exception(self, exception: BaseException) -> None:
+        self.error = exception
+
+
+class RecordingTracer(Tracer):
+    """在内存中记录已结束的 span，父子关系通过 contextvars 跟踪（跨 asyncio 任务正确）"""
+
+    def __init__(self):
+        self.spans: list[RecordedSpan] = []
+        self._current: contextvars.ContextVar[Optional[RecordedSpan]] = contextvars.ContextVar(
+            f"atlassian_recording_span_{id(self)}", default=None
+        )
+
+    @contextmanager
+    def start_span(
+        self,
+        name: str,
+        attributes: Optional[Mapping[str, Any]] = None,
+    ) -> Iterator[Span]:
+        span = RecordedSpan(name, parent=self._current.get(), attributes=dict(attributes or {}))
+        token = self._current.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_exception(e)
+            raise
+        finally:
+            span.end = time.perf_counter()
+            try:
+                self._current.reset(token)
+            except ValueError:
+                # 未关闭的流被垃圾回收时在另一个上下文中结束，无需恢复
+                pass
+            self.spans.append(span)
+
+    def find(self, name: str) -> list[RecordedSpan]:
+        """按名称查找已结束的 span"""
+        return [span for span in self.spans if span.name == name]
+
+    def children(self, parent: RecordedSpan) -> list[RecordedSpan]:
+        """查找直接子 span"""
+        return [span for span in self.spans if span.parent is parent]
+
+    def clear(self) -> None:
+        self.spans.clear()
+
+
+def page_attributes(params: Any) -> dict[str, Any]:
+    """从查询参数中提取分页属性"""
+    if not params:
+        return {}
+    params = httpx.QueryParams(params)
+    for start_key, size_key in _PAGE_PARAMS:
+        if start_key in params:
+            attributes: dict[str, Any] = {}
+            try:
+                start = int(params[start_key])
+            except ValueError:
+                return {}
+            attributes["atlassian.page.start"] = start
+            if size_key in params:
+                try:
+                    size = int(params[size_key])
+                except ValueError:
+                    return attributes
+                attributes["atlassian.page.size"] = size
+                if size > 0:
+                    attributes["atlassian.page.index"] = start // size
+            return attributes
+    return {}
+
+
+def traced_resource_method(name: str, func: Callable) -> Callable:
+    """包装资源协程方法: 客户端配置了 tracer 时创建名为 name 的 span"""
+
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        tracer = getattr(self._client, "tracer", None)
+        if tracer is None:
+            return await func(self, *args, **kwargs)
+        with tracer.start_span(name, {"code.function": name}):
+            return await func(self, *args, **kwargs)
+
+    wrapper.__traced__ = True
+    return wrapper
+
+
+async def _traced_stream(tracer: Tracer, name: str, stream: AsyncIterator) -> AsyncIterator:
+    with tracer.start_span(name, {"code.function": name}) as span:
+        items = 0
+        try:
+            async for item in stream:
+                items += 1
+                try:
+                    yield item
+                except GeneratorExit:
+                    # 调用方提前关闭不是错误
+                    span.set_attribute("atlassian.stream.closed", True)
+                    return
+        finally:
+            span.set_attribute("atlassian.stream.items", items)
+            await stream.aclose()
+
+
+def traced_resource_stream(name: str, func: Callable) -> Callable:
+    """
+    包装资源异步生成器方法: 客户端配置了 tracer 时返回带 span 的迭代器
+
+    未配置 tracer 时直接返回原生成器，逐条迭代没有额外开销。
+    """
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        tracer = getattr(self._client, "tracer", None)
+        if tracer is None:
+            return func(self, *args, **kwargs)
+        return _traced_stream(tracer, name, func(self, *args, **kwargs))
+
+    wrapper.__traced__ = True
+    return wrapper
+
+
+def trace_public_methods(cls: type) -> None:
+    """为类中定义的公开协程与异步生成器方法添加追踪包装（由 BaseResource.__init_subclass__ 调用）"""
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith("_") or getattr(value, "__traced__", False):
+            continue
+        if inspect.iscoroutinefunction(value):
+            setattr(cls, attr, traced_resource_method(f"{cls.__name__}.{attr}", value))
+        elif inspect.isasyncgenfunction(value):
+            setattr(cls, attr, traced_resource_stream(f"{cls.__name__}.{attr}", value))
+
+
+class _TracedAuth(httpx.Auth):
+    """为签名类认证（OAuth 1.0a）的签名步骤创建 span"""
+
+    def __init__(self, auth: httpx.Auth, tracer: Tracer):
+        self._auth = auth
+        self._tracer = tracer
+        self.requires_request_body = auth.requires_request_body
+        self.requires_response_body = auth.requires_response_body
+
+    def auth_flow(self, request: httpx.Request) -> Generator[httpx.Request, httpx.Response, None]:
+        flow = self._auth.auth_flow(request)
+        with self._tracer.start_span(SPAN_OAUTH1_SIGN):
+            request = next(flow)
+        while True:
+            response = yield request
+            try:
+                request = flow.send(response)
+            except StopIteration:
+                return
@@ -0,0 +1,209 @@
+"""
+Transport - 连接池与传输层配置
+
+集中管理 BaseHttpClient 底层 httpx.AsyncClient 的连接池参数:
+- 最大连接数 / keep-alive 连接数 / keep-alive 过期时间
+- HTTP/2 多路复用 (需要安装 h2: pip install "custom-atlassian-api[http2]")
+- 自定义 transport (测试或代理场景)
+- 请求 / 响应体压缩 (见 atlassian.common.compression)
+- 连接预热
+
+并通过 httpcore 的 trace 扩展统计连接池等待时间与连接复用次数，
+用于根据实际压测数据调整连接池大小。
+"""
+
+import importlib.util
+import time
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+import httpx
+from httpx._utils import get_environment_proxies
+
+from atlassian.common.compression import CompressionConfig
+
+
+@dataclass(frozen=True)
+class TransportConfig:
+    """
+    传输层配置
+
+    用法:
+        config = TransportConfig(max_connections=200, http2=True, prewarm_connections=8)
+        async with JiraClient(transport_config=config) as jira:
+            ...
+            print(jira.pool_stats.snapshot())
+    """
+
+    max_connections: Optional[int] = 100
+    max_keepalive_connections: Optional[int] = 20
+    keepalive_expiry: Optional[float] = 5.0
+    http2: bool = False
+    transport: Optional[httpx.AsyncBaseTransport] = None
+    prewarm_connections: int = 0
+    prewarm_path: str = "/status"
+    compression: Optional[CompressionConfig] = None
+
+    def __post_init__(self) -> None:
+        if self.max_connections is not None and self.max_connections < 1:
+            raise ValueError("max_connections must be >= 1")
+        if self.max_keepalive_connections is not None and self.max_keepalive_connections < 0:
+            raise ValueError("max_keepalive_connections must be >= 0")
+        if self.keepalive_expiry is not None and self.keepalive_expiry < 0:
+            raise ValueError("keepalive_expiry must be >= 0")
+        if self.prewarm_connections < 0:
+            raise ValueError("prewarm_connections must be >= 0")
+        if self.http2 and self.transport is None and importlib.util.find_spec("h2") is None:
+            raise ValueError(
+                "http2=True requires the 'h2' package: "
+                'pip install "custom-atlassian-api[http2]"'
+            )
+
+    @property
+    def limits(self) -> httpx.Limits:
+        """转换为 httpx.Limits"""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def create_transport(self, trust_env: bool = True) -> httpx.AsyncBaseTransport:
+        """构建底层 transport，未指定自定义 transport 时使用 httpx 连接池"""
+        if self.transport is not None:
+            return self.transport
+        return httpx.AsyncHTTPTransport(
+            limits=self.limits,
+            http2=self.http2,
+            trust_env=trust_env,
+        )
+
+    def create_proxy_mounts(
+        self, trust_env: bool = True
+    ) -> dict[str, Optional[httpx.AsyncBaseTransport]]:
+        """
+        按代理环境变量（HTTP_PROXY / HTTPS_PROXY / ALL_PROXY / NO_PROXY）构建 mounts
+
+        httpx.AsyncClient 传入 transport 后不再读取代理环境变量，因此代理 transport 在这里构建，
+        连接池参数与直连 transport 相同。值为 None 的模式表示不走代理（NO_PROXY）。
+        """
+        if not trust_env or self.transport is not None:
+            return {}
+        return {
+            pattern: None
+            if url is None
+            else httpx.AsyncHTTPTransport(
+                limits=self.limits,
+                http2=self.http2,
+                trust_env=trust_env,
+                proxy=httpx.Proxy(url),
+            )
+            for pattern, url in get_environment_proxies().items()
+        }
+
+
+@dataclass
+class PoolStats:
+    """
+    连接池统计
+
+    - requests: 经过 transport 的请求数
+    - connections_opened: 新建 TCP 连接数
+    - connections_reused: 复用已有连接的请求数
+    - pool_wait_total / pool_wait_max: 等待空闲连接的累计/最大耗时（秒）
+    """
+
+    requests: int = 0
+    connections_opened: int = 0
+    connections_reused: int = 0
+    pool_wait_total: float = 0.0
+    pool_wait_max: float = 0.0
+    pool_wait_count: int = field(default=0, repr=False)
+
+    def record_wait(self, seconds: float) -> None:
+        self.pool_wait_count += 1
+        self.pool_wait_total += seconds
+        if seconds > self.pool_wait_max:
+            self.pool_wait_max = seconds
+
+    @property
+    def reuse_ratio(self) -> float:
+        """连接复用率"""
+        total = self.connections_opened + self.connections_reused
+        return self.connections_reused / total if total else 0.0
+
+    @property
+    def pool_wait_avg(self) -> float:
+        """平均连接池等待时间（秒）"""
+        return self.pool_wait_total / self.pool_wait_count if self.pool_wait_count else 0.0
+
+    def snapshot(self) -> dict[str, Any]:
+        """导出为字典"""
+        return {
+            "requests": self.requests,
+            "connections_opened": self.connections_opened,
+            "connections_reused": self.connections_reused,
+            "reuse_ratio": self.reuse_ratio,
+            "pool_wait_total": self.pool_wait_total,
+            "pool_wait_avg": self.pool_wait_avg,
+            "pool_wait_max": self.pool_wait_max,
+        }
+
+    def reset(self) -> None:
+        """清零计数器"""
+        self.requests = 0
+        self.connections_opened = 0
+        self.connections_reused = 0
+        self.pool_wait_total = 0.0
+        self.pool_wait_max = 0.0
+        self.pool_wait_count = 0
+
+
+class _PoolTracingTransport(httpx.AsyncBaseTransport):
+    """
+    包装 transport，通过 httpcore trace 事件统计连接池行为
+
+    从请求进入 transport 到第一个连接级事件（建立 TCP 或发送请求头）之间的
+    时间即为等待空闲连接的时间；若发送请求头前没有 connect_tcp 事件，
+    则说明复用了已有连接。
+    """
+
+    _CONNECT_EVENT = "connection.connect_tcp.started"
+    _SEND_EVENTS = (
+        "http11.send_request_headers.started",
+        "http2.send_request_headers.started",
+    )
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, stats: PoolStats):
+        self._transport = transport
+        self._stats = stats
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        stats = self._stats
+        stats.requests += 1
+        started = time.perf_counter()
+        state = {"waited": False, "connected": False}
+        upstream_trace = request.extensions.get("trace")
+
+        async def trace(event_name: str, info: dict) -> None:
+            if not state["waited"] and (
+                event_name == self._CONNECT_EVENT or event_name in self._SEND_EVENTS
+            ):
+                state["waited"] = True
+                stats.record_wait(time.perf_counter() - started)
+            if event_name == self._CONNECT_EVENT:
+                state["connected"] = True
+                stats.connections_opened += 1
+            elif event_name in self._SEND_EVENTS and not state["connected"]:
+                state["connected"] = True
+                stats.connections_reused += 1
+            if upstream_trace is not None:
+                result = upstream_trace(event_name, info)
+                if hasattr(result, "__await__"):
+                    await result
+
+        request.extensions["trace"] = trace
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
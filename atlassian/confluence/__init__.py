@@ -12,6 +12,20 @@ Confluence API Client - Confluence Server/Data Center REST API
         page = await confluence.content.get(page_id)
 """
 
-from atlassian.confluence.client import ConfluenceClient
+from typing import TYPE_CHECKING
+
+from atlassian.common.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from atlassian.confluence import models, resources
+    from atlassian.confluence.client import ConfluenceClient
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "atlassian.confluence.client": ("ConfluenceClient",),
+    },
+    submodules=("models", "resources"),
+)
 
 __all__ = ["ConfluenceClient"]
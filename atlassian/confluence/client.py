@@ -4,22 +4,40 @@ Confluence Client - Confluence HTTP 客户端
 提供统一的 Confluence API 访问入口，整合所有资源类
 """
 
-from typing import Optional
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional, Union
+
+import httpx
 
 from atlassian.common.auth import OAuth1Config
 from atlassian.common.client import BaseHttpClient, AuthMode
-from atlassian.confluence.resources import (
-    ContentResource,
-    SpaceResource,
-    UserResource,
-    SearchResource,
-    NotificationResource,
-    GroupResource,
-    AuditResource,
-    LongTaskResource,
-    WebhookResource,
-    AccessModeResource,
-)
+from atlassian.common.retry import RetryPolicy
+from atlassian.common.ratelimit import RateLimiter
+from atlassian.common.cache import ResponseCache
+from atlassian.common.shared import SharedConnection
+from atlassian.common.codec import JsonCodec
+from atlassian.common.instrumentation import Instrumentation
+from atlassian.common.tracing import Tracer
+from atlassian.common.transport import TransportConfig
+from atlassian.common.session_store import SessionStore
+from atlassian.common.circuit import CircuitBreaker
+from atlassian.common.hedging import Hedger
+from atlassian.common.routing import NodeRouter
+from atlassian.common.concurrency import AdaptiveLimiter
+from atlassian.common.scheduler import RequestScheduler
+
+if TYPE_CHECKING:
+    from atlassian.confluence.resources.content import ContentResource
+    from atlassian.confluence.resources.space import SpaceResource
+    from atlassian.confluence.resources.user import UserResource
+    from atlassian.confluence.resources.search import SearchResource
+    from atlassian.confluence.resources.notification import NotificationResource
+    from atlassian.confluence.resources.group import GroupResource
+    from atlassian.confluence.resources.audit import AuditResource
+    from atlassian.confluence.resources.longtask import LongTaskResource
+    from atlassian.confluence.resources.webhook import WebhookResource
+    from atlassian.confluence.resources.accessmode import AccessModeResource
 
 
 class ConfluenceClient(BaseHttpClient):
@@ -73,6 +91,22 @@ class ConfluenceClient(BaseHttpClient):
         auth_mode: AuthMode = "basic",  # Confluence 默认使用 Basic Auth
         oauth1: Optional[OAuth1Config] = None,
         trust_env: bool = True,
+        transport_config: Optional[TransportConfig] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalesce_requests: bool = False,
+        response_cache: Optional[ResponseCache] = None,
+        shared: Optional[SharedConnection] = None,
+        json_codec: Union[str, JsonCodec, None] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        tracer: Optional[Tracer] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        session_store: Optional[SessionStore] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedger: Optional[Hedger] = None,
+        node_router: Optional[NodeRouter] = None,
+        concurrency_limiter: Optional[AdaptiveLimiter] = None,
+        scheduler: Optional[RequestScheduler] = None,
     ):
         """
         初始化 Confluence 客户端
@@ -87,6 +121,22 @@ class ConfluenceClient(BaseHttpClient):
             auth_mode: 认证模式，"basic" (默认)、"session" 或 "oauth1"
             oauth1: OAuth 1.0a RSA-SHA1 认证配置
             trust_env: 是否读取系统代理等 HTTPX 环境变量
+            transport_config: 连接池 / HTTP2 / 自定义 transport 配置
+            retry_policy: 429/5xx/连接异常的重试策略，默认不重试
+            rate_limiter: 客户端令牌桶限流器，可在多个客户端间共享
+            coalesce_requests: 是否合并并发的相同 GET 请求 (get_json)
+            response_cache: get_json 响应缓存（支持 ETag/Last-Modified 重新验证）
+            shared: 与其他客户端共享连接池与登录会话
+            json_codec: JSON 编解码器，默认自动选择 orjson / msgspec / json
+            instrumentation: 请求/登录事件钩子与按接口模板聚合的指标
+            tracer: 分布式追踪（如 OpenTelemetryTracer）
+            transport: 自定义 httpx transport（如 RecordingTransport / ReplayTransport）
+            session_store: 跨进程共享会话 Cookie 的存储（FileSessionStore / SqliteSessionStore，仅 session 模式）
+            circuit_breaker: 按产品与接口族熔断，后端持续失败或变慢时快速失败
+            hedger: 对冲 GET 请求以削减长尾延迟，可发往备用节点
+            node_router: Data Center 多节点路由（负载均衡、故障节点摘除与自动切换，Session 模式下会话绑定节点）
+            concurrency_limiter: AIMD 自适应并发限制（按错误与延迟自动调整并发数，批量方法受其约束）
+            scheduler: 按优先级类别加权公平分配连接池（为交互式请求保留名额，避免被批量任务饿死）
         """
         super().__init__(
             base_url=base_url,
@@ -99,6 +149,22 @@ class ConfluenceClient(BaseHttpClient):
             auth_mode=auth_mode,
             oauth1=oauth1,
             trust_env=trust_env,
+            transport_config=transport_config,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            coalesce_requests=coalesce_requests,
+            response_cache=response_cache,
+            shared=shared,
+            json_codec=json_codec,
+            instrumentation=instrumentation,
+            tracer=tracer,
+            transport=transport,
+            session_store=session_store,
+            circuit_breaker=circuit_breaker,
+            hedger=hedger,
+            node_router=node_router,
+            concurrency_limiter=concurrency_limiter,
+            scheduler=scheduler,
         )
 
         # 初始化资源
@@ -117,6 +183,8 @@ class ConfluenceClient(BaseHttpClient):
     def content(self) -> ContentResource:
         """内容资源 (rest/api/content)"""
         if self._content is None:
+            from atlassian.confluence.resources.content import ContentResource
+
             self._content = ContentResource(self)
         return self._content
 
@@ -124,6 +192,8 @@ class ConfluenceClient(BaseHttpClient):
     def space(self) -> SpaceResource:
         """空间资源 (rest/api/space)"""
         if self._space is None:
+            from atlassian.confluence.resources.space import SpaceResource
+
             self._space = SpaceResource(self)
         return self._space
 
@@ -131,6 +201,8 @@ class ConfluenceClient(BaseHttpClient):
     def user(self) -> UserResource:
         """用户资源 (rest/api/user)"""
         if self._user is None:
+            from atlassian.confluence.resources.user import UserResource
+
             self._user = UserResource(self)
         return self._user
 
@@ -138,6 +210,8 @@ class ConfluenceClient(BaseHttpClient):
     def search(self) -> SearchResource:
         """搜索资源 (rest/api/search)"""
         if self._search is None:
+            from atlassian.confluence.resources.search import SearchResource
+
             self._search = SearchResource(self)
         return self._search
 
@@ -145,6 +219,8 @@ class ConfluenceClient(BaseHttpClient):
     def notification(self) -> NotificationResource:
         """通知资源 (rest/notification) - 需要 MyWork Plugin"""
         if self._notification is None:
+            from atlassian.confluence.resources.notification import NotificationResource
+
             self._notification = NotificationResource(self)
         return self._notification
 
@@ -152,6 +228,8 @@ class ConfluenceClient(BaseHttpClient):
     def group(self) -> GroupResource:
         """用户组资源 (rest/api/group)"""
         if self._group is None:
+            from atlassian.confluence.resources.group import GroupResource
+
             self._group = GroupResource(self)
         return self._group
 
@@ -159,6 +237,8 @@ class ConfluenceClient(BaseHttpClient):
     def audit(self) -> AuditResource:
         """审计资源 (rest/audit) - 需要管理员权限"""
         if self._audit is None:
+            from atlassian.confluence.resources.audit import AuditResource
+
             self._audit = AuditResource(self)
         return self._audit
 
@@ -166,6 +246,8 @@ class ConfluenceClient(BaseHttpClient):
     def longtask(self) -> LongTaskResource:
         """长期任务资源 (rest/api/longtask)"""
         if self._longtask is None:
+            from atlassian.confluence.resources.longtask import LongTaskResource
+
             self._longtask = LongTaskResource(self)
         return self._longtask
 
@@ -173,6 +255,8 @@ class ConfluenceClient(BaseHttpClient):
     def webhook(self) -> WebhookResource:
         """Webhook 资源 (rest/api/webhooks) - 需要 Confluence 7.0+"""
         if self._webhook is None:
+            from atlassian.confluence.resources.webhook import WebhookResource
+
             self._webhook = WebhookResource(self)
         return self._webhook
 
@@ -180,6 +264,8 @@ class ConfluenceClient(BaseHttpClient):
     def accessmode(self) -> AccessModeResource:
         """访问模式资源 (rest/api/accessmode) - 需要 Confluence 7.0+"""
         if self._accessmode is None:
+            from atlassian.confluence.resources.accessmode import AccessModeResource
+
             self._accessmode = AccessModeResource(self)
         return self._accessmode
 
@@ -2,35 +2,72 @@
 Confluence Models - Pydantic 数据模型
 """
 
-from atlassian.confluence.models.user import (
-    ProfilePicture,
-    User,
-    UserWatch,
-)
-from atlassian.confluence.models.space import (
-    SpaceDescription,
-    Space,
-    SpaceList,
-    SpaceProperty,
-    SpacePropertyList,
-)
-from atlassian.confluence.models.content import (
-    ContentBody,
-    ContentBodyContainer,
-    ContentVersion,
-    ContentHistory,
-    Content,
-    ContentList,
-    ContentLabel,
-    ContentLabelList,
-    ContentProperty,
-    ContentPropertyList,
-    Attachment,
-    AttachmentList,
-    Comment,
-    CommentList,
-    SearchResult,
-    SearchResultList,
+from typing import TYPE_CHECKING
+
+from atlassian.common.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from atlassian.confluence.models.user import (
+        ProfilePicture,
+        User,
+        UserWatch,
+    )
+    from atlassian.confluence.models.space import (
+        SpaceDescription,
+        Space,
+        SpaceList,
+        SpaceProperty,
+        SpacePropertyList,
+    )
+    from atlassian.confluence.models.content import (
+        ContentBody,
+        ContentBodyContainer,
+        ContentVersion,
+        ContentHistory,
+        Content,
+        ContentList,
+        ContentLabel,
+        ContentLabelList,
+        ContentProperty,
+        ContentPropertyList,
+        Attachment,
+        AttachmentList,
+        Comment,
+        CommentList,
+        SearchResult,
+        SearchResultList,
+    )
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "atlassian.confluence.models.user": ("ProfilePicture", "User", "UserWatch"),
+        "atlassian.confluence.models.space": (
+            "SpaceDescription",
+            "Space",
+            "SpaceList",
+            "SpaceProperty",
+            "SpacePropertyList",
+        ),
+        "atlassian.confluence.models.content": (
+            "ContentBody",
+            "ContentBodyContainer",
+            "ContentVersion",
+            "ContentHistory",
+            "Content",
+            "ContentList",
+            "ContentLabel",
+            "ContentLabelList",
+            "ContentProperty",
+            "ContentPropertyList",
+            "Attachment",
+            "AttachmentList",
+            "Comment",
+            "CommentList",
+            "SearchResult",
+            "SearchResultList",
+        ),
+    },
 )
 
 __all__ = [
@@ -2,16 +2,37 @@
 Confluence Resources - API 资源类
 """
 
-from atlassian.confluence.resources.content import ContentResource
-from atlassian.confluence.resources.space import SpaceResource
-from atlassian.confluence.resources.user import UserResource
-from atlassian.confluence.resources.search import SearchResource
-from atlassian.confluence.resources.notification import NotificationResource
-from atlassian.confluence.resources.group import GroupResource
-from atlassian.confluence.resources.audit import AuditResource
-from atlassian.confluence.resources.longtask import LongTaskResource
-from atlassian.confluence.resources.webhook import WebhookResource
-from atlassian.confluence.resources.accessmode import AccessModeResource
+from typing import TYPE_CHECKING
+
+from atlassian.common.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from atlassian.confluence.resources.content import ContentResource
+    from atlassian.confluence.resources.space import SpaceResource
+    from atlassian.confluence.resources.user import UserResource
+    from atlassian.confluence.resources.search import SearchResource
+    from atlassian.confluence.resources.notification import NotificationResource
+    from atlassian.confluence.resources.group import GroupResource
+    from atlassian.confluence.resources.audit import AuditResource
+    from atlassian.confluence.resources.longtask import LongTaskResource
+    from atlassian.confluence.resources.webhook import WebhookResource
+    from atlassian.confluence.resources.accessmode import AccessModeResource
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "atlassian.confluence.resources.content": ("ContentResource",),
+        "atlassian.confluence.resources.space": ("SpaceResource",),
+        "atlassian.confluence.resources.user": ("UserResource",),
+        "atlassian.confluence.resources.search": ("SearchResource",),
+        "atlassian.confluence.resources.notification": ("NotificationResource",),
+        "atlassian.confluence.resources.group": ("GroupResource",),
+        "atlassian.confluence.resources.audit": ("AuditResource",),
+        "atlassian.confluence.resources.longtask": ("LongTaskResource",),
+        "atlassian.confluence.resources.webhook": ("WebhookResource",),
+        "atlassian.confluence.resources.accessmode": ("AccessModeResource",),
+    },
+)
 
 __all__ = [
     "ContentResource",
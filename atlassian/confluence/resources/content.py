@@ -30,7 +30,7 @@ DELETE /rest/api/content/{id}/label/{label}           - 删除标签
 GET    /rest/api/content/{id}/restriction/byOperation - 获取限制
 """
 
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional
 from pathlib import Path
 
 from atlassian.common.base import BaseResource
@@ -138,6 +138,32 @@ class ContentResource(BaseResource):
         data = await self.client.get_json(path, params=params)
         return Content.model_validate(data)
 
+    async def get_many(
+        self,
+        content_ids: list[str],
+        status: Optional[str] = None,
+        expand: Optional[str] = None,
+        concurrency: Optional[int] = None,
+    ) -> list[Content]:
+        """
+        并发获取多个内容详情，按传入顺序返回
+
+        并发数由客户端的 concurrency_limiter 自适应调整（见 client.gather）。
+
+        Args:
+            content_ids: 内容 ID 列表
+            status: 状态筛选
+            expand: 展开的字段
+            concurrency: 固定并发上限（可选）
+
+        Returns:
+            list[Content]: 内容列表
+        """
+        return await self.client.gather(
+            (self.get(content_id, status=status, expand=expand) for content_id in content_ids),
+            concurrency=concurrency,
+        )
+
     async def get_raw(
         self,
         content_id: str,
@@ -494,21 +520,7 @@ class ContentResource(BaseResource):
             if minor_edit:
                 data["minorEdit"] = "true"
 
-            headers = {
-                "X-Atlassian-Token": "no-check",
-            }
-            auth_headers = self.client._get_auth_headers()
-            auth_headers.pop("Content-Type", None)
-            headers.update(auth_headers)
-
-            response = await self.client._get_client().post(
-                path,
-                files=files,
-                data=data if data else None,
-                headers=headers,
-            )
-            response.raise_for_status()
-            result = response.json()
+            result = await self.client.post_multipart(path, files=files, data=data)
 
         return AttachmentList.model_validate(result)
 
@@ -542,21 +554,7 @@ class ContentResource(BaseResource):
         if minor_edit:
             data["minorEdit"] = "true"
 
-        headers = {
-            "X-Atlassian-Token": "no-check",
-        }
-        auth_headers = self.client._get_auth_headers()
-        auth_headers.pop("Content-Type", None)
-        headers.update(auth_headers)
-
-        response = await self.client._get_client().post(
-            path,
-            files=files,
-            data=data if data else None,
-            headers=headers,
-        )
-        response.raise_for_status()
-        result = response.json()
+        result = await self.client.post_multipart(path, files=files, data=data)
 
         return AttachmentList.model_validate(result)
 
@@ -656,6 +654,51 @@ class ContentResource(BaseResource):
         data = await self.client.get_json(path, params=params)
         return ContentList.model_validate(data)
 
+    async def stream_descendants(
+        self,
+        content_id: str,
+        descendant_type: str = "page",
+        expand: Optional[str] = None,
+        limit: int = 200,
+    ) -> AsyncIterator[dict]:
+        """
+        流式获取指定类型的全部后代内容（原始JSON），自动翻页
+
+        GET /rest/api/content/{id}/descendant/{type}
+
+        每页的 results 数组在到达时逐个解析产出，
+        适合 expand=body.storage 等单页响应很大的场景。
+
+        Args:
+            content_id: 内容 ID
+            descendant_type: 后代类型 (page, comment, attachment)
+            expand: 展开的字段
+            limit: 每页数量
+
+        Yields:
+            dict: 后代内容原始数据
+        """
+        path = f"{self.BASE_PATH}/{content_id}/descendant/{descendant_type}"
+        params: dict[str, Any] = {"limit": limit}
+        if expand:
+            params["expand"] = expand
+
+        start = 0
+        while True:
+            page: dict[str, Any] = {}
+            count = 0
+            async for item in self.client.stream_json_items(
+                path,
+                item_key="results",
+                metadata=page,
+                params={**params, "start": start},
+            ):
+                count += 1
+                yield item
+            start += count
+            if count < page.get("limit", limit) or count == 0:
+                break
+
     # ========== Properties ==========
 
     async def get_properties(
@@ -17,6 +17,20 @@ Jira API Client - Jira Server/Data Center REST API
         projects = await jira.project.get_all()
 """
 
-from atlassian.jira.client import JiraClient
+from typing import TYPE_CHECKING
+
+from atlassian.common.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from atlassian.jira import models, resources
+    from atlassian.jira.client import JiraClient
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "atlassian.jira.client": ("JiraClient",),
+    },
+    submodules=("models", "resources"),
+)
 
 __all__ = ["JiraClient"]
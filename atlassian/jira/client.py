@@ -4,44 +4,61 @@ Jira Client - Jira HTTP 客户端
 提供统一的 Jira API 访问入口，整合所有资源类
 """
 
-from typing import Optional
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional, Union
+
+import httpx
 
 from atlassian.common.auth import OAuth1Config
 from atlassian.common.client import BaseHttpClient, AuthMode
-from atlassian.jira.resources import (
-    MyselfResource,
-    IssueResource,
-    IssueLinkResource,
-    IssueLinkTypeResource,
-    AttachmentResource,
-    CustomFieldsResource,
-    ProjectResource,
-    SearchResource,
-    ComponentResource,
-    VersionResource,
-    UserResource,
-    FilterResource,
-    GroupResource,
-    WorkflowResource,
-    WorkflowSchemeResource,
-    StatusResource,
-    ResolutionResource,
-    PermissionSchemeResource,
-    RoleResource,
-    SecurityLevelResource,
-    IssueTypeResource,
-    IssueTypeSchemeResource,
-    FieldResource,
-    ScreenResource,
-    PriorityResource,
-    PrioritySchemeResource,
-    # Agile Resources
-    BoardResource,
-    SprintResource,
-    EpicResource,
-    BacklogResource,
-    AgileIssueResource,
-)
+from atlassian.common.retry import RetryPolicy
+from atlassian.common.ratelimit import RateLimiter
+from atlassian.common.cache import ResponseCache
+from atlassian.common.shared import SharedConnection
+from atlassian.common.codec import JsonCodec
+from atlassian.common.instrumentation import Instrumentation
+from atlassian.common.tracing import Tracer
+from atlassian.common.transport import TransportConfig
+from atlassian.common.session_store import SessionStore
+from atlassian.common.circuit import CircuitBreaker
+from atlassian.common.hedging import Hedger
+from atlassian.common.routing import NodeRouter
+from atlassian.common.concurrency import AdaptiveLimiter
+from atlassian.common.scheduler import RequestScheduler
+
+if TYPE_CHECKING:
+    from atlassian.jira.resources.myself import MyselfResource
+    from atlassian.jira.resources.issue import IssueResource
+    from atlassian.jira.resources.issue_link import IssueLinkResource
+    from atlassian.jira.resources.issue_link_type import IssueLinkTypeResource
+    from atlassian.jira.resources.attachment import AttachmentResource
+    from atlassian.jira.resources.custom_fields import CustomFieldsResource
+    from atlassian.jira.resources.project import ProjectResource
+    from atlassian.jira.resources.search import SearchResource
+    from atlassian.jira.resources.component import ComponentResource
+    from atlassian.jira.resources.version import VersionResource
+    from atlassian.jira.resources.user import UserResource
+    from atlassian.jira.resources.filter import FilterResource
+    from atlassian.jira.resources.group import GroupResource
+    from atlassian.jira.resources.workflow import WorkflowResource
+    from atlassian.jira.resources.workflow_scheme import WorkflowSchemeResource
+    from atlassian.jira.resources.status import StatusResource
+    from atlassian.jira.resources.resolution import ResolutionResource
+    from atlassian.jira.resources.permission_scheme import PermissionSchemeResource
+    from atlassian.jira.resources.role import RoleResource
+    from atlassian.jira.resources.security_level import SecurityLevelResource
+    from atlassian.jira.resources.issue_type import IssueTypeResource
+    from atlassian.jira.resources.issue_type_scheme import IssueTypeSchemeResource
+    from atlassian.jira.resources.field import FieldResource
+    from atlassian.jira.resources.screen import ScreenResource
+    from atlassian.jira.resources.priority import PriorityResource
+    from atlassian.jira.resources.priority_scheme import PrioritySchemeResource
+    from atlassian.jira.resources.board import BoardResource
+    from atlassian.jira.resources.sprint import SprintResource
+    from atlassian.jira.resources.epic import EpicResource
+    from atlassian.jira.resources.backlog import BacklogResource
+    from atlassian.jira.resources.agile_issue import AgileIssueResource
 
 
 class JiraClient(BaseHttpClient):
@@ -85,6 +102,22 @@ class JiraClient(BaseHttpClient):
         auth_mode: AuthMode = "basic",
         oauth1: Optional[OAuth1Config] = None,
         trust_env: bool = True,
+        transport_config: Optional[TransportConfig] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalesce_requests: bool = False,
+        response_cache: Optional[ResponseCache] = None,
+        shared: Optional[SharedConnection] = None,
+        json_codec: Union[str, JsonCodec, None] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        tracer: Optional[Tracer] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        session_store: Optional[SessionStore] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedger: Optional[Hedger] = None,
+        node_router: Optional[NodeRouter] = None,
+        concurrency_limiter: Optional[AdaptiveLimiter] = None,
+        scheduler: Optional[RequestScheduler] = None,
     ):
         """
         初始化 Jira 客户端
@@ -99,6 +132,22 @@ class JiraClient(BaseHttpClient):
             auth_mode: 认证模式，"basic" (默认)、"session" 或 "oauth1"
             oauth1: OAuth 1.0a RSA-SHA1 认证配置
             trust_env: 是否读取系统代理等 HTTPX 环境变量
+            transport_config: 连接池 / HTTP2 / 自定义 transport 配置
+            retry_policy: 429/5xx/连接异常的重试策略，默认不重试
+            rate_limiter: 客户端令牌桶限流器，可在多个客户端间共享
+            coalesce_requests: 是否合并并发的相同 GET 请求 (get_json)
+            response_cache: get_json 响应缓存（支持 ETag/Last-Modified 重新验证）
+            shared: 与其他客户端共享连接池与登录会话
+            json_codec: JSON 编解码器，默认自动选择 orjson / msgspec / json
+            instrumentation: 请求/登录事件钩子与按接口模板聚合的指标
+            tracer: 分布式追踪（如 OpenTelemetryTracer）
+            transport: 自定义 httpx transport（如 RecordingTransport / ReplayTransport）
+            session_store: 跨进程共享会话 Cookie 的存储（FileSessionStore / SqliteSessionStore，仅 session 模式）
+            circuit_breaker: 按产品与接口族熔断，后端持续失败或变慢时快速失败
+            hedger: 对冲 GET 请求以削减长尾延迟，可发往备用节点
+            node_router: Data Center 多节点路由（负载均衡、故障节点摘除与自动切换，Session 模式下会话绑定节点）
+            concurrency_limiter: AIMD 自适应并发限制（按错误与延迟自动调整并发数，批量方法受其约束）
+            scheduler: 按优先级类别加权公平分配连接池（为交互式请求保留名额，避免被批量任务饿死）
         """
         super().__init__(
             base_url=base_url,
@@ -111,6 +160,22 @@ class JiraClient(BaseHttpClient):
             auth_mode=auth_mode,
             oauth1=oauth1,
             trust_env=trust_env,
+            transport_config=transport_config,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            coalesce_requests=coalesce_requests,
+            response_cache=response_cache,
+            shared=shared,
+            json_codec=json_codec,
+            instrumentation=instrumentation,
+            tracer=tracer,
+            transport=transport,
+            session_store=session_store,
+            circuit_breaker=circuit_breaker,
+            hedger=hedger,
+            node_router=node_router,
+            concurrency_limiter=concurrency_limiter,
+            scheduler=scheduler,
         )
 
         # 初始化资源
@@ -152,6 +217,8 @@ class JiraClient(BaseHttpClient):
     def myself(self) -> MyselfResource:
         """当前用户资源 (api/2/myself)"""
         if self._myself is None:
+            from atlassian.jira.resources.myself import MyselfResource
+
             self._myself = MyselfResource(self)
         return self._myself
 
@@ -159,6 +226,8 @@ class JiraClient(BaseHttpClient):
     def issue(self) -> IssueResource:
         """Issue 资源 (api/2/issue)"""
         if self._issue is None:
+            from atlassian.jira.resources.issue import IssueResource
+
             self._issue = IssueResource(self)
         return self._issue
 
@@ -166,6 +235,8 @@ class JiraClient(BaseHttpClient):
     def issue_link(self) -> IssueLinkResource:
         """Issue 链接资源 (api/2/issueLink)"""
         if self._issue_link is None:
+            from atlassian.jira.resources.issue_link import IssueLinkResource
+
             self._issue_link = IssueLinkResource(self)
         return self._issue_link
 
@@ -173,6 +244,8 @@ class JiraClient(BaseHttpClient):
     def issue_link_type(self) -> IssueLinkTypeResource:
         """Issue 链接类型资源 (api/2/issueLinkType)"""
         if self._issue_link_type is None:
+            from atlassian.jira.resources.issue_link_type import IssueLinkTypeResource
+
             self._issue_link_type = IssueLinkTypeResource(self)
         return self._issue_link_type
 
@@ -180,6 +253,8 @@ class JiraClient(BaseHttpClient):
     def attachment(self) -> AttachmentResource:
         """附件资源 (api/2/attachment)"""
         if self._attachment is None:
+            from atlassian.jira.resources.attachment import AttachmentResource
+
             self._attachment = AttachmentResource(self)
         return self._attachment
 
@@ -187,6 +262,8 @@ class JiraClient(BaseHttpClient):
     def custom_fields(self) -> CustomFieldsResource:
         """自定义字段资源 (api/2/customFields)"""
         if self._custom_fields is None:
+            from atlassian.jira.resources.custom_fields import CustomFieldsResource
+
             self._custom_fields = CustomFieldsResource(self)
         return self._custom_fields
 
@@ -194,6 +271,8 @@ class JiraClient(BaseHttpClient):
     def project(self) -> ProjectResource:
         """项目资源 (api/2/project)"""
         if self._project is None:
+            from atlassian.jira.resources.project import ProjectResource
+
             self._project = ProjectResource(self)
         return self._project
 
@@ -201,6 +280,8 @@ class JiraClient(BaseHttpClient):
     def search(self) -> SearchResource:
         """搜索资源 (api/2/search)"""
         if self._search is None:
+            from atlassian.jira.resources.search import SearchResource
+
             self._search = SearchResource(self)
         return self._search
 
@@ -208,6 +289,8 @@ class JiraClient(BaseHttpClient):
     def component(self) -> ComponentResource:
         """组件资源 (api/2/component)"""
         if self._component is None:
+            from atlassian.jira.resources.component import ComponentResource
+
             self._component = ComponentResource(self)
         return self._component
 
@@ -215,6 +298,8 @@ class JiraClient(BaseHttpClient):
     def version(self) -> VersionResource:
         """版本资源 (api/2/version)"""
         if self._version is None:
+            from atlassian.jira.resources.version import VersionResource
+
             self._version = VersionResource(self)
         return self._version
 
@@ -222,6 +307,8 @@ class JiraClient(BaseHttpClient):
     def user(self) -> UserResource:
         """用户资源 (api/2/user)"""
         if self._user is None:
+            from atlassian.jira.resources.user import UserResource
+
             self._user = UserResource(self)
         return self._user
 
@@ -229,6 +316,8 @@ class JiraClient(BaseHttpClient):
     def filter(self) -> FilterResource:
         """过滤器资源 (api/2/filter)"""
         if self._filter is None:
+            from atlassian.jira.resources.filter import FilterResource
+
             self._filter = FilterResource(self)
         return self._filter
 
@@ -236,6 +325,8 @@ class JiraClient(BaseHttpClient):
     def group(self) -> GroupResource:
         """用户组资源 (api/2/group)"""
         if self._group is None:
+            from atlassian.jira.resources.group import GroupResource
+
             self._group = GroupResource(self)
         return self._group
 
@@ -243,6 +334,8 @@ class JiraClient(BaseHttpClient):
     def workflow(self) -> WorkflowResource:
         """工作流资源 (api/2/workflow)"""
         if self._workflow is None:
+            from atlassian.jira.resources.workflow import WorkflowResource
+
             self._workflow = WorkflowResource(self)
         return self._workflow
 
@@ -250,6 +343,8 @@ class JiraClient(BaseHttpClient):
     def workflow_scheme(self) -> WorkflowSchemeResource:
         """工作流方案资源 (api/2/workflowscheme)"""
         if self._workflow_scheme is None:
+            from atlassian.jira.resources.workflow_scheme import WorkflowSchemeResource
+
             self._workflow_scheme = WorkflowSchemeResource(self)
         return self._workflow_scheme
 
@@ -257,6 +352,8 @@ class JiraClient(BaseHttpClient):
     def status(self) -> StatusResource:
         """状态资源 (api/2/status)"""
         if self._status is None:
+            from atlassian.jira.resources.status import StatusResource
+
             self._status = StatusResource(self)
         return self._status
 
@@ -264,6 +361,8 @@ class JiraClient(BaseHttpClient):
     def resolution(self) -> ResolutionResource:
         """解决方案资源 (api/2/resolution)"""
         if self._resolution is None:
+            from atlassian.jira.resources.resolution import ResolutionResource
+
             self._resolution = ResolutionResource(self)
         return self._resolution
 
@@ -271,6 +370,8 @@ class JiraClient(BaseHttpClient):
     def permission_scheme(self) -> PermissionSchemeResource:
         """权限方案资源 (api/2/permissionscheme)"""
         if self._permission_scheme is None:
+            from atlassian.jira.resources.permission_scheme import PermissionSchemeResource
+
             self._permission_scheme = PermissionSchemeResource(self)
         return self._permission_scheme
 
@@ -278,6 +379,8 @@ class JiraClient(BaseHttpClient):
     def role(self) -> RoleResource:
         """角色资源 (api/2/role)"""
         if self._role is None:
+            from atlassian.jira.resources.role import RoleResource
+
             self._role = RoleResource(self)
         return self._role
 
@@ -285,6 +388,8 @@ class JiraClient(BaseHttpClient):
     def security_level(self) -> SecurityLevelResource:
         """安全级别资源 (api/2/securitylevel)"""
         if self._security_level is None:
+            from atlassian.jira.resources.security_level import SecurityLevelResource
+
             self._security_level = SecurityLevelResource(self)
         return self._security_level
 
@@ -292,6 +397,8 @@ class JiraClient(BaseHttpClient):
     def issue_type(self) -> IssueTypeResource:
         """Issue类型资源 (api/2/issuetype)"""
         if self._issue_type is None:
+            from atlassian.jira.resources.issue_type import IssueTypeResource
+
             self._issue_type = IssueTypeResource(self)
         return self._issue_type
 
@@ -299,6 +406,8 @@ class JiraClient(BaseHttpClient):
     def issue_type_scheme(self) -> IssueTypeSchemeResource:
         """Issue类型方案资源 (api/2/issuetypescheme)"""
         if self._issue_type_scheme is None:
+            from atlassian.jira.resources.issue_type_scheme import IssueTypeSchemeResource
+
             self._issue_type_scheme = IssueTypeSchemeResource(self)
         return self._issue_type_scheme
 
@@ -306,6 +415,8 @@ class JiraClient(BaseHttpClient):
     def field(self) -> FieldResource:
         """字段资源 (api/2/field)"""
         if self._field is None:
+            from atlassian.jira.resources.field import FieldResource
+
             self._field = FieldResource(self)
         return self._field
 
@@ -313,6 +424,8 @@ class JiraClient(BaseHttpClient):
     def screen(self) -> ScreenResource:
         """屏幕资源 (api/2/screens)"""
         if self._screen is None:
+            from atlassian.jira.resources.screen import ScreenResource
+
             self._screen = ScreenResource(self)
         return self._screen
 
@@ -320,6 +433,8 @@ class JiraClient(BaseHttpClient):
     def priority(self) -> PriorityResource:
         """优先级资源 (api/2/priority)"""
         if self._priority is None:
+            from atlassian.jira.resources.priority import PriorityResource
+
             self._priority = PriorityResource(self)
         return self._priority
 
@@ -327,6 +442,8 @@ class JiraClient(BaseHttpClient):
     def priority_scheme(self) -> PrioritySchemeResource:
         """优先级方案资源 (api/2/priorityscheme)"""
         if self._priority_scheme is None:
+            from atlassian.jira.resources.priority_scheme import PrioritySchemeResource
+
             self._priority_scheme = PrioritySchemeResource(self)
         return self._priority_scheme
 
@@ -336,6 +453,8 @@ class JiraClient(BaseHttpClient):
     def board(self) -> BoardResource:
         """看板资源 (agile/1.0/board)"""
         if self._board is None:
+            from atlassian.jira.resources.board import BoardResource
+
             self._board = BoardResource(self)
         return self._board
 
@@ -343,6 +462,8 @@ class JiraClient(BaseHttpClient):
     def sprint(self) -> SprintResource:
         """Sprint 资源 (agile/1.0/sprint)"""
         if self._sprint is None:
+            from atlassian.jira.resources.sprint import SprintResource
+
             self._sprint = SprintResource(self)
         return self._sprint
 
@@ -350,6 +471,8 @@ class JiraClient(BaseHttpClient):
     def epic(self) -> EpicResource:
         """Epic 资源 (agile/1.0/epic)"""
         if self._epic is None:
+            from atlassian.jira.resources.epic import EpicResource
+
             self._epic = EpicResource(self)
         return self._epic
 
@@ -357,6 +480,8 @@ class JiraClient(BaseHttpClient):
     def backlog(self) -> BacklogResource:
         """Backlog 资源 (agile/1.0/backlog)"""
         if self._backlog is None:
+            from atlassian.jira.resources.backlog import BacklogResource
+
             self._backlog = BacklogResource(self)
         return self._backlog
 
@@ -364,6 +489,8 @@ class JiraClient(BaseHttpClient):
     def agile_issue(self) -> AgileIssueResource:
         """Agile Issue 资源 (agile/1.0/issue)"""
         if self._agile_issue is None:
+            from atlassian.jira.resources.agile_issue import AgileIssueResource
+
             self._agile_issue = AgileIssueResource(self)
         return self._agile_issue
 
@@ -386,4 +513,5 @@ class JiraClient(BaseHttpClient):
                 "startAt": start_at,
                 "maxResults": max_results,
             },
+            idempotent=True,
         )
@@ -2,185 +2,353 @@
 Jira Models - Pydantic 数据模型
 """
 
-from atlassian.jira.models.user import User, UserDetails, AvatarUrls
-from atlassian.jira.models.issue import (
-    Issue,
-    IssueFields,
-    IssueType,
-    Priority,
-    Status,
-    StatusCategory,
-    Resolution,
-    IssueTransition,
-    IssueComment,
-    IssueComments,
-    CreateIssueRequest,
-    CreateIssueResponse,
-    UpdateIssueRequest,
-    Worklog,
-    WorklogList,
-    Watchers,
-    Votes,
-    RemoteObject,
-    RemoteLink,
-    EditMeta,
-    CreateMeta,
-    IssuePickerSuggestion,
-    IssuePickerSection,
-    IssuePickerResults,
-)
-from atlassian.jira.models.issue_link import (
-    IssueLink,
-    IssueLinkType,
-    LinkedIssue,
-    CreateIssueLinkRequest,
-    IssueLinkTypeList,
-)
-from atlassian.jira.models.attachment import Attachment, AttachmentMeta, ArchiveEntry, ExpandedArchive
-from atlassian.jira.models.project import (
-    Project,
-    ProjectCategory,
-    ProjectComponent,
-    ProjectVersion,
-    ProjectStatus,
-    StatusCategory,
-    IssueTypeStatus,
-    ProjectIssueTypeStatuses,
-)
-from atlassian.jira.models.custom_field import CustomField, CustomFieldsResponse
+from typing import TYPE_CHECKING
 
-# Common models
-from atlassian.jira.models.common import (
-    PaginatedResponse,
-    SimpleListResponse,
-    ErrorMessage,
-    EntityProperty,
-    EntityPropertyKeys,
-    SimpleLink,
-    NamedResource,
-    Visibility,
-    TimeTracking,
-    ServerInfo,
-    Scope,
-)
+from atlassian.common.lazy import lazy_exports
 
-# Workflow models
-from atlassian.jira.models.workflow import (
-    Transition,
-    Workflow,
-    WorkflowScheme,
-    WorkflowSchemeAssociations,
-    WorkflowMapping,
-    WorkflowStatus,
-    TransitionScreenDetails,
-    TransitionRule,
-    IssueTypeMapping,
-    DefaultWorkflow,
-    WorkflowSchemeDraft,
-)
+if TYPE_CHECKING:
+    from atlassian.jira.models.user import User, UserDetails, AvatarUrls
+    from atlassian.jira.models.issue import (
+        Issue,
+        IssueFields,
+        IssueType,
+        Priority,
+        Status,
+        StatusCategory,
+        Resolution,
+        IssueTransition,
+        IssueComment,
+        IssueComments,
+        CreateIssueRequest,
+        CreateIssueResponse,
+        UpdateIssueRequest,
+        Worklog,
+        WorklogList,
+        Watchers,
+        Votes,
+        RemoteObject,
+        RemoteLink,
+        EditMeta,
+        CreateMeta,
+        IssuePickerSuggestion,
+        IssuePickerSection,
+        IssuePickerResults,
+    )
+    from atlassian.jira.models.issue_link import (
+        IssueLink,
+        IssueLinkType,
+        LinkedIssue,
+        CreateIssueLinkRequest,
+        IssueLinkTypeList,
+    )
+    from atlassian.jira.models.attachment import Attachment, AttachmentMeta, ArchiveEntry, ExpandedArchive
+    from atlassian.jira.models.project import (
+        Project,
+        ProjectCategory,
+        ProjectComponent,
+        ProjectVersion,
+        ProjectStatus,
+        StatusCategory,
+        IssueTypeStatus,
+        ProjectIssueTypeStatuses,
+    )
+    from atlassian.jira.models.custom_field import CustomField, CustomFieldsResponse
 
-# Field models
-from atlassian.jira.models.field import (
-    FieldMetadata,
-    AllowedValue,
-    FieldConfiguration,
-    FieldConfigurationItem,
-    FieldConfigurationScheme,
-    Screen,
-    ScreenTab,
-    ScreenableField,
-    ScreenScheme,
-    IssueTypeScreenScheme,
-    CustomFieldOption,
-    CustomFieldContext,
-    FieldCreateMetadata,
-    FieldEditMetadata,
-)
+    # Common models
+    from atlassian.jira.models.common import (
+        PaginatedResponse,
+        SimpleListResponse,
+        ErrorMessage,
+        EntityProperty,
+        EntityPropertyKeys,
+        SimpleLink,
+        NamedResource,
+        Visibility,
+        TimeTracking,
+        ServerInfo,
+        Scope,
+    )
 
-# Avatar models
-from atlassian.jira.models.avatar import (
-    Avatar,
-    SystemAvatar,
-    CustomAvatar,
-    TemporaryAvatar,
-    AvatarCropping,
-    ProjectAvatar,
-    IssueTypeAvatar,
-    UserAvatar,
-)
+    # Workflow models
+    from atlassian.jira.models.workflow import (
+        Transition,
+        Workflow,
+        WorkflowScheme,
+        WorkflowSchemeAssociations,
+        WorkflowMapping,
+        WorkflowStatus,
+        TransitionScreenDetails,
+        TransitionRule,
+        IssueTypeMapping,
+        DefaultWorkflow,
+        WorkflowSchemeDraft,
+    )
 
-# Search models
-from atlassian.jira.models.search import SearchResults
+    # Field models
+    from atlassian.jira.models.field import (
+        FieldMetadata,
+        AllowedValue,
+        FieldConfiguration,
+        FieldConfigurationItem,
+        FieldConfigurationScheme,
+        Screen,
+        ScreenTab,
+        ScreenableField,
+        ScreenScheme,
+        IssueTypeScreenScheme,
+        CustomFieldOption,
+        CustomFieldContext,
+        FieldCreateMetadata,
+        FieldEditMetadata,
+    )
 
-# Component models
-from atlassian.jira.models.component import Component, ComponentIssueCounts
+    # Avatar models
+    from atlassian.jira.models.avatar import (
+        Avatar,
+        SystemAvatar,
+        CustomAvatar,
+        TemporaryAvatar,
+        AvatarCropping,
+        ProjectAvatar,
+        IssueTypeAvatar,
+        UserAvatar,
+    )
 
-# Version models
-from atlassian.jira.models.version import (
-    Version,
-    VersionRemoteLink,
-    VersionIssueCounts,
-    VersionUnresolvedIssueCount,
-)
+    # Search models
+    from atlassian.jira.models.search import SearchResults
 
-# Filter models
-from atlassian.jira.models.filter import (
-    Filter,
-    FilterPermission,
-    FilterSubscription,
-    Column,
-)
+    # Component models
+    from atlassian.jira.models.component import Component, ComponentIssueCounts
 
-# Group models
-from atlassian.jira.models.group import (
-    Group,
-    GroupMember,
-    GroupMembers,
-)
+    # Version models
+    from atlassian.jira.models.version import (
+        Version,
+        VersionRemoteLink,
+        VersionIssueCounts,
+        VersionUnresolvedIssueCount,
+    )
 
-# Permission models
-from atlassian.jira.models.permission import (
-    PermissionGrant,
-    PermissionScheme,
-    Role,
-    RoleActor,
-    SecurityLevel,
-)
+    # Filter models
+    from atlassian.jira.models.filter import (
+        Filter,
+        FilterPermission,
+        FilterSubscription,
+        Column,
+    )
 
-# IssueType models
-from atlassian.jira.models.issue_type import (
-    IssueTypeScheme,
-    IssueTypeSchemeMapping,
-    IssueTypeSchemeProjects,
-    PriorityScheme,
-)
+    # Group models
+    from atlassian.jira.models.group import (
+        Group,
+        GroupMember,
+        GroupMembers,
+    )
+
+    # Permission models
+    from atlassian.jira.models.permission import (
+        PermissionGrant,
+        PermissionScheme,
+        Role,
+        RoleActor,
+        SecurityLevel,
+    )
+
+    # IssueType models
+    from atlassian.jira.models.issue_type import (
+        IssueTypeScheme,
+        IssueTypeSchemeMapping,
+        IssueTypeSchemeProjects,
+        PriorityScheme,
+    )
+
+    # Agile models
+    from atlassian.jira.models.agile import (
+        Board,
+        BoardList,
+        BoardLocation,
+        BoardConfiguration,
+        ColumnConfig,
+        EstimationConfig,
+        RankingConfig,
+        Sprint,
+        SprintList,
+        CreateSprintRequest,
+        UpdateSprintRequest,
+        Epic,
+        EpicList,
+        UpdateEpicRequest,
+        RankEpicRequest,
+        AgileIssue,
+        AgileIssueList,
+        IssueEstimation,
+        RankIssuesRequest,
+        MoveIssuesToSprintRequest,
+        MoveIssuesToBacklogRequest,
+        MoveIssuesToEpicRequest,
+        QuickFilter,
+        QuickFilterList,
+    )
 
-# Agile models
-from atlassian.jira.models.agile import (
-    Board,
-    BoardList,
-    BoardLocation,
-    BoardConfiguration,
-    ColumnConfig,
-    EstimationConfig,
-    RankingConfig,
-    Sprint,
-    SprintList,
-    CreateSprintRequest,
-    UpdateSprintRequest,
-    Epic,
-    EpicList,
-    UpdateEpicRequest,
-    RankEpicRequest,
-    AgileIssue,
-    AgileIssueList,
-    IssueEstimation,
-    RankIssuesRequest,
-    MoveIssuesToSprintRequest,
-    MoveIssuesToBacklogRequest,
-    MoveIssuesToEpicRequest,
-    QuickFilter,
-    QuickFilterList,
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "atlassian.jira.models.user": ("User", "UserDetails", "AvatarUrls"),
+        "atlassian.jira.models.issue": (
+            "Issue",
+            "IssueFields",
+            "IssueType",
+            "Priority",
+            "Status",
+            "StatusCategory",
+            "Resolution",
+            "IssueTransition",
+            "IssueComment",
+            "IssueComments",
+            "CreateIssueRequest",
+            "CreateIssueResponse",
+            "UpdateIssueRequest",
+            "Worklog",
+            "WorklogList",
+            "Watchers",
+            "Votes",
+            "RemoteObject",
+            "RemoteLink",
+            "EditMeta",
+            "CreateMeta",
+            "IssuePickerSuggestion",
+            "IssuePickerSection",
+            "IssuePickerResults",
+        ),
+        "atlassian.jira.models.issue_link": (
+            "IssueLink",
+            "IssueLinkType",
+            "LinkedIssue",
+            "CreateIssueLinkRequest",
+            "IssueLinkTypeList",
+        ),
+        "atlassian.jira.models.attachment": (
+            "Attachment",
+            "AttachmentMeta",
+            "ArchiveEntry",
+            "ExpandedArchive",
+        ),
+        "atlassian.jira.models.project": (
+            "Project",
+            "ProjectCategory",
+            "ProjectComponent",
+            "ProjectVersion",
+            "ProjectStatus",
+            "StatusCategory",
+            "IssueTypeStatus",
+            "ProjectIssueTypeStatuses",
+        ),
+        "atlassian.jira.models.custom_field": ("CustomField", "CustomFieldsResponse"),
+        "atlassian.jira.models.common": (
+            "PaginatedResponse",
+            "SimpleListResponse",
+            "ErrorMessage",
+            "EntityProperty",
+            "EntityPropertyKeys",
+            "SimpleLink",
+            "NamedResource",
+            "Visibility",
+            "TimeTracking",
+            "ServerInfo",
+            "Scope",
+        ),
+        "atlassian.jira.models.workflow": (
+            "Transition",
+            "Workflow",
+            "WorkflowScheme",
+            "WorkflowSchemeAssociations",
+            "WorkflowMapping",
+            "WorkflowStatus",
+            "TransitionScreenDetails",
+            "TransitionRule",
+            "IssueTypeMapping",
+            "DefaultWorkflow",
+            "WorkflowSchemeDraft",
+        ),
+        "atlassian.jira.models.field": (
+            "FieldMetadata",
+            "AllowedValue",
+            "FieldConfiguration",
+            "FieldConfigurationItem",
+            "FieldConfigurationScheme",
+            "Screen",
+            "ScreenTab",
+            "ScreenableField",
+            "ScreenScheme",
+            "IssueTypeScreenScheme",
+            "CustomFieldOption",
+            "CustomFieldContext",
+            "FieldCreateMetadata",
+            "FieldEditMetadata",
+        ),
+        "atlassian.jira.models.avatar": (
+            "Avatar",
+            "SystemAvatar",
+            "CustomAvatar",
+            "TemporaryAvatar",
+            "AvatarCropping",
+            "ProjectAvatar",
+            "IssueTypeAvatar",
+            "UserAvatar",
+        ),
+        "atlassian.jira.models.search": ("SearchResults",),
+        "atlassian.jira.models.component": ("Component", "ComponentIssueCounts"),
+        "atlassian.jira.models.version": (
+            "Version",
+            "VersionRemoteLink",
+            "VersionIssueCounts",
+            "VersionUnresolvedIssueCount",
+        ),
+        "atlassian.jira.models.filter": (
+            "Filter",
+            "FilterPermission",
+            "FilterSubscription",
+            "Column",
+        ),
+        "atlassian.jira.models.group": ("Group", "GroupMember", "GroupMembers"),
+        "atlassian.jira.models.permission": (
+            "PermissionGrant",
+            "PermissionScheme",
+            "Role",
+            "RoleActor",
+            "SecurityLevel",
+        ),
+        "atlassian.jira.models.issue_type": (
+            "IssueTypeScheme",
+            "IssueTypeSchemeMapping",
+            "IssueTypeSchemeProjects",
+            "PriorityScheme",
+        ),
+        "atlassian.jira.models.agile": (
+            "Board",
+            "BoardList",
+            "BoardLocation",
+            "BoardConfiguration",
+            "ColumnConfig",
+            "EstimationConfig",
+            "RankingConfig",
+            "Sprint",
+            "SprintList",
+            "CreateSprintRequest",
+            "UpdateSprintRequest",
+            "Epic",
+            "EpicList",
+            "UpdateEpicRequest",
+            "RankEpicRequest",
+            "AgileIssue",
+            "AgileIssueList",
+            "IssueEstimation",
+            "RankIssuesRequest",
+            "MoveIssuesToSprintRequest",
+            "MoveIssuesToBacklogRequest",
+            "MoveIssuesToEpicRequest",
+            "QuickFilter",
+            "QuickFilterList",
+        ),
+    },
 )
 
 __all__ = [
@@ -2,39 +2,81 @@
 Jira Resources - API 资源类
 """
 
-from atlassian.jira.resources.myself import MyselfResource
-from atlassian.jira.resources.issue import IssueResource
-from atlassian.jira.resources.issue_link import IssueLinkResource
-from atlassian.jira.resources.issue_link_type import IssueLinkTypeResource
-from atlassian.jira.resources.attachment import AttachmentResource
-from atlassian.jira.resources.custom_fields import CustomFieldsResource
-from atlassian.jira.resources.project import ProjectResource
-from atlassian.jira.resources.search import SearchResource
-from atlassian.jira.resources.component import ComponentResource
-from atlassian.jira.resources.version import VersionResource
-from atlassian.jira.resources.user import UserResource
-from atlassian.jira.resources.filter import FilterResource
-from atlassian.jira.resources.group import GroupResource
-from atlassian.jira.resources.workflow import WorkflowResource
-from atlassian.jira.resources.workflow_scheme import WorkflowSchemeResource
-from atlassian.jira.resources.status import StatusResource
-from atlassian.jira.resources.resolution import ResolutionResource
-from atlassian.jira.resources.permission_scheme import PermissionSchemeResource
-from atlassian.jira.resources.role import RoleResource
-from atlassian.jira.resources.security_level import SecurityLevelResource
-from atlassian.jira.resources.issue_type import IssueTypeResource
-from atlassian.jira.resources.issue_type_scheme import IssueTypeSchemeResource
-from atlassian.jira.resources.field import FieldResource
-from atlassian.jira.resources.screen import ScreenResource
-from atlassian.jira.resources.priority import PriorityResource
-from atlassian.jira.resources.priority_scheme import PrioritySchemeResource
+from typing import TYPE_CHECKING
 
-# Agile Resources
-from atlassian.jira.resources.board import BoardResource
-from atlassian.jira.resources.sprint import SprintResource
-from atlassian.jira.resources.epic import EpicResource
-from atlassian.jira.resources.backlog import BacklogResource
-from atlassian.jira.resources.agile_issue import AgileIssueResource
+from atlassian.common.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from atlassian.jira.resources.myself import MyselfResource
+    from atlassian.jira.resources.issue import IssueResource
+    from atlassian.jira.resources.issue_link import IssueLinkResource
+    from atlassian.jira.resources.issue_link_type import IssueLinkTypeResource
+    from atlassian.jira.resources.attachment import AttachmentResource
+    from atlassian.jira.resources.custom_fields import CustomFieldsResource
+    from atlassian.jira.resources.project import ProjectResource
+    from atlassian.jira.resources.search import SearchResource
+    from atlassian.jira.resources.component import ComponentResource
+    from atlassian.jira.resources.version import VersionResource
+    from atlassian.jira.resources.user import UserResource
+    from atlassian.jira.resources.filter import FilterResource
+    from atlassian.jira.resources.group import GroupResource
+    from atlassian.jira.resources.workflow import WorkflowResource
+    from atlassian.jira.resources.workflow_scheme import WorkflowSchemeResource
+    from atlassian.jira.resources.status import StatusResource
+    from atlassian.jira.resources.resolution import ResolutionResource
+    from atlassian.jira.resources.permission_scheme import PermissionSchemeResource
+    from atlassian.jira.resources.role import RoleResource
+    from atlassian.jira.resources.security_level import SecurityLevelResource
+    from atlassian.jira.resources.issue_type import IssueTypeResource
+    from atlassian.jira.resources.issue_type_scheme import IssueTypeSchemeResource
+    from atlassian.jira.resources.field import FieldResource
+    from atlassian.jira.resources.screen import ScreenResource
+    from atlassian.jira.resources.priority import PriorityResource
+    from atlassian.jira.resources.priority_scheme import PrioritySchemeResource
+
+    # Agile Resources
+    from atlassian.jira.resources.board import BoardResource
+    from atlassian.jira.resources.sprint import SprintResource
+    from atlassian.jira.resources.epic import EpicResource
+    from atlassian.jira.resources.backlog import BacklogResource
+    from atlassian.jira.resources.agile_issue import AgileIssueResource
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "atlassian.jira.resources.myself": ("MyselfResource",),
+        "atlassian.jira.resources.issue": ("IssueResource",),
+        "atlassian.jira.resources.issue_link": ("IssueLinkResource",),
+        "atlassian.jira.resources.issue_link_type": ("IssueLinkTypeResource",),
+        "atlassian.jira.resources.attachment": ("AttachmentResource",),
+        "atlassian.jira.resources.custom_fields": ("CustomFieldsResource",),
+        "atlassian.jira.resources.project": ("ProjectResource",),
+        "atlassian.jira.resources.search": ("SearchResource",),
+        "atlassian.jira.resources.component": ("ComponentResource",),
+        "atlassian.jira.resources.version": ("VersionResource",),
+        "atlassian.jira.resources.user": ("UserResource",),
+        "atlassian.jira.resources.filter": ("FilterResource",),
+        "atlassian.jira.resources.group": ("GroupResource",),
+        "atlassian.jira.resources.workflow": ("WorkflowResource",),
+        "atlassian.jira.resources.workflow_scheme": ("WorkflowSchemeResource",),
+        "atlassian.jira.resources.status": ("StatusResource",),
+        "atlassian.jira.resources.resolution": ("ResolutionResource",),
+        "atlassian.jira.resources.permission_scheme": ("PermissionSchemeResource",),
+        "atlassian.jira.resources.role": ("RoleResource",),
+        "atlassian.jira.resources.security_level": ("SecurityLevelResource",),
+        "atlassian.jira.resources.issue_type": ("IssueTypeResource",),
+        "atlassian.jira.resources.issue_type_scheme": ("IssueTypeSchemeResource",),
+        "atlassian.jira.resources.field": ("FieldResource",),
+        "atlassian.jira.resources.screen": ("ScreenResource",),
+        "atlassian.jira.resources.priority": ("PriorityResource",),
+        "atlassian.jira.resources.priority_scheme": ("PrioritySchemeResource",),
+        "atlassian.jira.resources.board": ("BoardResource",),
+        "atlassian.jira.resources.sprint": ("SprintResource",),
+        "atlassian.jira.resources.epic": ("EpicResource",),
+        "atlassian.jira.resources.backlog": ("BacklogResource",),
+        "atlassian.jira.resources.agile_issue": ("AgileIssueResource",),
+    },
+)
 
 __all__ = [
     "MyselfResource",
@@ -163,6 +163,32 @@ class IssueResource(BaseResource):
         data = await self.client.get_json(path, params=params)
         return Issue.model_validate(data)
 
+    async def get_many(
+        self,
+        issue_ids_or_keys: list[str],
+        fields: Optional[list[str]] = None,
+        expand: Optional[str] = None,
+        concurrency: Optional[int] = None,
+    ) -> list[Issue]:
+        """
+        并发获取多个 Issue，按传入顺序返回
+
+        并发数由客户端的 concurrency_limiter 自适应调整（见 client.gather）。
+
+        Args:
+            issue_ids_or_keys: Issue ID 或 Key 列表
+            fields: 要返回的字段列表（可选）
+            expand: 展开的字段（可选）
+            concurrency: 固定并发上限（可选）
+
+        Returns:
+            list[Issue]: Issue 列表
+        """
+        return await self.client.gather(
+            (self.get(key, fields=fields, expand=expand) for key in issue_ids_or_keys),
+            concurrency=concurrency,
+        )
+
     async def get_raw(
         self,
         issue_id_or_key: str,
@@ -476,22 +502,7 @@ class IssueResource(BaseResource):
             filename = file_path_obj.name
 
         with open(file_path_obj, "rb") as f:
-            files = {"file": (filename, f)}
-            headers = {
-                "X-Atlassian-Token": "no-check",
-            }
-            # 移除 Content-Type，让 httpx 自动设置 multipart/form-data
-            auth_headers = self.client._get_auth_headers()
-            auth_headers.pop("Content-Type", None)
-            headers.update(auth_headers)
-
-            response = await self.client._get_client().post(
-                path,
-                files=files,
-                headers=headers,
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = await self.client.post_multipart(path, files={"file": (filename, f)})
 
         return [Attachment.model_validate(a) for a in data]
 
@@ -514,21 +525,7 @@ class IssueResource(BaseResource):
         """
         path = f"{self.BASE_PATH}/{issue_id_or_key}/attachments"
 
-        files = {"file": (filename, content)}
-        headers = {
-            "X-Atlassian-Token": "no-check",
-        }
-        auth_headers = self.client._get_auth_headers()
-        auth_headers.pop("Content-Type", None)
-        headers.update(auth_headers)
-
-        response = await self.client._get_client().post(
-            path,
-            files=files,
-            headers=headers,
-        )
-        response.raise_for_status()
-        data = response.json()
+        data = await self.client.post_multipart(path, files={"file": (filename, content)})
 
         return [Attachment.model_validate(a) for a in data]
 
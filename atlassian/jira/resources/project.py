@@ -692,19 +692,7 @@ class ProjectResource(BaseResource):
             filename = file_path_obj.name
 
         with open(file_path_obj, "rb") as f:
-            files = {"file": (filename, f)}
-            headers = {"X-Atlassian-Token": "no-check"}
-            auth_headers = self.client._get_auth_headers()
-            auth_headers.pop("Content-Type", None)
-            headers.update(auth_headers)
-
-            response = await self.client._get_client().post(
-                path,
-                files=files,
-                headers=headers,
-            )
-            response.raise_for_status()
-            return response.json()
+            return await self.client.post_multipart(path, files={"file": (filename, f)})
 
     async def update_avatar(
         self,
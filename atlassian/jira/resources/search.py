@@ -5,7 +5,7 @@ GET  /rest/api/2/search - JQL搜索（GET）
 POST /rest/api/2/search - JQL搜索（POST）
 """
 
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional
 
 from atlassian.common.base import BaseResource
 from atlassian.jira.models.search import SearchResults
@@ -118,7 +118,7 @@ class SearchResource(BaseResource):
         if expand:
             payload["expand"] = expand
 
-        data = await self.client.post_json(self.BASE_PATH, data=payload)
+        data = await self.client.post_json(self.BASE_PATH, data=payload, idempotent=True)
         return SearchResults.model_validate(data)
 
     async def search_post_raw(
@@ -142,4 +142,55 @@ class SearchResource(BaseResource):
         if expand:
             payload["expand"] = expand
 
-        return await self.client.post_json(self.BASE_PATH, data=payload)
+        return await self.client.post_json(self.BASE_PATH, data=payload, idempotent=True)
+
+    async def stream_raw(
+        self,
+        jql: str,
+        start_at: int = 0,
+        page_size: int = 1000,
+        fields: Optional[list[str]] = None,
+        expand: Optional[list[str]] = None,
+        validate_query: bool = True,
+    ) -> AsyncIterator[dict]:
+        """
+        流式搜索Issues（原始JSON），自动翻页
+
+        每页的 issues 数组在到达时逐个解析产出，内存峰值只与单个 Issue 大小相关，
+        适合 maxResults=1000、expand=changelog 的大批量导出。
+
+        Args:
+            jql: JQL查询语句
+            start_at: 起始位置（默认0）
+            page_size: 每页数量（默认1000）
+            fields: 要返回的字段列表（可选）
+            expand: 要扩展的字段列表（可选）
+            validate_query: 是否验证查询（默认True）
+
+        Yields:
+            dict: Issue 原始数据
+        """
+        params: dict[str, Any] = {
+            "jql": jql,
+            "maxResults": page_size,
+            "validateQuery": str(validate_query).lower(),
+        }
+        if fields:
+            params["fields"] = ",".join(fields)
+        if expand:
+            params["expand"] = ",".join(expand)
+
+        while True:
+            page: dict[str, Any] = {}
+            count = 0
+            async for issue in self.client.stream_json_items(
+                self.BASE_PATH,
+                item_key="issues",
+                metadata=page,
+                params={**params, "startAt": start_at},
+            ):
+                count += 1
+                yield issue
+            start_at += count
+            if count == 0 or start_at >= page.get("total", 0):
+                break
@@ -671,22 +671,7 @@ class UserResource(BaseResource):
             filename = file_path_obj.name
 
         with open(file_path_obj, "rb") as f:
-            files = {"file": (filename, f)}
-            headers = {"X-Atlassian-Token": "no-check"}
-            auth_headers = self.client._get_auth_headers()
-            auth_headers.pop("Content-Type", None)
-            headers.update(auth_headers)
-
-            # 构建完整URL
-            full_url = f"{self.client.base_url}{path}"
-            response = await self.client._get_client().post(
-                full_url,
-                params=params,
-                files=files,
-                headers=headers,
-            )
-            response.raise_for_status()
-            return response.json()
+            return await self.client.post_multipart(path, files={"file": (filename, f)}, params=params)
 
     async def crop_avatar(
         self,
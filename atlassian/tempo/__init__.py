@@ -4,6 +4,20 @@ Tempo API - Tempo Server/Data Center API 客户端
 支持 Tempo Timesheets, Accounts, Teams
 """
 
-from atlassian.tempo.client import TempoClient
+from typing import TYPE_CHECKING
+
+from atlassian.common.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from atlassian.tempo import models, resources
+    from atlassian.tempo.client import TempoClient
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "atlassian.tempo.client": ("TempoClient",),
+    },
+    submodules=("models", "resources"),
+)
 
 __all__ = ["TempoClient"]
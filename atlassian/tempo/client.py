@@ -9,17 +9,35 @@ Tempo 是 Jira 的插件，使用与 Jira 相同的认证和 Base URL
 - Teams (团队)
 """
 
-from typing import Optional
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional, Union
+
+import httpx
 
 from atlassian.common.auth import OAuth1Config
 from atlassian.common.client import BaseHttpClient, AuthMode
-from atlassian.tempo.resources import (
-    WorklogResource,
-    AccountResource,
-    TeamResource,
-    PlanResource,
-    CoreResource,
-)
+from atlassian.common.retry import RetryPolicy
+from atlassian.common.ratelimit import RateLimiter
+from atlassian.common.cache import ResponseCache
+from atlassian.common.shared import SharedConnection
+from atlassian.common.codec import JsonCodec
+from atlassian.common.instrumentation import Instrumentation
+from atlassian.common.tracing import Tracer
+from atlassian.common.transport import TransportConfig
+from atlassian.common.session_store import SessionStore
+from atlassian.common.circuit import CircuitBreaker
+from atlassian.common.hedging import Hedger
+from atlassian.common.routing import NodeRouter
+from atlassian.common.concurrency import AdaptiveLimiter
+from atlassian.common.scheduler import RequestScheduler
+
+if TYPE_CHECKING:
+    from atlassian.tempo.resources.worklog import WorklogResource
+    from atlassian.tempo.resources.account import AccountResource
+    from atlassian.tempo.resources.team import TeamResource
+    from atlassian.tempo.resources.plan import PlanResource
+    from atlassian.tempo.resources.core import CoreResource
 
 
 class TempoClient(BaseHttpClient):
@@ -64,6 +82,22 @@ class TempoClient(BaseHttpClient):
         auth_mode: AuthMode = "basic",
         oauth1: Optional[OAuth1Config] = None,
         trust_env: bool = True,
+        transport_config: Optional[TransportConfig] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalesce_requests: bool = False,
+        response_cache: Optional[ResponseCache] = None,
+        shared: Optional[SharedConnection] = None,
+        json_codec: Union[str, JsonCodec, None] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        tracer: Optional[Tracer] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        session_store: Optional[SessionStore] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedger: Optional[Hedger] = None,
+        node_router: Optional[NodeRouter] = None,
+        concurrency_limiter: Optional[AdaptiveLimiter] = None,
+        scheduler: Optional[RequestScheduler] = None,
     ):
         """
         初始化 Tempo 客户端
@@ -78,6 +112,22 @@ class TempoClient(BaseHttpClient):
             auth_mode: 认证模式，"basic" (默认)、"session" 或 "oauth1"
             oauth1: OAuth 1.0a RSA-SHA1 认证配置
             trust_env: 是否读取系统代理等 HTTPX 环境变量
+            transport_config: 连接池 / HTTP2 / 自定义 transport 配置
+            retry_policy: 429/5xx/连接异常的重试策略，默认不重试
+            rate_limiter: 客户端令牌桶限流器，可在多个客户端间共享
+            coalesce_requests: 是否合并并发的相同 GET 请求 (get_json)
+            response_cache: get_json 响应缓存（支持 ETag/Last-Modified 重新验证）
+            shared: 与其他客户端共享连接池与登录会话
+            json_codec: JSON 编解码器，默认自动选择 orjson / msgspec / json
+            instrumentation: 请求/登录事件钩子与按接口模板聚合的指标
+            tracer: 分布式追踪（如 OpenTelemetryTracer）
+            transport: 自定义 httpx transport（如 RecordingTransport / ReplayTransport）
+            session_store: 跨进程共享会话 Cookie 的存储（FileSessionStore / SqliteSessionStore，仅 session 模式）
+            circuit_breaker: 按产品与接口族熔断，后端持续失败或变慢时快速失败
+            hedger: 对冲 GET 请求以削减长尾延迟，可发往备用节点
+            node_router: Data Center 多节点路由（负载均衡、故障节点摘除与自动切换，Session 模式下会话绑定节点）
+            concurrency_limiter: AIMD 自适应并发限制（按错误与延迟自动调整并发数，批量方法受其约束）
+            scheduler: 按优先级类别加权公平分配连接池（为交互式请求保留名额，避免被批量任务饿死）
         """
         # Tempo 可以使用 JIRA 的环境变量作为后备
         import os
@@ -111,6 +161,22 @@ class TempoClient(BaseHttpClient):
             auth_mode=auth_mode,
             oauth1=oauth1,
             trust_env=trust_env,
+            transport_config=transport_config,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            coalesce_requests=coalesce_requests,
+            response_cache=response_cache,
+            shared=shared,
+            json_codec=json_codec,
+            instrumentation=instrumentation,
+            tracer=tracer,
+            transport=transport,
+            session_store=session_store,
+            circuit_breaker=circuit_breaker,
+            hedger=hedger,
+            node_router=node_router,
+            concurrency_limiter=concurrency_limiter,
+            scheduler=scheduler,
         )
 
         # 初始化资源
@@ -124,6 +190,8 @@ class TempoClient(BaseHttpClient):
     def worklog(self) -> WorklogResource:
         """工时记录资源 (tempo-timesheets/4/worklogs)"""
         if self._worklog is None:
+            from atlassian.tempo.resources.worklog import WorklogResource
+
             self._worklog = WorklogResource(self)
         return self._worklog
 
@@ -131,6 +199,8 @@ class TempoClient(BaseHttpClient):
     def account(self) -> AccountResource:
         """账户资源 (tempo-accounts/1/account)"""
         if self._account is None:
+            from atlassian.tempo.resources.account import AccountResource
+
             self._account = AccountResource(self)
         return self._account
 
@@ -138,6 +208,8 @@ class TempoClient(BaseHttpClient):
     def team(self) -> TeamResource:
         """团队资源 (tempo-teams/2/team)"""
         if self._team is None:
+            from atlassian.tempo.resources.team import TeamResource
+
             self._team = TeamResource(self)
         return self._team
 
@@ -145,6 +217,8 @@ class TempoClient(BaseHttpClient):
     def plan(self) -> PlanResource:
         """计划资源 (tempo-planning/1/allocation, tempo-planning/1/plan)"""
         if self._plan is None:
+            from atlassian.tempo.resources.plan import PlanResource
+
             self._plan = PlanResource(self)
         return self._plan
 
@@ -152,6 +226,8 @@ class TempoClient(BaseHttpClient):
     def core(self) -> CoreResource:
         """核心资源 (tempo-core/1/) - 费用、用户日程、工作属性等"""
         if self._core is None:
+            from atlassian.tempo.resources.core import CoreResource
+
             self._core = CoreResource(self)
         return self._core
 
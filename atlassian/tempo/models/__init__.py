@@ -2,43 +2,85 @@
 Tempo 数据模型
 """
 
-from atlassian.tempo.models.worklog import (
-    Worklog,
-    WorklogCreate,
-    WorklogUpdate,
-    WorklogSearchParams,
-)
-from atlassian.tempo.models.account import (
-    Account,
-    AccountCreate,
-    AccountLink,
-)
-from atlassian.tempo.models.team import (
-    Team,
-    TeamMember,
-)
-from atlassian.tempo.models.plan import (
-    Allocation,
-    AllocationCreate,
-    Plan,
-    PlanLog,
-    PlanSearchParams,
-)
-from atlassian.tempo.models.core import (
-    Expense,
-    ExpenseCreate,
-    ExpenseUpdate,
-    ExpenseCategory,
-    UserSchedule,
-    DaySchedule,
-    Holiday,
-    WorkAttribute,
-    WorkAttributeCreate,
-    WorkAttributeType,
-    WorkAttributeValue,
-    StaticListValue,
-    ActivitySource,
-    ActivitySourceCreate,
+from typing import TYPE_CHECKING
+
+from atlassian.common.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from atlassian.tempo.models.worklog import (
+        Worklog,
+        WorklogCreate,
+        WorklogUpdate,
+        WorklogSearchParams,
+    )
+    from atlassian.tempo.models.account import (
+        Account,
+        AccountCreate,
+        AccountLink,
+    )
+    from atlassian.tempo.models.team import (
+        Team,
+        TeamMember,
+    )
+    from atlassian.tempo.models.plan import (
+        Allocation,
+        AllocationCreate,
+        Plan,
+        PlanLog,
+        PlanSearchParams,
+    )
+    from atlassian.tempo.models.core import (
+        Expense,
+        ExpenseCreate,
+        ExpenseUpdate,
+        ExpenseCategory,
+        UserSchedule,
+        DaySchedule,
+        Holiday,
+        WorkAttribute,
+        WorkAttributeCreate,
+        WorkAttributeType,
+        WorkAttributeValue,
+        StaticListValue,
+        ActivitySource,
+        ActivitySourceCreate,
+    )
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "atlassian.tempo.models.worklog": (
+            "Worklog",
+            "WorklogCreate",
+            "WorklogUpdate",
+            "WorklogSearchParams",
+        ),
+        "atlassian.tempo.models.account": ("Account", "AccountCreate", "AccountLink"),
+        "atlassian.tempo.models.team": ("Team", "TeamMember"),
+        "atlassian.tempo.models.plan": (
+            "Allocation",
+            "AllocationCreate",
+            "Plan",
+            "PlanLog",
+            "PlanSearchParams",
+        ),
+        "atlassian.tempo.models.core": (
+            "Expense",
+            "ExpenseCreate",
+            "ExpenseUpdate",
+            "ExpenseCategory",
+            "UserSchedule",
+            "DaySchedule",
+            "Holiday",
+            "WorkAttribute",
+            "WorkAttributeCreate",
+            "WorkAttributeType",
+            "WorkAttributeValue",
+            "StaticListValue",
+            "ActivitySource",
+            "ActivitySourceCreate",
+        ),
+    },
 )
 
 __all__ = [
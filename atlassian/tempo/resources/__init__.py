@@ -2,11 +2,27 @@
 Tempo API 资源类
 """
 
-from atlassian.tempo.resources.worklog import WorklogResource
-from atlassian.tempo.resources.account import AccountResource
-from atlassian.tempo.resources.team import TeamResource
-from atlassian.tempo.resources.plan import PlanResource
-from atlassian.tempo.resources.core import CoreResource
+from typing import TYPE_CHECKING
+
+from atlassian.common.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from atlassian.tempo.resources.worklog import WorklogResource
+    from atlassian.tempo.resources.account import AccountResource
+    from atlassian.tempo.resources.team import TeamResource
+    from atlassian.tempo.resources.plan import PlanResource
+    from atlassian.tempo.resources.core import CoreResource
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "atlassian.tempo.resources.worklog": ("WorklogResource",),
+        "atlassian.tempo.resources.account": ("AccountResource",),
+        "atlassian.tempo.resources.team": ("TeamResource",),
+        "atlassian.tempo.resources.plan": ("PlanResource",),
+        "atlassian.tempo.resources.core": ("CoreResource",),
+    },
+)
 
 __all__ = [
     "WorklogResource",
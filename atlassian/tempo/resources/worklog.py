@@ -4,7 +4,7 @@ Tempo Worklog 资源
 API: /rest/tempo-timesheets/4/worklogs
 """
 
-from typing import Optional
+from typing import Any, AsyncIterator, Optional
 from atlassian.common.base import BaseResource
 from atlassian.tempo.models.worklog import (
     Worklog,
@@ -219,6 +219,7 @@ class WorklogResource(BaseResource):
         data = await self._client.post_json(
             f"{self.BASE_PATH}/search",
             data=params.to_api_dict(),
+            idempotent=True,  # 只读查询，可安全重试
         )
         # API 返回 list
         return [Worklog.model_validate(item) for item in data]
@@ -268,4 +269,35 @@ class WorklogResource(BaseResource):
         return await self._client.post_json(
             f"{self.BASE_PATH}/search",
             data=params.to_api_dict(),
+            idempotent=True,  # 只读查询，可安全重试
         )
+
+    async def search_stream(
+        self,
+        from_date: str,
+        to_date: str,
+        **filters: Any,
+    ) -> AsyncIterator[dict]:
+        """
+        流式搜索工时记录原始数据
+
+        响应数组按块增量解析，每块中完整到达的工时记录一次解码后产出，
+        内存峰值只与单块及单条记录大小相关，适合一个季度甚至更长时间范围的大批量查询。
+        返回原始 dict、不做模型校验，吞吐不低于 search()。
+
+        Args:
+            from_date: 开始日期 "2024-01-01"
+            to_date: 结束日期 "2024-01-31"
+            **filters: 与 search() 相同的过滤参数（worker、project_key、task_key 等）
+
+        Yields:
+            dict: 工时记录原始数据
+        """
+        params = WorklogSearchParams(from_date=from_date, to_date=to_date, **filters)
+        async for item in self._client.stream_json_items(
+            f"{self.BASE_PATH}/search",
+            method="POST",
+            json=params.to_api_dict(),
+            idempotent=True,  # 只读查询，可安全重试
+        ):
+            yield item
@@ -0,0 +1,92 @@
+"""
+导入耗时基准
+
+每个场景在独立的解释器中运行（冷启动），报告中位耗时（扣除空解释器的启动时间）
+与加载的 atlassian 模块数量。eager 场景显式导入全部资源与模型，相当于延迟导入之前
+`import atlassian` 的开销，用于对比。
+
+用法:
+    python -m benchmarks.bench_import
+    python -m benchmarks.bench_import --runs 10
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import Any
+
+SCENARIOS: dict[str, str] = {
+    "import atlassian": "import atlassian",
+    "JiraClient()": (
+        "from atlassian import JiraClient\n"
+        "JiraClient(base_url='http://x', username='u', password='p')"
+    ),
+    "jira.issue": (
+        "from atlassian import JiraClient\n"
+        "JiraClient(base_url='http://x', username='u', password='p').issue"
+    ),
+    "eager (all resources and models)": (
+        "import importlib\n"
+        "for product in ('jira', 'confluence', 'tempo'):\n"
+        "    for part in ('resources', 'models'):\n"
+        "        package = importlib.import_module(f'atlassian.{product}.{part}')\n"
+        "        for name in package.__all__:\n"
+        "            getattr(package, name)"
+    ),
+}
+
+_PROBE = (
+    "import sys, time\n"
+    "start = time.perf_counter()\n"
+    "exec(compile({code!r}, '<scenario>', 'exec'))\n"
+    "elapsed = time.perf_counter() - start\n"
+    "modules = sum(1 for m in sys.modules if m == 'atlassian' or m.startswith('atlassian.'))\n"
+    "print(elapsed, modules, 'pydantic' in sys.modules, 'cryptography' in sys.modules)\n"
+)
+
+
+def measure(code: str, runs: int = 5) -> dict[str, Any]:
+    """在 runs 个新解释器中执行 code，返回中位耗时（ms）与模块统计"""
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-W", "ignore", "-c", _PROBE.format(code=code)],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+        samples.append(float(output[0]))
+    return {
+        "ms": statistics.median(samples) * 1000,
+        "atlassian_modules": int(output[1]),
+        "pydantic": output[2] == "True",
+        "cryptography": output[3] == "True",
+    }
+
+
+def run(runs: int = 5) -> dict[str, dict[str, Any]]:
+    return {name: measure(code, runs) for name, code in SCENARIOS.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="print raw JSON")
+    args = parser.parse_args()
+
+    results = run(args.runs)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'scenario':<36}{'ms':>10}{'modules':>10}{'pydantic':>10}{'crypto':>8}")
+    for name, r in results.items():
+        print(
+            f"{name:<36}{r['ms']:>10.1f}{r['atlassian_modules']:>10}"
+            f"{'yes' if r['pydantic'] else 'no':>10}{'yes' if r['cryptography'] else 'no':>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
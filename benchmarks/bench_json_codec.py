@@ -0,0 +1,134 @@
+"""
+JSON 编解码微基准
+
+用合成的 Jira 搜索响应（maxResults=1000，可选 changelog）比较各后端的解码与编码耗时。
+
+用法:
+    python -m benchmarks.bench_json_codec
+    python -m benchmarks.bench_json_codec --issues 200 --changelog --repeat 20
+"""
+
+import argparse
+import random
+import time
+from typing import Any
+
+from atlassian.common.codec import available_codecs, get_codec
+
+
+def make_search_payload(issues: int = 1000, changelog: bool = False, seed: int = 1) -> dict:
+    """构造与 /rest/api/2/search 结构相近的响应"""
+    rng = random.Random(seed)
+    statuses = ["Open", "In Progress", "Resolved", "Closed", "待处理"]
+
+    def user(i: int) -> dict:
+        return {
+            "name": f"user{i}",
+            "key": f"user{i}",
+            "displayName": f"User {i} 用户",
+            "emailAddress": f"user{i}@example.com",
+            "active": True,
+            "avatarUrls": {size: f"https://jira.example.com/avatar/{i}?s={size}" for size in ("16x16", "24x24", "32x32", "48x48")},
+        }
+
+    def issue(n: int) -> dict:
+        fields: dict[str, Any] = {
+            "summary": f"Issue {n}: " + " ".join(rng.choice(["fix", "add", "bug", "修复", "页面"]) for _ in range(8)),
+            "description": "lorem ipsum " * rng.randint(5, 40),
+            "status": {"name": rng.choice(statuses), "id": str(rng.randint(1, 10))},
+            "priority": {"name": "Major", "id": "3"},
+            "assignee": user(rng.randint(1, 50)),
+            "reporter": user(rng.randint(1, 50)),
+            "labels": [f"label-{rng.randint(1, 20)}" for _ in range(rng.randint(0, 4))],
+            "created": "2024-01-15T10:30:00.000+0800",
+            "updated": "2024-03-01T08:00:00.000+0800",
+            "timeoriginalestimate": rng.randint(0, 100000),
+            "customfield_10010": rng.random(),
+            "components": [{"id": str(i), "name": f"Component {i}"} for i in range(rng.randint(0, 3))],
+        }
+        data: dict[str, Any] = {
+            "id": str(10000 + n),
+            "key": f"DEMO-{n}",
+            "self": f"https://jira.example.com/rest/api/2/issue/{10000 + n}",
+            "fields": fields,
+        }
+        if changelog:
+            data["changelog"] = {
+                "startAt": 0,
+                "total": 10,
+                "histories": [
+                    {
+                        "id": str(h),
+                        "author": user(rng.randint(1, 50)),
+                        "created": "2024-02-01T09:00:00.000+0800",
+                        "items": [
+                            {"field": "status", "fromString": "Open", "toString": "In Progress"},
+                        ],
+                    }
+                    for h in range(10)
+                ],
+            }
+        return data
+
+    return {
+        "expand": "names,schema",
+        "startAt": 0,
+        "maxResults": issues,
+        "total": issues * 5,
+        "issues": [issue(n) for n in range(issues)],
+    }
+
+
+def _best_of(repeat: int, func, arg) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(issues: int = 1000, changelog: bool = False, repeat: int = 10) -> list[dict[str, Any]]:
+    """
+    运行基准
+
+    Returns:
+        list[dict]: 每个后端一条记录（decode_ms / encode_ms 为 repeat 次中的最优值）
+    """
+    payload = make_search_payload(issues, changelog)
+    body = get_codec("json").dumps(payload)
+    results = []
+    for name in available_codecs():
+        codec = get_codec(name)
+        assert codec.loads(body) == payload
+        results.append(
+            {
+                "codec": name,
+                "bytes": len(body),
+                "decode_ms": _best_of(repeat, codec.loads, body) * 1000,
+                "encode_ms": _best_of(repeat, codec.dumps, payload) * 1000,
+            }
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--issues", type=int, default=1000)
+    parser.add_argument("--changelog", action="store_true")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    results = run(args.issues, args.changelog, args.repeat)
+    baseline = next(r for r in results if r["codec"] == "json")
+    print(f"payload: {baseline['bytes'] / 1024:.0f} KiB, {args.issues} issues, changelog={args.changelog}")
+    print(f"{'codec':<10}{'decode ms':>12}{'encode ms':>12}{'decode x':>10}{'encode x':>10}")
+    for r in results:
+        print(
+            f"{r['codec']:<10}{r['decode_ms']:>12.2f}{r['encode_ms']:>12.2f}"
+            f"{baseline['decode_ms'] / r['decode_ms']:>10.1f}{baseline['encode_ms'] / r['encode_ms']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
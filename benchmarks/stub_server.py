@@ -0,0 +1,773 @@
+"""
+本地 Atlassian 桩服务 (ASGI)
+
+在笔记本上测量并发、分页与重试行为，无需真实的 Jira / Confluence / Tempo 实例。
+实现资源类用到的接口子集:
+
+- Session 认证: POST/DELETE /rest/auth/1/session（也接受 Basic Auth 与 OAuth 头）
+- Jira:  GET/POST /rest/api/2/search、GET /rest/api/2/issue/{key}、POST /rest/api/2/issue、
+         POST /rest/api/2/issue/{key}/attachments、GET /rest/api/2/attachment/{id}、
+         GET /secure/attachment/{id}/{filename}
+- Agile: GET /rest/agile/1.0/board、/board/{id}、/board/{id}/issue、/board/{id}/sprint
+- Confluence: GET /rest/api/content、/content/{id}、/content/{id}/child/page、/content/{id}/descendant/page
+- Tempo: POST /rest/tempo-timesheets/4/worklogs/search（响应分块流式输出）
+
+数据按序号确定性地即时生成，不会预先占用内存，因此可以配置 10 万 Issue、100 万工时记录。
+支持注入延迟、429 限流与会话过期。
+
+用法:
+    # 进程内（推荐用于基准，排除网络栈的干扰）
+    server = StubServer(StubConfig(issues=100_000, latency=0.005))
+    async with JiraClient(base_url="http://stub", username="u", password="p",
+                          transport=server.transport()) as jira:
+        ...
+
+    # 独立进程（需要 uvicorn）
+    python -m benchmarks.stub_server --port 8080 --issues 100000 --worklogs 1000000
+"""
+
+import argparse
+import asyncio
+import base64
+import datetime as dt
+import itertools
+import math
+import random
+import re
+import secrets
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Iterator, Optional
+from urllib.parse import parse_qs
+
+import httpx
+
+from atlassian.common.codec import get_codec
+
+Scope = dict[str, Any]
+Receive = Callable[[], Awaitable[dict]]
+Send = Callable[[dict], Awaitable[None]]
+
+_STATUSES = [("1", "Open"), ("3", "In Progress"), ("5", "Resolved"), ("6", "Closed")]
+_PRIORITIES = [("1", "Highest"), ("2", "High"), ("3", "Medium"), ("4", "Low")]
+_ISSUE_TYPES = [("1", "Bug"), ("3", "Task"), ("10001", "Story")]
+_WORDS = "alpha beta gamma delta epsilon 页面 修复 优化 接口 性能".split()
+_PROJECT_CLAUSE = re.compile(r"project\s*(?:=|in)\s*\(?\s*\"?([A-Za-z][A-Za-z0-9_]*)", re.IGNORECASE)
+_ISSUE_KEY = re.compile(r"^([A-Z][A-Z0-9_]*)-(\d+)$")
+_FILENAME = re.compile(rb'filename="([^"]*)"')
+
+
+@dataclass
+class StubConfig:
+    """桩服务配置"""
+
+    # 数据规模
+    issues: int = 1000
+    projects: tuple[str, ...] = ("DEMO",)
+    users: int = 50
+    boards: int = 5
+    pages: int = 1000
+    page_fanout: int = 10  # Confluence 页面树的分叉数
+    worklogs: int = 10_000
+    worklog_start: dt.date = dt.date(2024, 1, 1)
+    worklog_days: int = 365
+    description_size: int = 200
+    attachment_size: int = 64 * 1024  # 未上传过的附件下载时的合成大小
+    max_results_cap: int = 1000  # 与 Jira 默认的 maxResults 上限一致
+
+    # 故障注入
+    latency: float = 0.0  # 每个请求的固定延迟（秒）
+    latency_jitter: float = 0.0  # 额外的均匀随机延迟上限（秒）
+    rate_limit_every: int = 0  # 每 N 个请求返回一次 429，0 表示关闭
+    rate_limit_ratio: float = 0.0  # 以该概率返回 429
+    retry_after: float = 0.0  # 429 响应的 Retry-After（秒）
+    session_max_requests: int = 0  # 会话在 N 个请求后过期，0 表示不过期
+    session_ttl: float = 0.0  # 会话在 N 秒后过期，0 表示不过期
+
+    # 认证
+    username: Optional[str] = None  # 为 None 时接受任意用户名/密码
+    password: Optional[str] = None
+
+    seed: int = 0
+    worklog_chunk: int = 1000  # Tempo 搜索响应每块的记录数
+
+
+@dataclass
+class StubStats:
+    """桩服务统计"""
+
+    requests: int = 0
+    logins: int = 0
+    logouts: int = 0
+    rate_limited: int = 0
+    expired: int = 0
+    unauthorized: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    status: dict[int, int] = field(default_factory=dict)
+    endpoints: dict[str, int] = field(default_factory=dict)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "logins": self.logins,
+            "logouts": self.logouts,
+            "rate_limited": self.rate_limited,
+            "expired": self.expired,
+            "unauthorized": self.unauthorized,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "status": {str(k): v for k, v in sorted(self.status.items())},
+            "endpoints": dict(sorted(self.endpoints.items())),
+        }
+
+
+@dataclass
+class _Session:
+    created: float
+    requests: int = 0
+
+
+class _Response:
+    def __init__(
+        self,
+        status: int = 200,
+        body: Any = None,
+        raw: Optional[bytes] = None,
+        chunks: Optional[Iterator[bytes]] = None,
+        headers: Optional[dict[str, str]] = None,
+        content_type: str = "application/json",
+    ):
+        self.status = status
+        self.body = body
+        self.raw = raw
+        self.chunks = chunks
+        self.headers = headers or {}
+        self.content_type = content_type
+
+
+class _Request:
+    def __init__(self, scope: Scope, body: bytes):
+        self.method: str = scope["method"]
+        full_path: str = scope["path"]
+        index = full_path.find("/rest/")
+        if index < 0:
+            index = full_path.find("/secure/")
+        self.path = full_path[index:] if index >= 0 else full_path
+        self.query = {k: v[-1] for k, v in parse_qs(scope.get("query_string", b"").decode()).items()}
+        self.headers = {k.decode().lower(): v.decode() for k, v in scope.get("headers", [])}
+        self.body = body
+
+    def int_param(self, name: str, default: int) -> int:
+        try:
+            return int(self.query.get(name, default))
+        except ValueError:
+            return default
+
+
+class StubServer:
+    """Jira / Agile / Confluence / Tempo 桩服务（ASGI 应用）"""
+
+    def __init__(self, config: Optional[StubConfig] = None):
+        self.config = config or StubConfig()
+        self.stats = StubStats()
+        self._codec = get_codec()
+        self._rng = random.Random(self.config.seed)
+        self._sessions: dict[str, _Session] = {}
+        self._attachments: dict[int, tuple[str, bytes]] = {}
+        self._attachment_ids = itertools.count(20000)
+        self._created_issues = itertools.count(self.config.issues)
+        self._filler = self._make_filler(self.config.description_size)
+        self._routes: list[tuple[str, re.Pattern, Callable[..., _Response]]] = [
+            ("GET", re.compile(r"^/rest/api/2/search$"), self._search),
+            ("POST", re.compile(r"^/rest/api/2/search$"), self._search),
+            ("GET", re.compile(r"^/rest/api/2/issue/([^/]+)$"), self._get_issue),
+            ("POST", re.compile(r"^/rest/api/2/issue$"), self._create_issue),
+            ("POST", re.compile(r"^/rest/api/2/issue/([^/]+)/attachments$"), self._upload_attachment),
+            ("GET", re.compile(r"^/rest/api/2/attachment/(\d+)$"), self._get_attachment),
+            ("GET", re.compile(r"^/secure/attachment/(\d+)/[^/]*$"), self._download_attachment),
+            ("GET", re.compile(r"^/rest/api/2/myself$"), self._myself),
+            ("GET", re.compile(r"^/rest/api/2/serverInfo$"), self._server_info),
+            ("GET", re.compile(r"^/status$"), self._status),
+            ("GET", re.compile(r"^/rest/agile/1\.0/board$"), self._boards),
+            ("GET", re.compile(r"^/rest/agile/1\.0/board/(\d+)$"), self._board),
+            ("GET", re.compile(r"^/rest/agile/1\.0/board/(\d+)/issue$"), self._board_issues),
+            ("GET", re.compile(r"^/rest/agile/1\.0/board/(\d+)/sprint$"), self._board_sprints),
+            ("GET", re.compile(r"^/rest/api/content$"), self._contents),
+            ("GET", re.compile(r"^/rest/api/content/(\d+)$"), self._content),
+            ("GET", re.compile(r"^/rest/api/content/(\d+)/child/page$"), self._children),
+            ("GET", re.compile(r"^/rest/api/content/(\d+)/descendant/page$"), self._descendants),
+            ("POST", re.compile(r"^/rest/tempo-timesheets/4/worklogs/search$"), self._worklog_search),
+        ]
+
+    # ========== 对外接口 ==========
+
+    def transport(self) -> httpx.AsyncBaseTransport:
+        """进程内 transport，直接传给客户端的 transport= 参数"""
+        return httpx.ASGITransport(app=self)
+
+    def expire_sessions(self) -> None:
+        """使所有会话立即过期"""
+        self._sessions.clear()
+
+    def issue_key(self, index: int) -> str:
+        projects = self.config.projects
+        return f"{projects[index % len(projects)]}-{index // len(projects) + 1}"
+
+    # ========== ASGI ==========
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+        request = _Request(scope, body)
+
+        config = self.config
+        delay = config.latency + (self._rng.random() * config.latency_jitter if config.latency_jitter else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        response = self._handle(request)
+        await self._send(send, response)
+
+    def _handle(self, request: _Request) -> _Response:
+        stats = self.stats
+        stats.requests += 1
+        stats.bytes_in += len(request.body)
+
+        if request.path == "/rest/auth/1/session":
+            response = self._session(request)
+        elif self._rate_limited():
+            stats.rate_limited += 1
+            response = _Response(
+                429,
+                {"errorMessages": ["Rate limit exceeded"]},
+                headers={"Retry-After": f"{self.config.retry_after:g}"},
+            )
+        else:
+            response = self._authenticate(request) or self._route(request)
+
+        stats.status[response.status] = stats.status.get(response.status, 0) + 1
+        return response
+
+    async def _send(self, send: Send, response: _Response) -> None:
+        headers = [(b"content-type", response.content_type.encode())]
+        headers += [(k.lower().encode(), v.encode()) for k, v in response.headers.items()]
+        if response.chunks is not None:
+            await send({"type": "http.response.start", "status": response.status, "headers": headers})
+            for chunk in response.chunks:
+                self.stats.bytes_out += len(chunk)
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        if response.raw is not None:
+            payload = response.raw
+        elif response.body is not None:
+            payload = self._codec.dumps(response.body)
+        else:
+            payload = b""
+        self.stats.bytes_out += len(payload)
+        headers.append((b"content-length", str(len(payload)).encode()))
+        await send({"type": "http.response.start", "status": response.status, "headers": headers})
+        await send({"type": "http.response.body", "body": payload})
+
+    # ========== 认证与故障注入 ==========
+
+    def _rate_limited(self) -> bool:
+        config = self.config
+        if config.rate_limit_every and self.stats.requests % config.rate_limit_every == 0:
+            return True
+        return bool(config.rate_limit_ratio) and self._rng.random() < config.rate_limit_ratio
+
+    def _session(self, request: _Request) -> _Response:
+        if request.method == "POST":
+            credentials = self._codec.loads(request.body or b"{}")
+            if not self._check_credentials(credentials.get("username"), credentials.get("password")):
+                return _Response(401, {"errorMessages": ["Login failed"]})
+            token = secrets.token_hex(16)
+            self._sessions[token] = _Session(created=time.monotonic())
+            self.stats.logins += 1
+            return _Response(
+                200,
+                {
+                    "session": {"name": "JSESSIONID", "value": token},
+                    "loginInfo": {"loginCount": self.stats.logins, "failedLoginCount": 0},
+                },
+            )
+        if request.method == "DELETE":
+            token = self._cookie_session(request)
+            if token is not None:
+                self._sessions.pop(token, None)
+                self.stats.logouts += 1
+            return _Response(204)
+        return _Response(405)
+
+    def _check_credentials(self, username: Optional[str], password: Optional[str]) -> bool:
+        config = self.config
+        if config.username is None:
+            return bool(username)
+        return username == config.username and password == config.password
+
+    @staticmethod
+    def _cookie_session(request: _Request) -> Optional[str]:
+        for part in request.headers.get("cookie", "").split(";"):
+            name, _, value = part.strip().partition("=")
+            if name == "JSESSIONID":
+                return value
+        return None
+
+    def _authenticate(self, request: _Request) -> Optional[_Response]:
+        """认证失败时返回 401 响应"""
+        if request.path == "/status":
+            return None
+        authorization = request.headers.get("authorization", "")
+        if authorization.startswith("OAuth "):
+            return None
+        if authorization.startswith("Basic "):
+            username, _, password = base64.b64decode(authorization[6:]).decode().partition(":")
+            if self._check_credentials(username, password):
+                return None
+            self.stats.unauthorized += 1
+            return _Response(401, {"errorMessages": ["Unauthorized"]})
+
+        token = self._cookie_session(request)
+        session = self._sessions.get(token) if token else None
+        if session is None:
+            self.stats.unauthorized += 1
+            return _Response(401, {"errorMessages": ["Session expired"]})
+
+        config = self.config
+        session.requests += 1
+        if (config.session_max_requests and session.requests > config.session_max_requests) or (
+            config.session_ttl and time.monotonic() - session.created > config.session_ttl
+        ):
+            del self._sessions[token]
+            self.stats.expired += 1
+            return _Response(401, {"errorMessages": ["Session expired"]})
+        return None
+
+    def _route(self, request: _Request) -> _Response:
+        for method, pattern, handler in self._routes:
+            if method != request.method:
+                continue
+            match = pattern.match(request.path)
+            if match:
+                key = f"{method} {pattern.pattern}"
+                self.stats.endpoints[key] = self.stats.endpoints.get(key, 0) + 1
+                return handler(request, *match.groups())
+        return _Response(404, {"errorMessages": [f"No stub for {request.method} {request.path}"]})
+
+    # ========== 数据生成 ==========
+
+    @staticmethod
+    def _make_filler(size: int) -> str:
+        words = itertools.cycle(_WORDS)
+        text = ""
+        while len(text) < size:
+            text += next(words) + " "
+        return text[:size]
+
+    def _user(self, index: int) -> dict:
+        name = f"user{index % max(self.config.users, 1)}"
+        return {
+            "self": f"/rest/api/2/user?username={name}",
+            "key": name,
+            "name": name,
+            "displayName": f"User {name}",
+            "emailAddress": f"{name}@example.com",
+            "active": True,
+            "timeZone": "Asia/Shanghai",
+        }
+
+    def _issue_index(self, key: str) -> Optional[int]:
+        if key.isdigit():
+            index = int(key) - 10000
+        else:
+            match = _ISSUE_KEY.match(key)
+            if not match or match.group(1) not in self.config.projects:
+                return None
+            projects = self.config.projects
+            index = (int(match.group(2)) - 1) * len(projects) + projects.index(match.group(1))
+        return index if 0 <= index < self.config.issues else None
+
+    def _issue(self, index: int, changelog: bool = False) -> dict:
+        projects = self.config.projects
+        project = projects[index % len(projects)]
+        status_id, status_name = _STATUSES[index % len(_STATUSES)]
+        priority_id, priority_name = _PRIORITIES[index % len(_PRIORITIES)]
+        type_id, type_name = _ISSUE_TYPES[index % len(_ISSUE_TYPES)]
+        day = dt.date(2024, 1, 1) + dt.timedelta(days=index % 365)
+        issue = {
+            "id": str(10000 + index),
+            "key": self.issue_key(index),
+            "self": f"/rest/api/2/issue/{10000 + index}",
+            "fields": {
+                "summary": f"{_WORDS[index % len(_WORDS)]} issue {index}",
+                "description": self._filler,
+                "issuetype": {"id": type_id, "name": type_name, "subtask": False},
+                "status": {
+                    "id": status_id,
+                    "name": status_name,
+                    "statusCategory": {"id": 2, "key": "new", "name": "To Do"},
+                },
+                "priority": {"id": priority_id, "name": priority_name},
+                "assignee": self._user(index),
+                "reporter": self._user(index + 7),
+                "created": f"{day.isoformat()}T09:00:00.000+0800",
+                "updated": f"{day.isoformat()}T18:00:00.000+0800",
+                "labels": [f"label{index % 7}", f"label{index % 11}"],
+                "project": {"id": str(10000 + projects.index(project)), "key": project, "name": project},
+                "components": [],
+            },
+        }
+        if changelog:
+            issue["changelog"] = {
+                "startAt": 0,
+                "maxResults": 3,
+                "total": 3,
+                "histories": [
+                    {
+                        "id": str(index * 10 + h),
+                        "author": self._user(index + h),
+                        "created": f"{day.isoformat()}T1{h}:00:00.000+0800",
+                        "items": [
+                            {"field": "status", "fromString": _STATUSES[h][1], "toString": _STATUSES[h + 1][1]}
+                        ],
+                    }
+                    for h in range(3)
+                ],
+            }
+        return issue
+
+    def _page_params(self, request: _Request, start_key: str, size_key: str, default: int) -> tuple[int, int]:
+        start = max(request.int_param(start_key, 0), 0)
+        size = min(max(request.int_param(size_key, default), 0), self.config.max_results_cap)
+        return start, size
+
+    # ========== Jira ==========
+
+    def _search(self, request: _Request) -> _Response:
+        if request.method == "POST":
+            body = self._codec.loads(request.body or b"{}")
+            jql = body.get("jql", "")
+            start = max(int(body.get("startAt", 0)), 0)
+            size = min(int(body.get("maxResults", 50)), self.config.max_results_cap)
+            expand = body.get("expand") or []
+            expand = ",".join(expand) if isinstance(expand, list) else expand
+        else:
+            jql = request.query.get("jql", "")
+            start, size = self._page_params(request, "startAt", "maxResults", 50)
+            expand = request.query.get("expand", "")
+
+        # 只识别 project = KEY 条件，其余 JQL 视为匹配全部
+        projects = self.config.projects
+        match = _PROJECT_CLAUSE.search(jql)
+        if match and match.group(1).upper() in projects:
+            offset, step = projects.index(match.group(1).upper()), len(projects)
+            total = len(range(offset, self.config.issues, step))
+        else:
+            offset, step, total = 0, 1, self.config.issues
+        changelog = "changelog" in expand
+        issues = [self._issue(offset + i * step, changelog) for i in range(start, min(start + size, total))]
+        return _Response(
+            200,
+            {"expand": "schema,names", "startAt": start, "maxResults": size, "total": total, "issues": issues},
+        )
+
+    def _get_issue(self, request: _Request, key: str) -> _Response:
+        index = self._issue_index(key)
+        if index is None:
+            return _Response(404, {"errorMessages": ["Issue Does Not Exist"]})
+        return _Response(200, self._issue(index, "changelog" in request.query.get("expand", "")))
+
+    def _create_issue(self, request: _Request) -> _Response:
+        index = next(self._created_issues)
+        return _Response(201, {"id": str(10000 + index), "key": self.issue_key(index), "self": f"/rest/api/2/issue/{10000 + index}"})
+
+    def _attachment_meta(self, attachment_id: int, filename: str, size: int) -> dict:
+        return {
+            "id": str(attachment_id),
+            "self": f"/rest/api/2/attachment/{attachment_id}",
+            "filename": filename,
+            "author": self._user(0),
+            "created": "2024-01-01T09:00:00.000+0800",
+            "size": size,
+            "mimeType": "application/octet-stream",
+            "content": f"/secure/attachment/{attachment_id}/{filename}",
+        }
+
+    def _upload_attachment(self, request: _Request, key: str) -> _Response:
+        if self._issue_index(key) is None:
+            return _Response(404, {"errorMessages": ["Issue Does Not Exist"]})
+        if request.headers.get("x-atlassian-token") != "no-check":
+            return _Response(403, {"errorMessages": ["XSRF check failed"]})
+        match = _FILENAME.search(request.body)
+        filename = match.group(1).decode() if match else "upload.bin"
+        # 去掉 multipart 首尾边界，近似得到文件内容
+        content = request.body
+        header_end = content.find(b"\r\n\r\n")
+        if header_end >= 0:
+            content = content[header_end + 4:content.rfind(b"\r\n--")]
+        attachment_id = next(self._attachment_ids)
+        self._attachments[attachment_id] = (filename, content)
+        return _Response(200, [self._attachment_meta(attachment_id, filename, len(content))])
+
+    def _get_attachment(self, request: _Request, attachment_id: str) -> _Response:
+        filename, content = self._attachment_content(int(attachment_id))
+        return _Response(200, self._attachment_meta(int(attachment_id), filename, len(content)))
+
+    def _download_attachment(self, request: _Request, attachment_id: str) -> _Response:
+        filename, content = self._attachment_content(int(attachment_id))
+        return _Response(200, raw=content, content_type="application/octet-stream")
+
+    def _attachment_content(self, attachment_id: int) -> tuple[str, bytes]:
+        if attachment_id in self._attachments:
+            return self._attachments[attachment_id]
+        size = self.config.attachment_size
+        return f"file-{attachment_id}.bin", (bytes(range(256)) * (size // 256 + 1))[:size]
+
+    def _myself(self, request: _Request) -> _Response:
+        return _Response(200, self._user(0))
+
+    def _server_info(self, request: _Request) -> _Response:
+        return _Response(200, {"baseUrl": "http://stub", "version": "9.12.0", "deploymentType": "Server"})
+
+    def _status(self, request: _Request) -> _Response:
+        return _Response(200, {"state": "RUNNING"})
+
+    # ========== Agile ==========
+
+    def _board_json(self, board_id: int) -> dict:
+        project = self.config.projects[board_id % len(self.config.projects)]
+        return {
+            "id": board_id,
+            "self": f"/rest/agile/1.0/board/{board_id}",
+            "name": f"Board {board_id}",
+            "type": "scrum" if board_id % 2 else "kanban",
+            "location": {"projectKey": project, "name": project},
+        }
+
+    def _boards(self, request: _Request) -> _Response:
+        start, size = self._page_params(request, "startAt", "maxResults", 50)
+        ids = range(1, self.config.boards + 1)
+        values = [self._board_json(i) for i in ids[start:start + size]]
+        return _Response(
+            200,
+            {
+                "maxResults": size,
+                "startAt": start,
+                "total": len(ids),
+                "isLast": start + size >= len(ids),
+                "values": values,
+            },
+        )
+
+    def _board(self, request: _Request, board_id: str) -> _Response:
+        if not 1 <= int(board_id) <= self.config.boards:
+            return _Response(404, {"errorMessages": ["Board does not exist"]})
+        return _Response(200, self._board_json(int(board_id)))
+
+    def _board_issues(self, request: _Request, board_id: str) -> _Response:
+        board = int(board_id)
+        if not 1 <= board <= self.config.boards:
+            return _Response(404, {"errorMessages": ["Board does not exist"]})
+        start, size = self._page_params(request, "startAt", "maxResults", 50)
+        # 看板 b 包含序号 i % boards == b - 1 的 Issue
+        indices = range(board - 1, self.config.issues, self.config.boards)
+        issues = [self._issue(i) for i in indices[start:start + size]]
+        return _Response(200, {"maxResults": size, "startAt": start, "total": len(indices), "issues": issues})
+
+    def _board_sprints(self, request: _Request, board_id: str) -> _Response:
+        board = int(board_id)
+        sprints = [
+            {
+                "id": board * 100 + n,
+                "self": f"/rest/agile/1.0/sprint/{board * 100 + n}",
+                "state": "closed" if n < 3 else "active",
+                "name": f"Sprint {n}",
+                "originBoardId": board,
+            }
+            for n in range(1, 4)
+        ]
+        return _Response(200, {"maxResults": 50, "startAt": 0, "isLast": True, "values": sprints})
+
+    # ========== Confluence ==========
+
+    def _page_json(self, page_id: int) -> dict:
+        index = page_id - 1
+        ancestors = []
+        parent = index
+        while parent > 0:
+            parent = (parent - 1) // self.config.page_fanout
+            ancestors.append({"id": str(parent + 1), "type": "page"})
+        return {
+            "id": str(page_id),
+            "type": "page",
+            "status": "current",
+            "title": f"Page {page_id}",
+            "space": {"id": 1, "key": "DOC", "name": "Documentation", "type": "global"},
+            "version": {"number": 1 + index % 5, "when": "2024-01-01T09:00:00.000+08:00"},
+            "ancestors": list(reversed(ancestors)),
+            "body": {"storage": {"value": f"<p>{self._filler}</p>", "representation": "storage"}},
+            "_links": {"webui": f"/pages/viewpage.action?pageId={page_id}"},
+        }
+
+    def _content_list(self, ids: list[int], start: int, limit: int) -> dict:
+        return {
+            "results": [self._page_json(i) for i in ids],
+            "start": start,
+            "limit": limit,
+            "size": len(ids),
+            "_links": {"base": "http://stub", "context": ""},
+        }
+
+    def _contents(self, request: _Request) -> _Response:
+        start, limit = self._page_params(request, "start", "limit", 25)
+        ids = list(range(1, self.config.pages + 1)[start:start + limit])
+        return _Response(200, self._content_list(ids, start, limit))
+
+    def _content(self, request: _Request, page_id: str) -> _Response:
+        if not 1 <= int(page_id) <= self.config.pages:
+            return _Response(404, {"message": "No content found"})
+        return _Response(200, self._page_json(int(page_id)))
+
+    def _child_ids(self, page_id: int) -> range:
+        fanout = self.config.page_fanout
+        first = (page_id - 1) * fanout + 2
+        return range(first, min(first + fanout, self.config.pages + 1))
+
+    def _children(self, request: _Request, page_id: str) -> _Response:
+        start, limit = self._page_params(request, "start", "limit", 25)
+        ids = list(self._child_ids(int(page_id))[start:start + limit])
+        return _Response(200, self._content_list(ids, start, limit))
+
+    def _descendants(self, request: _Request, page_id: str) -> _Response:
+        start, limit = self._page_params(request, "start", "limit", 25)
+
+        def walk() -> Iterator[int]:
+            queue = list(self._child_ids(int(page_id)))
+            while queue:
+                current = queue.pop(0)
+                yield current
+                queue.extend(self._child_ids(current))
+
+        ids = list(itertools.islice(walk(), start, start + limit))
+        return _Response(200, self._content_list(ids, start, limit))
+
+    # ========== Tempo ==========
+
+    def _worklog_json(self, index: int, day: dt.date) -> dict:
+        issue_index = (index * 7919) % max(self.config.issues, 1)
+        seconds = 900 * (1 + index % 16)
+        return {
+            "tempoWorklogId": 100000 + index,
+            "jiraWorklogId": 200000 + index,
+            "issue": {
+                "key": self.issue_key(issue_index),
+                "id": 10000 + issue_index,
+                "summary": f"issue {issue_index}",
+                "projectKey": self.issue_key(issue_index).split("-")[0],
+            },
+            "timeSpentSeconds": seconds,
+            "billableSeconds": seconds if index % 3 else 0,
+            "started": f"{day.isoformat()} 09:00:00.000",
+            "comment": f"work {index}",
+            "worker": f"user{index % max(self.config.users, 1)}",
+            "author": f"user{index % max(self.config.users, 1)}",
+            "originTaskId": 10000 + issue_index,
+            "attributes": {},
+        }
+
+    def _worklog_search(self, request: _Request) -> _Response:
+        config = self.config
+        body = self._codec.loads(request.body or b"{}")
+        try:
+            from_date = dt.date.fromisoformat(body["from"])
+            to_date = dt.date.fromisoformat(body["to"])
+        except (KeyError, ValueError):
+            return _Response(400, {"errorMessages": ["from and to are required"]})
+
+        # 工时记录按序号均匀分布在 worklog_days 天内，日期范围可直接换算为序号范围
+        per_day = max(math.ceil(config.worklogs / config.worklog_days), 1)
+        first_day = max((from_date - config.worklog_start).days, 0)
+        last_day = min((to_date - config.worklog_start).days, config.worklog_days - 1)
+        indices = range(first_day * per_day, min((last_day + 1) * per_day, config.worklogs))
+
+        workers = set(body.get("worker") or [])
+        projects = set(body.get("projectKey") or [])
+        tasks = set(body.get("taskKey") or [])
+
+        def matching() -> Iterator[dict]:
+            for index in indices:
+                worklog = self._worklog_json(index, config.worklog_start + dt.timedelta(days=index // per_day))
+                if workers and worklog["worker"] not in workers:
+                    continue
+                if projects and worklog["issue"]["projectKey"] not in projects:
+                    continue
+                if tasks and worklog["issue"]["key"] not in tasks:
+                    continue
+                yield worklog
+
+        def chunks() -> Iterator[bytes]:
+            items = matching()
+            yield b"["
+            first = True
+            while True:
+                batch = list(itertools.islice(items, config.worklog_chunk))
+                if not batch:
+                    break
+                encoded = b",".join(self._codec.dumps(item) for item in batch)
+                yield encoded if first else b"," + encoded
+                first = False
+            yield b"]"
+
+        return _Response(200, chunks=chunks())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the local Atlassian stub server (requires uvicorn)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--issues", type=int, default=StubConfig.issues)
+    parser.add_argument("--worklogs", type=int, default=StubConfig.worklogs)
+    parser.add_argument("--pages", type=int, default=StubConfig.pages)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--rate-limit-every", type=int, default=0)
+    parser.add_argument("--session-max-requests", type=int, default=0)
+    args = parser.parse_args()
+
+    try:
+        import uvicorn
+    except ImportError:
+        raise SystemExit("uvicorn is required to serve over TCP: pip install uvicorn")
+
+    server = StubServer(
+        StubConfig(
+            issues=args.issues,
+            worklogs=args.worklogs,
+            pages=args.pages,
+            latency=args.latency,
+            rate_limit_every=args.rate_limit_every,
+            session_max_requests=args.session_max_requests,
+        )
+    )
+    uvicorn.run(server, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
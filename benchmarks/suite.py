@@ -0,0 +1,382 @@
+"""
+客户端热点路径基准套件
+
+全部基于进程内桩服务（benchmarks.stub_server），不依赖网络与真实实例:
+
+    search        SearchResource.search 的 Issue 吞吐（issues/s）
+    validation    Issue / SearchResults 的 pydantic 校验耗时
+    oauth1        OAuth 1.0a auth_flow 签名吞吐（次/s）
+    attachment    附件上传 / 下载吞吐（MB/s）
+    tempo         Tempo 工时搜索 + 按人汇总（worklogs/s）
+    import        import atlassian 的冷启动耗时（子进程）
+
+结果以 JSON 保存，可与之前的结果比较并标记回退:
+
+    python -m benchmarks.suite --output results/HEAD.json
+    python -m benchmarks.suite --only search,tempo --compare results/main.json --threshold 0.15
+
+--compare 发现回退时以状态码 1 退出，便于在 CI 中使用。
+"""
+
+import argparse
+import asyncio
+import datetime as dt
+import json
+import platform
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+SCHEMA_VERSION = 1
+
+
+@dataclass
+class Measurement:
+    """单项指标"""
+
+    value: float
+    unit: str
+    higher_is_better: bool
+
+
+@dataclass
+class Regression:
+    """与基准结果相比变差的指标"""
+
+    metric: str
+    baseline: float
+    current: float
+    change: float  # 相对变化，正数表示变差
+
+    def __str__(self) -> str:
+        return f"{self.metric}: {self.baseline:.4g} -> {self.current:.4g} ({self.change:+.1%} worse)"
+
+
+@dataclass
+class SuiteConfig:
+    """基准规模配置（quick() 用于冒烟测试）"""
+
+    search_issues: int = 5000
+    search_page_size: int = 1000
+    validation_issues: int = 1000
+    oauth1_signs: int = 200
+    attachment_size: int = 8 * 1024 * 1024
+    attachment_rounds: int = 5
+    tempo_worklogs: int = 100_000
+    import_runs: int = 5
+    repeat: int = 3
+
+    @classmethod
+    def quick(cls) -> "SuiteConfig":
+        return cls(
+            search_issues=200,
+            search_page_size=100,
+            validation_issues=50,
+            oauth1_signs=5,
+            attachment_size=64 * 1024,
+            attachment_rounds=2,
+            tempo_worklogs=1000,
+            import_runs=1,
+            repeat=1,
+        )
+
+
+def _best_of(repeat: int, func: Callable[[], Any]) -> float:
+    """运行 repeat 次，返回最短耗时（秒）"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _client(cls, server, **kwargs):
+    return cls(
+        base_url="http://stub.bench",
+        username="bench",
+        password="bench",
+        trust_env=False,
+        transport=server.transport(),
+        **kwargs,
+    )
+
+
+# ========== 各项基准 ==========
+
+
+def bench_search(config: SuiteConfig) -> dict[str, Measurement]:
+    from atlassian import JiraClient
+    from benchmarks.stub_server import StubConfig, StubServer
+
+    server = StubServer(StubConfig(issues=config.search_issues, max_results_cap=config.search_page_size))
+
+    async def fetch_all() -> int:
+        count = 0
+        async with _client(JiraClient, server) as jira:
+            start = 0
+            while True:
+                page = await jira.search.search("project = DEMO", start_at=start, max_results=config.search_page_size)
+                count += len(page.issues)
+                start += len(page.issues)
+                if not page.issues or start >= page.total:
+                    return count
+
+    elapsed = _best_of(config.repeat, lambda: asyncio.run(fetch_all()))
+    return {
+        "issues_per_sec": Measurement(config.search_issues / elapsed, "issues/s", True),
+        "page_ms": Measurement(
+            elapsed * 1000 / -(-config.search_issues // config.search_page_size), "ms", False
+        ),
+    }
+
+
+def bench_validation(config: SuiteConfig) -> dict[str, Measurement]:
+    from atlassian.jira.models import Issue, SearchResults
+    from benchmarks.bench_json_codec import make_search_payload
+
+    payload = make_search_payload(config.validation_issues, changelog=True)
+    issues = payload["issues"]
+
+    def validate_issues() -> None:
+        for issue in issues:
+            Issue.model_validate(issue)
+
+    search = _best_of(config.repeat, lambda: SearchResults.model_validate(payload))
+    issue = _best_of(config.repeat, validate_issues)
+    return {
+        "search_results_ms": Measurement(search * 1000, "ms", False),
+        "issue_us": Measurement(issue * 1e6 / len(issues), "us", False),
+    }
+
+
+def bench_oauth1(config: SuiteConfig) -> dict[str, Measurement]:
+    import httpx
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    from atlassian import OAuth1Config
+
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pem = key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode()
+    auth = OAuth1Config(consumer_key="bench", private_key=pem, access_token="token").create_httpx_auth()
+    body = json.dumps({"jql": "project = DEMO ORDER BY key", "maxResults": 1000}).encode()
+
+    def sign(request: httpx.Request) -> None:
+        next(auth.auth_flow(request))
+
+    def sign_get() -> None:
+        for _ in range(config.oauth1_signs):
+            sign(httpx.Request("GET", "http://stub.bench/rest/api/2/search?jql=project%20%3D%20DEMO&startAt=0"))
+
+    def sign_post() -> None:
+        for _ in range(config.oauth1_signs):
+            sign(
+                httpx.Request(
+                    "POST",
+                    "http://stub.bench/rest/api/2/search",
+                    content=body,
+                    headers={"Content-Type": "application/json"},
+                )
+            )
+
+    return {
+        "get_signs_per_sec": Measurement(config.oauth1_signs / _best_of(config.repeat, sign_get), "signs/s", True),
+        "post_signs_per_sec": Measurement(config.oauth1_signs / _best_of(config.repeat, sign_post), "signs/s", True),
+    }
+
+
+def bench_attachment(config: SuiteConfig) -> dict[str, Measurement]:
+    from atlassian import JiraClient
+    from benchmarks.stub_server import StubConfig, StubServer
+
+    server = StubServer(StubConfig(issues=10, attachment_size=config.attachment_size))
+    content = bytes(range(256)) * (config.attachment_size // 256)
+    timings = {"upload": float("inf"), "download": float("inf")}
+
+    async def round_trip() -> None:
+        async with _client(JiraClient, server) as jira:
+            for _ in range(config.attachment_rounds):
+                start = time.perf_counter()
+                uploaded = await jira.issue.add_attachment_bytes("DEMO-1", content, "bench.bin")
+                middle = time.perf_counter()
+                downloaded = await jira.attachment.download(uploaded[0].id)
+                end = time.perf_counter()
+                assert len(downloaded) == len(content)
+                timings["upload"] = min(timings["upload"], middle - start)
+                timings["download"] = min(timings["download"], end - middle)
+
+    asyncio.run(round_trip())
+    megabytes = len(content) / (1024 * 1024)
+    return {
+        "upload_mb_per_sec": Measurement(megabytes / timings["upload"], "MB/s", True),
+        "download_mb_per_sec": Measurement(megabytes / timings["download"], "MB/s", True),
+    }
+
+
+def bench_tempo(config: SuiteConfig) -> dict[str, Measurement]:
+    from atlassian.tempo import TempoClient
+    from benchmarks.stub_server import StubConfig, StubServer
+
+    server = StubServer(StubConfig(issues=1000, worklogs=config.tempo_worklogs, worklog_days=365))
+
+    async def aggregate(stream: bool) -> dict[str, int]:
+        totals: dict[str, int] = {}
+        async with _client(TempoClient, server) as tempo:
+            if stream:
+                async for worklog in tempo.worklog.search_stream("2024-01-01", "2024-12-31"):
+                    totals[worklog["worker"]] = totals.get(worklog["worker"], 0) + worklog["timeSpentSeconds"]
+            else:
+                for worklog in await tempo.worklog.search("2024-01-01", "2024-12-31"):
+                    totals[worklog.worker] = totals.get(worklog.worker, 0) + worklog.time_spent_seconds
+        return totals
+
+    buffered = _best_of(config.repeat, lambda: asyncio.run(aggregate(False)))
+    streamed = _best_of(config.repeat, lambda: asyncio.run(aggregate(True)))
+    return {
+        "worklogs_per_sec": Measurement(config.tempo_worklogs / buffered, "worklogs/s", True),
+        "stream_worklogs_per_sec": Measurement(config.tempo_worklogs / streamed, "worklogs/s", True),
+    }
+
+
+def bench_import(config: SuiteConfig) -> dict[str, Measurement]:
+    from benchmarks.bench_import import SCENARIOS, measure
+
+    package = measure(SCENARIOS["import atlassian"], config.import_runs)
+    client = measure(SCENARIOS["JiraClient()"], config.import_runs)
+    issue = measure(SCENARIOS["jira.issue"], config.import_runs)
+    return {
+        "import_atlassian_ms": Measurement(package["ms"], "ms", False),
+        "import_jira_client_ms": Measurement(client["ms"], "ms", False),
+        "jira_issue_ms": Measurement(issue["ms"], "ms", False),
+        "jira_client_modules": Measurement(client["atlassian_modules"], "modules", False),
+    }
+
+
+BENCHMARKS: dict[str, Callable[[SuiteConfig], dict[str, Measurement]]] = {
+    "search": bench_search,
+    "validation": bench_validation,
+    "oauth1": bench_oauth1,
+    "attachment": bench_attachment,
+    "tempo": bench_tempo,
+    "import": bench_import,
+}
+
+
+# ========== 运行与比较 ==========
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).resolve().parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def run_suite(config: Optional[SuiteConfig] = None, only: Optional[list[str]] = None) -> dict[str, Any]:
+    """
+    运行基准套件
+
+    Args:
+        config: 规模配置
+        only: 只运行指定的基准（BENCHMARKS 的键）
+
+    Returns:
+        dict: 可直接 JSON 序列化的结果，metrics 的键为 "<基准>.<指标>"
+    """
+    config = config or SuiteConfig()
+    names = only or list(BENCHMARKS)
+    unknown = set(names) - set(BENCHMARKS)
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {sorted(unknown)} (expected {list(BENCHMARKS)})")
+
+    metrics: dict[str, dict[str, Any]] = {}
+    for name in names:
+        for metric, measurement in BENCHMARKS[name](config).items():
+            metrics[f"{name}.{metric}"] = asdict(measurement)
+    return {
+        "schema": SCHEMA_VERSION,
+        "revision": _git_revision(),
+        "timestamp": dt.datetime.now(dt.timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": asdict(config),
+        "metrics": metrics,
+    }
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any], threshold: float = 0.1) -> list[Regression]:
+    """
+    比较两次结果，返回变差超过 threshold（相对值）的指标
+
+    只比较双方都有的指标；方向由 higher_is_better 决定。
+    """
+    regressions = []
+    for metric, now in current["metrics"].items():
+        before = baseline.get("metrics", {}).get(metric)
+        if before is None or not before["value"]:
+            continue
+        change = (now["value"] - before["value"]) / before["value"]
+        if now["higher_is_better"]:
+            change = -change
+        if change > threshold:
+            regressions.append(Regression(metric, before["value"], now["value"], change))
+    return regressions
+
+
+def save_results(results: dict[str, Any], path: str | Path) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    return path
+
+
+def load_results(path: str | Path) -> dict[str, Any]:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", help=f"comma separated subset of {','.join(BENCHMARKS)}")
+    parser.add_argument("--quick", action="store_true", help="tiny data sets, for smoke testing")
+    parser.add_argument("--output", help="write results JSON to this path")
+    parser.add_argument("--compare", help="baseline results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1, help="relative change flagged as regression")
+    args = parser.parse_args(argv)
+
+    config = SuiteConfig.quick() if args.quick else SuiteConfig()
+    results = run_suite(config, args.only.split(",") if args.only else None)
+
+    print(f"revision {results['revision'] or '-'}, python {results['python']}")
+    for metric, m in results["metrics"].items():
+        arrow = "↑" if m["higher_is_better"] else "↓"
+        print(f"  {metric:<40}{m['value']:>14.2f} {m['unit']} {arrow}")
+    if args.output:
+        print(f"saved to {save_results(results, args.output)}")
+
+    if args.compare:
+        regressions = compare(load_results(args.compare), results, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+        print(f"no regressions above {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""
+测试共用的客户端构造与模拟服务
+"""
+
+import asyncio
+import dataclasses
+from typing import Any, Callable, Optional, Union
+
+import httpx
+
+from atlassian import JiraClient
+from atlassian.common import TransportConfig
+
+BASE_URL = "https://jira.example.test"
+SESSION_PATH = "/rest/auth/1/session"
+
+
+def make_client(
+    handler: Union[Callable[[httpx.Request], Any], httpx.AsyncBaseTransport],
+    cls: type = JiraClient,
+    transport_config: Optional[TransportConfig] = None,
+    **kwargs,
+):
+    """
+    创建指向模拟服务的客户端
+
+    Args:
+        handler: httpx.MockTransport 的处理函数（同步或异步），或现成的传输（录制回放、桩服务等）
+        cls: 客户端类（JiraClient / ConfluenceClient / TempoClient）
+        transport_config: 其他传输层配置（如 compression），其中的 transport 会被替换
+        **kwargs: 传递给客户端的其他参数；未指定 oauth1 时默认使用 demo / secret 凭据
+    """
+    transport = handler if isinstance(handler, httpx.AsyncBaseTransport) else httpx.MockTransport(handler)
+    if "oauth1" not in kwargs:
+        kwargs.setdefault("username", "demo")
+        kwargs.setdefault("password", "secret")
+    kwargs.setdefault("base_url", BASE_URL)
+    kwargs.setdefault("trust_env", False)
+    return cls(
+        transport_config=dataclasses.replace(transport_config or TransportConfig(), transport=transport),
+        **kwargs,
+    )
+
+
+class SessionServer:
+    """Mock Jira 会话端点: 每次登录签发新的 JSESSIONID，只接受最新的会话"""
+
+    def __init__(self) -> None:
+        self.logins = 0
+        self.logouts = 0
+        self.valid: set[str] = set()
+        self.fail_login = False
+
+    def expire(self) -> None:
+        """服务端会话过期"""
+        self.valid = set()
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == SESSION_PATH:
+            if request.method == "DELETE":
+                self.logouts += 1
+                return httpx.Response(204)
+            self.logins += 1
+            await asyncio.sleep(0.01)
+            if self.fail_login:
+                return httpx.Response(401, json={"errorMessages": ["bad credentials"]})
+            value = f"s{self.logins}"
+            self.valid = {f"JSESSIONID={value}"}
+            return httpx.Response(200, json={"session": {"name": "JSESSIONID", "value": value}})
+        await asyncio.sleep(0)
+        if request.headers.get("Cookie") not in self.valid:
+            return httpx.Response(401)
+        return httpx.Response(200, json={"cookie": request.headers["Cookie"]})
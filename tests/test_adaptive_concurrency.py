@@ -0,0 +1,170 @@
+import asyncio
+
+import httpx
+import pytest
+
+from atlassian import ConfluenceClient
+from atlassian.common import AdaptiveLimiter, ConcurrencyPolicy, RetryPolicy
+from atlassian.common.client import DEFAULT_BULK_CONCURRENCY
+from tests.helpers import make_client
+
+
+class Server:
+    """记录同时进行的请求数，超过 capacity 时返回 503"""
+
+    def __init__(self, capacity: int = 1000, delay: float = 0.005):
+        self.capacity = capacity
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.rejected = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.active > self.capacity:
+                self.rejected += 1
+                return httpx.Response(503)
+            key = request.url.path.rsplit("/", 1)[-1]
+            return httpx.Response(200, json={"id": key, "key": key, "fields": {}})
+        finally:
+            self.active -= 1
+
+
+def test_policy_validates_parameters() -> None:
+    with pytest.raises(ValueError):
+        ConcurrencyPolicy(min_limit=0)
+    with pytest.raises(ValueError):
+        ConcurrencyPolicy(initial_limit=100, max_limit=10)
+    with pytest.raises(ValueError):
+        ConcurrencyPolicy(decrease_ratio=1)
+    with pytest.raises(ValueError):
+        ConcurrencyPolicy(latency_tolerance=1)
+
+
+def test_limit_grows_additively_while_latency_is_flat() -> None:
+    limiter = AdaptiveLimiter(ConcurrencyPolicy(initial_limit=4, max_limit=6))
+
+    async def run() -> None:
+        for _ in range(12):
+            slots = [await limiter.acquire() for _ in range(limiter.limit)]
+            for slot in slots:
+                limiter.release(slot, 0.01, key="/rest/api/2/issue/{key}")
+
+    asyncio.run(run())
+    # 每轮 +1，到 max_limit 为止
+    assert limiter.limit == 6
+    assert limiter.snapshot()["error_backoffs"] == 0
+
+
+def test_errors_cut_limit_once_per_round() -> None:
+    limiter = AdaptiveLimiter(ConcurrencyPolicy(initial_limit=10, decrease_ratio=0.5))
+
+    async def run() -> None:
+        slots = [await limiter.acquire() for _ in range(10)]
+        # 同一轮发出的请求同时失败，只降低一次
+        for slot in slots:
+            limiter.release(slot, 0.01, failed=True)
+        assert limiter.limit == 5
+        slot = await limiter.acquire()
+        limiter.release(slot, 0.01, failed=True)
+
+    asyncio.run(run())
+    assert limiter.limit == 2
+    assert limiter.stats.error_backoffs == 2
+
+
+def test_latency_spike_cuts_limit() -> None:
+    limiter = AdaptiveLimiter(ConcurrencyPolicy(initial_limit=8, latency_floor=0.0))
+    template = "/rest/api/content/{id}"
+
+    async def run() -> None:
+        for _ in range(5):
+            limiter.release(await limiter.acquire(), 0.02, key=template)
+        limit = limiter.limit
+        # 其他接口的正常延迟不受该接口基线影响
+        limiter.release(await limiter.acquire(), 0.5, key="/rest/api/search")
+        assert limiter.limit >= limit
+        limiter.release(await limiter.acquire(), 0.2, key=template)
+        assert limiter.limit < limit
+
+    asyncio.run(run())
+    assert limiter.stats.latency_backoffs == 1
+    assert limiter.snapshot()["baselines"][template] > 0.02
+
+
+def test_get_many_converges_below_server_capacity() -> None:
+    server = Server(capacity=6)
+    limiter = AdaptiveLimiter(ConcurrencyPolicy(initial_limit=2, max_limit=32))
+    keys = [f"DEMO-{i}" for i in range(300)]
+
+    async def run() -> list:
+        retry = RetryPolicy(max_retries=10, backoff_base=0.001)
+        async with make_client(server, concurrency_limiter=limiter, retry_policy=retry) as jira:
+            return await jira.issue.get_many(keys)
+
+    issues = asyncio.run(run())
+    assert [issue.key for issue in issues] == keys
+    # 增长到服务端容量附近后被 503 压回，不会一直停在初始值或冲到上限
+    assert limiter.stats.peak_inflight > 2
+    assert server.peak < 32
+    assert limiter.stats.error_backoffs >= 1
+    assert server.rejected < len(keys) // 5
+    assert limiter.snapshot()["inflight"] == 0
+
+
+def test_gather_without_limiter_uses_default_concurrency() -> None:
+    server = Server()
+
+    async def run() -> list:
+        async with make_client(server) as jira:
+            return await jira.gather(
+                jira.get_json(f"/rest/api/2/issue/DEMO-{i}") for i in range(40)
+            )
+
+    results = asyncio.run(run())
+    assert [r["key"] for r in results] == [f"DEMO-{i}" for i in range(40)]
+    assert server.peak == DEFAULT_BULK_CONCURRENCY
+
+
+def test_confluence_get_many_shares_limiter() -> None:
+    server = Server()
+    limiter = AdaptiveLimiter(ConcurrencyPolicy(initial_limit=3, max_limit=3))
+
+    async def run() -> list:
+        async with make_client(
+            server,
+            ConfluenceClient,
+            base_url="https://confluence.example.test",
+            concurrency_limiter=limiter,
+        ) as confluence, make_client(server, concurrency_limiter=limiter) as jira:
+            pages, issues = await asyncio.gather(
+                confluence.content.get_many([str(i) for i in range(20)]),
+                jira.issue.get_many([f"DEMO-{i}" for i in range(20)]),
+            )
+            return [page.id for page in pages]
+
+    assert asyncio.run(run()) == [str(i) for i in range(20)]
+    assert server.peak == 3
+    assert limiter.stats.queued > 0
+
+
+def test_cancelled_waiter_does_not_leak_slots() -> None:
+    limiter = AdaptiveLimiter(ConcurrencyPolicy(initial_limit=1, max_limit=1))
+
+    async def run() -> None:
+        slot = await limiter.acquire()
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        limiter.release(slot)
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        # 名额没有泄漏给被取消的等待者
+        limiter.release(await asyncio.wait_for(limiter.acquire(), 1))
+
+    asyncio.run(run())
+    assert limiter.snapshot()["inflight"] == 0
+    assert limiter.snapshot()["waiting"] == 0
@@ -0,0 +1,94 @@
+import asyncio
+
+import httpx
+import pytest
+
+from tests.helpers import make_client
+
+SESSION_PATH = "/rest/auth/1/session"
+
+
+class UploadServer:
+    """会话端点 + 附件上传端点，可使会话过期"""
+
+    def __init__(self) -> None:
+        self.logins = 0
+        self.valid_cookie: str | None = None
+        self.uploads: list[httpx.Request] = []
+        self.seen_cookies: list[str] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == SESSION_PATH:
+            if request.method == "DELETE":
+                return httpx.Response(204)
+            self.logins += 1
+            self.valid_cookie = f"JSESSIONID=s{self.logins}"
+            return httpx.Response(200, json={"session": {"name": "JSESSIONID", "value": f"s{self.logins}"}})
+        self.seen_cookies.append(request.headers.get("Cookie", ""))
+        if request.headers.get("Cookie") != self.valid_cookie:
+            return httpx.Response(401)
+        if request.url.path.endswith("/attachments"):
+            self.uploads.append(request)
+            return httpx.Response(
+                200,
+                json=[{"id": "1", "self": "/rest/api/2/attachment/1", "filename": "a.txt", "size": 7}],
+            )
+        return httpx.Response(200, json={})
+
+
+def test_basic_auth_headers_are_built_once_and_read_only() -> None:
+    client = make_client(UploadServer().handler, auth_mode="basic")
+
+    headers = client._get_auth_headers()
+    assert headers is client._get_auth_headers()
+    assert headers["Authorization"].startswith("Basic ")
+    assert headers["Content-Type"] == "application/json"
+    with pytest.raises(TypeError):
+        headers["Accept"] = "text/plain"  # type: ignore[index]
+
+    multipart = client._get_auth_headers(multipart=True)
+    assert "Content-Type" not in multipart
+    assert multipart["X-Atlassian-Token"] == "no-check"
+    assert multipart["Authorization"] == headers["Authorization"]
+
+
+def test_session_headers_are_rebuilt_only_when_the_session_changes() -> None:
+    server = UploadServer()
+
+    async def run() -> None:
+        async with make_client(server.handler, auth_mode="session") as jira:
+            first = jira._get_auth_headers()
+            await jira.get_json("/rest/api/2/myself")
+            await jira.get_json("/rest/api/2/myself")
+            assert jira._get_auth_headers() is first
+            assert first["Cookie"] == "JSESSIONID=s1"
+
+            server.valid_cookie = None  # 会话过期 -> 重新登录
+            await jira.get_json("/rest/api/2/myself")
+            assert jira._get_auth_headers()["Cookie"] == "JSESSIONID=s2"
+            assert first["Cookie"] == "JSESSIONID=s1"
+
+    asyncio.run(run())
+    assert server.seen_cookies == ["JSESSIONID=s1", "JSESSIONID=s1", "JSESSIONID=s1", "JSESSIONID=s2"]
+
+
+def test_attachment_upload_uses_multipart_headers_and_relogs_in(tmp_path) -> None:
+    server = UploadServer()
+    file_path = tmp_path / "a.txt"
+    file_path.write_bytes(b"payload")
+
+    async def run() -> None:
+        async with make_client(server.handler, auth_mode="session") as jira:
+            server.valid_cookie = None  # 首次上传遇到 401，重新登录后重放
+            attachments = await jira.issue.add_attachment("DEMO-1", str(file_path))
+            assert attachments[0].filename == "a.txt"
+            await jira.issue.add_attachment_bytes("DEMO-1", b"payload", "b.txt")
+
+    asyncio.run(run())
+    assert server.logins == 2
+    assert len(server.uploads) == 2
+    for request in server.uploads:
+        assert request.headers["Content-Type"].startswith("multipart/form-data; boundary=")
+        assert request.headers["X-Atlassian-Token"] == "no-check"
+        assert request.headers["Cookie"] == "JSESSIONID=s2"
+        assert b"payload" in request.content
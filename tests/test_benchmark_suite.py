@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from benchmarks.suite import SuiteConfig, compare, main, run_suite
+
+
+def results(**metrics: tuple[float, bool]) -> dict:
+    return {
+        "metrics": {
+            name: {"value": value, "unit": "x", "higher_is_better": higher}
+            for name, (value, higher) in metrics.items()
+        }
+    }
+
+
+def test_compare_respects_metric_direction_and_threshold() -> None:
+    baseline = results(throughput=(100.0, True), latency=(10.0, False), gone=(1.0, True))
+    current = results(throughput=(85.0, True), latency=(10.5, False), new=(1.0, True))
+
+    regressions = compare(baseline, current, threshold=0.1)
+
+    assert [r.metric for r in regressions] == ["throughput"]
+    assert regressions[0].change == pytest.approx(0.15)
+    assert compare(baseline, results(throughput=(120.0, True), latency=(8.0, False))) == []
+    assert [r.metric for r in compare(baseline, results(latency=(12.0, False)))] == ["latency"]
+
+
+def test_quick_suite_produces_comparable_json(tmp_path) -> None:
+    data = run_suite(SuiteConfig.quick(), only=["search", "validation", "tempo"])
+
+    assert data["schema"] == 1
+    assert set(data["metrics"]) == {
+        "search.issues_per_sec",
+        "search.page_ms",
+        "validation.search_results_ms",
+        "validation.issue_us",
+        "tempo.worklogs_per_sec",
+        "tempo.stream_worklogs_per_sec",
+    }
+    assert all(m["value"] > 0 for m in data["metrics"].values())
+    assert compare(data, data) == []
+
+    with pytest.raises(ValueError):
+        run_suite(SuiteConfig.quick(), only=["nope"])
+
+
+def test_cli_flags_regressions(tmp_path, capsys) -> None:
+    output = tmp_path / "current.json"
+    assert main(["--quick", "--only", "validation", "--output", str(output)]) == 0
+
+    baseline = json.loads(output.read_text())
+    for metric in baseline["metrics"].values():
+        metric["value"] /= 1000  # 基准快了 1000 倍，当前结果必然被标记为回退
+    baseline_path = tmp_path / "baseline.json"
+    baseline_path.write_text(json.dumps(baseline))
+
+    assert main(["--quick", "--only", "validation", "--compare", str(baseline_path)]) == 1
+    assert "REGRESSION validation.issue_us" in capsys.readouterr().out
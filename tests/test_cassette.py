@@ -0,0 +1,133 @@
+import asyncio
+import gzip
+import json
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+from atlassian import JiraClient
+from atlassian.common import (
+    AtlassianCassetteError,
+    Cassette,
+    RecordingTransport,
+    ReplayTransport,
+)
+from tests.helpers import make_client
+
+SESSION_PATH = "/rest/auth/1/session"
+
+
+class FakeJira:
+    def __init__(self) -> None:
+        self.counter = 0
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == SESSION_PATH:
+            if request.method == "POST":
+                return httpx.Response(
+                    200,
+                    json={"session": {"name": "JSESSIONID", "value": "secret-session"}},
+                    headers={"Set-Cookie": "JSESSIONID=secret-session"},
+                )
+            return httpx.Response(204)
+        if request.url.path.endswith("/search"):
+            self.counter += 1
+            return httpx.Response(200, json={"total": self.counter, "issues": [{"key": "DEMO-1"}]})
+        if request.url.path.endswith("/attachment"):
+            payload = gzip.compress(json.dumps({"binary": True}).encode())
+            return httpx.Response(200, content=payload, headers={"Content-Encoding": "gzip"})
+        return httpx.Response(200, json={"key": request.url.path.rsplit("/", 1)[-1], "summary": "中文"})
+
+
+async def exercise(jira: JiraClient) -> list:
+    return [
+        await jira.issue.get_raw("DEMO-1"),
+        await jira.search.search_raw("project = DEMO"),
+        await jira.search.search_raw("project = DEMO"),
+        await jira.get_json("/rest/api/2/attachment"),
+    ]
+
+
+def test_record_then_replay_round_trip(tmp_path: Path) -> None:
+    cassette_path = tmp_path / "jira.jsonl.gz"
+    recorder = RecordingTransport(cassette_path, transport=httpx.MockTransport(FakeJira().handler))
+
+    async def record() -> list:
+        async with make_client(recorder, auth_mode="session") as jira:
+            return await exercise(jira)
+
+    recorded = asyncio.run(record())
+    assert cassette_path.exists()
+    cassette = Cassette.load(cassette_path)
+    assert len(cassette) == 6  # login + 4 API calls + logout
+
+    raw = gzip.decompress(cassette_path.read_bytes()).decode()
+    assert '["set-cookie","<redacted>"]' in raw
+    assert "secret" not in raw.replace("secret-session", "")  # 密码已脱敏
+
+    async def replay() -> list:
+        async with make_client(ReplayTransport(cassette_path), auth_mode="session") as jira:
+            return await exercise(jira)
+
+    replayed = asyncio.run(replay())
+    assert replayed == recorded
+    assert [r["total"] for r in replayed[1:3]] == [1, 2]  # 相同请求按录制顺序回放
+    assert replayed[3] == {"binary": True}  # gzip 原始字节被保留并在回放时解码
+
+
+def test_replay_repeats_last_and_raises_on_miss() -> None:
+    recorder = RecordingTransport(transport=httpx.MockTransport(FakeJira().handler))
+
+    async def record() -> None:
+        async with make_client(recorder, auth_mode="basic") as jira:
+            await jira.search.search_raw("project = DEMO")
+
+    asyncio.run(record())
+    replay = ReplayTransport(recorder.cassette)
+
+    async def run() -> list:
+        async with make_client(replay, auth_mode="basic") as jira:
+            results = [await jira.search.search_raw("project = DEMO") for _ in range(3)]
+            with pytest.raises(AtlassianCassetteError):
+                await jira.search.search_raw("project = OTHER")
+            return results
+
+    results = asyncio.run(run())
+    assert [r["total"] for r in results] == [1, 1, 1]
+    assert replay.played == 3
+
+
+def test_replay_latency_and_bandwidth() -> None:
+    recorder = RecordingTransport(transport=httpx.MockTransport(FakeJira().handler))
+
+    async def record() -> None:
+        async with make_client(recorder, auth_mode="basic") as jira:
+            await jira.issue.get_raw("DEMO-1")
+
+    asyncio.run(record())
+    size = len(recorder.cassette.interactions[0].content)
+
+    async def run(**kwargs) -> float:
+        replay = ReplayTransport(recorder.cassette, **kwargs)
+        async with make_client(replay, auth_mode="basic") as jira:
+            started = time.perf_counter()
+            await jira.issue.get_raw("DEMO-1")
+            return time.perf_counter() - started
+
+    assert asyncio.run(run(latency=0.05)) >= 0.05
+    assert asyncio.run(run(bandwidth=size / 0.05, chunk_size=8)) >= 0.045
+
+
+def test_transport_argument_conflicts_with_shared() -> None:
+    from atlassian.common import SharedConnection
+
+    with pytest.raises(ValueError):
+        JiraClient(
+            base_url="https://jira.example.test",
+            username="demo",
+            password="secret",
+            transport=httpx.MockTransport(FakeJira().handler),
+            shared=SharedConnection(),
+        )
@@ -0,0 +1,194 @@
+import asyncio
+
+import httpx
+import pytest
+
+from atlassian.common import (
+    AtlassianAPIError,
+    AtlassianCircuitOpenError,
+    BreakerPolicy,
+    CircuitBreaker,
+    Instrumentation,
+    RetryPolicy,
+)
+from atlassian.common.circuit import endpoint_family
+from atlassian.tempo import TempoClient
+from tests.helpers import make_client
+
+
+def test_policy_validates_parameters() -> None:
+    with pytest.raises(ValueError):
+        BreakerPolicy(failure_ratio=0)
+    with pytest.raises(ValueError):
+        BreakerPolicy(window_size=5, min_calls=6)
+    with pytest.raises(ValueError):
+        BreakerPolicy(half_open_calls=0)
+
+
+def test_endpoint_family() -> None:
+    assert endpoint_family("/rest/api/2/issue/DEMO-1") == "/rest/api/2/issue"
+    assert endpoint_family("/rest/api/2/search?jql=x") == "/rest/api/2/search"
+    assert endpoint_family("/rest/tempo-timesheets/4/worklogs/search") == "/rest/tempo-timesheets/4/worklogs"
+    assert endpoint_family("/secure/attachment/1/a.txt") == "/secure"
+
+
+def test_opens_after_failure_ratio_and_fails_fast() -> None:
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if request.url.path.startswith("/rest/api/2/search"):
+            return httpx.Response(503, json={})
+        return httpx.Response(200, json={"key": "DEMO-1"})
+
+    breaker = CircuitBreaker(BreakerPolicy(window_size=4, min_calls=4, open_duration=60))
+
+    async def run() -> None:
+        async with make_client(handler, circuit_breaker=breaker) as jira:
+            for _ in range(4):
+                with pytest.raises(httpx.HTTPStatusError):
+                    await jira.get_json("/rest/api/2/search")
+            with pytest.raises(AtlassianCircuitOpenError) as info:
+                await jira.get_json("/rest/api/2/search")
+            assert info.value.retry_after > 50
+            assert isinstance(info.value, AtlassianAPIError)
+            # 其他接口族不受影响
+            assert (await jira.get_json("/rest/api/2/issue/DEMO-1"))["key"] == "DEMO-1"
+
+    asyncio.run(run())
+    assert calls.count("/rest/api/2/search") == 4
+    snapshot = breaker.snapshot()
+    search = snapshot["jira jira.example.test /rest/api/2/search"]
+    assert search["state"] == "open"
+    assert search["rejected"] == 1
+    assert snapshot["jira jira.example.test /rest/api/2/issue"]["state"] == "closed"
+
+
+def test_open_circuit_stops_retries() -> None:
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        return httpx.Response(502)
+
+    breaker = CircuitBreaker(BreakerPolicy(window_size=2, min_calls=2))
+    policy = RetryPolicy(max_retries=10, backoff_base=0.001, backoff_max=0.001)
+
+    async def run() -> None:
+        async with make_client(handler, circuit_breaker=breaker, retry_policy=policy) as jira:
+            with pytest.raises(AtlassianCircuitOpenError):
+                await jira.get_json("/rest/api/2/myself")
+
+    asyncio.run(run())
+    assert len(calls) == 2
+
+
+def test_half_open_probe_closes_or_reopens() -> None:
+    state = {"status": 500}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(state["status"], json={})
+
+    breaker = CircuitBreaker(BreakerPolicy(window_size=2, min_calls=2, open_duration=0.05))
+    instrumentation = Instrumentation()
+    events = []
+    instrumentation.add_hook("circuit", lambda e: events.append((e.previous, e.state)))
+
+    async def run() -> None:
+        async with make_client(handler, circuit_breaker=breaker, instrumentation=instrumentation) as jira:
+            for _ in range(2):
+                with pytest.raises(httpx.HTTPStatusError):
+                    await jira.get_json("/rest/api/2/myself")
+            await asyncio.sleep(0.06)
+            # 探测失败，重新打开
+            with pytest.raises(httpx.HTTPStatusError):
+                await jira.get_json("/rest/api/2/myself")
+            with pytest.raises(AtlassianCircuitOpenError):
+                await jira.get_json("/rest/api/2/myself")
+            await asyncio.sleep(0.06)
+            state["status"] = 200
+            await jira.get_json("/rest/api/2/myself")
+            await jira.get_json("/rest/api/2/myself")
+
+    asyncio.run(run())
+    assert events == [
+        ("closed", "open"),
+        ("open", "half_open"),
+        ("half_open", "open"),
+        ("open", "half_open"),
+        ("half_open", "closed"),
+    ]
+    circuits = instrumentation.snapshot()["circuits"]
+    assert circuits["jira jira.example.test /rest/api/2/myself"] == {
+        "state": "closed",
+        "opened": 2,
+        "half_opened": 2,
+        "closed": 1,
+    }
+
+
+def test_half_open_limits_concurrent_probes() -> None:
+    breaker = CircuitBreaker(BreakerPolicy(window_size=1, min_calls=1, open_duration=0))
+    circuit = breaker.circuit("jira", "jira.example.test", "/rest/api/2/myself")
+    circuit.record(False, True, 0.0)
+    assert circuit.state == "open"
+    probe, event = circuit.before_call()
+    assert probe and event.state == "half_open"
+    with pytest.raises(AtlassianCircuitOpenError):
+        circuit.before_call()
+    # 取消的探测归还名额
+    circuit.release(probe)
+    assert circuit.before_call()[0]
+
+
+def test_slow_calls_open_circuit() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.02)
+        return httpx.Response(200, json={})
+
+    breaker = CircuitBreaker(
+        BreakerPolicy(window_size=2, min_calls=2, slow_call_duration=0.01, slow_call_ratio=1.0)
+    )
+
+    async def run() -> None:
+        async with make_client(handler, circuit_breaker=breaker) as jira:
+            await jira.get_json("/rest/api/2/myself")
+            await jira.get_json("/rest/api/2/myself")
+            with pytest.raises(AtlassianCircuitOpenError):
+                await jira.get_json("/rest/api/2/myself")
+
+    asyncio.run(run())
+
+
+def test_transport_errors_count_as_failures_and_products_are_separate() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    breaker = CircuitBreaker(BreakerPolicy(window_size=1, min_calls=1, open_duration=60))
+
+    async def run() -> None:
+        async with make_client(handler, circuit_breaker=breaker) as jira:
+            with pytest.raises(httpx.ConnectError):
+                await jira.get_json("/rest/api/2/myself")
+            with pytest.raises(AtlassianCircuitOpenError):
+                await jira.get_json("/rest/api/2/myself")
+        async with make_client(handler, circuit_breaker=breaker, cls=TempoClient) as tempo:
+            with pytest.raises(httpx.ConnectError):
+                await tempo.get_json("/rest/api/2/myself")
+
+    asyncio.run(run())
+    assert set(breaker.snapshot()) == {
+        "jira jira.example.test /rest/api/2/myself",
+        "tempo jira.example.test /rest/api/2/myself",
+    }
+
+
+def test_endpoint_policy_overrides_default() -> None:
+    breaker = CircuitBreaker(
+        default=BreakerPolicy(open_duration=1),
+        endpoints={"/rest/tempo-timesheets/4/worklogs/search": BreakerPolicy(open_duration=60)},
+    )
+    circuit = breaker.circuit("tempo", "Jira.Example.Test", "/rest/tempo-timesheets/4/worklogs/search")
+    assert circuit.policy.open_duration == 60
+    assert circuit.key == "tempo jira.example.test /rest/tempo-timesheets/4/worklogs/search"
+    assert breaker.circuit("tempo", "jira.example.test", "/rest/tempo-timesheets/4/worklogs") is not circuit
@@ -0,0 +1,124 @@
+import asyncio
+
+import httpx
+import pytest
+
+from atlassian import JiraClient
+from atlassian.common import current_deadline, deadline, request_priority
+from atlassian.common.exceptions import AtlassianDeadlineExceededError
+from tests.helpers import make_client
+
+
+def counting_handler(calls: list[str]):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        await asyncio.sleep(0.01)
+        if request.url.path.endswith("MISSING"):
+            return httpx.Response(404)
+        return httpx.Response(200, json={"key": request.url.path.rsplit("/", 1)[-1]})
+
+    return handler
+
+
+def test_identical_concurrent_gets_share_one_request() -> None:
+    calls: list[str] = []
+
+    async def run() -> tuple[list, JiraClient]:
+        async with make_client(counting_handler(calls), coalesce_requests=True) as client:
+            results = await asyncio.gather(
+                *(client.issue.get_raw("DEMO-1") for _ in range(10)),
+                client.issue.get_raw("DEMO-2"),
+            )
+        return results, client
+
+    results, client = asyncio.run(run())
+    assert len(calls) == 2
+    assert results[0] is results[9]
+    assert results[10] == {"key": "DEMO-2"}
+    assert client.coalesce_stats.coalesced == 9
+
+
+def test_params_order_does_not_matter_but_values_do() -> None:
+    calls: list[str] = []
+
+    async def run() -> None:
+        async with make_client(counting_handler(calls), coalesce_requests=True) as client:
+            await asyncio.gather(
+                client.get_json("/rest/api/2/field", params={"a": 1, "b": 2}),
+                client.get_json("/rest/api/2/field", params={"b": 2, "a": 1}),
+                client.get_json("/rest/api/2/field", params={"a": 1, "b": 3}),
+            )
+
+    asyncio.run(run())
+    assert len(calls) == 2
+
+
+def test_coalescing_is_opt_in_and_errors_are_shared() -> None:
+    calls: list[str] = []
+
+    async def run() -> list:
+        async with make_client(counting_handler(calls)) as client:
+            await asyncio.gather(*(client.get_json("/rest/api/2/issue/A") for _ in range(3)))
+            assert len(calls) == 3
+            return await asyncio.gather(
+                *(client.get_json("/rest/api/2/issue/MISSING", coalesce=True) for _ in range(3)),
+                return_exceptions=True,
+            )
+
+    results = asyncio.run(run())
+    assert len(calls) == 4
+    assert all(isinstance(r, httpx.HTTPStatusError) for r in results)
+
+
+def test_cancelled_leader_does_not_cancel_followers() -> None:
+    calls: list[str] = []
+
+    async def run() -> dict:
+        async with make_client(counting_handler(calls), coalesce_requests=True) as client:
+            leader = asyncio.create_task(client.get_json("/rest/api/2/issue/A"))
+            await asyncio.sleep(0)
+            follower = asyncio.create_task(client.get_json("/rest/api/2/issue/A"))
+            await asyncio.sleep(0)
+            leader.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            return await follower
+
+    assert asyncio.run(run()) == {"key": "A"}
+    assert len(calls) == 1
+
+
+def test_each_caller_keeps_its_own_deadline_and_priority() -> None:
+    calls: list[str] = []
+    deadlines: list = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        deadlines.append(current_deadline())
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, json={"key": "DEMO-1"})
+
+    async def run() -> tuple:
+        async with make_client(handler, coalesce_requests=True) as client:
+
+            async def tight() -> dict:
+                with deadline(0.03):
+                    return await client.get_json("/rest/api/2/issue/DEMO-1")
+
+            first, second = await asyncio.gather(
+                tight(), client.get_json("/rest/api/2/issue/DEMO-1"), return_exceptions=True
+            )
+            # 不同优先级的请求不合并
+            with request_priority("batch"):
+                batch = asyncio.ensure_future(client.get_json("/rest/api/2/issue/DEMO-1"))
+            with request_priority("interactive"):
+                await client.get_json("/rest/api/2/issue/DEMO-1")
+            await batch
+            return first, second
+
+    first, second = asyncio.run(run())
+    assert isinstance(first, AtlassianDeadlineExceededError)
+    assert second == {"key": "DEMO-1"}
+    # 共享请求不继承第一个调用方的 deadline
+    assert deadlines[0] is None
+    assert len(calls) == 3
@@ -0,0 +1,175 @@
+import asyncio
+import gzip
+import json
+
+import httpx
+import pytest
+
+from atlassian.common import CompressionConfig, TransportConfig, available_encodings
+from tests.helpers import make_client
+
+
+def gzip_json(data) -> httpx.Response:
+    return httpx.Response(
+        200,
+        content=gzip.compress(json.dumps(data).encode()),
+        headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+    )
+
+
+def big_payload(n: int = 500) -> dict:
+    return {"issueUpdates": [{"fields": {"summary": f"Issue {i}", "description": "x" * 50}} for i in range(n)]}
+
+
+def test_config_validates_parameters() -> None:
+    with pytest.raises(ValueError):
+        CompressionConfig(min_size=-1)
+    with pytest.raises(ValueError):
+        CompressionConfig(level=0)
+
+
+def test_accept_encoding_is_advertised() -> None:
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers["Accept-Encoding"])
+        return httpx.Response(200, json={})
+
+    async def run() -> None:
+        for config in (CompressionConfig(), CompressionConfig(accept_encodings=("gzip",))):
+            async with make_client(handler, transport_config=TransportConfig(compression=config)) as jira:
+                await jira.get_json("/rest/api/2/myself")
+
+    asyncio.run(run())
+    assert seen == [", ".join(available_encodings()), "gzip"]
+    assert "gzip" in available_encodings()
+
+
+def test_compressed_response_is_decoded_and_counted() -> None:
+    issues = [{"key": f"DEMO-{i}", "fields": {"summary": "same summary"}} for i in range(200)]
+
+    async def run() -> tuple:
+        async with make_client(
+            lambda r: gzip_json({"issues": issues}),
+            transport_config=TransportConfig(compression=CompressionConfig()),
+        ) as jira:
+            data = await jira.get_json("/rest/api/2/search")
+            return data, jira.compression_stats.snapshot()
+
+    data, stats = asyncio.run(run())
+    assert data["issues"] == issues
+    assert stats["responses_compressed"] == 1
+    assert stats["response_bytes_decoded"] == len(json.dumps({"issues": issues}))
+    assert stats["bytes_saved"] > stats["response_bytes_received"]
+
+
+def test_streamed_response_is_counted() -> None:
+    issues = [{"key": f"DEMO-{i}"} for i in range(100)]
+
+    async def run() -> tuple:
+        async with make_client(
+            lambda r: gzip_json({"issues": issues}),
+            transport_config=TransportConfig(compression=CompressionConfig()),
+        ) as jira:
+            items = [i async for i in jira.stream_json_items("/rest/api/2/search", item_key="issues")]
+            return items, jira.compression_stats
+
+    items, stats = asyncio.run(run())
+    assert items == issues
+    assert stats.responses_compressed == 1
+    assert stats.response_bytes_decoded == len(json.dumps({"issues": issues}))
+
+
+def test_large_request_bodies_are_gzipped() -> None:
+    bodies = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        encoding = request.headers.get("Content-Encoding")
+        body = gzip.decompress(request.content) if encoding == "gzip" else request.content
+        bodies.append((encoding, json.loads(body)))
+        return httpx.Response(201, json={"issues": []})
+
+    config = CompressionConfig(compress_requests=True, min_size=1024)
+
+    async def run():
+        async with make_client(handler, transport_config=TransportConfig(compression=config)) as jira:
+            await jira.post_json("/rest/api/2/issue/bulk", big_payload())
+            await jira.post_json("/rest/api/2/issue", {"fields": {"summary": "small"}})
+            return jira.compression_stats
+
+    stats = asyncio.run(run())
+    assert bodies[0] == ("gzip", big_payload())
+    assert bodies[1] == (None, {"fields": {"summary": "small"}})
+    assert stats.requests_compressed == 1
+    assert stats.request_bytes_raw > 10 * stats.request_bytes_sent
+
+
+def test_rejected_gzip_body_falls_back_and_disables_compression() -> None:
+    encodings = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        encodings.append(request.headers.get("Content-Encoding"))
+        if request.headers.get("Content-Encoding") == "gzip":
+            return httpx.Response(415)
+        json.loads(request.content)
+        return httpx.Response(200, json={})
+
+    config = CompressionConfig(compress_requests=True, min_size=1024)
+
+    async def run():
+        async with make_client(handler, transport_config=TransportConfig(compression=config)) as jira:
+            await jira.put_json("/rest/api/2/issue/DEMO-1", big_payload())
+            await jira.put_json("/rest/api/2/issue/DEMO-1", big_payload())
+            return jira.compression_stats.snapshot()
+
+    stats = asyncio.run(run())
+    assert encodings == ["gzip", None, None]
+    assert stats["requests_rejected"] == 1
+    assert stats["requests_compressed"] == 0
+    assert stats["bytes_saved"] == 0
+
+
+def test_rejected_non_idempotent_request_is_not_resent() -> None:
+    encodings = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        encodings.append(request.headers.get("Content-Encoding"))
+        if request.headers.get("Content-Encoding") == "gzip":
+            return httpx.Response(400, text="Unsupported Content-Encoding: gzip")
+        return httpx.Response(201, json={})
+
+    config = CompressionConfig(compress_requests=True, min_size=1024)
+
+    async def run():
+        async with make_client(handler, transport_config=TransportConfig(compression=config)) as jira:
+            with pytest.raises(httpx.HTTPStatusError):
+                await jira.post_json("/rest/api/2/issue/bulk", big_payload())
+            await jira.post_json("/rest/api/2/issue/bulk", big_payload())
+            return jira.compression_stats.snapshot()
+
+    stats = asyncio.run(run())
+    # POST 可能已被处理，不重发；之后的请求不再压缩
+    assert encodings == ["gzip", None]
+    assert stats["requests_rejected"] == 1
+
+
+def test_validation_error_is_not_treated_as_rejection() -> None:
+    encodings = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        encodings.append(request.headers.get("Content-Encoding"))
+        return httpx.Response(400, json={"errors": {"summary": "Summary is required"}})
+
+    config = CompressionConfig(compress_requests=True, min_size=1024)
+
+    async def run():
+        async with make_client(handler, transport_config=TransportConfig(compression=config)) as jira:
+            for _ in range(2):
+                with pytest.raises(httpx.HTTPStatusError):
+                    await jira.put_json("/rest/api/2/issue/DEMO-1", big_payload())
+            return jira.compression_stats.snapshot()
+
+    stats = asyncio.run(run())
+    assert encodings == ["gzip", "gzip"]
+    assert stats["requests_rejected"] == 0
+    assert stats["requests_compressed"] == 2
@@ -0,0 +1,175 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from atlassian.common import (
+    AtlassianDeadlineExceededError,
+    RetryPolicy,
+    SyncClient,
+    current_deadline,
+    deadline,
+)
+from tests.helpers import make_client
+
+SESSION_PATH = "/rest/auth/1/session"
+
+
+def search_page(request: httpx.Request, total: int = 100, size: int = 10) -> httpx.Response:
+    start = int(request.url.params.get("startAt", 0))
+    issues = [{"key": f"DEMO-{i}"} for i in range(start, min(start + size, total))]
+    return httpx.Response(200, json={"startAt": start, "total": total, "issues": issues})
+
+
+def test_nested_deadline_cannot_extend_outer() -> None:
+    assert current_deadline() is None
+    with deadline(1.0) as outer:
+        with deadline(10.0, min_budget=0.1) as inner:
+            assert inner.expires_at == outer.expires_at
+            assert inner.min_budget == 0.1
+            assert current_deadline() is inner
+        with deadline(0.5) as shorter:
+            assert shorter.expires_at < outer.expires_at
+        assert current_deadline() is outer
+    assert current_deadline() is None
+    with pytest.raises(ValueError):
+        with deadline(0):
+            pass
+
+
+def test_pagination_aborts_when_budget_runs_out() -> None:
+    pages = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        pages.append(request.url.params["startAt"])
+        await asyncio.sleep(0.03)
+        return search_page(request)
+
+    async def run() -> list[dict]:
+        issues = []
+        async with make_client(handler) as jira:
+            search = jira.search  # 首次访问导入资源模块，不计入预算
+            with deadline(0.1):
+                async for issue in search.stream_raw("project = DEMO", page_size=10):
+                    issues.append(issue)
+        return issues
+
+    started = time.monotonic()
+    with pytest.raises(AtlassianDeadlineExceededError) as info:
+        asyncio.run(run())
+    assert time.monotonic() - started < 0.5
+    assert info.value.timeout == 0.1
+    assert 1 <= len(pages) < 10
+
+
+def test_slow_attempt_is_cut_at_deadline() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(5)
+        return httpx.Response(200, json={})
+
+    async def run() -> None:
+        async with make_client(handler) as jira:
+            with deadline(0.05):
+                await jira.get_json("/rest/api/2/myself")
+
+    started = time.monotonic()
+    with pytest.raises(AtlassianDeadlineExceededError) as info:
+        asyncio.run(run())
+    assert time.monotonic() - started < 1
+    assert info.value.attempts == 1
+
+
+def test_per_attempt_timeout_is_capped_by_remaining_budget() -> None:
+    timeouts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        timeouts.append(request.extensions["timeout"]["read"])
+        return httpx.Response(200, json={})
+
+    async def run() -> None:
+        async with make_client(handler, timeout=30.0) as jira:
+            await jira.get_json("/rest/api/2/myself")
+            with deadline(2.0):
+                await jira.get_json("/rest/api/2/myself")
+
+    asyncio.run(run())
+    assert timeouts[0] == 30.0
+    assert 1.5 < timeouts[1] <= 2.0
+
+
+def test_backoff_longer_than_budget_aborts_early() -> None:
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        return httpx.Response(503, headers={"Retry-After": "5"})
+
+    policy = RetryPolicy(max_retries=3)
+
+    async def run() -> None:
+        async with make_client(handler, retry_policy=policy) as jira:
+            with deadline(1.0):
+                await jira.get("/rest/api/2/myself")
+
+    started = time.monotonic()
+    with pytest.raises(AtlassianDeadlineExceededError) as info:
+        asyncio.run(run())
+    assert time.monotonic() - started < 0.5
+    assert calls == [1]
+    assert info.value.status_code == 503
+
+
+def test_min_budget_stops_before_sending() -> None:
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        return httpx.Response(200, json={})
+
+    async def run() -> None:
+        async with make_client(handler) as jira:
+            with deadline(0.05, min_budget=0.1):
+                await jira.get_json("/rest/api/2/myself")
+
+    with pytest.raises(AtlassianDeadlineExceededError):
+        asyncio.run(run())
+    assert calls == []
+
+
+def test_relogin_and_concurrent_tasks_share_budget() -> None:
+    logins = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == SESSION_PATH:
+            logins.append(1)
+            if len(logins) > 1:
+                await asyncio.sleep(5)  # 重新登录卡住
+            return httpx.Response(200, json={"session": {"name": "JSESSIONID", "value": "s"}})
+        return httpx.Response(401)
+
+    async def run() -> list:
+        async with make_client(handler, auth_mode="session") as jira:
+            with deadline(0.1):
+                return await asyncio.gather(
+                    *(jira.get("/rest/api/2/myself") for _ in range(3)),
+                    return_exceptions=True,
+                )
+
+    started = time.monotonic()
+    results = asyncio.run(run())
+    assert time.monotonic() - started < 1
+    assert all(isinstance(r, AtlassianDeadlineExceededError) for r in results)
+
+
+def test_sync_client_propagates_deadline() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(5)
+        return httpx.Response(200, json={})
+
+    with SyncClient(make_client(handler)) as jira:
+        started = time.monotonic()
+        with deadline(0.05):
+            with pytest.raises(AtlassianDeadlineExceededError):
+                jira.get_json("/rest/api/2/myself")
+        assert time.monotonic() - started < 1
@@ -0,0 +1,239 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from atlassian.common import (
+    AdaptiveLimiter,
+    CircuitBreaker,
+    ConcurrencyPolicy,
+    HedgePolicy,
+    Hedger,
+    NodeRouter,
+    RateLimit,
+    RateLimiter,
+)
+from tests.helpers import make_client
+
+
+def slow_first(seen: list, slow: float = 2.0):
+    """第一个请求很慢，其余立即返回"""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.host)
+        if len(seen) == 1:
+            await asyncio.sleep(slow)
+        return httpx.Response(200, json={"host": request.url.host, "n": len(seen)})
+
+    return handler
+
+
+def test_policy_validates_parameters() -> None:
+    with pytest.raises(ValueError):
+        HedgePolicy(percentile=1)
+    with pytest.raises(ValueError):
+        HedgePolicy(min_samples=50, window=10)
+    with pytest.raises(ValueError):
+        HedgePolicy(budget_ratio=0)
+
+
+def test_threshold_adapts_to_recent_latency() -> None:
+    hedger = Hedger(HedgePolicy(percentile=0.9, min_samples=10, initial_delay=2.0))
+    template = "/rest/api/2/issue/{key}"
+    assert hedger.delay_for(template) == 2.0
+    for i in range(1, 11):
+        hedger.observe(template, i / 100)
+    assert hedger.delay_for(template) == pytest.approx(0.10)
+    assert hedger.snapshot()["thresholds"] == {template: pytest.approx(0.10)}
+
+
+def test_slow_primary_is_hedged_and_cancelled() -> None:
+    seen: list = []
+    hedger = Hedger(HedgePolicy(initial_delay=0.02))
+
+    async def run() -> dict:
+        async with make_client(slow_first(seen), hedger=hedger) as jira:
+            return await jira.get_json("/rest/api/2/issue/DEMO-1")
+
+    started = time.monotonic()
+    result = asyncio.run(run())
+    assert time.monotonic() - started < 1
+    assert result["n"] == 2
+    stats = hedger.snapshot()
+    assert stats["hedged"] == 1
+    assert stats["hedge_wins"] == 1
+
+
+def test_fast_primary_is_not_hedged() -> None:
+    seen: list = []
+    hedger = Hedger(HedgePolicy(initial_delay=0.5))
+
+    async def run() -> None:
+        async with make_client(slow_first(seen, slow=0.0), hedger=hedger) as jira:
+            await jira.get_json("/rest/api/2/issue/DEMO-1")
+
+    asyncio.run(run())
+    assert len(seen) == 1
+    assert hedger.stats.hedged == 0
+
+
+def test_hedge_goes_to_alternate_node() -> None:
+    seen: list = []
+    hedger = Hedger(
+        HedgePolicy(initial_delay=0.02, alternate_urls=("https://node2.example.test/",))
+    )
+
+    async def run() -> dict:
+        async with make_client(slow_first(seen), hedger=hedger) as jira:
+            return await jira.get_json("/rest/api/2/search", params={"jql": "project = DEMO"})
+
+    result = asyncio.run(run())
+    assert seen == ["jira.example.test", "node2.example.test"]
+    assert result["host"] == "node2.example.test"
+
+
+def test_unusable_hedge_response_is_discarded() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "node2.example.test":
+            return httpx.Response(401)  # 会话只在原节点有效
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, json={"host": request.url.host})
+
+    hedger = Hedger(
+        HedgePolicy(initial_delay=0.02, alternate_urls=("https://node2.example.test",))
+    )
+
+    async def run() -> dict:
+        async with make_client(handler, hedger=hedger) as jira:
+            return await jira.get_json("/rest/api/2/myself")
+
+    assert asyncio.run(run())["host"] == "jira.example.test"
+    assert hedger.stats.rejected == 1
+    assert hedger.stats.hedge_wins == 0
+
+
+def test_hedge_recovers_from_primary_transport_error() -> None:
+    calls: list = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        if len(calls) == 1:
+            await asyncio.sleep(0.05)
+            raise httpx.ConnectError("reset", request=request)
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, json={"ok": True})
+
+    hedger = Hedger(HedgePolicy(initial_delay=0.02))
+
+    async def run() -> dict:
+        async with make_client(handler, hedger=hedger) as jira:
+            return await jira.get_json("/rest/api/2/myself")
+
+    assert asyncio.run(run()) == {"ok": True}
+    assert hedger.stats.hedge_wins == 1
+
+
+def test_budget_bounds_extra_load() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={})
+
+    hedger = Hedger(HedgePolicy(initial_delay=0.01, budget_ratio=0.01, budget_burst=2))
+
+    async def run() -> None:
+        async with make_client(handler, hedger=hedger) as jira:
+            await asyncio.gather(*(jira.get_json(f"/rest/api/2/issue/DEMO-{i}") for i in range(10)))
+
+    asyncio.run(run())
+    assert hedger.stats.requests == 10
+    assert hedger.stats.hedged == 2
+    assert hedger.stats.budget_denied == 8
+
+
+def test_only_get_requests_are_hedged() -> None:
+    seen: list = []
+    hedger = Hedger(HedgePolicy(initial_delay=0.01))
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.method)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={})
+
+    async def run() -> None:
+        async with make_client(handler, hedger=hedger) as jira:
+            await jira.post_json("/rest/api/2/issue", {"fields": {}})
+            await jira.get_json("/rest/api/2/myself", hedge=False)
+
+    asyncio.run(run())
+    assert seen == ["POST", "GET"]
+    assert hedger.stats.requests == 0
+
+
+def test_hedge_goes_to_another_router_node() -> None:
+    seen: list = []
+    router = NodeRouter(["https://node1.example.test", "https://node2.example.test"])
+    hedger = Hedger(HedgePolicy(initial_delay=0.02))
+
+    async def run() -> dict:
+        async with make_client(slow_first(seen), hedger=hedger, node_router=router) as jira:
+            return await jira.get_json("/rest/api/2/issue/DEMO-1")
+
+    result = asyncio.run(run())
+    assert seen == ["node1.example.test", "node2.example.test"]
+    assert result["host"] == "node2.example.test"
+    assert all(node["outstanding"] == 0 for node in router.snapshot().values())
+    with pytest.raises(ValueError):
+        make_client(
+            slow_first([]),
+            hedger=Hedger(HedgePolicy(alternate_urls=("https://node2.example.test",))),
+            node_router=router,
+        )
+
+
+def test_hedge_is_skipped_without_free_slot_or_token() -> None:
+    async def run(**limits) -> dict:
+        seen: list = []
+        hedger = Hedger(HedgePolicy(initial_delay=0.02))
+        async with make_client(slow_first(seen, 0.1), hedger=hedger, **limits) as jira:
+            result = await jira.get_json("/rest/api/2/issue/DEMO-1")
+        assert len(seen) == 1
+        return {**result, **hedger.snapshot()}
+
+    # 原请求占用了唯一的并发名额 / 令牌，对冲不排队等待而是直接放弃
+    for limits in (
+        {"concurrency_limiter": AdaptiveLimiter(ConcurrencyPolicy(initial_limit=1, max_limit=1))},
+        {"rate_limiter": RateLimiter(default=RateLimit(rate=0.1, burst=1))},
+    ):
+        stats = asyncio.run(run(**limits))
+        assert stats["n"] == 1
+        assert stats["hedged"] == 0
+        assert stats["throttled"] == 1
+
+
+def test_hedge_goes_through_limiter_and_circuit_breaker() -> None:
+    seen: list = []
+    hedger = Hedger(HedgePolicy(initial_delay=0.02))
+    limiter = AdaptiveLimiter(ConcurrencyPolicy(initial_limit=2, max_limit=2))
+    rate_limiter = RateLimiter(default=RateLimit(rate=0.1, burst=2))
+    breaker = CircuitBreaker()
+
+    async def run() -> dict:
+        async with make_client(
+            slow_first(seen),
+            hedger=hedger,
+            concurrency_limiter=limiter,
+            rate_limiter=rate_limiter,
+            circuit_breaker=breaker,
+        ) as jira:
+            return await jira.get_json("/rest/api/2/issue/DEMO-1")
+
+    assert asyncio.run(run())["n"] == 2
+    assert hedger.snapshot()["hedge_wins"] == 1
+    assert limiter.stats.peak_inflight == 2
+    assert limiter.snapshot()["inflight"] == 0
+    # 对冲请求同样消耗令牌，并与原请求各计入一次熔断统计
+    assert not rate_limiter._buckets[("jira.example.test", "*")].try_acquire()
+    [circuit] = breaker.snapshot().values()
+    assert circuit["calls"] == 2
+    assert circuit["failures"] == 0
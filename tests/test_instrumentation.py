@@ -0,0 +1,215 @@
+import asyncio
+
+import httpx
+import pytest
+
+from atlassian.common import Instrumentation, RetryPolicy
+from atlassian.common.instrumentation import LatencyHistogram, project_key
+from tests.helpers import make_client
+
+SESSION_PATH = "/rest/auth/1/session"
+
+
+@pytest.mark.parametrize(
+    "path, template",
+    [
+        ("/rest/api/2/issue/DEMO-1", "/rest/api/2/issue/{key}"),
+        ("/rest/api/2/issue/10001/comment/20002", "/rest/api/2/issue/{id}/comment/{id}"),
+        ("/rest/api/2/issue/DEMO-7?expand=changelog", "/rest/api/2/issue/{key}"),
+        (
+            "/rest/api/2/user/properties/557058:f58131cb-b67d-43c7-b30d-6b58d40bd077",
+            "/rest/api/2/user/properties/{id}",
+        ),
+        ("/rest/api/2/search", "/rest/api/2/search"),
+        ("/rest/api/2/project/DEMO", "/rest/api/2/project/DEMO"),
+        ("/rest/api/2/issue/demo-1", "/rest/api/2/issue/{key}"),
+        ("/rest/api/2/project/demo/versions", "/rest/api/2/project/DEMO/versions"),
+        ("/rest/api/2/project/type", "/rest/api/2/project/type"),
+    ],
+)
+def test_builtin_templates(path: str, template: str) -> None:
+    assert Instrumentation().template_for(path) == template
+
+
+@pytest.mark.parametrize(
+    "path, project",
+    [
+        ("/rest/api/2/issue/demo-1/comment", "DEMO"),
+        ("/rest/api/2/issue/Demo_Ops-12", "DEMO_OPS"),
+        ("/rest/api/2/project/demo", "DEMO"),
+        ("/rest/api/2/project/type", None),
+        ("/rest/api/2/search", None),
+    ],
+)
+def test_project_key_is_upper_cased(path: str, project) -> None:
+    assert project_key(path) == project
+
+
+def test_custom_templates_take_precedence() -> None:
+    instrumentation = Instrumentation(templates=["/rest/api/2/project/{projectKey}"])
+    assert instrumentation.template_for("/rest/api/2/project/DEMO") == "/rest/api/2/project/{projectKey}"
+    assert instrumentation.template_for("/rest/api/2/project/DEMO/versions") == "/rest/api/2/project/DEMO/versions"
+
+
+def test_histogram_percentiles() -> None:
+    histogram = LatencyHistogram(buckets=(0.1, 0.2, 0.5))
+    for value in [0.05] * 90 + [0.15] * 9 + [3.0]:
+        histogram.observe(value)
+    snapshot = histogram.snapshot()
+    assert snapshot["count"] == 100
+    assert snapshot["p50"] == 0.1
+    assert snapshot["p95"] == 0.2
+    assert snapshot["p99"] == 0.2
+    assert histogram.percentile(1.0) == 3.0
+    assert snapshot["buckets"] == {"0.1": 90, "0.2": 9, "0.5": 0, "+inf": 1}
+
+
+def test_client_records_metrics_and_calls_hooks() -> None:
+    attempts = {"n": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/search"):
+            attempts["n"] += 1
+            if attempts["n"] == 1:
+                return httpx.Response(503)
+            return httpx.Response(200, json={"issues": [], "total": 0})
+        if request.url.path.endswith("MISSING-1"):
+            return httpx.Response(404)
+        return httpx.Response(200, json={"key": request.url.path.rsplit("/", 1)[-1]})
+
+    instrumentation = Instrumentation()
+    started: list[str] = []
+    ended: list[tuple] = []
+    instrumentation.add_hook("request_start", lambda e: started.append(e.path))
+    instrumentation.add_hook("request_end", lambda e: ended.append((e.template, e.status_code, e.attempt)))
+
+    def broken_hook(event) -> None:
+        raise RuntimeError("hook failure must not break requests")
+
+    instrumentation.add_hook("request_end", broken_hook)
+
+    async def run() -> None:
+        async with make_client(
+            handler,
+            instrumentation=instrumentation,
+            retry_policy=RetryPolicy(backoff_base=0, backoff_max=0),
+        ) as jira:
+            await jira.issue.get_raw("DEMO-1")
+            await jira.issue.get_raw("DEMO-2")
+            with pytest.raises(Exception):
+                await jira.issue.get_raw("MISSING-1")
+            await jira.post_json("/rest/api/2/search", {"jql": "project = DEMO"}, idempotent=True)
+
+    asyncio.run(run())
+
+    assert started[:2] == ["/rest/api/2/issue/DEMO-1", "/rest/api/2/issue/DEMO-2"]
+    assert ("/rest/api/2/search", 503, 1) in ended
+    assert ("/rest/api/2/search", 200, 2) in ended
+
+    snapshot = instrumentation.snapshot()
+    issue = snapshot["endpoints"]["GET /rest/api/2/issue/{key}"]
+    assert issue["requests"] == 3
+    assert issue["status"] == {"200": 2, "404": 1}
+    assert issue["latency"]["count"] == 3
+    assert issue["bytes_in"] > 0
+
+    search = snapshot["endpoints"]["POST /rest/api/2/search"]
+    assert search["requests"] == 2
+    assert search["retries"] == 1
+    assert search["bytes_out"] == 2 * len(b'{"jql":"project = DEMO"}')
+
+    assert snapshot["requests"] == 5
+    assert snapshot["status"] == {"200": 3, "404": 1, "503": 1}
+
+    instrumentation.reset()
+    assert instrumentation.snapshot()["requests"] == 0
+
+
+def test_mixed_case_keys_share_metrics_and_project() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={})
+
+    instrumentation = Instrumentation()
+    projects: list = []
+    instrumentation.add_hook("request_end", lambda e: projects.append(e.project))
+
+    async def run() -> None:
+        async with make_client(handler, instrumentation=instrumentation) as jira:
+            await jira.issue.get_raw("DEMO-1")
+            await jira.issue.get_raw("demo-2")
+            await jira.get_json("/rest/api/2/project/Demo")
+
+    asyncio.run(run())
+    assert projects == ["DEMO", "DEMO", "DEMO"]
+    endpoints = instrumentation.snapshot()["endpoints"]
+    assert endpoints["GET /rest/api/2/issue/{key}"]["requests"] == 2
+    assert endpoints["GET /rest/api/2/project/DEMO"]["requests"] == 1
+
+
+def test_cancelled_attempt_emits_request_end() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(10)
+        return httpx.Response(200, json={})
+
+    instrumentation = Instrumentation()
+    started: list[str] = []
+    ended: list = []
+    instrumentation.add_hook("request_start", lambda e: started.append(e.path))
+    instrumentation.add_hook("request_end", lambda e: ended.append(e))
+
+    async def run() -> None:
+        async with make_client(handler, instrumentation=instrumentation) as jira:
+            task = asyncio.ensure_future(jira.issue.get_raw("DEMO-1"))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+    asyncio.run(run())
+    assert started == ["/rest/api/2/issue/DEMO-1"]
+    assert len(ended) == 1
+    assert isinstance(ended[0].error, asyncio.CancelledError)
+    assert ended[0].status_code is None
+
+    snapshot = instrumentation.snapshot()
+    issue = snapshot["endpoints"]["GET /rest/api/2/issue/{key}"]
+    assert issue["cancelled"] == 1
+    assert issue["errors"] == 0
+    assert snapshot["cancelled"] == 1
+
+
+def test_login_and_relogin_events() -> None:
+    state = {"logins": 0, "cookie": None}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == SESSION_PATH and request.method == "POST":
+            state["logins"] += 1
+            state["cookie"] = f"JSESSIONID=s{state['logins']}"
+            return httpx.Response(200, json={"session": {"name": "JSESSIONID", "value": f"s{state['logins']}"}})
+        if request.url.path == SESSION_PATH:
+            return httpx.Response(204)
+        if request.headers.get("Cookie") != state["cookie"]:
+            return httpx.Response(401)
+        return httpx.Response(200, json={})
+
+    instrumentation = Instrumentation()
+    logins: list[bool] = []
+    instrumentation.add_hook("login", lambda e: logins.append(e.relogin))
+
+    async def run() -> None:
+        async with make_client(handler, auth_mode="session", instrumentation=instrumentation) as jira:
+            await jira.get_json("/rest/api/2/myself")
+            state["cookie"] = None  # 会话过期
+            await jira.get_json("/rest/api/2/myself")
+
+    asyncio.run(run())
+    assert logins == [False, True]
+    snapshot = instrumentation.snapshot()
+    assert snapshot["logins"] == 2
+    assert snapshot["relogins"] == 1
+    assert snapshot["endpoints"]["GET /rest/api/2/myself"]["status"] == {"200": 2, "401": 1}
+
+
+def test_unknown_hook_event_rejected() -> None:
+    with pytest.raises(ValueError):
+        Instrumentation().add_hook("response", print)
@@ -0,0 +1,90 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from atlassian import JiraClient
+from atlassian.common import TransportConfig, available_codecs, get_codec
+from atlassian.common.codec import JsonCodec, StdlibJsonCodec
+
+PAYLOAD = {
+    "issues": [{"key": "DEMO-1", "summary": "中文 \"quoted\"", "n": 1.5, "ok": True, "x": None}],
+    "total": 1,
+}
+
+
+@pytest.mark.parametrize("name", available_codecs())
+def test_backends_round_trip_and_match_stdlib_wire_format(name: str) -> None:
+    codec = get_codec(name)
+    encoded = codec.dumps(PAYLOAD)
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == PAYLOAD
+    assert json.loads(encoded) == PAYLOAD
+    assert encoded == get_codec("json").dumps(PAYLOAD)
+
+
+def test_get_codec_resolution() -> None:
+    assert available_codecs()[-1] == "json"
+    assert get_codec().name == available_codecs()[0]
+    assert get_codec("auto") is get_codec()
+    custom = StdlibJsonCodec()
+    assert get_codec(custom) is custom
+    with pytest.raises(ValueError):
+        get_codec("yaml")
+
+
+def test_incomplete_codec_fails_at_construction() -> None:
+    class DecodeOnly(JsonCodec):
+        def loads(self, data):
+            return json.loads(data)
+
+    with pytest.raises(TypeError):
+        DecodeOnly()
+
+
+class CountingCodec(StdlibJsonCodec):
+    name = "counting"
+
+    def __init__(self):
+        self.loads_calls = 0
+        self.dumps_calls = 0
+
+    def loads(self, data):
+        self.loads_calls += 1
+        return super().loads(data)
+
+    def dumps(self, obj):
+        self.dumps_calls += 1
+        return super().dumps(obj)
+
+
+def test_client_uses_codec_for_request_and_response_bodies() -> None:
+    codec = CountingCodec()
+    seen: list[tuple[bytes, str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.content, request.headers["Content-Type"]))
+        return httpx.Response(200, json={"echo": json.loads(request.content or b"null")})
+
+    async def run() -> tuple:
+        async with JiraClient(
+            base_url="https://jira.example.test",
+            username="demo",
+            password="secret",
+            auth_mode="basic",
+            trust_env=False,
+            transport_config=TransportConfig(transport=httpx.MockTransport(handler)),
+            json_codec=codec,
+        ) as jira:
+            created = await jira.post_json("/rest/api/2/issue/bulk", {"issueUpdates": ["中"]})
+            fetched = await jira.get_json("/rest/api/2/myself")
+            return created, fetched
+
+    created, fetched = asyncio.run(run())
+    assert created == {"echo": {"issueUpdates": ["中"]}}
+    assert fetched == {"echo": None}
+    assert codec.dumps_calls == 1
+    assert codec.loads_calls == 2
+    assert seen[0] == ('{"issueUpdates":["中"]}'.encode(), "application/json")
+
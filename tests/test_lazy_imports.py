@@ -0,0 +1,76 @@
+import subprocess
+import sys
+
+import pytest
+
+import atlassian
+import atlassian.jira.models as jira_models
+from atlassian.jira.resources import IssueResource
+
+
+def loaded_after(code: str) -> set[str]:
+    """在新解释器中执行 code，返回加载的模块（atlassian.* 以及关注的第三方包）"""
+    probe = (
+        f"{code}\n"
+        "import sys\n"
+        "print('\\n'.join(m for m in sys.modules "
+        "if m.startswith(('atlassian', 'pydantic', 'cryptography'))))"
+    )
+    output = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True).stdout
+    return set(output.split())
+
+
+def test_import_atlassian_loads_no_clients_models_or_crypto() -> None:
+    modules = loaded_after("import atlassian")
+    assert "atlassian.jira.client" not in modules
+    assert not any(m.startswith(("pydantic", "cryptography")) for m in modules)
+
+
+def test_client_defers_resources_until_first_access() -> None:
+    modules = loaded_after(
+        "from atlassian import JiraClient\n"
+        "jira = JiraClient(base_url='http://x', username='u', password='p')"
+    )
+    assert "atlassian.jira.client" in modules
+    assert not any(m.startswith("atlassian.jira.resources.") for m in modules)
+    assert "pydantic" not in modules
+
+    modules = loaded_after(
+        "from atlassian import JiraClient\n"
+        "JiraClient(base_url='http://x', username='u', password='p').issue"
+    )
+    assert "atlassian.jira.resources.issue" in modules
+    assert "atlassian.jira.resources.board" not in modules
+    assert "atlassian.jira.models.agile" not in modules
+
+
+def test_lazy_exports_behave_like_eager_imports() -> None:
+    from atlassian.jira.models.issue import Issue
+
+    assert jira_models.Issue is Issue
+    assert "Issue" in vars(jira_models)  # 首次访问后写回命名空间
+    assert "SearchResults" in dir(jira_models)
+    assert set(jira_models.__all__) <= set(dir(jira_models))
+    assert IssueResource.__module__ == "atlassian.jira.resources.issue"
+    assert atlassian.JiraClient.__name__ == "JiraClient"
+
+    namespace: dict = {}
+    exec("from atlassian.tempo.models import *", namespace)
+    assert "Worklog" in namespace
+
+    with pytest.raises(AttributeError):
+        jira_models.DoesNotExist
+
+
+def test_submodules_resolve_as_package_attributes() -> None:
+    modules = loaded_after(
+        "import atlassian\n"
+        "assert atlassian.jira.models.Issue.__name__ == 'Issue'\n"
+        "assert atlassian.jira.resources.IssueResource.__name__ == 'IssueResource'\n"
+        "assert atlassian.confluence.models.Content.__name__ == 'Content'\n"
+        "import atlassian.tempo\n"
+        "assert atlassian.tempo.resources.WorklogResource.__name__ == 'WorklogResource'\n"
+        "assert {'models', 'resources'} <= set(dir(atlassian.tempo))"
+    )
+    assert "atlassian.jira.models" in modules
+    assert "atlassian.tempo.resources" in modules
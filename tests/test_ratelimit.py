@@ -0,0 +1,98 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from atlassian import JiraClient
+from atlassian.common import RateLimit, RateLimiter, TransportConfig
+from atlassian.common.ratelimit import SEARCH_PATH, TEMPO_WORKLOG_SEARCH_PATH, TokenBucket
+from atlassian.tempo import TempoClient
+
+
+def test_rate_limit_validates_parameters() -> None:
+    with pytest.raises(ValueError):
+        RateLimit(rate=0)
+    with pytest.raises(ValueError):
+        RateLimit(rate=1, burst=0)
+
+
+def test_token_bucket_allows_burst_then_paces() -> None:
+    async def run() -> list[float]:
+        bucket = TokenBucket(RateLimit(rate=100, burst=2))
+        return [await bucket.acquire() for _ in range(4)]
+
+    waits = asyncio.run(run())
+    assert waits[:2] == [0.0, 0.0]
+    assert all(w > 0 for w in waits[2:])
+
+
+def test_cancelled_acquire_refunds_reserved_tokens() -> None:
+    async def run() -> float:
+        bucket = TokenBucket(RateLimit(rate=10, burst=1))
+        await bucket.acquire()
+        # 排队中的调用者被取消，预留的令牌不应推迟后来者
+        waiters = [asyncio.ensure_future(bucket.acquire()) for _ in range(5)]
+        await asyncio.sleep(0)
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+        return await bucket.acquire()
+
+    assert asyncio.run(run()) <= 0.1
+
+
+def test_endpoint_families_use_separate_buckets() -> None:
+    limiter = RateLimiter(
+        endpoints={
+            SEARCH_PATH: RateLimit(rate=1000, burst=1),
+            TEMPO_WORKLOG_SEARCH_PATH: RateLimit(rate=1000, burst=1),
+        },
+    )
+
+    async def run() -> None:
+        await limiter.acquire("jira.example.test", SEARCH_PATH)
+        await limiter.acquire("jira.example.test", TEMPO_WORKLOG_SEARCH_PATH)
+        await limiter.acquire("jira.example.test", "/rest/api/2/issue/DEMO-1")
+        await limiter.acquire("jira.example.test", SEARCH_PATH)
+
+    asyncio.run(run())
+    stats = limiter.stats()
+    assert set(stats) == {
+        f"jira.example.test {SEARCH_PATH}",
+        f"jira.example.test {TEMPO_WORKLOG_SEARCH_PATH}",
+    }
+    assert stats[f"jira.example.test {SEARCH_PATH}"]["waited"] == 1
+    assert stats[f"jira.example.test {TEMPO_WORKLOG_SEARCH_PATH}"]["waited"] == 0
+
+
+def test_limiter_is_shared_between_clients() -> None:
+    limiter = RateLimiter(default=RateLimit(rate=50, burst=2))
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=[]))
+
+    def make(cls):
+        return cls(
+            base_url="https://jira.example.test",
+            username="demo",
+            password="secret",
+            trust_env=False,
+            transport_config=TransportConfig(transport=transport),
+            rate_limiter=limiter,
+        )
+
+    async def run() -> float:
+        started = time.monotonic()
+        async with make(JiraClient) as jira, make(TempoClient) as tempo:
+            await asyncio.gather(
+                jira.get_json("/rest/api/2/myself"),
+                jira.get_json("/rest/api/2/myself"),
+                tempo.post_json(TEMPO_WORKLOG_SEARCH_PATH, data={}),
+                tempo.post_json(TEMPO_WORKLOG_SEARCH_PATH, data={}),
+            )
+        return time.monotonic() - started
+
+    elapsed = asyncio.run(run())
+    stats = limiter.stats()["jira.example.test *"]
+    assert stats["acquired"] == 4
+    assert stats["waited"] == 2
+    assert elapsed >= 0.03
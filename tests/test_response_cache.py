@@ -0,0 +1,176 @@
+import asyncio
+import threading
+from pathlib import Path
+
+import httpx
+import pytest
+
+from atlassian import JiraClient
+from atlassian.common import DiskCache, MemoryCache, ResponseCache
+from atlassian.common.cache import CacheBackend, CacheEntry
+from tests.helpers import make_client
+
+
+def test_ttl_hits_and_per_request_bypass() -> None:
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(200, json=[{"id": "summary"}])
+
+    cache = ResponseCache(MemoryCache(), ttls={"/rest/api/2/field": 60})
+
+    async def run() -> None:
+        async with make_client(handler, response_cache=cache) as client:
+            assert await client.get_json("/rest/api/2/field") == [{"id": "summary"}]
+            assert await client.get_json("/rest/api/2/field") == [{"id": "summary"}]
+            await client.get_json("/rest/api/2/field", cache=False)
+            # 未配置 TTL 且无验证器的路径不缓存
+            await client.get_json("/rest/api/2/myself")
+            await client.get_json("/rest/api/2/myself")
+
+    asyncio.run(run())
+    assert calls == ["/rest/api/2/field"] * 2 + ["/rest/api/2/myself"] * 2
+    assert cache.stats.hits == 1
+    assert cache.stats.bypassed == 1
+
+
+def test_etag_revalidation_reuses_body_on_304() -> None:
+    seen: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"key": "DEMO-1"}, headers={"ETag": '"v1"'})
+
+    cache = ResponseCache()
+
+    async def run() -> list:
+        async with make_client(handler, response_cache=cache) as client:
+            return [await client.issue.get_raw("DEMO-1") for _ in range(2)]
+
+    assert asyncio.run(run()) == [{"key": "DEMO-1"}] * 2
+    assert seen == [None, '"v1"']
+    assert cache.stats.revalidated == 1
+    assert cache.stats.misses == 1
+
+
+def test_memory_cache_evicts_least_recently_used() -> None:
+    cache = MemoryCache(max_entries=2)
+    cache.set("a", CacheEntry(body=b"1"))
+    cache.set("b", CacheEntry(body=b"2"))
+    cache.get("a")
+    cache.set("c", CacheEntry(body=b"3"))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+
+def test_disk_cache_round_trip_and_size_bound(tmp_path: Path) -> None:
+    cache = DiskCache(tmp_path, max_bytes=400)
+    cache.set("k1", CacheEntry(body=b"x" * 150, etag='"e"', expires_at=1.0))
+    entry = cache.get("k1")
+    assert entry is not None and entry.etag == '"e"' and entry.body == b"x" * 150
+
+    cache.set("k2", CacheEntry(body=b"y" * 150))
+    cache.set("k3", CacheEntry(body=b"z" * 150))
+    assert sum(p.stat().st_size for p in tmp_path.glob("*.cache")) <= 400
+    assert cache.get("k3") is not None
+
+
+def test_disk_cache_scans_only_when_size_bound_is_crossed(tmp_path: Path, monkeypatch) -> None:
+    cache = DiskCache(tmp_path, max_bytes=10_000)
+    scans: list[int] = []
+    scan = cache._scan
+    monkeypatch.setattr(cache, "_scan", lambda: scans.append(1) or scan())
+
+    for i in range(200):
+        cache.set(f"k{i}", CacheEntry(body=b"x" * 200))
+    # 每次越过上限后淘汰到 90%，约每 5 次写入才扫描一次目录
+    assert 0 < len(scans) <= 50
+    assert sum(p.stat().st_size for p in tmp_path.glob("*.cache")) <= 10_000
+    assert cache.get("k199") is not None
+    assert cache.get("k0") is None
+
+
+def test_cache_backend_requires_all_methods() -> None:
+    class Partial(CacheBackend):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        Partial()
+
+
+def test_disk_cache_io_runs_off_the_event_loop(tmp_path: Path) -> None:
+    threads: set[str] = set()
+
+    class TrackingDiskCache(DiskCache):
+        def get(self, key):
+            threads.add(threading.current_thread().name)
+            return super().get(key)
+
+        def set(self, key, entry):
+            threads.add(threading.current_thread().name)
+            super().set(key, entry)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"id": "1"})
+
+    cache = ResponseCache(TrackingDiskCache(tmp_path), ttls={"/rest/api/2/field": 60})
+
+    async def run() -> str:
+        async with make_client(handler, response_cache=cache) as client:
+            for _ in range(2):
+                assert await client.get_json("/rest/api/2/field") == {"id": "1"}
+        return threading.current_thread().name
+
+    loop_thread = asyncio.run(run())
+    assert threads and loop_thread not in threads
+    assert cache.stats.hits == 1
+
+
+def test_shared_cache_is_keyed_by_instance() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"host": request.url.host}, headers={"ETag": '"v1"'})
+
+    cache = ResponseCache(ttls={"/rest/api/2/myself": 60})
+
+    async def run() -> list:
+        results = []
+        for base_url in ("https://jira-a.example.test", "https://jira-b.example.test"):
+            async with JiraClient(
+                base_url=base_url,
+                username="demo",
+                password="secret",
+                trust_env=False,
+                transport=httpx.MockTransport(handler),
+                response_cache=cache,
+            ) as client:
+                results.append(await client.get_json("/rest/api/2/myself"))
+        return results
+
+    assert asyncio.run(run()) == [{"host": "jira-a.example.test"}, {"host": "jira-b.example.test"}]
+    assert cache.stats.hits == 0
+
+
+def test_304_without_cached_entry_is_refetched() -> None:
+    seen: list = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match"):
+            return httpx.Response(304)
+        return httpx.Response(200, json={"key": "DEMO-1"}, headers={"ETag": '"v2"'})
+
+    cache = ResponseCache()
+
+    async def run() -> dict:
+        async with make_client(handler, response_cache=cache) as client:
+            return await client.get_json(
+                "/rest/api/2/issue/DEMO-1", headers={"If-None-Match": '"v1"'}
+            )
+
+    assert asyncio.run(run()) == {"key": "DEMO-1"}
+    assert seen == ['"v1"', None]
+    assert cache.stats.revalidated == 0
@@ -0,0 +1,148 @@
+import asyncio
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from atlassian import ConfluenceClient, OAuth1Config
+from atlassian.common import (
+    AtlassianRateLimitError,
+    AtlassianRetryExhaustedError,
+    RetryPolicy,
+    TransportConfig,
+)
+from atlassian.common.retry import parse_retry_after
+from tests.helpers import make_client
+
+FAST = RetryPolicy(max_retries=3, backoff_base=0.0)
+
+
+def test_parse_retry_after_accepts_seconds_and_http_dates() -> None:
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("garbage") is None
+    future = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert 25 < parse_retry_after(future) <= 30
+
+
+def test_get_is_retried_on_503_and_429() -> None:
+    statuses = iter([503, 429, 200])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = next(statuses)
+        headers = {"Retry-After": "0"} if status == 429 else {}
+        return httpx.Response(status, json={"ok": status == 200}, headers=headers)
+
+    async def run() -> dict:
+        async with make_client(handler, retry_policy=FAST) as client:
+            return await client.get_json("/rest/api/2/myself")
+
+    assert asyncio.run(run()) == {"ok": True}
+
+
+def test_post_is_not_retried_on_503_unless_idempotent() -> None:
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        return httpx.Response(503 if len(calls) == 1 else 200, json={})
+
+    async def run() -> int:
+        async with make_client(handler, retry_policy=FAST) as client:
+            response = await client.post("/rest/api/2/issue", json={})
+            status = response.status_code
+            calls.clear()
+            await client.post_json("/rest/api/2/search", data={}, idempotent=True)
+            return status
+
+    assert asyncio.run(run()) == 503
+    assert calls == ["POST", "POST"]
+
+
+def test_exhausted_429_raises_rate_limit_error_with_attempts() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(429, headers={"Retry-After": "0"})
+
+    async def run() -> None:
+        async with make_client(handler, retry_policy=FAST) as client:
+            await client.get_json("/rest/api/2/search")
+
+    with pytest.raises(AtlassianRateLimitError) as exc_info:
+        asyncio.run(run())
+    assert exc_info.value.attempts == 4
+    assert exc_info.value.retry_after == 0.0
+
+
+def test_connect_errors_are_retried_then_reported() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    async def run() -> None:
+        async with make_client(handler, retry_policy=RetryPolicy(max_retries=2, backoff_base=0.0)) as client:
+            await client.get_json("/rest/api/2/myself")
+
+    with pytest.raises(AtlassianRetryExhaustedError) as exc_info:
+        asyncio.run(run())
+    assert exc_info.value.attempts == 3
+    assert isinstance(exc_info.value.__cause__, httpx.ConnectError)
+
+
+def test_retry_budget_stops_long_retry_after() -> None:
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(503, headers={"Retry-After": "600"})
+
+    async def run() -> None:
+        async with make_client(handler, retry_policy=RetryPolicy(max_retry_time=5.0)) as client:
+            await client.get_json("/rest/api/2/myself")
+
+    with pytest.raises(AtlassianRetryExhaustedError):
+        asyncio.run(run())
+    assert calls == 1
+
+
+def test_without_policy_errors_are_returned_unchanged() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(503)
+
+    async def run() -> None:
+        async with make_client(handler, retry_policy=None) as client:
+            await client.get_json("/rest/api/2/myself")
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(run())
+
+
+def test_oauth1_requests_are_resigned_on_each_attempt() -> None:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pem = key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode()
+    headers: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        headers.append(request.headers["Authorization"])
+        return httpx.Response(503 if len(headers) == 1 else 200, json={})
+
+    async def run() -> None:
+        client = ConfluenceClient(
+            base_url="https://cf.example.test",
+            auth_mode="oauth1",
+            oauth1=OAuth1Config(consumer_key="c", private_key=pem, access_token="t"),
+            trust_env=False,
+            transport_config=TransportConfig(transport=httpx.MockTransport(handler)),
+            retry_policy=FAST,
+        )
+        async with client:
+            await client.get_json("/rest/api/user/current")
+
+    asyncio.run(run())
+    assert len(headers) == 2
+    assert headers[0] != headers[1]
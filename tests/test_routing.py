@@ -0,0 +1,192 @@
+import asyncio
+import time
+from collections import Counter
+
+import httpx
+import pytest
+
+from atlassian.common import MemorySessionStore, NodeRouter, RoutingPolicy
+from tests.helpers import make_client
+
+SESSION_PATH = "/rest/auth/1/session"
+NODES = ["https://node1.example.test", "https://node2.example.test"]
+
+
+def session_handler(hosts: list, down: set):
+    """每个节点签发自己的会话，只接受本节点的会话"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        hosts.append((request.method, host, request.url.path))
+        if host in down:
+            raise httpx.ConnectError("connection refused", request=request)
+        if request.url.path == SESSION_PATH and request.method == "POST":
+            return httpx.Response(200, json={"session": {"name": "JSESSIONID", "value": host}})
+        if request.url.path == SESSION_PATH:
+            return httpx.Response(204)
+        if request.headers.get("Cookie") != f"JSESSIONID={host}":
+            return httpx.Response(401)
+        return httpx.Response(200, json={"host": host})
+
+    return handler
+
+
+def test_policy_and_router_validate_parameters() -> None:
+    with pytest.raises(ValueError):
+        RoutingPolicy(strategy="random")
+    with pytest.raises(ValueError):
+        NodeRouter([])
+    with pytest.raises(ValueError):
+        NodeRouter(["https://a.test", "https://a.test/"])
+    with pytest.raises(ValueError):
+        make_client(
+            lambda r: httpx.Response(200),
+            node_router=NodeRouter(NODES),
+            auth_mode="session",
+            session_store=MemorySessionStore(),
+        )
+
+
+def test_least_outstanding_spreads_requests() -> None:
+    hosts = Counter()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        hosts[request.url.host] += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={})
+
+    router = NodeRouter(NODES)
+
+    async def run() -> None:
+        async with make_client(handler, node_router=router) as jira:
+            await asyncio.gather(*(jira.get_json("/rest/api/2/myself") for _ in range(10)))
+            for _ in range(4):
+                await jira.get_json("/rest/api/2/myself")
+
+    asyncio.run(run())
+    assert hosts == {"node1.example.test": 7, "node2.example.test": 7}
+    assert all(n["outstanding"] == 0 for n in router.snapshot().values())
+
+
+def test_latency_strategy_prefers_fast_node() -> None:
+    hosts = Counter()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        hosts[request.url.host] += 1
+        await asyncio.sleep(0.03 if request.url.host == "node1.example.test" else 0.001)
+        return httpx.Response(200, json={})
+
+    router = NodeRouter(NODES, RoutingPolicy(strategy="latency"))
+
+    async def run() -> None:
+        async with make_client(handler, node_router=router) as jira:
+            for _ in range(20):
+                await jira.get_json("/rest/api/2/myself")
+
+    asyncio.run(run())
+    assert hosts["node2.example.test"] > 15
+    snapshot = router.snapshot()
+    assert snapshot[NODES[0]]["latency"] > snapshot[NODES[1]]["latency"]
+
+
+def test_unreachable_node_fails_over_and_recovers() -> None:
+    hosts: list = []
+    down = {"node1.example.test"}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        hosts.append(request.url.host)
+        if request.url.host in down:
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(200, json={"host": request.url.host})
+
+    router = NodeRouter(NODES, RoutingPolicy(cooldown=0.05))
+
+    async def run() -> None:
+        async with make_client(handler, node_router=router) as jira:
+            assert (await jira.get_json("/rest/api/2/myself"))["host"] == "node2.example.test"
+            assert not router.snapshot()[NODES[0]]["healthy"]
+            for _ in range(3):
+                await jira.get_json("/rest/api/2/myself")
+            down.clear()
+            await asyncio.sleep(0.06)
+            await jira.get_json("/rest/api/2/myself")
+
+    asyncio.run(run())
+    assert hosts == ["node1.example.test"] + ["node2.example.test"] * 4 + ["node1.example.test"]
+    assert router.snapshot()[NODES[0]]["ejections"] == 1
+
+
+def test_consecutive_server_errors_eject_node() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "node1.example.test":
+            return httpx.Response(503)
+        return httpx.Response(200, json={})
+
+    router = NodeRouter(NODES, RoutingPolicy(failure_threshold=2))
+
+    async def run() -> None:
+        async with make_client(handler, node_router=router) as jira:
+            for _ in range(6):
+                await jira.get("/rest/api/2/myself")
+
+    asyncio.run(run())
+    snapshot = router.snapshot()
+    assert not snapshot[NODES[0]]["healthy"]
+    assert snapshot[NODES[0]]["requests"] == 2
+    assert snapshot[NODES[1]]["requests"] == 4
+
+
+def test_session_is_bound_to_login_node() -> None:
+    hosts: list = []
+    router = NodeRouter(NODES)
+    handler = session_handler(hosts, set())
+
+    async def run() -> tuple:
+        async with make_client(handler, node_router=router, auth_mode="session") as first, make_client(
+            handler, node_router=router, auth_mode="session"
+        ) as second:
+            a = [(await first.get_json("/rest/api/2/myself"))["host"] for _ in range(3)]
+            b = [(await second.get_json("/rest/api/2/myself"))["host"] for _ in range(3)]
+            return a, b, first.session_info.node_url, second.session_info.node_url
+
+    a, b, first_node, second_node = asyncio.run(run())
+    assert len(set(a)) == 1 and len(set(b)) == 1
+    assert {first_node, second_node} == set(NODES)
+    # 注销发往会话所属节点
+    assert ("DELETE", "node1.example.test", SESSION_PATH) in hosts
+    assert ("DELETE", "node2.example.test", SESSION_PATH) in hosts
+
+
+def test_session_moves_when_bound_node_goes_down() -> None:
+    hosts: list = []
+    down: set = set()
+    router = NodeRouter(NODES, RoutingPolicy(cooldown=60))
+
+    async def run() -> tuple:
+        async with make_client(session_handler(hosts, down), node_router=router, auth_mode="session") as jira:
+            await jira.get_json("/rest/api/2/myself")
+            bound = jira.session_info.node_url
+            down.add(httpx.URL(bound).host)
+            result = await jira.get_json("/rest/api/2/myself")
+            return bound, jira.session_info.node_url, result, jira.login_stats
+
+    bound, moved, result, stats = asyncio.run(run())
+    assert moved != bound
+    assert result["host"] == httpx.URL(moved).host
+    assert stats.logins == 2
+
+
+def test_login_skips_unreachable_node() -> None:
+    hosts: list = []
+    router = NodeRouter(NODES)
+
+    async def run() -> str:
+        async with make_client(
+            session_handler(hosts, {"node1.example.test"}), node_router=router, auth_mode="session"
+        ) as jira:
+            await jira.get_json("/rest/api/2/myself")
+            return jira.session_info.node_url
+
+    started = time.monotonic()
+    assert asyncio.run(run()) == NODES[1]
+    assert time.monotonic() - started < 1
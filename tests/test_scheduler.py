@@ -0,0 +1,208 @@
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from atlassian.common import (
+    RequestScheduler,
+    SchedulerPolicy,
+    TransportConfig,
+    current_priority,
+    request_priority,
+)
+from tests.helpers import make_client
+
+
+def slow_handler(served: list, active: dict, delay: float = 0.01):
+    """记录服务顺序（优先级）与同时进行的请求数"""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        try:
+            await asyncio.sleep(delay)
+            served.append(current_priority() or "default")
+            return httpx.Response(200, json={"key": "DEMO-1", "fields": {}})
+        finally:
+            active["now"] -= 1
+
+    return handler
+
+
+def test_policy_validates_parameters() -> None:
+    with pytest.raises(ValueError):
+        SchedulerPolicy(weights={"batch": 1.0})  # default_priority 不在 weights 中
+    with pytest.raises(ValueError):
+        SchedulerPolicy(reserved={"ui": 1})
+    with pytest.raises(ValueError):
+        SchedulerPolicy(weights={"default": 0})
+    with pytest.raises(ValueError):
+        SchedulerPolicy(reserved={"interactive": 4}, max_concurrency=4)
+    # 保留名额必须小于连接池容量
+    with pytest.raises(ValueError):
+        make_client(
+            lambda r: httpx.Response(200),
+            scheduler=RequestScheduler(SchedulerPolicy(reserved={"interactive": 8})),
+            transport_config=TransportConfig(max_connections=8),
+        )
+
+
+def test_capacity_defaults_to_pool_size() -> None:
+    scheduler = RequestScheduler()
+    make_client(
+        lambda r: httpx.Response(200),
+        scheduler=scheduler,
+        transport_config=TransportConfig(max_connections=12),
+    )
+    assert scheduler.snapshot()["max_concurrency"] == 12
+
+
+def test_interactive_request_is_not_starved_by_batch() -> None:
+    served: list = []
+    active = {"now": 0, "peak": 0}
+    scheduler = RequestScheduler(
+        SchedulerPolicy(reserved={"interactive": 1}, max_concurrency=4)
+    )
+
+    async def run() -> float:
+        async with make_client(slow_handler(served, active, 0.02), scheduler=scheduler) as jira:
+
+            async def export() -> None:
+                with request_priority("batch"):
+                    await asyncio.gather(
+                        *(jira.get_json(f"/rest/api/2/issue/DEMO-{i}") for i in range(60))
+                    )
+
+            issues = jira.issue  # 资源模块按需导入，避免计入耗时
+            batch = asyncio.ensure_future(export())
+            await asyncio.sleep(0.05)
+            started = time.perf_counter()
+            with request_priority("interactive"):
+                await issues.get("DEMO-1")
+            elapsed = time.perf_counter() - started
+            await batch
+            return elapsed
+
+    elapsed = asyncio.run(run())
+    # 60 个批量请求需要约 0.3s；界面请求使用保留名额，不必排在后面
+    assert elapsed < 0.1
+    assert active["peak"] == 4
+    snapshot = scheduler.snapshot()["classes"]
+    assert snapshot["interactive"]["queued"] == 0
+    assert snapshot["batch"]["queued"] > 0
+    assert snapshot["batch"]["inflight"] == 0
+
+
+def test_backlogged_classes_share_by_weight() -> None:
+    served: list = []
+    active = {"now": 0, "peak": 0}
+    scheduler = RequestScheduler(
+        SchedulerPolicy(weights={"default": 4.0, "batch": 1.0}, reserved={}, max_concurrency=1)
+    )
+
+    async def run() -> None:
+        async with make_client(slow_handler(served, active, 0.002), scheduler=scheduler) as jira:
+
+            async def many(priority: str) -> None:
+                with request_priority(priority):
+                    await asyncio.gather(
+                        *(jira.get_json(f"/rest/api/2/issue/DEMO-{i}") for i in range(20))
+                    )
+
+            await asyncio.gather(many("batch"), many("default"))
+
+    asyncio.run(run())
+    assert len(served) == 40
+    # 两个类别都有积压时按 4:1 分享；低权重类别不会饿死
+    window = served[1:21]
+    assert 14 <= window.count("default") <= 18
+    assert "batch" in window
+
+
+def test_priority_argument_overrides_context() -> None:
+    seen: list = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.extensions.get("atlassian.priority"))
+        return httpx.Response(200, json={})
+
+    scheduler = RequestScheduler()
+
+    async def run() -> None:
+        async with make_client(handler, scheduler=scheduler) as jira:
+            with request_priority("batch"):
+                await jira.get_json("/rest/api/2/myself", priority="interactive")
+                await jira.get_json("/rest/api/2/myself")
+            with pytest.raises(ValueError):
+                await jira.get_json("/rest/api/2/myself", priority="urgent")
+
+    asyncio.run(run())
+    assert seen == ["interactive", None]
+    classes = scheduler.snapshot()["classes"]
+    assert classes["interactive"]["requests"] == 1
+    assert classes["batch"]["requests"] == 1
+
+
+def test_streamed_response_holds_slot_until_closed() -> None:
+    body = json.dumps({"issues": [{"key": f"DEMO-{i}"} for i in range(5)]}).encode()
+    scheduler = RequestScheduler(SchedulerPolicy(reserved={}, max_concurrency=1))
+
+    async def chunks():
+        for i in range(0, len(body), 16):
+            yield body[i : i + 16]
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=chunks())
+
+    async def run() -> list:
+        inflight = []
+        async with make_client(handler, scheduler=scheduler) as jira:
+            async for _ in jira.stream_json_items("/rest/api/2/search", item_key="issues"):
+                inflight.append(scheduler.snapshot()["classes"]["default"]["inflight"])
+            inflight.append(scheduler.snapshot()["classes"]["default"]["inflight"])
+        return inflight
+
+    assert asyncio.run(run()) == [1] * 5 + [0]
+
+
+def test_queue_wait_is_bounded_by_pool_timeout() -> None:
+    scheduler = RequestScheduler(SchedulerPolicy(reserved={}, max_concurrency=1))
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.3)
+        return httpx.Response(200, json={})
+
+    async def run() -> None:
+        async with make_client(handler, scheduler=scheduler, timeout=0.05) as jira:
+            first = asyncio.ensure_future(jira.get_json("/rest/api/2/myself"))
+            await asyncio.sleep(0.01)
+            with pytest.raises(httpx.PoolTimeout):
+                await jira.get_json("/rest/api/2/myself")
+            await first
+
+    asyncio.run(run())
+    snapshot = scheduler.snapshot()["classes"]["default"]
+    assert snapshot["timeouts"] == 1
+    assert snapshot["inflight"] == 0
+    assert snapshot["waiting"] == 0
+
+
+def test_cancelled_waiter_does_not_leak_slots() -> None:
+    scheduler = RequestScheduler(SchedulerPolicy(reserved={}, max_concurrency=1))
+
+    async def run() -> None:
+        await scheduler.acquire("default")
+        waiter = asyncio.ensure_future(scheduler.acquire("batch"))
+        await asyncio.sleep(0)
+        scheduler.release("default")
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        await asyncio.wait_for(scheduler.acquire("default"), 1)
+        scheduler.release("default")
+
+    asyncio.run(run())
+    classes = scheduler.snapshot()["classes"]
+    assert all(c["inflight"] == 0 and c["waiting"] == 0 for c in classes.values())
@@ -0,0 +1,56 @@
+import asyncio
+
+from atlassian import JiraClient
+from atlassian.common import AtlassianAuthError
+from tests.helpers import SessionServer, make_client
+
+
+def test_concurrent_401s_trigger_a_single_relogin() -> None:
+    server = SessionServer()
+
+    async def run() -> tuple[list[dict], JiraClient]:
+        client = make_client(server.handler, auth_mode="session")
+        async with client:
+            server.expire()
+            results = await asyncio.gather(
+                *(client.get_json("/rest/api/2/myself") for _ in range(200))
+            )
+        return results, client
+
+    results, client = asyncio.run(run())
+    assert server.logins == 2
+    assert all(result == {"cookie": "JSESSIONID=s2"} for result in results)
+    assert client.login_stats.relogins == 1
+    assert client.login_stats.avoided_logins == 199
+
+
+def test_concurrent_first_requests_share_the_auto_login() -> None:
+    server = SessionServer()
+
+    async def run() -> JiraClient:
+        client = make_client(server.handler, auth_mode="session")
+        await asyncio.gather(*(client.get_json("/rest/api/2/myself") for _ in range(20)))
+        await client.close()
+        return client
+
+    client = asyncio.run(run())
+    assert server.logins == 1
+    assert client.login_stats.avoided_logins == 19
+
+
+def test_waiters_share_the_leader_login_failure() -> None:
+    server = SessionServer()
+
+    async def run() -> list:
+        client = make_client(server.handler, auth_mode="session")
+        async with client:
+            server.expire()
+            server.fail_login = True
+            return await asyncio.gather(
+                *(client.get_json("/rest/api/2/myself") for _ in range(10)),
+                return_exceptions=True,
+            )
+
+    results = asyncio.run(run())
+    assert all(isinstance(result, AtlassianAuthError) for result in results)
+    assert server.logins == 2
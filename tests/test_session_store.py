@@ -0,0 +1,236 @@
+import asyncio
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from atlassian.common import (
+    FileSessionStore,
+    MemorySessionStore,
+    SessionInfo,
+    SqliteSessionStore,
+)
+from tests.helpers import SessionServer, make_client
+
+
+@pytest.fixture(params=["memory", "file", "sqlite"])
+def make_store(request, tmp_path):
+    def factory(**kwargs):
+        if request.param == "memory":
+            return MemorySessionStore(**kwargs)
+        if request.param == "file":
+            return FileSessionStore(tmp_path / "sessions", **kwargs)
+        return SqliteSessionStore(tmp_path / "sessions.db", **kwargs)
+
+    return factory
+
+
+def test_store_save_load_and_compare_and_delete(make_store) -> None:
+    store = make_store()
+    key = store.make_key("https://jira.example.test", "session:demo")
+    assert store.load(key) is None
+
+    store.save(key, SessionInfo(session_name="JSESSIONID", session_value="s1"))
+    stored = store.load(key)
+    assert (stored.session_name, stored.session_value) == ("JSESSIONID", "s1")
+    assert stored.to_session_info().session_value == "s1"
+
+    store.delete(key, "stale")  # 已被其他进程刷新的会话不会被误删
+    assert store.load(key) is not None
+    store.delete(key, "s1")
+    assert store.load(key) is None
+
+
+def test_store_max_age(make_store) -> None:
+    store = make_store(max_age=0.05)
+    store.save("k", SessionInfo(session_name="JSESSIONID", session_value="s1"))
+    assert store.load("k") is not None
+    time.sleep(0.1)
+    assert store.load("k") is None
+
+
+def test_store_lock_is_exclusive_and_lease_expires(make_store) -> None:
+    store = make_store(lock_timeout=0.2, poll_interval=0.01)
+    order: list[str] = []
+
+    async def worker(name: str) -> None:
+        async with store.lock("k"):
+            order.append(f"{name}+")
+            await asyncio.sleep(0.02)
+            order.append(f"{name}-")
+
+    async def run() -> None:
+        await asyncio.gather(*(worker(str(i)) for i in range(3)))
+        if isinstance(store, FileSessionStore):
+            return  # 文件锁没有租约，见 test_file_lock_is_released_when_holder_exits
+        # 持有者崩溃（未释放）时，租约到期后其他进程可以获得锁
+        assert store._try_lock("k", "crashed")
+        started = time.monotonic()
+        async with store.lock("k"):
+            assert time.monotonic() - started >= 0.1
+
+    asyncio.run(run())
+    assert all(order[i][0] == order[i + 1][0] for i in range(0, len(order), 2))
+
+
+def test_cancelled_lock_attempt_does_not_leak_lock(make_store, monkeypatch) -> None:
+    store = make_store(poll_interval=0.01)
+    try_lock = store._try_lock
+
+    def slow_try_lock(key: str, owner: str) -> bool:
+        time.sleep(0.05)
+        return try_lock(key, owner)
+
+    async def run() -> None:
+        monkeypatch.setattr(store, "_try_lock", slow_try_lock)
+
+        async def holder() -> None:
+            async with store.lock("k"):
+                await asyncio.sleep(10)
+
+        # 在线程加锁期间（或持有锁期间）取消，例如 deadline 到期或对冲请求落败
+        task = asyncio.ensure_future(holder())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        monkeypatch.undo()
+        await asyncio.sleep(0.1)  # 被放弃的加锁线程已经完成
+        async with asyncio.timeout(1):
+            async with store.lock("k"):
+                pass
+
+    asyncio.run(run())
+
+
+def test_lock_wait_times_out(make_store) -> None:
+    store = make_store(poll_interval=0.01, wait_timeout=0.05)
+
+    async def run() -> None:
+        async with store.lock("k"):
+            with pytest.raises(TimeoutError):
+                async with store.lock("k"):
+                    pass
+
+    asyncio.run(run())
+
+
+def test_file_lock_is_released_when_holder_exits(tmp_path) -> None:
+    store = FileSessionStore(tmp_path / "sessions", poll_interval=0.01)
+    holder = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "import sys, time\n"
+            "from atlassian.common import FileSessionStore\n"
+            "assert FileSessionStore(sys.argv[1])._try_lock('k', 'other')\n"
+            "print('locked', flush=True)\n"
+            "time.sleep(60)\n",
+            str(tmp_path / "sessions"),
+        ],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        assert holder.stdout.readline().strip() == "locked"
+        # 锁文件的修改时间再旧也不会被抢占，只有持有进程退出才释放
+        os.utime(store._path("k", ".lock"), (0, 0))
+        assert not store._try_lock("k", "me")
+        holder.kill()
+        holder.wait()
+    finally:
+        holder.kill()
+        holder.stdout.close()
+
+    async def run() -> None:
+        async with asyncio.timeout(1):
+            async with store.lock("k"):
+                assert not store._try_lock("k", "other")
+        assert store._try_lock("k", "other")
+
+    asyncio.run(run())
+
+
+def test_blocking_backends_do_not_run_on_event_loop(make_store, monkeypatch) -> None:
+    store = make_store()
+    loop_thread = threading.get_ident()
+    threads: set[int] = set()
+    read = store._read
+
+    def tracking_read(key):
+        threads.add(threading.get_ident())
+        return read(key)
+
+    monkeypatch.setattr(store, "_read", tracking_read)
+
+    async def run() -> None:
+        async with store.lock("k"):
+            await store.asave("k", SessionInfo(session_name="JSESSIONID", session_value="s1"))
+            assert (await store.aload("k")).session_value == "s1"
+            await store.adelete("k", "s1")
+            assert await store.aload("k") is None
+
+    asyncio.run(run())
+    assert (loop_thread in threads) == (not store.blocking_io)
+
+
+def test_workers_reuse_one_stored_session_and_skip_logout(tmp_path) -> None:
+    server = SessionServer()
+    store = FileSessionStore(tmp_path)
+
+    async def worker() -> tuple[dict, int]:
+        async with make_client(server.handler, auth_mode="session", session_store=store) as jira:
+            result = await jira.get_json("/rest/api/2/myself")
+            return result, jira.login_stats.stored_sessions
+
+    async def run() -> list:
+        return await asyncio.gather(*(worker() for _ in range(8)))
+
+    results = asyncio.run(run())
+    assert server.logins == 1
+    assert server.logouts == 0
+    assert {r["cookie"] for r, _ in results} == {"JSESSIONID=s1"}
+    assert sum(reused for _, reused in results) == 7
+
+    # 重启后依然复用
+    asyncio.run(run())
+    assert server.logins == 1
+
+
+def test_expired_session_is_refreshed_once_across_workers(tmp_path) -> None:
+    server = SessionServer()
+    store = SqliteSessionStore(tmp_path / "sessions.db")
+
+    async def run() -> list[dict]:
+        # 每个客户端有独立的会话状态，相当于独立的工作进程
+        clients = [make_client(server.handler, auth_mode="session", session_store=store) for _ in range(6)]
+        for client in clients:
+            await client.__aenter__()
+        server.expire()
+        try:
+            return await asyncio.gather(*(c.get_json("/rest/api/2/myself") for c in clients))
+        finally:
+            for client in clients:
+                await client.__aexit__(None, None, None)
+
+    results = asyncio.run(run())
+    assert server.logins == 2
+    assert {r["cookie"] for r in results} == {"JSESSIONID=s2"}
+    assert store.load(store.make_key("https://jira.example.test", "session:demo")).session_value == "s2"
+
+
+def test_explicit_logout_removes_stored_session(tmp_path) -> None:
+    server = SessionServer()
+    store = MemorySessionStore()
+
+    async def run() -> None:
+        async with make_client(server.handler, auth_mode="session", session_store=store) as jira:
+            await jira.get_json("/rest/api/2/myself")
+            await jira.logout()
+
+    asyncio.run(run())
+    assert server.logouts == 1
+    assert store.load(store.make_key("https://jira.example.test", "session:demo")) is None
@@ -0,0 +1,98 @@
+import asyncio
+
+import httpx
+
+from atlassian import ConfluenceClient, JiraClient
+from atlassian.common import SharedConnection, TransportConfig
+from atlassian.tempo import TempoClient
+
+SESSION_PATH = "/rest/auth/1/session"
+
+
+class CountingTransport(httpx.MockTransport):
+    def __init__(self) -> None:
+        super().__init__(self.handle)
+        self.logins = 0
+        self.logouts = 0
+        self.closed = 0
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith(SESSION_PATH) and request.method == "POST":
+            self.logins += 1
+            return httpx.Response(
+                200, json={"session": {"name": "JSESSIONID", "value": f"s{self.logins}"}}
+            )
+        if request.url.path.endswith(SESSION_PATH) and request.method == "DELETE":
+            self.logouts += 1
+            return httpx.Response(204)
+        return httpx.Response(200, json={"cookie": request.headers.get("Cookie")})
+
+    async def aclose(self) -> None:
+        self.closed += 1
+
+
+def make(cls, shared: SharedConnection, base_url: str = "https://jira.example.test"):
+    return cls(
+        base_url=base_url,
+        username="demo",
+        password="secret",
+        auth_mode="session",
+        trust_env=False,
+        shared=shared,
+    )
+
+
+def test_jira_and_tempo_share_one_session_and_pool() -> None:
+    transport = CountingTransport()
+    shared = SharedConnection(TransportConfig(transport=transport))
+
+    async def run() -> None:
+        async with make(JiraClient, shared) as jira:
+            async with make(TempoClient, shared) as tempo:
+                jira_result = await jira.get_json("/rest/api/2/myself")
+                tempo_result = await tempo.get_json("/rest/tempo-teams/2/team")
+                assert jira_result == tempo_result == {"cookie": "JSESSIONID=s1"}
+                assert shared.active_clients == 2
+            # Tempo 退出时 Jira 仍在使用会话与连接池
+            assert transport.logouts == 0
+            assert transport.closed == 0
+            await jira.get_json("/rest/api/2/myself")
+
+    asyncio.run(run())
+    assert transport.logins == 1
+    assert transport.logouts == 1
+    assert transport.closed == 1
+    assert shared.active_clients == 0
+    assert shared.pool_stats.requests == 5
+
+
+def test_different_base_urls_share_pool_but_not_session() -> None:
+    transport = CountingTransport()
+    shared = SharedConnection(TransportConfig(transport=transport))
+
+    async def run() -> None:
+        async with shared:
+            async with make(JiraClient, shared), make(
+                ConfluenceClient, shared, "https://jira.example.test/confluence"
+            ):
+                pass
+            assert transport.closed == 0
+
+    asyncio.run(run())
+    assert transport.logins == 2
+    assert transport.logouts == 2
+    assert transport.closed == 1
+
+
+def test_relogin_by_one_client_is_visible_to_the_other() -> None:
+    transport = CountingTransport()
+    shared = SharedConnection(TransportConfig(transport=transport))
+
+    async def run() -> None:
+        async with make(JiraClient, shared) as jira, make(TempoClient, shared) as tempo:
+            await jira._login_once(jira._auth_state.generation, relogin=True)
+            assert tempo.session_info is jira.session_info
+            assert tempo.login_stats.relogins == 1
+
+    asyncio.run(run())
+    assert transport.logins == 2
@@ -0,0 +1,177 @@
+import asyncio
+import json
+import random
+
+import httpx
+import pytest
+
+from atlassian import ConfluenceClient
+from atlassian.tempo import TempoClient
+from atlassian.common import JsonArrayStreamParser
+from tests.helpers import make_client
+
+
+def feed_in_chunks(parser: JsonArrayStreamParser, data: bytes, size: int) -> list:
+    items = []
+    for i in range(0, len(data), size):
+        items.extend(parser.feed(data[i:i + size]))
+    parser.close()
+    return items
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 64, 10_000])
+def test_parser_yields_items_and_metadata_for_any_chunking(size: int) -> None:
+    doc = {
+        "startAt": 0,
+        "names": {"a": "[not, an, array]"},
+        "issues": [
+            {"key": "DEMO-1", "summary": 'quote " and \\ backslash ]}'},
+            {"key": "DEMO-2", "changelog": {"histories": [[], [1, 2]]}},
+            "text",
+            3.5,
+            None,
+        ],
+        "total": 5,
+    }
+    parser = JsonArrayStreamParser("issues")
+    items = feed_in_chunks(parser, json.dumps(doc, ensure_ascii=False).encode(), size)
+    assert items == doc["issues"]
+    assert parser.metadata == {"startAt": 0, "names": {"a": "[not, an, array]"}, "total": 5}
+    assert parser.items_seen == 5
+
+
+def test_parser_top_level_array_and_empty_array() -> None:
+    assert feed_in_chunks(JsonArrayStreamParser(), b' [ {"id": 1} , {"id": 2} ] ', 3) == [
+        {"id": 1},
+        {"id": 2},
+    ]
+    parser = JsonArrayStreamParser("results")
+    assert feed_in_chunks(parser, b'{"results": [], "size": 0}', 4) == []
+    assert parser.metadata == {"size": 0}
+
+
+def test_parser_random_documents() -> None:
+    rng = random.Random(7)
+
+    def value(depth: int):
+        kind = rng.randrange(6 if depth < 3 else 3)
+        if kind == 0:
+            return rng.randint(-1000, 1000)
+        if kind == 1:
+            return "".join(rng.choice('ab"\\[]{},:ü ') for _ in range(rng.randrange(8)))
+        if kind == 2:
+            return rng.choice([True, False, None])
+        if kind == 3:
+            return [value(depth + 1) for _ in range(rng.randrange(4))]
+        return {f"k{i}": value(depth + 1) for i in range(rng.randrange(4))}
+
+    for _ in range(100):
+        items = [value(0) for _ in range(rng.randrange(6))]
+        doc = {"before": value(1), "values": items, "after": value(1)}
+        parser = JsonArrayStreamParser("values")
+        data = json.dumps(doc, indent=rng.choice([None, 2]), ensure_ascii=rng.random() < 0.5).encode()
+        assert feed_in_chunks(parser, data, rng.randint(1, 50)) == items
+        assert parser.metadata == {"before": doc["before"], "after": doc["after"]}
+
+
+def test_parser_decodes_complete_items_of_a_chunk_in_one_call() -> None:
+    calls: list[bytes] = []
+
+    def loads(raw: bytes):
+        calls.append(raw)
+        return json.loads(raw)
+
+    items = [{"id": i, "tags": ["a", "b"], "note": "x}]"} for i in range(100)]
+    data = json.dumps({"values": items, "total": 100}).encode()
+    parser = JsonArrayStreamParser("values", loads=loads)
+    assert parser.feed(data[:len(data) // 2]) + parser.feed(data[len(data) // 2:]) == items
+    parser.close()
+    assert parser.items_seen == 100
+    assert len(calls) == 3  # 两块各一次，外加 total
+
+
+def test_parser_close_rejects_truncated_stream() -> None:
+    parser = JsonArrayStreamParser("issues")
+    parser.feed(b'{"issues": [{"key": "DEMO-1"}, {"key"')
+    with pytest.raises(ValueError):
+        parser.close()
+
+
+class ChunkedStream(httpx.AsyncByteStream):
+    def __init__(self, data: bytes, size: int = 5):
+        self._data = data
+        self._size = size
+
+    async def __aiter__(self):
+        for i in range(0, len(self._data), self._size):
+            yield self._data[i:i + self._size]
+
+
+def test_jira_search_stream_pages_through_results() -> None:
+    issues = [{"key": f"DEMO-{i}"} for i in range(7)]
+    seen: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(dict(request.url.params))
+        start = int(request.url.params["startAt"])
+        size = int(request.url.params["maxResults"])
+        body = {"startAt": start, "total": len(issues), "issues": issues[start:start + size]}
+        return httpx.Response(200, stream=ChunkedStream(json.dumps(body).encode()))
+
+    async def run() -> list[dict]:
+        async with make_client(handler) as jira:
+            return [issue async for issue in jira.search.stream_raw("project = DEMO", page_size=3)]
+
+    assert asyncio.run(run()) == issues
+    assert [params["startAt"] for params in seen] == ["0", "3", "6"]
+
+
+def test_tempo_worklog_search_stream_posts_filters() -> None:
+    worklogs = [{"tempoWorklogId": i} for i in range(4)]
+    bodies: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, stream=ChunkedStream(json.dumps(worklogs).encode(), 3))
+
+    async def run() -> list[dict]:
+        async with make_client(handler, TempoClient) as tempo:
+            return [
+                w
+                async for w in tempo.worklog.search_stream(
+                    "2024-01-01", "2024-03-31", project_key=["DEMO"]
+                )
+            ]
+
+    assert asyncio.run(run()) == worklogs
+    assert bodies == [{"from": "2024-01-01", "to": "2024-03-31", "projectKey": ["DEMO"]}]
+
+
+def test_confluence_stream_descendants_stops_on_short_page() -> None:
+    pages = [{"id": str(i)} for i in range(5)]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        start = int(request.url.params["start"])
+        limit = int(request.url.params["limit"])
+        results = pages[start:start + limit]
+        body = {"results": results, "start": start, "limit": limit, "size": len(results)}
+        return httpx.Response(200, stream=ChunkedStream(json.dumps(body).encode()))
+
+    async def run() -> list[dict]:
+        async with make_client(handler, ConfluenceClient) as confluence:
+            return [p async for p in confluence.content.stream_descendants("1", limit=2)]
+
+    assert asyncio.run(run()) == pages
+
+
+def test_stream_error_status_raises() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(500, json={"errorMessages": ["boom"]})
+
+    async def run() -> None:
+        async with make_client(handler) as jira:
+            async for _ in jira.search.stream_raw("project = DEMO"):
+                pass
+
+    with pytest.raises(Exception):
+        asyncio.run(run())
@@ -0,0 +1,123 @@
+import asyncio
+import datetime as dt
+
+import httpx
+
+from atlassian import ConfluenceClient
+from atlassian.common import RetryPolicy
+from atlassian.tempo import TempoClient
+from benchmarks.stub_server import StubConfig, StubServer
+from tests.helpers import make_client
+
+BASE_URL = "http://stub.example.test"
+
+
+def test_search_pages_through_projects() -> None:
+    server = StubServer(StubConfig(issues=250, projects=("DEMO", "OPS")))
+
+    async def run() -> tuple[int, list[str]]:
+        async with make_client(server.transport(), auth_mode="session") as jira:
+            first = await jira.search.search("project = OPS", max_results=100)
+            keys = [issue["key"] async for issue in jira.search.stream_raw("project = DEMO", page_size=40)]
+            return first.total, keys
+
+    total, keys = asyncio.run(run())
+    assert total == 125
+    assert len(keys) == 125
+    assert keys[:3] == ["DEMO-1", "DEMO-2", "DEMO-3"]
+    assert server.stats.logins == 1
+
+
+def test_issue_and_attachment_round_trip() -> None:
+    server = StubServer(StubConfig(issues=10))
+
+    async def run():
+        async with make_client(server.transport(), auth_mode="session") as jira:
+            issue = await jira.issue.get("DEMO-3")
+            response = await jira.get("/rest/api/2/issue/DEMO-99")
+            uploaded = await jira.issue.add_attachment_bytes("DEMO-3", b"payload", "a.txt")
+            downloaded = await jira.get(f"/secure/attachment/{uploaded[0].id}/a.txt")
+            return issue, response.status_code, downloaded.content
+
+    issue, missing_status, content = asyncio.run(run())
+    assert issue.key == "DEMO-3"
+    assert issue.fields.status.name == "Resolved"
+    assert missing_status == 404
+    assert content == b"payload"
+
+
+def test_session_expiry_triggers_relogin() -> None:
+    server = StubServer(StubConfig(issues=50, session_max_requests=2))
+
+    async def run() -> list[str]:
+        async with make_client(server.transport(), auth_mode="session") as jira:
+            return [(await jira.issue.get(f"DEMO-{i}")).key for i in range(1, 6)]
+
+    assert asyncio.run(run()) == [f"DEMO-{i}" for i in range(1, 6)]
+    assert server.stats.expired == 2
+    assert server.stats.logins == 3
+
+
+def test_rate_limit_is_retried() -> None:
+    server = StubServer(StubConfig(issues=20, rate_limit_every=2))
+    policy = RetryPolicy(max_retries=3, backoff_base=0, backoff_max=0)
+
+    async def run() -> int:
+        async with make_client(server.transport(), auth_mode="session", retry_policy=policy) as jira:
+            pages = [await jira.search.search("", start_at=i * 5, max_results=5) for i in range(3)]
+            return sum(len(page.issues) for page in pages)
+
+    assert asyncio.run(run()) == 15
+    assert server.stats.rate_limited >= 1
+    assert server.stats.status[429] >= 1
+
+
+def test_boards_and_confluence_tree() -> None:
+    server = StubServer(StubConfig(issues=30, boards=3, pages=31, page_fanout=5))
+
+    async def run():
+        async with make_client(server.transport(), auth_mode="session") as jira:
+            boards = await jira.board.get_all()
+            board_issues = await jira.board.get_issues(2, max_results=100)
+        async with make_client(server.transport(), ConfluenceClient, auth_mode="session") as confluence:
+            page = await confluence.content.get("2")
+            descendants = [p["id"] async for p in confluence.content.stream_descendants("1", limit=7)]
+        return boards, board_issues, page, descendants
+
+    boards, board_issues, page, descendants = asyncio.run(run())
+    assert [b.id for b in boards.values] == [1, 2, 3]
+    assert len(board_issues.issues) == 10
+    assert page.title == "Page 2"
+    assert descendants == [str(i) for i in range(2, 32)]
+
+
+def test_tempo_worklog_search_filters_by_date_and_worker() -> None:
+    server = StubServer(
+        StubConfig(issues=100, users=4, worklogs=3650, worklog_days=365, worklog_chunk=7)
+    )
+
+    async def run():
+        async with make_client(server.transport(), TempoClient, auth_mode="session") as tempo:
+            january = await tempo.worklog.search("2024-01-01", "2024-01-31")
+            streamed = [
+                w async for w in tempo.worklog.search_stream("2024-02-01", "2024-02-10", worker=["user1"])
+            ]
+        return january, streamed
+
+    january, streamed = asyncio.run(run())
+    assert len(january) == 310
+    assert all(w.started.startswith("2024-01") for w in january)
+    assert streamed and all(w["worker"] == "user1" for w in streamed)
+    assert {w["started"][:10] for w in streamed} <= {
+        (dt.date(2024, 2, 1) + dt.timedelta(days=d)).isoformat() for d in range(10)
+    }
+
+
+def test_unauthenticated_request_is_rejected() -> None:
+    server = StubServer(StubConfig(username="demo", password="secret"))
+
+    async def run() -> int:
+        async with httpx.AsyncClient(transport=server.transport(), base_url=BASE_URL) as client:
+            return (await client.get("/rest/api/2/search")).status_code
+
+    assert asyncio.run(run()) == 401
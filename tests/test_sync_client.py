@@ -0,0 +1,141 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from atlassian import JiraClient
+from atlassian.common import EventLoopThread, SyncClient, TransportConfig
+from atlassian.common.client import DEFAULT_BULK_CONCURRENCY
+from tests.helpers import make_client
+
+SESSION_PATH = "/rest/auth/1/session"
+
+
+def make_handler(logins: list[int]):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == SESSION_PATH:
+            if request.method == "POST":
+                logins.append(1)
+                return httpx.Response(
+                    200, json={"session": {"name": "JSESSIONID", "value": "s"}}
+                )
+            return httpx.Response(204)
+        await asyncio.sleep(0.005)
+        key = request.url.path.rsplit("/", 1)[-1]
+        if key == "MISSING":
+            return httpx.Response(404)
+        return httpx.Response(200, json={"key": key, "thread": threading.current_thread().name})
+
+    return handler
+
+
+def test_sync_calls_reuse_one_session_from_many_threads() -> None:
+    logins: list[int] = []
+    with SyncClient(make_client(make_handler(logins), auth_mode="session")) as jira:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda i: jira.issue.get_raw(f"DEMO-{i}"), range(32)))
+        direct = jira.get_json("/rest/api/2/issue/DEMO-X")
+
+    assert [r["key"] for r in results] == [f"DEMO-{i}" for i in range(32)]
+    assert {r["thread"] for r in results} == {"atlassian-event-loop"}
+    assert direct["key"] == "DEMO-X"
+    assert len(logins) == 1
+
+
+def test_batch_gathers_results_in_order() -> None:
+    logins: list[int] = []
+    with SyncClient(make_client(make_handler(logins), auth_mode="session")) as jira:
+        results = jira.batch(
+            [(lambda c, k=key: c.issue.get_raw(k)) for key in ["A", "B", "C"]],
+            concurrency=2,
+        )
+        errors = jira.batch(
+            [jira.client.get_json("/rest/api/2/issue/MISSING")],
+            return_exceptions=True,
+        )
+        with pytest.raises(httpx.HTTPStatusError):
+            jira.batch([lambda c: c.get_json("/rest/api/2/issue/MISSING")])
+
+    assert [r["key"] for r in results] == ["A", "B", "C"]
+    assert isinstance(errors[0], httpx.HTTPStatusError)
+
+
+def test_shared_loop_thread_outlives_facades() -> None:
+    loop_thread = EventLoopThread()
+    try:
+        for _ in range(2):
+            with SyncClient(make_client(make_handler([]), auth_mode="session"), loop_thread=loop_thread) as jira:
+                assert jira.get_json("/rest/api/2/issue/A")["key"] == "A"
+            assert loop_thread.is_running
+    finally:
+        loop_thread.stop()
+    assert not loop_thread.is_running
+
+
+def test_async_generator_methods_iterate_synchronously() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        async def body():
+            yield b'{"issues": ['
+            for i in range(5):
+                yield (b"," if i else b"") + f'{{"key": "DEMO-{i}"}}'.encode()
+            yield b"]}"
+
+        return httpx.Response(200, content=body())
+
+    client = JiraClient(
+        base_url="https://jira.example.test",
+        username="demo",
+        password="secret",
+        trust_env=False,
+        transport_config=TransportConfig(transport=httpx.MockTransport(handler)),
+    )
+    events: list[str] = []
+
+    async def numbers():
+        try:
+            for i in range(10):
+                events.append(threading.current_thread().name)
+                yield i
+        finally:
+            events.append("closed")
+
+    client.numbers = numbers
+    with SyncClient(client) as jira:
+        items = jira.stream_json_items("/rest/api/2/search", item_key="issues")
+        assert [item["key"] for item in items] == [f"DEMO-{i}" for i in range(5)]
+
+        # 提前结束迭代时在后台循环中关闭异步生成器
+        for i in jira.numbers():
+            if i == 2:
+                break
+        assert events == ["atlassian-event-loop"] * 3 + ["closed"]
+
+
+def test_batch_without_concurrency_uses_client_gather_default() -> None:
+    active = {"now": 0, "peak": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        try:
+            await asyncio.sleep(0.005)
+            return httpx.Response(200, json={"key": request.url.path.rsplit("/", 1)[-1]})
+        finally:
+            active["now"] -= 1
+
+    client = JiraClient(
+        base_url="https://jira.example.test",
+        username="demo",
+        password="secret",
+        trust_env=False,
+        transport_config=TransportConfig(transport=httpx.MockTransport(handler)),
+    )
+    with SyncClient(client) as jira:
+        results = jira.batch(
+            (lambda c, i=i: c.get_json(f"/rest/api/2/issue/DEMO-{i}")) for i in range(40)
+        )
+
+    assert [r["key"] for r in results] == [f"DEMO-{i}" for i in range(40)]
+    assert active["peak"] == DEFAULT_BULK_CONCURRENCY
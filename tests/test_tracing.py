@@ -0,0 +1,210 @@
+import asyncio
+from contextlib import aclosing
+
+import httpx
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from atlassian import ConfluenceClient
+from atlassian.common import OAuth1Config, RecordingTracer, RetryPolicy, SyncClient
+from atlassian.common.tracing import page_attributes
+from tests.helpers import make_client
+
+SESSION_PATH = "/rest/auth/1/session"
+
+
+def test_resource_span_wraps_login_http_and_decode_spans() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == SESSION_PATH:
+            if request.method == "POST":
+                return httpx.Response(200, json={"session": {"name": "JSESSIONID", "value": "s1"}})
+            return httpx.Response(204)
+        return httpx.Response(200, json={"id": "10001", "key": "DEMO-1", "fields": {}})
+
+    tracer = RecordingTracer()
+
+    async def run() -> None:
+        jira = make_client(handler, tracer=tracer, auth_mode="session")
+        try:
+            await jira.issue.get("DEMO-1")  # 首次请求时自动登录
+        finally:
+            await jira.close()
+
+    asyncio.run(run())
+
+    [get] = tracer.find("IssueResource.get")
+    assert get.parent is None
+    children = [span.name for span in tracer.children(get)]
+    assert children == ["atlassian.login", "HTTP GET /rest/api/2/issue/{key}", "atlassian.json.decode"]
+
+    [http] = tracer.find("HTTP GET /rest/api/2/issue/{key}")
+    assert http.attributes["atlassian.endpoint"] == "/rest/api/2/issue/{key}"
+    assert http.attributes["http.response.status_code"] == 200
+    assert http.attributes["http.response.body.size"] > 0
+    assert http.attributes["atlassian.attempt"] == 1
+    assert get.duration >= http.duration
+
+
+def test_retries_produce_attempt_and_backoff_spans() -> None:
+    calls = {"n": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        if calls["n"] == 1:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"issues": [], "total": 0, "startAt": 50, "maxResults": 50})
+
+    tracer = RecordingTracer()
+
+    async def run() -> None:
+        async with make_client(
+            handler,
+            tracer=tracer,
+            auth_mode="basic",
+            retry_policy=RetryPolicy(backoff_base=0, backoff_max=0),
+        ) as jira:
+            await jira.search.search_raw("project = DEMO", start_at=50, max_results=50)
+
+    asyncio.run(run())
+
+    [search] = tracer.find("SearchResource.search_raw")
+    spans = tracer.children(search)
+    assert [span.name for span in spans] == [
+        "HTTP GET /rest/api/2/search",
+        "atlassian.retry.backoff",
+        "HTTP GET /rest/api/2/search",
+        "atlassian.json.decode",
+    ]
+    first, backoff, second = spans[:3]
+    assert first.attributes["http.response.status_code"] == 503
+    assert backoff.attributes["atlassian.retry.reason"] == "HTTP 503"
+    assert second.attributes["atlassian.attempt"] == 2
+    assert second.attributes["atlassian.page.index"] == 1
+
+
+def test_failed_resource_call_records_exception() -> None:
+    tracer = RecordingTracer()
+
+    async def run() -> None:
+        async with make_client(lambda r: httpx.Response(404), tracer=tracer, auth_mode="basic") as jira:
+            await jira.issue.get_raw("DEMO-404")
+
+    with pytest.raises(Exception):
+        asyncio.run(run())
+    [span] = tracer.find("IssueResource.get_raw")
+    assert span.error is not None
+
+
+def search_handler(issues: list[dict]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        start = int(request.url.params["startAt"])
+        size = int(request.url.params["maxResults"])
+        return httpx.Response(200, json={"startAt": start, "total": len(issues), "issues": issues[start:start + size]})
+
+    return handler
+
+
+def test_stream_span_covers_all_pages() -> None:
+    issues = [{"key": f"DEMO-{i}"} for i in range(5)]
+    tracer = RecordingTracer()
+
+    async def run() -> list[dict]:
+        async with make_client(search_handler(issues), tracer=tracer, auth_mode="basic") as jira:
+            result = []
+            async for issue in jira.search.stream_raw("project = DEMO", page_size=2):
+                assert tracer.find("SearchResource.stream_raw") == []  # 迭代期间 span 尚未结束
+                result.append(issue)
+            return result
+
+    assert asyncio.run(run()) == issues
+    [stream] = tracer.find("SearchResource.stream_raw")
+    assert stream.end is not None
+    assert stream.error is None
+    assert stream.attributes["atlassian.stream.items"] == 5
+    assert "atlassian.stream.closed" not in stream.attributes
+    pages = [span for span in tracer.children(stream) if span.name.startswith("HTTP ")]
+    assert len(pages) == 3
+
+
+def test_closed_stream_ends_span_without_error() -> None:
+    issues = [{"key": f"DEMO-{i}"} for i in range(5)]
+    tracer = RecordingTracer()
+
+    async def run() -> None:
+        async with make_client(search_handler(issues), tracer=tracer, auth_mode="basic") as jira:
+            stream = jira.search.stream_raw("project = DEMO", page_size=2)
+            assert tracer.find("SearchResource.stream_raw") == []  # 首次迭代前不创建 span
+            async with aclosing(stream):
+                async for _ in stream:
+                    break
+            assert len(tracer.find("SearchResource.stream_raw")) == 1
+
+    asyncio.run(run())
+    [stream] = tracer.find("SearchResource.stream_raw")
+    assert stream.error is None
+    assert stream.attributes["atlassian.stream.closed"] is True
+    assert stream.attributes["atlassian.stream.items"] == 1
+
+
+def test_oauth1_signing_span_is_nested_in_http_span() -> None:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pem = key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode()
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers["Authorization"])
+        return httpx.Response(200, json={"results": [], "size": 0})
+
+    tracer = RecordingTracer()
+
+    async def run() -> None:
+        async with make_client(
+            handler,
+            tracer=tracer,
+            cls=ConfluenceClient,
+            auth_mode="oauth1",
+            oauth1=OAuth1Config(
+                consumer_key="consumer",
+                private_key=pem,
+                access_token="token",
+                access_token_secret="secret",
+            ),
+        ) as confluence:
+            await confluence.get_json("/rest/api/content", params={"start": 50, "limit": 25})
+
+    asyncio.run(run())
+    assert seen[0].startswith("OAuth ")
+    [sign] = tracer.find("atlassian.oauth1.sign")
+    assert sign.parent.name == "HTTP GET /rest/api/content"
+    assert sign.parent.attributes["atlassian.page.index"] == 2
+
+
+def test_page_attributes() -> None:
+    assert page_attributes({"startAt": 100, "maxResults": 50}) == {
+        "atlassian.page.start": 100,
+        "atlassian.page.size": 50,
+        "atlassian.page.index": 2,
+    }
+    assert page_attributes({"jql": "x"}) == {}
+    assert page_attributes(None) == {}
+
+
+def test_no_tracer_leaves_resource_calls_untouched() -> None:
+    async def run() -> dict:
+        async with make_client(lambda r: httpx.Response(200, json={"key": "DEMO-1"}), auth_mode="basic") as jira:
+            return await jira.issue.get_raw("DEMO-1")
+
+    assert asyncio.run(run()) == {"key": "DEMO-1"}
+
+
+def test_sync_client_iterates_traced_stream() -> None:
+    issues = [{"key": f"DEMO-{i}"} for i in range(3)]
+    tracer = RecordingTracer()
+    with SyncClient(make_client(search_handler(issues), tracer=tracer, auth_mode="basic")) as jira:
+        assert list(jira.search.stream_raw("project = DEMO", page_size=2)) == issues
+    assert len(tracer.find("SearchResource.stream_raw")) == 1
@@ -0,0 +1,135 @@
+import asyncio
+
+import httpx
+import pytest
+
+from atlassian import JiraClient
+from atlassian.common import SharedConnection, TransportConfig
+
+
+async def _serve_json(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    body = b'{"state":"RUNNING"}'
+    try:
+        while await reader.readuntil(b"\r\n\r\n"):
+            writer.write(
+                b"HTTP/1.1 200 OK\r\n"
+                b"Content-Type: application/json\r\n"
+                b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body
+            )
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+def test_transport_config_validates_limits() -> None:
+    with pytest.raises(ValueError, match="max_connections"):
+        TransportConfig(max_connections=0)
+    with pytest.raises(ValueError, match="prewarm_connections"):
+        TransportConfig(prewarm_connections=-1)
+
+    limits = TransportConfig(max_connections=8, keepalive_expiry=30.0).limits
+    assert limits.max_connections == 8
+    assert limits.keepalive_expiry == 30.0
+
+
+def test_custom_transport_is_used_by_client() -> None:
+    seen_paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_paths.append(request.url.path)
+        return httpx.Response(200, json={"name": "demo"})
+
+    async def run() -> dict:
+        client = JiraClient(
+            base_url="https://jira.example.test",
+            username="demo",
+            password="secret",
+            trust_env=False,
+            transport_config=TransportConfig(
+                transport=httpx.MockTransport(handler),
+                prewarm_connections=2,
+            ),
+        )
+        async with client:
+            result = await client.get_json("/rest/api/2/myself")
+        assert client.pool_stats.requests == 3
+        return result
+
+    assert asyncio.run(run()) == {"name": "demo"}
+    assert seen_paths == ["/status", "/status", "/rest/api/2/myself"]
+
+
+def test_pool_stats_count_new_and_reused_connections() -> None:
+    async def run() -> dict:
+        server = await asyncio.start_server(_serve_json, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            client = JiraClient(
+                base_url=f"http://127.0.0.1:{port}",
+                username="demo",
+                password="secret",
+                trust_env=False,
+                transport_config=TransportConfig(max_connections=1),
+            )
+            async with client:
+                for _ in range(3):
+                    await client.get_json("/rest/api/2/myself")
+            return client.pool_stats.snapshot()
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    stats = asyncio.run(run())
+    assert stats["requests"] == 3
+    assert stats["connections_opened"] == 1
+    assert stats["connections_reused"] == 2
+    assert stats["pool_wait_max"] >= 0.0
+
+
+def test_environment_proxies_are_mounted(monkeypatch) -> None:
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example.test:3128")
+    monkeypatch.setenv("NO_PROXY", "internal.example.test")
+
+    def mounts(client: JiraClient) -> dict:
+        return {pattern.pattern: mount for pattern, mount in client._get_client()._mounts.items()}
+
+    async def run() -> None:
+        client = JiraClient(base_url="https://jira.example.test", username="u", password="p")
+        found = mounts(client)
+        assert found["https://"] is not None
+        assert found["all://*internal.example.test"] is None
+        await client.close()
+
+        shared = SharedConnection()
+        async with JiraClient(
+            base_url="https://jira.example.test", username="u", password="p", shared=shared
+        ) as client:
+            assert mounts(client)["https://"] is not None
+
+        client = JiraClient(
+            base_url="https://jira.example.test", username="u", password="p", trust_env=False
+        )
+        assert mounts(client) == {}
+        await client.close()
+
+    asyncio.run(run())
+
+
+def test_requests_go_through_environment_proxy(monkeypatch) -> None:
+    async def run() -> dict:
+        proxy = await asyncio.start_server(_serve_json, "127.0.0.1", 0)
+        port = proxy.sockets[0].getsockname()[1]
+        monkeypatch.setenv("HTTP_PROXY", f"http://127.0.0.1:{port}")
+        try:
+            client = JiraClient(base_url="http://jira.invalid", username="u", password="p")
+            async with client:
+                result = await client.get_json("/rest/api/2/serverInfo")
+            assert client.pool_stats.requests == 1
+            return result
+        finally:
+            proxy.close()
+            await proxy.wait_closed()
+
+    assert asyncio.run(run()) == {"state": "RUNNING"}